@@ -16,16 +16,23 @@ from app.config import get_config, GofrIqConfig
 from app.logger import session_logger
 from app.services import (
     DocumentStore,
-    DuplicateDetector,
     EmbeddingIndex,
     GraphIndex,
-    IngestService,
-    LanguageDetector,
     LLMService,
     QueryService,
     SourceRegistry,
+    create_async_llm_service,
+    create_chunk_embedding_store,
+    create_client_matcher,
+    create_embedding_dispatcher,
+    create_entity_resolution_cache,
+    create_feed_cache,
+    create_ingest_queue,
+    create_ingest_service,
+    create_mandate_embedding_store,
+    create_query_embedding_cache,
 )
-from app.tools import register_all_tools
+from app.tools import create_tool_executor, register_all_tools
 
 from gofr_common.auth.backends import create_vault_client_from_env
 from gofr_common.auth.openrouter_key_provider import OpenRouterKeyProvider
@@ -65,8 +72,6 @@ def create_mcp_server(
 
     # Initialize services
     document_store = DocumentStore(base_path=storage_path / "documents")
-    language_detector = LanguageDetector()
-    duplicate_detector = DuplicateDetector()
 
     # Create LLM service with config FIRST (needed for embedding function)
     # OpenRouter API key is read from Vault by default; env var is an optional override.
@@ -95,6 +100,12 @@ def create_mcp_server(
             raise
 
     session_logger.info("LLMService initialized")
+
+    # Pooled async client for native async LLM tools (GOFR_IQ_ASYNC_LLM=0 disables);
+    # shares the resolved settings (API key) with the sync service
+    async_llm_service = None
+    if os.environ.get("GOFR_IQ_ASYNC_LLM", "1").lower() not in ("0", "false", "no"):
+        async_llm_service = create_async_llm_service(settings=llm_service.settings)
     
     # Create embedding function using LLM service for OpenRouter embeddings
     from app.services.embedding_index import LLMEmbeddingFunction
@@ -102,6 +113,8 @@ def create_mcp_server(
         llm_service=llm_service,
         model=config.embedding_model,  # qwen/qwen3-embedding-8b
         batch_size=100,
+        # Concurrent batches (GOFR_IQ_EMBEDDING_CONCURRENCY > 1 enables)
+        dispatcher=create_embedding_dispatcher(llm_service, model=config.embedding_model),
     )
     session_logger.info(f"LLM embedding function created with model: {config.embedding_model}")
 
@@ -109,10 +122,14 @@ def create_mcp_server(
     if config.chromadb_is_http_mode:
         # HTTP client mode - connect to ChromaDB server
         # Pass embedding_function for client-side embedding generation
+        # Query embedding cache (GOFR_IQ_QUERY_EMBEDDING_CACHE_MAX_MB=0 disables)
         embedding_index = EmbeddingIndex(
             host=config.chroma_host,
             port=config.chroma_port,
             embedding_function=embedding_function,
+            query_cache=create_query_embedding_cache(),
+            # Chunk vectors by content hash (GOFR_IQ_CHUNK_EMBEDDING_STORE=0 disables)
+            chunk_store=create_chunk_embedding_store(storage_path / "embeddings"),
         )
     else:
         # ChromaDB HTTP server MUST be configured - no local fallback
@@ -136,23 +153,57 @@ def create_mcp_server(
         graph_index=graph_index,
     )
 
-    ingest_service = IngestService(
+    # Per-client feed cache (GOFR_IQ_FEED_CACHE_TTL_SECONDS=0 disables)
+    feed_cache = create_feed_cache()
+
+    # Ticker/company -> guid cache shared by ingest and client tools
+    # (GOFR_IQ_ENTITY_CACHE_MAX_ENTRIES=0 disables)
+    entity_cache = create_entity_resolution_cache()
+    if entity_cache is not None:
+        try:
+            entity_cache.warm(graph_index)
+        except Exception as e:
+            # Cold cache still works; entries fill in on first lookup
+            session_logger.warning(f"Entity resolution cache warm-up failed: {e}")
+
+    # Mandate vectors off the ClientProfile node (GOFR_IQ_MANDATE_EMBEDDING_STORE=0 disables)
+    mandate_store = create_mandate_embedding_store(storage_path / "mandate_embeddings")
+
+    # Ingest-time matching of documents to client inboxes (GOFR_IQ_CLIENT_MATCHER=1 enables)
+    client_matcher = create_client_matcher(graph_index, mandate_store)
+
+    # Ingest flags (GOFR_IQ_INGEST_BATCH_WORKERS etc.) are read by the factory
+    ingest_service = create_ingest_service(
+        storage_path,
         document_store=document_store,
         source_registry=source_registry,
-        language_detector=language_detector,
-        duplicate_detector=duplicate_detector,
         embedding_index=embedding_index,
         graph_index=graph_index,
         llm_service=llm_service,
-        strict_ticker_validation=os.environ.get("GOFR_IQ_STRICT_TICKER_VALIDATION", "").lower() in ("1", "true", "yes"),
+        feed_cache=feed_cache,
+        entity_cache=entity_cache,
+        client_matcher=client_matcher,
     )
 
+    # Durable queue behind ingest_document_async (GOFR_IQ_INGEST_QUEUE=0 disables);
+    # jobs interrupted by a restart are picked up again here
+    ingest_queue = create_ingest_queue(storage_path, ingest_service)
+    if ingest_queue is not None:
+        ingest_queue.start()
+        session_logger.info(f"Ingest queue started: {ingest_queue}")
+
     # Create query service for semantic search
     query_service = QueryService(
         embedding_index=embedding_index,
         document_store=document_store,
         source_registry=source_registry,
         graph_index=graph_index,
+        consolidated_feed_retrieval=os.environ.get("GOFR_IQ_CONSOLIDATED_FEED_RETRIEVAL", "").lower() in ("1", "true", "yes"),
+        concurrent_feed_fanout=os.environ.get("GOFR_IQ_CONCURRENT_FEED_FANOUT", "").lower() in ("1", "true", "yes"),
+        filter_pushdown=os.environ.get("GOFR_IQ_CHROMA_FILTER_PUSHDOWN", "").lower() in ("1", "true", "yes"),
+        adaptive_overfetch=os.environ.get("GOFR_IQ_ADAPTIVE_OVERFETCH", "").lower() in ("1", "true", "yes"),
+        feed_cache=feed_cache,
+        mandate_store=mandate_store,
     )
 
     # Create MCP server
@@ -162,6 +213,7 @@ def create_mcp_server(
 
 Available tools:
 - ingest_document: Ingest news documents with validation and language detection
+- ingest_document_async: Queue a document for ingestion; poll get_ingest_status with the job_id
 - query_documents: Search for news articles by topic, company, or event
 - list_sources: List registered news sources with optional filtering
 - get_source: Get detailed information about a specific source
@@ -185,6 +237,10 @@ All documents are scoped by group_guid for access control.""",
         graph_index=graph_index,
         embedding_index=embedding_index,
         llm_service=llm_service,
+        async_llm_service=async_llm_service,
+        # Tools run on worker pools, not the event loop (GOFR_IQ_TOOL_EXECUTOR=0 disables)
+        tool_executor=create_tool_executor(),
+        ingest_queue=ingest_queue,
     )
 
     return server
@@ -24,6 +24,7 @@ class ClientProfile(BaseModel):
     client_type: str | None = None
 
     # ClientProfile node properties
+    profile_guid: str | None = None
     mandate_type: str | None = None
     mandate_text: str | None = None
     horizon: str | None = None
@@ -32,6 +33,9 @@ class ClientProfile(BaseModel):
     # Enrichment fields (Phase 1 / M4)
     mandate_themes: list[str] = Field(default_factory=list)
     mandate_embedding: list[float] = Field(default_factory=list)
+    # Set when the node still carries a mandate_embedding property (not yet
+    # moved to the mandate embedding store); the vector itself is loaded lazily
+    mandate_embedding_in_graph: bool | None = None
 
     # Parsed restrictions payload (stored as JSON string in Neo4j)
     restrictions: dict[str, Any] | None = None
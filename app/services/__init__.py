@@ -2,12 +2,22 @@
 
 This package contains all service layer modules:
 - document_store: Canonical document storage
+- document_index: GUID -> (group, date) index for the document store
 - source_registry: Source management
 - language_detector: Language detection for documents
 - duplicate_detector: Duplicate document detection
 - ingest_service: Document ingestion orchestration
+- ingest_queue: Durable queue for asynchronous ingestion
 - audit_service: Audit logging for all operations
 - query_service: Query orchestration
+- chunk_embedding_store: Content-addressed chunk embedding store
+- client_matcher: Ingest-time document -> client matching into per-client inboxes
+- mandate_embedding_store: Client mandate embeddings keyed by profile guid
+- embedding_dispatcher: Concurrent, rate-limit-aware embedding batches
+- entity_cache: Shared ticker/company name -> guid resolution cache
+- feed_cache: Per-client feed result cache
+- query_embedding_cache: Query embedding cache for similarity search
+- ticker_matcher: Single-pass known-ticker scanner
 """
 
 from app.services.audit_service import (
@@ -23,6 +33,16 @@ from app.services.audit_service import (
     log_source_delete,
     log_source_update,
 )
+from app.services.chunk_embedding_store import (
+    ChunkEmbeddingStore,
+    create_chunk_embedding_store,
+)
+from app.services.client_matcher import (
+    ClientMatch,
+    ClientMatcher,
+    create_client_matcher,
+)
+from app.services.document_index import DocumentPathIndex
 from app.services.document_store import (
     DocumentNotFoundError,
     DocumentStore,
@@ -32,6 +52,7 @@ from app.services.duplicate_detector import (
     CandidateDocument,
     DuplicateDetector,
     DuplicateResult,
+    MinHashLSHIndex,
     check_duplicate,
     compute_content_hash,
     cosine_similarity,
@@ -44,11 +65,27 @@ from app.services.embedding_index import (
     DeterministicEmbeddingFunction,
     EmbeddingIndex,
     LLMEmbeddingFunction,
+    PreparedEmbedding,
     SimilarityResult,
     create_embedding_index,
     create_llm_embedding_function,
 )
+from app.services.embedding_dispatcher import (
+    EmbeddingDispatcher,
+    TokenBucket,
+    create_embedding_dispatcher,
+)
+from app.services.entity_cache import (
+    EntityResolutionCache,
+    create_entity_resolution_cache,
+)
+from app.services.feed_cache import (
+    FeedCache,
+    FeedDependencies,
+    create_feed_cache,
+)
 from app.services.graph_index import (
+    DocumentGraphWrite,
     GraphIndex,
     GraphNode,
     GraphRelationship,
@@ -58,6 +95,7 @@ from app.services.graph_index import (
     create_graph_index,
 )
 from app.services.llm_service import (
+    AsyncLLMService,
     ChatCompletionResult,
     ChatMessage,
     EmbeddingResult,
@@ -66,9 +104,16 @@ from app.services.llm_service import (
     LLMRateLimitError,
     LLMService,
     LLMServiceError,
+    create_async_llm_service,
     create_llm_service,
     llm_available,
 )
+from app.services.ingest_queue import (
+    IngestJob,
+    IngestJobQueue,
+    IngestJobStatus,
+    create_ingest_queue,
+)
 from app.services.ingest_service import (
     IngestError,
     IngestResult,
@@ -86,6 +131,10 @@ from app.services.language_detector import (
     detect_language_with_confidence,
 )
 from app.models.themes import VALID_THEMES
+from app.services.mandate_embedding_store import (
+    MandateEmbeddingStore,
+    create_mandate_embedding_store,
+)
 from app.services.mandate_enrichment import (
     MandateEnrichmentError,
     MandateEnrichmentResult,
@@ -101,11 +150,16 @@ from app.services.query_service import (
     ScoringWeights,
     create_query_service,
 )
+from app.services.query_embedding_cache import (
+    QueryEmbeddingCache,
+    create_query_embedding_cache,
+)
 from app.services.source_registry import (
     SourceNotFoundError,
     SourceRegistry,
     SourceRegistryError,
 )
+from app.services.ticker_matcher import TickerMatcher
 from app.services.group_service import (
     AdminAccessDeniedError,
     GroupAccessDeniedError,
@@ -123,6 +177,7 @@ from app.models.group import PUBLIC_GROUP
 
 __all__ = [
     "AdminAccessDeniedError",
+    "AsyncLLMService",
     "AuditEntry",
     "AuditEventType",
     "AuditService",
@@ -131,19 +186,31 @@ __all__ = [
     "ChatMessage",
     "Chunk",
     "ChunkConfig",
+    "ChunkEmbeddingStore",
+    "ClientMatch",
+    "ClientMatcher",
+    "DocumentGraphWrite",
     "DocumentNotFoundError",
+    "DocumentPathIndex",
     "DocumentStore",
     "DocumentStoreError",
     "DuplicateDetector",
     "DuplicateResult",
+    "EmbeddingDispatcher",
     "EmbeddingIndex",
     "EmbeddingResult",
+    "EntityResolutionCache",
+    "FeedCache",
+    "FeedDependencies",
     "GraphIndex",
     "GraphNode",
     "GraphRelationship",
     "GroupAccessDeniedError",
     "GroupService",
     "IngestError",
+    "IngestJob",
+    "IngestJobQueue",
+    "IngestJobStatus",
     "IngestResult",
     "IngestService",
     "IngestStatus",
@@ -156,10 +223,14 @@ __all__ = [
     "LLMRateLimitError",
     "LLMService",
     "LLMServiceError",
+    "MandateEmbeddingStore",
     "MandateEnrichmentError",
     "MandateEnrichmentResult",
+    "MinHashLSHIndex",
     "NodeLabel",
     "PUBLIC_GROUP",
+    "PreparedEmbedding",
+    "QueryEmbeddingCache",
     "QueryFilters",
     "QueryResponse",
     "QueryResult",
@@ -171,18 +242,29 @@ __all__ = [
     "SourceRegistry",
     "SourceRegistryError",
     "SourceValidationError",
+    "TickerMatcher",
+    "TokenBucket",
     "TraversalResult",
     "WordCountError",
     "check_duplicate",
     "compute_content_hash",
     "compute_mandate_hash",
     "cosine_similarity",
+    "create_async_llm_service",
     "create_audit_service",
+    "create_chunk_embedding_store",
+    "create_client_matcher",
+    "create_embedding_dispatcher",
     "create_embedding_index",
+    "create_entity_resolution_cache",
+    "create_feed_cache",
     "create_graph_index",
+    "create_ingest_queue",
     "create_ingest_service",
     "create_llm_embedding_function",
     "create_llm_service",
+    "create_mandate_embedding_store",
+    "create_query_embedding_cache",
     "create_query_service",
     "detect_language",
     "detect_language_with_confidence",
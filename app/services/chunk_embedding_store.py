@@ -0,0 +1,147 @@
+"""Chunk Embedding Store.
+
+Content-addressed, persistent store of chunk embeddings so unchanged chunk
+text is never sent to the embeddings API twice: re-ingesting a document,
+saving a new version, or rebuilding a ChromaDB collection from the
+DocumentStore only embeds chunks whose text (for that model) is new.
+
+Vectors are keyed on (embedding model, SHA-256 of the exact chunk text) and
+kept in a VectorLog under ``base_path`` with one
+``model<TAB>digest<TAB>offset<TAB>dim`` index line per vector. Entries are
+never evicted; deleting the directory resets the store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from app.logger import StructuredLogger
+from app.services.vector_log import VectorLog
+
+__all__ = [
+    "ChunkEmbeddingStore",
+    "create_chunk_embedding_store",
+]
+
+logger = StructuredLogger(__name__)
+
+
+class ChunkEmbeddingStore:
+    """Thread-safe append-only store of chunk embeddings.
+
+    Attributes:
+        base_path: Directory holding vectors.f32, index.tsv and write.lock
+    """
+
+    def __init__(self, base_path: Path) -> None:
+        self.base_path = Path(base_path)
+        self._log = VectorLog(self.base_path)
+        self._lock = threading.Lock()
+        # (model, digest) -> (offset in floats, dimensions)
+        self._index: dict[tuple[str, str], tuple[int, int]] = {}
+        self._hits = 0
+        self._misses = 0
+        with self._lock:
+            self._refresh_index()
+
+    @staticmethod
+    def digest(text: str) -> str:
+        """Content address of a chunk's text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, model: str, texts: Sequence[str]) -> list[list[float] | None]:
+        """Look up embeddings for chunk texts (None where not stored)."""
+        digests = [self.digest(text) for text in texts]
+        with self._lock:
+            if any((model, d) not in self._index for d in digests):
+                # Another process may have appended since we last looked
+                self._refresh_index()
+            found: list[list[float] | None] = []
+            for d in digests:
+                location = self._index.get((model, d))
+                if location is None:
+                    self._misses += 1
+                    found.append(None)
+                    continue
+                vector = self._log.read(*location)
+                if vector is None:
+                    self._misses += 1
+                else:
+                    self._hits += 1
+                found.append(vector)
+            return found
+
+    def put_many(self, model: str, texts: Sequence[str], embeddings: Sequence[Sequence[float]]) -> int:
+        """Append embeddings for chunk texts not already stored.
+
+        Returns:
+            Number of vectors written
+        """
+        if len(texts) != len(embeddings):
+            raise ValueError("texts and embeddings must have the same length")
+        with self._lock, self._log.writer_lock():
+            self._refresh_index()
+            pending: dict[str, Sequence[float]] = {}
+            for text, embedding in zip(texts, embeddings):
+                d = self.digest(text)
+                if (model, d) not in self._index and d not in pending:
+                    pending[d] = embedding
+            if not pending:
+                return 0
+
+            locations = self._log.append_vectors(pending.values())
+            # Index lines only after their vectors are on disk
+            self._log.append_index(
+                [(model, d, offset, dim) for d, (offset, dim) in zip(pending, locations)]
+            )
+            self._refresh_index()
+            return len(locations)
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for health_check."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "vectors": len(self._index),
+                "bytes": self._log.size_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def _refresh_index(self) -> None:
+        """Replay index lines appended since the last refresh. Caller holds the lock."""
+        for parts in self._log.read_index():
+            if len(parts) != 4:
+                continue
+            model, d, offset, dim = parts
+            self._index[(model, d)] = (int(offset), int(dim))
+
+    def __repr__(self) -> str:
+        return f"ChunkEmbeddingStore(path={self.base_path}, vectors={len(self)})"
+
+
+def create_chunk_embedding_store(base_path: Path) -> ChunkEmbeddingStore | None:
+    """Create a ChunkEmbeddingStore from environment configuration.
+
+    Environment:
+        GOFR_IQ_CHUNK_EMBEDDING_STORE: Set to 0/false/no to disable (default on)
+
+    Args:
+        base_path: Directory for the store (e.g. <storage>/embeddings)
+
+    Returns:
+        ChunkEmbeddingStore, or None when disabled
+    """
+    if os.environ.get("GOFR_IQ_CHUNK_EMBEDDING_STORE", "").lower() in ("0", "false", "no"):
+        return None
+    return ChunkEmbeddingStore(base_path)
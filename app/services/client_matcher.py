@@ -0,0 +1,427 @@
+"""Client Matcher.
+
+Standing-query matching of newly ingested documents against every client,
+so relevance is pushed at ingest time instead of only being computed when a
+feed is pulled.
+
+Each successfully ingested document is scored once against:
+- a ticker -> client inverted index built from HOLDS and WATCHES
+  (reasons DIRECT_HOLDING and WATCHLIST)
+- a matrix of all client mandate embeddings (reason VECTOR): one matrix
+  product against the document's chunk embeddings gives each client's best
+  chunk similarity, the same measure as the VECTOR feed channel
+
+The best-scoring clients get a ClientMatch appended to their inbox, a
+bounded ring buffer held in memory (newest first on read; lost on restart).
+Feed tools read an inbox without touching the graph, and it is the hook for
+real-time alerting.
+
+The client universe is loaded from Neo4j (mandate vectors from the mandate
+embedding store) on first use, when invalidate() has been called after a
+portfolio, watchlist or profile change, and at most every
+``refresh_interval_seconds`` otherwise.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from app.logger import StructuredLogger
+
+if TYPE_CHECKING:
+    from app.services.graph_index import GraphIndex
+    from app.services.mandate_embedding_store import MandateEmbeddingStore
+
+__all__ = [
+    "ClientMatch",
+    "ClientMatcher",
+    "create_client_matcher",
+]
+
+logger = StructuredLogger(__name__)
+
+DIRECT_HOLDING = "DIRECT_HOLDING"
+WATCHLIST = "WATCHLIST"
+VECTOR = "VECTOR"
+
+# Score of a position match; a vector match scores its similarity (0-1)
+_POSITION_SCORES = {DIRECT_HOLDING: 1.0, WATCHLIST: 0.8}
+
+
+@dataclass(frozen=True)
+class ClientMatch:
+    """One document matched to one client at ingest time."""
+
+    document_guid: str
+    group_guid: str
+    title: str
+    score: float
+    reasons: tuple[str, ...]
+    tickers: tuple[str, ...] = ()
+    similarity: float = 0.0
+    impact_score: float | None = None
+    impact_tier: str | None = None
+    created_at: str | None = None
+    matched_at: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "document_guid": self.document_guid,
+            "group_guid": self.group_guid,
+            "title": self.title,
+            "score": round(self.score, 4),
+            "reasons": list(self.reasons),
+            "tickers": list(self.tickers),
+            "similarity": round(self.similarity, 4),
+            "impact_score": self.impact_score,
+            "impact_tier": self.impact_tier,
+            "created_at": self.created_at,
+            "matched_at": datetime.fromtimestamp(self.matched_at, UTC).isoformat(),
+        }
+
+
+@dataclass
+class _Universe:
+    """Snapshot of every active client, swapped in whole by refresh()."""
+
+    # ticker -> [(client_guid, reason)]
+    positions: dict[str, list[tuple[str, str]]] = field(default_factory=dict)
+    # Unit-length mandate embeddings, one row per client in vector_clients
+    mandates: np.ndarray | None = None
+    vector_clients: list[str] = field(default_factory=list)
+    clients: int = 0
+    loaded_at: float = 0.0
+
+
+class ClientMatcher:
+    """Matches new documents against all clients' positions and mandates.
+
+    Attributes:
+        graph_index: Source of clients, positions and unmigrated mandate vectors
+        mandate_store: Mandate embeddings keyed by profile guid
+        inbox_size: Matches kept per client (oldest dropped first)
+        max_clients_per_document: Best-scoring clients recorded per document
+        similarity_threshold: Minimum mandate similarity for a VECTOR match
+        refresh_interval_seconds: Maximum age of the loaded client universe
+    """
+
+    def __init__(
+        self,
+        graph_index: GraphIndex,
+        mandate_store: MandateEmbeddingStore | None = None,
+        inbox_size: int = 200,
+        max_clients_per_document: int = 100,
+        similarity_threshold: float = 0.4,
+        refresh_interval_seconds: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.graph_index = graph_index
+        self.mandate_store = mandate_store
+        self.inbox_size = max(1, inbox_size)
+        self.max_clients_per_document = max(1, max_clients_per_document)
+        self.similarity_threshold = similarity_threshold
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._universe: _Universe | None = None
+        self._stale = True
+        self._inboxes: dict[str, deque[ClientMatch]] = {}
+        self._documents = 0
+        self._matches = 0
+        self._refreshes = 0
+
+    def invalidate(self) -> None:
+        """Reload the client universe before the next match (positions or mandate changed)."""
+        self._stale = True
+
+    def refresh(self) -> int:
+        """Load every active client's positions and mandate vector.
+
+        Returns:
+            Number of clients loaded
+        """
+        with self._refresh_lock:
+            return self._refresh_locked().clients
+
+    def match_document(
+        self,
+        document_guid: str,
+        group_guid: str,
+        title: str,
+        tickers: Sequence[str] = (),
+        embeddings: Sequence[Sequence[float]] = (),
+        impact_score: float | None = None,
+        impact_tier: str | None = None,
+        created_at: datetime | None = None,
+    ) -> list[tuple[str, ClientMatch]]:
+        """Score a document against every client and record the best matches.
+
+        Args:
+            document_guid: Document GUID
+            group_guid: Document group (inbox reads are filtered by it)
+            title: Document title
+            tickers: Instruments the document affects
+            embeddings: The document's chunk embeddings
+            impact_score: Extracted impact score
+            impact_tier: Extracted impact tier
+            created_at: Document timestamp
+
+        Returns:
+            (client_guid, match) pairs recorded, best first
+        """
+        universe = self._current_universe()
+
+        reasons: dict[str, set[str]] = {}
+        matched_tickers: dict[str, set[str]] = {}
+        for ticker in dict.fromkeys(t.upper() for t in tickers if t):
+            for client_guid, reason in universe.positions.get(ticker, ()):
+                reasons.setdefault(client_guid, set()).add(reason)
+                matched_tickers.setdefault(client_guid, set()).add(ticker)
+
+        similarities: dict[str, float] = {}
+        if universe.mandates is not None and len(embeddings):
+            chunks = np.asarray(embeddings, dtype=np.float32)
+            if chunks.ndim == 2 and chunks.shape[1] == universe.mandates.shape[1]:
+                norms = np.linalg.norm(chunks, axis=1, keepdims=True)
+                chunks = chunks / np.where(norms > 0, norms, 1.0)
+                # (clients x dim) @ (dim x chunks): best chunk per client
+                best = (universe.mandates @ chunks.T).max(axis=1)
+                for row in np.flatnonzero(best >= self.similarity_threshold):
+                    client_guid = universe.vector_clients[row]
+                    similarities[client_guid] = float(best[row])
+                    reasons.setdefault(client_guid, set()).add(VECTOR)
+
+        scored: list[tuple[float, str]] = []
+        for client_guid, client_reasons in reasons.items():
+            score = max(
+                _POSITION_SCORES.get(r, similarities.get(client_guid, 0.0)) for r in client_reasons
+            )
+            scored.append((score, client_guid))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+
+        now = self._clock()
+        recorded: list[tuple[str, ClientMatch]] = []
+        for score, client_guid in scored[: self.max_clients_per_document]:
+            recorded.append(
+                (
+                    client_guid,
+                    ClientMatch(
+                        document_guid=document_guid,
+                        group_guid=group_guid,
+                        title=title,
+                        score=score,
+                        reasons=tuple(r for r in (DIRECT_HOLDING, WATCHLIST, VECTOR) if r in reasons[client_guid]),
+                        tickers=tuple(sorted(matched_tickers.get(client_guid, ()))),
+                        similarity=similarities.get(client_guid, 0.0),
+                        impact_score=impact_score,
+                        impact_tier=impact_tier,
+                        created_at=created_at.isoformat() if created_at else None,
+                        matched_at=now,
+                    ),
+                )
+            )
+
+        with self._lock:
+            for client_guid, match in recorded:
+                inbox = self._inboxes.get(client_guid)
+                if inbox is None:
+                    inbox = self._inboxes[client_guid] = deque(maxlen=self.inbox_size)
+                inbox.append(match)
+            self._documents += 1
+            self._matches += len(recorded)
+        return recorded
+
+    def get_matches(
+        self,
+        client_guid: str,
+        group_guids: Sequence[str] | None = None,
+        limit: int | None = None,
+    ) -> list[ClientMatch]:
+        """A client's recorded matches, newest first.
+
+        Args:
+            client_guid: Client GUID
+            group_guids: Only documents in these groups (None for all)
+            limit: Maximum matches returned
+        """
+        with self._lock:
+            inbox = list(self._inboxes.get(client_guid, ()))
+        allowed = set(group_guids) if group_guids is not None else None
+        matches = [m for m in reversed(inbox) if allowed is None or m.group_guid in allowed]
+        return matches[:limit] if limit is not None else matches
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for health_check."""
+        with self._lock:
+            universe = self._universe
+            return {
+                "clients": universe.clients if universe else 0,
+                "mandate_vectors": len(universe.vector_clients) if universe else 0,
+                "tickers": len(universe.positions) if universe else 0,
+                "inboxes": len(self._inboxes),
+                "inbox_size": self.inbox_size,
+                "documents_matched": self._documents,
+                "matches_recorded": self._matches,
+                "refreshes": self._refreshes,
+            }
+
+    def _current_universe(self) -> _Universe:
+        universe = self._universe
+        if universe is None or self._needs_refresh(universe):
+            with self._refresh_lock:
+                # Another thread may have reloaded while we waited
+                universe = self._universe
+                if universe is None or self._needs_refresh(universe):
+                    universe = self._refresh_locked()
+        return universe
+
+    def _needs_refresh(self, universe: _Universe) -> bool:
+        return self._stale or self._clock() - universe.loaded_at > self.refresh_interval_seconds
+
+    def _refresh_locked(self) -> _Universe:
+        """Reload and swap in the client universe. Caller holds the refresh lock."""
+        # Cleared first, so an invalidate() during the load triggers another
+        self._stale = False
+        universe = self._load_universe()
+        with self._lock:
+            self._universe = universe
+            self._refreshes += 1
+        logger.info(
+            "Client matcher refreshed",
+            clients=universe.clients,
+            mandate_vectors=len(universe.vector_clients),
+            tickers=len(universe.positions),
+        )
+        return universe
+
+    def _load_universe(self) -> _Universe:
+        with self.graph_index._get_session() as session:
+            rows = [
+                dict(record)
+                for record in session.run(
+                    """
+                    MATCH (c:Client)
+                    WHERE coalesce(c.status, 'active') <> 'defunct'
+                    OPTIONAL MATCH (c)-[:HAS_PROFILE]->(cp:ClientProfile)
+                    CALL {
+                        WITH c
+                        OPTIONAL MATCH (c)-[:HAS_PORTFOLIO]->(:Portfolio)-[:HOLDS]->(hi:Instrument)
+                        RETURN collect(DISTINCT hi.ticker) AS holdings
+                    }
+                    CALL {
+                        WITH c
+                        OPTIONAL MATCH (c)-[:HAS_WATCHLIST]->(:Watchlist)-[:WATCHES]->(wi:Instrument)
+                        RETURN collect(DISTINCT wi.ticker) AS watchlist
+                    }
+                    RETURN c.guid AS client_guid,
+                           cp.guid AS profile_guid,
+                           holdings, watchlist
+                    """
+                )
+            ]
+
+        positions: dict[str, list[tuple[str, str]]] = {}
+        profiles: dict[str, str] = {}
+        for row in rows:
+            client_guid = row["client_guid"]
+            for reason, key in ((DIRECT_HOLDING, "holdings"), (WATCHLIST, "watchlist")):
+                for ticker in row.get(key) or []:
+                    if ticker:
+                        positions.setdefault(ticker.upper(), []).append((client_guid, reason))
+            if row.get("profile_guid"):
+                profiles[row["profile_guid"]] = client_guid
+
+        # One pass over the store for every profile
+        stored = self.mandate_store.get_many(profiles) if self.mandate_store is not None else {}
+        vectors = {profiles[guid]: vector for guid, vector in stored.items() if vector}
+        unmigrated = [guid for guid in profiles if guid not in stored]
+
+        if unmigrated:
+            # Profiles not yet moved to the mandate embedding store
+            with self.graph_index._get_session() as session:
+                for record in session.run(
+                    """
+                    UNWIND $profile_guids AS profile_guid
+                    MATCH (cp:ClientProfile {guid: profile_guid})
+                    WHERE cp.mandate_embedding IS NOT NULL
+                    RETURN cp.guid AS profile_guid, cp.mandate_embedding AS mandate_embedding
+                    """,
+                    profile_guids=unmigrated,
+                ):
+                    embedding = record["mandate_embedding"]
+                    if isinstance(embedding, list) and embedding:
+                        vectors[profiles[record["profile_guid"]]] = embedding
+
+        universe = _Universe(positions=positions, clients=len(rows), loaded_at=self._clock())
+        if vectors:
+            # Vectors from another embedding model cannot be compared: keep the common size
+            dim = Counter(len(v) for v in vectors.values()).most_common(1)[0][0]
+            universe.vector_clients = [guid for guid, v in vectors.items() if len(v) == dim]
+            mandates = np.asarray([vectors[guid] for guid in universe.vector_clients], dtype=np.float32)
+            norms = np.linalg.norm(mandates, axis=1, keepdims=True)
+            universe.mandates = mandates / np.where(norms > 0, norms, 1.0)
+        return universe
+
+    def __repr__(self) -> str:
+        universe = self._universe
+        return (
+            f"ClientMatcher(clients={universe.clients if universe else 0}, "
+            f"inbox_size={self.inbox_size})"
+        )
+
+
+def create_client_matcher(
+    graph_index: GraphIndex | None,
+    mandate_store: MandateEmbeddingStore | None = None,
+) -> ClientMatcher | None:
+    """Create a ClientMatcher from environment configuration.
+
+    Environment:
+        GOFR_IQ_CLIENT_MATCHER: Set to 1/true/yes to match documents to clients at ingest
+        GOFR_IQ_CLIENT_INBOX_SIZE: Matches kept per client (default 200)
+        GOFR_IQ_CLIENT_MATCHER_MAX_CLIENTS: Clients recorded per document (default 100)
+        GOFR_IQ_CLIENT_MATCHER_REFRESH_SECONDS: Maximum age of the loaded clients (default 300)
+        GOFR_IQ_VECTOR_SIMILARITY_THRESHOLD: Minimum mandate similarity, as for
+            the VECTOR feed channel (default 0.4)
+
+    Returns:
+        ClientMatcher, or None when disabled or there is no graph index
+    """
+    if graph_index is None:
+        return None
+    if os.environ.get("GOFR_IQ_CLIENT_MATCHER", "").lower() not in ("1", "true", "yes"):
+        return None
+    try:
+        inbox_size = int(os.environ.get("GOFR_IQ_CLIENT_INBOX_SIZE", "200"))
+    except ValueError:
+        inbox_size = 200
+    try:
+        max_clients = int(os.environ.get("GOFR_IQ_CLIENT_MATCHER_MAX_CLIENTS", "100"))
+    except ValueError:
+        max_clients = 100
+    try:
+        refresh_seconds = float(os.environ.get("GOFR_IQ_CLIENT_MATCHER_REFRESH_SECONDS", "300"))
+    except ValueError:
+        refresh_seconds = 300.0
+    try:
+        threshold = float(os.environ.get("GOFR_IQ_VECTOR_SIMILARITY_THRESHOLD", "0.4"))
+    except ValueError:
+        threshold = 0.4
+    return ClientMatcher(
+        graph_index,
+        mandate_store=mandate_store,
+        inbox_size=inbox_size,
+        max_clients_per_document=max_clients,
+        similarity_threshold=threshold,
+        refresh_interval_seconds=refresh_seconds,
+    )
@@ -0,0 +1,166 @@
+"""Document Path Index.
+
+Persistent GUID -> (group, date) index for DocumentStore, so a document can
+be found without probing every date directory (and, for access checks,
+every group) for ``<guid>.json``.
+
+The index is an append-only log, ``guid_index.tsv``, next to the group
+directories:
+- ``+<TAB>guid<TAB>group<TAB>YYYY-MM-DD``: document saved
+- ``-<TAB>guid``: document deleted
+
+Every process keeps the replayed log in a dict and reads only the lines
+appended since its last lookup, so writes from other processes sharing the
+storage volume are seen on the next miss. rebuild() rescans the document
+tree and writes a compacted log (one line per live document); other
+processes notice the replaced file and reload it.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from app.logger import StructuredLogger
+
+__all__ = [
+    "DocumentPathIndex",
+]
+
+logger = StructuredLogger(__name__)
+
+
+class DocumentPathIndex:
+    """Thread-safe GUID -> (group_guid, date) index backed by an append-only log.
+
+    Attributes:
+        index_path: Path of the log file
+    """
+
+    def __init__(self, index_path: Path) -> None:
+        self.index_path = Path(index_path)
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[str, str]] = {}
+        self._bytes_read = 0
+        self._file_id: tuple[int, int] | None = None
+        # Log lines that no longer describe a live document (deletes, overwrites)
+        self._dead_lines = 0
+
+    def exists(self) -> bool:
+        """Whether the log file has been created (by put or rebuild)."""
+        return self.index_path.exists()
+
+    def get(self, guid: str) -> tuple[str, str] | None:
+        """Return (group_guid, date) for a document, or None if not indexed."""
+        with self._lock:
+            entry = self._entries.get(guid)
+            if entry is None:
+                # Another process may have appended since we last looked
+                self._refresh()
+                entry = self._entries.get(guid)
+            return entry
+
+    def put(self, guid: str, group_guid: str, date: str) -> None:
+        """Record a saved document."""
+        with self._lock:
+            self._append(f"+\t{guid}\t{group_guid}\t{date}\n")
+
+    def remove(self, guid: str) -> None:
+        """Record a deleted document."""
+        with self._lock:
+            self._append(f"-\t{guid}\n")
+
+    def rebuild(self, documents_path: Path) -> int:
+        """Rescan ``{group}/{date}/{guid}.json`` under documents_path and write a compacted log.
+
+        Only directory entries are read (no JSON parsing).
+
+        Returns:
+            Number of documents indexed
+        """
+        entries: dict[str, tuple[str, str]] = {}
+        documents_path = Path(documents_path)
+        if documents_path.exists():
+            with os.scandir(documents_path) as groups:
+                for group in groups:
+                    if not group.is_dir():
+                        continue
+                    with os.scandir(group.path) as dates:
+                        for date in dates:
+                            if not date.is_dir():
+                                continue
+                            with os.scandir(date.path) as files:
+                                for doc_file in files:
+                                    if doc_file.name.endswith(".json") and doc_file.is_file():
+                                        entries[doc_file.name[: -len(".json")]] = (group.name, date.name)
+
+        with self._lock:
+            tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                fh.writelines(f"+\t{guid}\t{group}\t{date}\n" for guid, (group, date) in entries.items())
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp_path, self.index_path)
+            self._entries = {}
+            self._bytes_read = 0
+            self._file_id = None
+            self._dead_lines = 0
+            self._refresh()
+        logger.info("Document path index rebuilt", documents=len(entries), path=str(self.index_path))
+        return len(entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Index size and log overhead (dead lines are dropped by rebuild)."""
+        with self._lock:
+            self._refresh()
+            return {
+                "documents": len(self._entries),
+                "dead_lines": self._dead_lines,
+                "bytes": self._bytes_read,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _append(self, line: str) -> None:
+        """Append one log line and replay it (with any lines before it). Caller holds the lock."""
+        # Single small O_APPEND writes do not interleave between processes
+        with open(self.index_path, "a", encoding="utf-8") as fh:
+            fh.write(line)
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """Replay log lines appended since the last refresh. Caller holds the lock."""
+        try:
+            stat = self.index_path.stat()
+        except FileNotFoundError:
+            return
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self._file_id or stat.st_size < self._bytes_read:
+            # Replaced by a rebuild in another process: start over
+            self._entries = {}
+            self._bytes_read = 0
+            self._dead_lines = 0
+            self._file_id = file_id
+        if stat.st_size == self._bytes_read:
+            return
+        with open(self.index_path, "rb") as fh:
+            fh.seek(self._bytes_read)
+            tail = fh.read()
+        # Ignore a trailing partial line from a concurrent writer
+        complete = tail[: tail.rfind(b"\n") + 1]
+        self._bytes_read += len(complete)
+        for raw in complete.decode("utf-8").splitlines():
+            parts = raw.split("\t")
+            if parts[0] == "+" and len(parts) == 4:
+                if parts[1] in self._entries:
+                    self._dead_lines += 1
+                self._entries[parts[1]] = (parts[2], parts[3])
+            elif parts[0] == "-" and len(parts) == 2:
+                self._dead_lines += 2 if self._entries.pop(parts[1], None) is not None else 1
+
+    def __repr__(self) -> str:
+        return f"DocumentPathIndex(path={self.index_path}, documents={len(self)})"
@@ -6,6 +6,7 @@ This module provides file-based storage for documents with:
 - Date-based subdirectories
 - Document versioning support
 - Group-based access control
+- GUID -> (group, date) index so loads do not probe every date directory
 """
 
 from __future__ import annotations
@@ -16,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from app.models import Document, DocumentCreate, count_words
+from app.services.document_index import DocumentPathIndex
 
 
 class DocumentNotFoundError(Exception):
@@ -55,19 +57,44 @@ class DocumentStore:
     Documents are stored in a directory structure:
         {base_path}/documents/{group_guid}/{YYYY-MM-DD}/{guid}.json
 
+    With use_index (the default), a DocumentPathIndex at
+    {base_path}/guid_index.tsv maps each GUID to its group and date. It is
+    maintained on save and delete and built from the directory tree the
+    first time a store is opened without one.
+
     Attributes:
         base_path: Root path for all document storage
+        index: GUID -> (group, date) index, or None when disabled
     """
 
-    def __init__(self, base_path: str | Path) -> None:
+    def __init__(self, base_path: str | Path, use_index: bool = True) -> None:
         """Initialize the document store.
 
         Args:
             base_path: Root directory for document storage
+            use_index: Maintain and use the GUID -> path index
         """
         self.base_path = Path(base_path)
         self._documents_path = self.base_path / "documents"
         self._ensure_directories()
+        self.index: DocumentPathIndex | None = None
+        if use_index:
+            self.index = DocumentPathIndex(self.base_path / "guid_index.tsv")
+            if not self.index.exists():
+                self.index.rebuild(self._documents_path)
+
+    def rebuild_index(self) -> int:
+        """Rebuild the GUID -> path index from the files on disk.
+
+        Returns:
+            Number of documents indexed
+
+        Raises:
+            DocumentStoreError: If the index is disabled
+        """
+        if self.index is None:
+            raise DocumentStoreError("Document index is disabled for this store")
+        return self.index.rebuild(self._documents_path)
 
     def _ensure_directories(self) -> None:
         """Ensure base directories exist."""
@@ -125,6 +152,8 @@ class DocumentStore:
             with file_path.open("w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
 
+            if self.index is not None:
+                self.index.put(document.guid, document.group_guid, file_path.parent.name)
             return file_path
         except Exception as e:
             raise DocumentStoreError(f"Failed to save document {document.guid}: {e}") from e
@@ -155,7 +184,15 @@ class DocumentStore:
                 if file_path.exists():
                     return self._load_from_path(file_path)
 
+            if self.index is not None:
+                file_path = self._indexed_path(guid)
+                if file_path is not None:
+                    if file_path.parent.parent.name != group_guid:
+                        raise DocumentNotFoundError(guid, group_guid)
+                    return self._load_from_path(file_path)
+
             # Otherwise, search all date directories in the group
+            # (files written without the index are added to it when found)
             group_path = self._get_group_path(group_guid)
             if not group_path.exists():
                 raise DocumentNotFoundError(guid, group_guid)
@@ -164,6 +201,8 @@ class DocumentStore:
                 if date_dir.is_dir():
                     file_path = date_dir / f"{guid}.json"
                     if file_path.exists():
+                        if self.index is not None:
+                            self.index.put(guid, group_guid, date_dir.name)
                         return self._load_from_path(file_path)
 
             raise DocumentNotFoundError(guid, group_guid)
@@ -196,6 +235,18 @@ class DocumentStore:
             DocumentAccessDeniedError: If document exists but user lacks access
             DocumentStoreError: If load fails
         """
+        if self.index is not None:
+            file_path = self._indexed_path(guid)
+            if file_path is not None:
+                group_guid = file_path.parent.parent.name
+                if group_guid not in permitted_groups:
+                    raise DocumentAccessDeniedError(
+                        guid=guid,
+                        group_guid=group_guid,
+                        permitted_groups=permitted_groups,
+                    )
+                return self._load_from_path(file_path)
+
         # Try each permitted group
         for group_guid in permitted_groups:
             try:
@@ -250,6 +301,24 @@ class DocumentStore:
         
         return documents
 
+    def _indexed_path(self, guid: str) -> Path | None:
+        """Return the indexed file path for a GUID if the file is still there.
+
+        A stale entry (file removed outside this store) is dropped from the
+        index and None returned so callers fall back to a directory search.
+        """
+        if self.index is None:
+            return None
+        entry = self.index.get(guid)
+        if entry is None:
+            return None
+        group_guid, date_str = entry
+        file_path = self._documents_path / group_guid / date_str / f"{guid}.json"
+        if file_path.exists():
+            return file_path
+        self.index.remove(guid)
+        return None
+
     def _load_from_path(self, file_path: Path) -> Document:
         """Load a document from a specific path.
 
@@ -300,6 +369,8 @@ class DocumentStore:
                 doc.guid, doc.group_guid, doc.created_at
             )
             file_path.unlink()
+            if self.index is not None:
+                self.index.remove(guid)
             return True
         except DocumentNotFoundError:
             return False
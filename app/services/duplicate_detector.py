@@ -4,6 +4,11 @@ Detects exact and near-duplicate documents at ingestion time.
 Uses content hashing for exact matches and cosine similarity
 for near-duplicates.
 
+The in-memory near-duplicate check is indexed: token vectors are computed
+once at register() time and a MinHash/LSH index narrows the candidates that
+are scored with the exact token cosine, so check() no longer re-tokenizes
+every registered document.
+
 Duplicate documents are still stored (append-only) but flagged
 with duplicate_of and duplicate_score fields.
 """
@@ -11,9 +16,12 @@ with duplicate_of and duplicate_score fields.
 from __future__ import annotations
 
 import hashlib
+import itertools
 import re
+from collections import Counter
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -27,6 +35,7 @@ if TYPE_CHECKING:
 __all__ = [
     "DuplicateDetector",
     "DuplicateResult",
+    "MinHashLSHIndex",
     "compute_content_hash",
     "normalize_text",
     "tokenize",
@@ -75,12 +84,36 @@ class CandidateDocument:
         content_hash: SHA-256 hash of normalized content
         title: Document title
         content: Document content (for similarity calculation)
+        created_at: Document timestamp (used for time_window_hours pruning)
     """
 
     guid: str
     content_hash: str
     title: str = ""
     content: str = ""
+    created_at: datetime | None = None
+
+
+@dataclass
+class _TokenVector:
+    """Term-frequency vector precomputed at register() time."""
+
+    freqs: dict[str, int]
+    magnitude: int  # sum of squared term frequencies
+    seq: int  # registration order, used for deterministic tie-breaking
+
+    @classmethod
+    def from_tokens(cls, tokens: list[str], seq: int = 0) -> _TokenVector:
+        freqs = dict(Counter(tokens))
+        return cls(freqs=freqs, magnitude=sum(v * v for v in freqs.values()), seq=seq)
+
+    def cosine(self, other: _TokenVector) -> float:
+        """Same value as cosine_similarity() on the original token lists."""
+        if not self.magnitude or not other.magnitude:
+            return 0.0
+        small, large = (self.freqs, other.freqs) if len(self.freqs) <= len(other.freqs) else (other.freqs, self.freqs)
+        dot = sum(v * large.get(term, 0) for term, v in small.items())
+        return dot / (self.magnitude**0.5 * other.magnitude**0.5)
 
 
 # =============================================================================
@@ -223,6 +256,174 @@ def compute_story_fingerprint(
     return f"{event_norm}|{date_key}|{','.join(tickers_norm)}"
 
 
+# =============================================================================
+# MINHASH / LSH INDEX
+# =============================================================================
+
+
+_HASH_MASK = (1 << 64) - 1
+
+
+@lru_cache(maxsize=65536)
+def _token_hash(token: str) -> int:
+    """Stable 64-bit token hash (independent of PYTHONHASHSEED)."""
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _shingle_hashes(freqs: dict[str, int]) -> list[int]:
+    """Hash every token occurrence; the k-th repeat of a token is its own element.
+
+    Expanding repeats keeps the MinHash estimate closer to the term-frequency
+    cosine used for verification than a plain token set would.
+    """
+    hashes: list[int] = []
+    for token, count in freqs.items():
+        base = _token_hash(token)
+        hashes.append(base)
+        for k in range(1, count):
+            hashes.append(((base ^ k) * 0x9E3779B97F4A7C15) & _HASH_MASK)
+    return hashes
+
+
+class MinHashLSHIndex:
+    """Banded MinHash index for candidate lookup.
+
+    Uses one-permutation MinHash (a single hash per token, split into
+    `bands * rows` bins, empty bins densified by rotation) so signatures stay
+    cheap to compute in pure Python. Documents sharing any band bucket are
+    returned as candidates; callers verify them with an exact similarity.
+
+    Attributes:
+        bands: Number of LSH bands
+        rows: MinHash values per band
+    """
+
+    def __init__(self, bands: int = 25, rows: int = 5) -> None:
+        if bands < 1 or rows < 1:
+            raise ValueError("bands and rows must be >= 1")
+        self.bands = bands
+        self.rows = rows
+        self.num_perm = bands * rows
+        self._buckets: list[dict[int, list[str]]] = [{} for _ in range(bands)]
+        self._keys: dict[str, list[int]] = {}
+
+    @classmethod
+    def for_threshold(
+        cls,
+        cosine_threshold: float,
+        num_perm: int = 128,
+        recall: float = 0.99,
+    ) -> MinHashLSHIndex:
+        """Pick the most selective banding that still finds near-duplicates.
+
+        A cosine of t between token sets implies a Jaccard of at least t**2, so
+        rows are chosen as large as possible while a pair at that Jaccard is
+        still a candidate with probability >= recall.
+        """
+        jaccard = min(1.0, max(0.0, cosine_threshold)) ** 2
+        best_rows = 1
+        for rows in range(1, num_perm + 1):
+            bands = num_perm // rows
+            if 1.0 - (1.0 - jaccard**rows) ** bands >= recall:
+                best_rows = rows
+            else:
+                break
+        return cls(bands=num_perm // best_rows, rows=best_rows)
+
+    def signature(self, hashes: list[int]) -> list[int]:
+        """One-permutation MinHash signature; empty list if there are no hashes."""
+        if not hashes:
+            return []
+        n = self.num_perm
+        empty = _HASH_MASK + 1
+        mins = [empty] * n
+        for h in hashes:
+            b = h % n
+            v = h // n
+            if v < mins[b]:
+                mins[b] = v
+        if empty in mins:
+            # Densify: borrow the nearest non-empty bin to the right (circular),
+            # offset by the distance so borrowed values stay distinguishable.
+            filled = [v for v in mins if v != empty]
+            if not filled:
+                return []
+            dense = list(mins)
+            for i in range(n):
+                if mins[i] != empty:
+                    continue
+                for d in range(1, n):
+                    j = (i + d) % n
+                    if mins[j] != empty:
+                        dense[i] = mins[j] + d * empty
+                        break
+            mins = dense
+        return mins
+
+    def _band_keys(self, signature: list[int]) -> list[int]:
+        r = self.rows
+        return [hash(tuple(signature[i * r : (i + 1) * r])) for i in range(self.bands)]
+
+    def add(self, guid: str, hashes: list[int]) -> bool:
+        """Index a document. Returns False if it has no tokens."""
+        self.remove(guid)
+        signature = self.signature(hashes)
+        if not signature:
+            return False
+        keys = self._band_keys(signature)
+        for bucket, key in zip(self._buckets, keys):
+            bucket.setdefault(key, []).append(guid)
+        self._keys[guid] = keys
+        return True
+
+    def remove(self, guid: str) -> bool:
+        """Drop a document from every band bucket."""
+        keys = self._keys.pop(guid, None)
+        if keys is None:
+            return False
+        for bucket, key in zip(self._buckets, keys):
+            members = bucket.get(key)
+            if members is None:
+                continue
+            try:
+                members.remove(guid)
+            except ValueError:
+                pass
+            if not members:
+                del bucket[key]
+        return True
+
+    def candidates(self, hashes: list[int]) -> set[str]:
+        """GUIDs sharing at least one band bucket with the given hashes."""
+        signature = self.signature(hashes)
+        if not signature:
+            return set()
+        found: set[str] = set()
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            members = bucket.get(key)
+            if members:
+                found.update(members)
+        return found
+
+    def clear(self) -> None:
+        for bucket in self._buckets:
+            bucket.clear()
+        self._keys.clear()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"MinHashLSHIndex(documents={len(self)}, bands={self.bands}, rows={self.rows})"
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    """Normalize aware datetimes to naive UTC so they compare with utcnow()."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
 # =============================================================================
 # DUPLICATE DETECTOR
 # =============================================================================
@@ -234,12 +435,15 @@ class DuplicateDetector:
 
     Supports two detection methods:
     1. Exact match: SHA-256 hash of normalized content
-    2. Near-duplicate: Cosine similarity on tokenized content
+    2. Near-duplicate: Cosine similarity on tokenized content, with candidates
+       looked up in a MinHash/LSH index sized for similarity_threshold
 
     Attributes:
         similarity_threshold: Minimum similarity for near-duplicate (default 0.95)
         use_hash_detection: Enable exact hash matching (default True)
         use_similarity_detection: Enable similarity matching (default True)
+        time_window_hours: Registered documents older than this (relative to
+            the checked document) are not near-duplicate candidates
     """
 
     similarity_threshold: float = 0.85
@@ -254,6 +458,17 @@ class DuplicateDetector:
     # Internal cache of documents for similarity (guid -> CandidateDocument)
     _similarity_index: dict[str, CandidateDocument] = field(default_factory=dict)
 
+    # Story fingerprints registered with the document (fingerprint -> guids);
+    # covers documents whose graph node is not written yet (bulk ingest)
+    _fingerprint_index: dict[str, set[str]] = field(default_factory=dict)
+    _fingerprints: dict[str, tuple[str, str | None]] = field(default_factory=dict)
+
+    # Precomputed token vectors (guid -> _TokenVector) and their LSH index
+    _token_vectors: dict[str, _TokenVector] = field(default_factory=dict)
+    _lsh: MinHashLSHIndex | None = None
+    _lsh_threshold: float | None = None
+    _seq: itertools.count[int] = field(default_factory=itertools.count)
+
     def __post_init__(self) -> None:
         """Initialize indexes if needed."""
         # Ensure indexes are initialized
@@ -261,6 +476,17 @@ class DuplicateDetector:
             self._hash_index = {}
         if not hasattr(self, "_similarity_index") or self._similarity_index is None:
             self._similarity_index = {}
+        if self._token_vectors is None:
+            self._token_vectors = {}
+
+    def _lsh_index(self) -> MinHashLSHIndex:
+        """LSH index for the current threshold (rebuilt if the threshold changed)."""
+        if self._lsh is None or self._lsh_threshold != self.similarity_threshold:
+            self._lsh = MinHashLSHIndex.for_threshold(self.similarity_threshold)
+            self._lsh_threshold = self.similarity_threshold
+            for guid, vector in self._token_vectors.items():
+                self._lsh.add(guid, _shingle_hashes(vector.freqs))
+        return self._lsh
 
     def check(
         self,
@@ -272,6 +498,7 @@ class DuplicateDetector:
         graph_index: "GraphIndex | None" = None,
         created_at: datetime | None = None,
         extraction: "GraphExtractionResult | None" = None,
+        query_embedding: "Sequence[float] | None" = None,
     ) -> DuplicateResult:
         """Check if content is a duplicate.
 
@@ -283,6 +510,12 @@ class DuplicateDetector:
             title: Document title
             content: Document content
             group: Optional group filter (not used in basic implementation)
+            query_embedding: Precomputed document vector for the ChromaDB probe
+                (e.g. PreparedEmbedding.probe_embedding); avoids re-embedding
+                the text when the caller already has chunk embeddings. Unlike
+                the text probe (title + content) it covers the content only,
+                like the indexed chunks it is compared with, so a rewritten
+                headline does not move the embedding score
 
         Returns:
             DuplicateResult with detection details
@@ -369,6 +602,28 @@ class DuplicateDetector:
                                 score=1.0,
                                 method="fingerprint",
                             )
+
+                    # Registered documents whose graph writes are still pending
+                    cutoff_dt = _as_naive_utc(created_at - timedelta(hours=self.fingerprint_window_hours))
+                    matches: list[tuple[datetime, str]] = []
+                    for guid in self._fingerprint_index.get(fingerprint, ()):
+                        if group is not None and self._fingerprints[guid][1] != group:
+                            continue
+                        candidate = self._similarity_index.get(guid)
+                        registered_at = (
+                            _as_naive_utc(candidate.created_at)
+                            if candidate and candidate.created_at
+                            else datetime.max
+                        )
+                        if registered_at >= cutoff_dt:
+                            matches.append((registered_at, guid))
+                    if matches:
+                        return DuplicateResult(
+                            is_duplicate=True,
+                            duplicate_of=max(matches)[1],
+                            score=1.0,
+                            method="fingerprint",
+                        )
             except Exception:  # nosec B110 - fingerprint is a best-effort signal
                 pass
 
@@ -376,12 +631,20 @@ class DuplicateDetector:
         if self.use_similarity_detection and embedding_index is not None:
             try:
                 # Overfetch then filter by time window and group (group filtering is enforced in search())
-                candidates = embedding_index.search(
-                    query=full_text,
-                    n_results=25,
-                    group_guids=[group] if group else None,
-                    include_content=False,
-                )
+                if query_embedding:
+                    candidates = embedding_index.search_by_embedding(
+                        query_embedding=list(query_embedding),
+                        n_results=25,
+                        group_guids=[group] if group else None,
+                        include_content=False,
+                    )
+                else:
+                    candidates = embedding_index.search(
+                        query=full_text,
+                        n_results=25,
+                        group_guids=[group] if group else None,
+                        include_content=False,
+                    )
                 cutoff_dt = created_at - timedelta(hours=self.time_window_hours)
 
                 best_guid: str | None = None
@@ -412,16 +675,20 @@ class DuplicateDetector:
             except Exception:  # nosec B110 - fallback to in-memory similarity if Chroma query fails
                 pass
 
-        # 3. Check similarity match (legacy in-memory token cosine)
-        if self.use_similarity_detection and self._similarity_index:
-            tokens = tokenize(full_text)
+        # 3. Check similarity match (in-memory token cosine over LSH candidates)
+        if self.use_similarity_detection and self._token_vectors:
+            query = _TokenVector.from_tokens(tokenize(full_text))
+            cutoff = _as_naive_utc(created_at) - timedelta(hours=self.time_window_hours)
             best_match: CandidateDocument | None = None
             best_score = 0.0
 
-            for candidate in self._similarity_index.values():
-                candidate_text = f"{candidate.title} {candidate.content}".strip()
-                candidate_tokens = tokenize(candidate_text)
-                similarity = cosine_similarity(tokens, candidate_tokens)
+            guids = self._lsh_index().candidates(_shingle_hashes(query.freqs))
+            # Registration order keeps tie-breaking identical to a linear scan
+            for guid in sorted(guids, key=lambda g: self._token_vectors[g].seq):
+                candidate = self._similarity_index[guid]
+                if candidate.created_at is not None and _as_naive_utc(candidate.created_at) < cutoff:
+                    continue
+                similarity = query.cosine(self._token_vectors[guid])
 
                 if similarity >= self.similarity_threshold and similarity > best_score:
                     best_match = candidate
@@ -442,28 +709,52 @@ class DuplicateDetector:
         guid: str,
         title: str,
         content: str,
+        created_at: datetime | None = None,
+        *,
+        group: str | None = None,
+        story_fingerprint: str | None = None,
     ) -> None:
         """Register a document for future duplicate detection.
 
+        Tokenizes once and adds the token vector to the LSH index; a GUID that
+        is already registered is replaced.
+
         Args:
             guid: Document GUID
             title: Document title
             content: Document content
+            created_at: Document timestamp (None = never aged out of the window)
+            group: Document group (scopes story_fingerprint matches)
+            story_fingerprint: Story fingerprint, matched by check() alongside
+                the graph lookup so documents not yet written to Neo4j count
         """
+        if guid in self._similarity_index:
+            self.unregister(guid)
+
         full_text = f"{title} {content}".strip()
         content_hash = compute_content_hash(full_text)
 
         # Add to hash index
         self._hash_index[content_hash] = guid
 
+        if story_fingerprint:
+            self._fingerprint_index.setdefault(story_fingerprint, set()).add(guid)
+            self._fingerprints[guid] = (story_fingerprint, group)
+
         # Add to similarity index
         self._similarity_index[guid] = CandidateDocument(
             guid=guid,
             content_hash=content_hash,
             title=title,
             content=content,
+            created_at=created_at,
         )
 
+        vector = _TokenVector.from_tokens(tokenize(full_text), seq=next(self._seq))
+        if vector.magnitude:
+            self._token_vectors[guid] = vector
+            self._lsh_index().add(guid, _shingle_hashes(vector.freqs))
+
     def unregister(self, guid: str) -> bool:
         """Remove a document from the detector.
 
@@ -477,12 +768,22 @@ class DuplicateDetector:
             return False
 
         candidate = self._similarity_index.pop(guid)
+        if self._token_vectors.pop(guid, None) is not None and self._lsh is not None:
+            self._lsh.remove(guid)
 
         # Remove from hash index
         if candidate.content_hash in self._hash_index:
             if self._hash_index[candidate.content_hash] == guid:
                 del self._hash_index[candidate.content_hash]
 
+        fingerprint = self._fingerprints.pop(guid, None)
+        if fingerprint is not None:
+            members = self._fingerprint_index.get(fingerprint[0])
+            if members is not None:
+                members.discard(guid)
+                if not members:
+                    del self._fingerprint_index[fingerprint[0]]
+
         return True
 
     def check_and_register(
@@ -523,7 +824,7 @@ class DuplicateDetector:
         """
         count = 0
         for doc in documents:
-            self.register(doc.guid, doc.title, doc.content)
+            self.register(doc.guid, doc.title, doc.content, created_at=doc.created_at)
             count += 1
         return count
 
@@ -531,6 +832,30 @@ class DuplicateDetector:
         """Clear all registered documents."""
         self._hash_index.clear()
         self._similarity_index.clear()
+        self._token_vectors.clear()
+        self._fingerprint_index.clear()
+        self._fingerprints.clear()
+        if self._lsh is not None:
+            self._lsh.clear()
+
+    def prune(self, older_than: datetime) -> int:
+        """Unregister documents created before `older_than`.
+
+        Such documents can no longer be near-duplicate candidates for newer
+        documents, so long-running services can call this to bound memory.
+
+        Returns:
+            Number of documents removed
+        """
+        cutoff = _as_naive_utc(older_than)
+        stale = [
+            guid
+            for guid, candidate in self._similarity_index.items()
+            if candidate.created_at is not None and _as_naive_utc(candidate.created_at) < cutoff
+        ]
+        for guid in stale:
+            self.unregister(guid)
+        return len(stale)
 
     @property
     def document_count(self) -> int:
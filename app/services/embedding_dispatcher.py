@@ -0,0 +1,264 @@
+"""Embedding Dispatcher.
+
+Sends embedding batches to the embeddings API concurrently instead of one
+after another, for bulk loads and backfills where LLMEmbeddingFunction
+would otherwise leave most of the provider's throughput unused.
+
+- Batches are sized by estimated token count as well as text count
+- Up to max_concurrency batches are in flight at once
+- A shared token bucket limits request rate; a 429 with Retry-After pauses
+  every worker (not just the one that was throttled) until it has passed
+- Results are returned in input order regardless of completion order
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, cast
+
+from app.logger import StructuredLogger
+from app.services.llm_service import LLMAPIError, LLMRateLimitError, LLMServiceError
+
+if TYPE_CHECKING:
+    from app.services.llm_service import LLMService
+
+__all__ = [
+    "EmbeddingDispatcher",
+    "TokenBucket",
+    "create_embedding_dispatcher",
+    "estimate_tokens",
+]
+
+logger = StructuredLogger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for batch sizing (about 4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by all dispatcher workers.
+
+    Attributes:
+        rate: Tokens added per second (None means no rate limit)
+        capacity: Maximum burst size
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate if rate and rate > 0 else None
+        self.capacity = max(1.0, capacity if capacity is not None else (self.rate or 1.0))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def pause_for(self, seconds: float) -> None:
+        """Block every acquire() for the given time, e.g. from Retry-After."""
+        with self._lock:
+            deadline = self._clock() + max(0.0, seconds)
+            self._paused_until = max(self._paused_until, deadline)
+            # Resume with an empty bucket so workers do not stampede together
+            self._tokens = 0.0
+            self._updated = max(self._updated, deadline)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens, sleeping until they are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                delay = self._paused_until - now
+                if delay <= 0:
+                    if self.rate is None:
+                        return waited
+                    if now > self._updated:
+                        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                        self._updated = now
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        return waited
+                    delay = (tokens - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+class EmbeddingDispatcher:
+    """Concurrent, rate-limit-aware embedding batch dispatcher.
+
+    Attributes:
+        max_concurrency: Batches in flight at once
+        max_batch_texts: Maximum texts per request
+        max_batch_tokens: Maximum estimated tokens per request
+        max_retries: Retries per batch on 429 or network errors
+    """
+
+    def __init__(
+        self,
+        llm_service: LLMService,
+        model: str | None = None,
+        max_concurrency: int = 4,
+        requests_per_second: float | None = None,
+        max_batch_texts: int = 100,
+        max_batch_tokens: int = 8000,
+        max_retries: int = 5,
+        bucket: TokenBucket | None = None,
+    ) -> None:
+        self._llm_service = llm_service
+        self._model = model
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_batch_texts = max(1, max_batch_texts)
+        self.max_batch_tokens = max(1, max_batch_tokens)
+        self.max_retries = max(0, max_retries)
+        self.bucket = bucket or TokenBucket(rate=requests_per_second)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="embedding-dispatch"
+        )
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._rate_limited = 0
+        self._retries = 0
+
+    def plan_batches(self, texts: Sequence[str]) -> list[list[int]]:
+        """Group text indices into batches bounded by text and token count.
+
+        A single text above max_batch_tokens is sent on its own.
+        """
+        batches: list[list[int]] = []
+        current: list[int] = []
+        current_tokens = 0
+        for i, text in enumerate(texts):
+            tokens = estimate_tokens(text)
+            if current and (
+                len(current) >= self.max_batch_texts or current_tokens + tokens > self.max_batch_tokens
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts, returning one vector per text in input order.
+
+        Raises:
+            LLMServiceError: If a batch still fails after max_retries
+        """
+        if not texts:
+            return []
+        batches = self.plan_batches(texts)
+        results: list[list[float] | None] = [None] * len(texts)
+        if len(batches) == 1:
+            outputs = [self._run_batch([texts[i] for i in batches[0]])]
+        else:
+            futures = [self._executor.submit(self._run_batch, [texts[i] for i in batch]) for batch in batches]
+            outputs = [future.result() for future in futures]
+        for batch, embeddings in zip(batches, outputs):
+            for i, embedding in zip(batch, embeddings):
+                results[i] = embedding
+        return cast(list[list[float]], results)
+
+    def _run_batch(self, batch: list[str]) -> list[list[float]]:
+        """Send one batch, retrying on rate limits and transient errors."""
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            with self._stats_lock:
+                self._requests += 1
+            try:
+                # retries=0: the dispatcher schedules retries, LLMService must not sleep
+                result = self._llm_service.generate_embeddings(batch, self._model, retries=0)
+            except LLMRateLimitError as exc:
+                with self._stats_lock:
+                    self._rate_limited += 1
+                if attempt >= self.max_retries:
+                    raise
+                wait = exc.retry_after if exc.retry_after else 2**attempt
+                self.bucket.pause_for(wait)
+            except LLMAPIError:
+                raise
+            except LLMServiceError:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(2**attempt)
+            else:
+                if len(result.embeddings) != len(batch):
+                    raise LLMAPIError(
+                        500, f"Embedding count mismatch: sent {len(batch)}, got {len(result.embeddings)}"
+                    )
+                return [[float(v) for v in embedding] for embedding in result.embeddings]
+            attempt += 1
+            with self._stats_lock:
+                self._retries += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Request counters."""
+        with self._stats_lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "requests": self._requests,
+                "rate_limited": self._rate_limited,
+                "retries": self._retries,
+            }
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        self._executor.shutdown(wait=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"EmbeddingDispatcher(max_concurrency={self.max_concurrency}, "
+            f"max_batch_texts={self.max_batch_texts}, max_batch_tokens={self.max_batch_tokens})"
+        )
+
+
+def create_embedding_dispatcher(llm_service: LLMService, model: str | None = None) -> EmbeddingDispatcher | None:
+    """Create an EmbeddingDispatcher from environment configuration.
+
+    Environment:
+        GOFR_IQ_EMBEDDING_CONCURRENCY: Batches in flight (default 1 = sequential, no dispatcher)
+        GOFR_IQ_EMBEDDING_RPS: Request rate limit per second (default: none)
+        GOFR_IQ_EMBEDDING_BATCH_TOKENS: Estimated tokens per request (default 8000)
+
+    Returns:
+        EmbeddingDispatcher, or None when concurrency is 1
+    """
+    try:
+        concurrency = int(os.environ.get("GOFR_IQ_EMBEDDING_CONCURRENCY", "1"))
+    except ValueError:
+        concurrency = 1
+    if concurrency <= 1:
+        return None
+    try:
+        rps: float | None = float(os.environ.get("GOFR_IQ_EMBEDDING_RPS", "0")) or None
+    except ValueError:
+        rps = None
+    try:
+        batch_tokens = int(os.environ.get("GOFR_IQ_EMBEDDING_BATCH_TOKENS", "8000"))
+    except ValueError:
+        batch_tokens = 8000
+    return EmbeddingDispatcher(
+        llm_service,
+        model=model,
+        max_concurrency=concurrency,
+        requests_per_second=rps,
+        max_batch_tokens=batch_tokens,
+    )
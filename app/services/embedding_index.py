@@ -12,7 +12,10 @@ Embedding Functions:
 from __future__ import annotations
 
 import hashlib
+import json
+import re
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Protocol, cast
 
@@ -23,7 +26,10 @@ from chromadb.config import Settings as ChromaSettings
 from app.logger import StructuredLogger
 
 if TYPE_CHECKING:
+    from app.services.chunk_embedding_store import ChunkEmbeddingStore
+    from app.services.embedding_dispatcher import EmbeddingDispatcher
     from app.services.llm_service import LLMService
+    from app.services.query_embedding_cache import QueryEmbeddingCache
 
 logger = StructuredLogger(__name__)
 
@@ -107,6 +113,7 @@ class LLMEmbeddingFunction:
         llm_service: LLMService,
         model: str | None = None,
         batch_size: int = 100,
+        dispatcher: EmbeddingDispatcher | None = None,
     ) -> None:
         """Initialize LLM embedding function
         
@@ -114,10 +121,13 @@ class LLMEmbeddingFunction:
             llm_service: LLM service instance for API calls
             model: Embedding model to use (uses service default if not specified)
             batch_size: Maximum texts to embed per API call
+            dispatcher: Optional concurrent, rate-limit-aware batch dispatcher;
+                when set, batches are sent through it instead of one by one
         """
         self._llm_service = llm_service
         self._model = model
         self._batch_size = batch_size
+        self._dispatcher = dispatcher
         self._dimensions: int | None = None
 
     @staticmethod
@@ -130,6 +140,14 @@ class LLMEmbeddingFunction:
         """Return the name of this embedding function (required by ChromaDB)"""
         return "openrouter-llm"
 
+    @property
+    def model_name(self) -> str:
+        """Embedding model used for API calls"""
+        if self._model:
+            return self._model
+        settings = getattr(self._llm_service, "settings", None)
+        return str(getattr(settings, "embedding_model", "") or self.name())
+
     @property
     def dimensions(self) -> int:
         """Get embedding dimensions (determined on first call)"""
@@ -151,8 +169,11 @@ class LLMEmbeddingFunction:
         if not input:
             return cast(Embeddings, [])
 
-        all_embeddings: list[list[float]] = []
         texts = [str(t) if t else "" for t in input]
+        if self._dispatcher is not None:
+            return cast(Embeddings, self._dispatcher.embed(texts))
+
+        all_embeddings: list[list[float]] = []
 
         # Process in batches
         for i in range(0, len(texts), self._batch_size):
@@ -221,6 +242,38 @@ class Chunk:
     end_char: int
 
 
+@dataclass
+class PreparedEmbedding:
+    """Chunks of one document and their embeddings, computed once per ingest
+
+    Lets the duplicate check probe ChromaDB with the same vectors that are
+    later written by embed_document(), instead of embedding the text twice.
+
+    Attributes:
+        chunks: Document chunks (from chunk_document)
+        embeddings: One embedding per chunk, in chunk order
+    """
+
+    chunks: list[Chunk]
+    embeddings: list[list[float]]
+
+    @property
+    def probe_embedding(self) -> list[float]:
+        """Document-level query vector: the L2-normalized mean of the chunk embeddings
+
+        Built from the content chunks only (the title is not indexed), so it
+        is comparable to the stored chunk vectors it is searched against.
+        """
+        if not self.embeddings:
+            return []
+        if len(self.embeddings) == 1:
+            return list(self.embeddings[0])
+        dims = len(self.embeddings[0])
+        mean = [sum(e[i] for e in self.embeddings) / len(self.embeddings) for i in range(dims)]
+        norm = sum(v * v for v in mean) ** 0.5
+        return [v / norm for v in mean] if norm > 0 else mean
+
+
 @dataclass
 class SimilarityResult:
     """Result from similarity search
@@ -240,6 +293,157 @@ class SimilarityResult:
     metadata: dict = field(default_factory=dict)
 
 
+# =============================================================================
+# FILTERABLE CHUNK METADATA
+# =============================================================================
+
+# Chunk metadata keys written by filterable_metadata() and used in where clauses
+REGION_KEY_PREFIX = "region_"
+SECTOR_KEY_PREFIX = "sector_"
+COMPANY_KEY_PREFIX = "company_"
+
+
+def normalize_filter_value(value: str) -> str:
+    """Normalize a region/sector/company name into a metadata-key-safe token"""
+    return re.sub(r"[^a-z0-9]+", "_", str(value).lower()).strip("_")
+
+
+def _as_str_list(value: Any) -> list[str]:
+    """Accept a list, a JSON-encoded list, or a scalar string"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        try:
+            decoded = json.loads(value)
+        except json.JSONDecodeError:
+            decoded = value
+        value = decoded
+    if isinstance(value, (list, tuple, set)):
+        return [str(v) for v in value if v]
+    return [str(value)] if value else []
+
+
+def to_epoch_seconds(value: Any) -> float | None:
+    """Convert a datetime or ISO string to epoch seconds (naive values are UTC)"""
+    if isinstance(value, str) and value:
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def filterable_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
+    """Derive Chroma-filterable chunk metadata from document metadata
+
+    Chroma metadata values must be scalars, so list-valued fields become one
+    boolean key per normalized member:
+    - created_at_ts: epoch seconds of created_at
+    - impact_score: float
+    - impact_tier: upper-cased tier
+    - region: primary region label, as given
+    - region_<name>: True for each entry of regions (and for region)
+    - sector_<name> / company_<name>: True for each sector/company
+
+    Args:
+        metadata: Document metadata (as passed to embed_document)
+
+    Returns:
+        Metadata keys to merge into every chunk
+    """
+    derived: dict[str, Any] = {}
+    created_at_ts = to_epoch_seconds(metadata.get("created_at"))
+    if created_at_ts is not None:
+        derived["created_at_ts"] = created_at_ts
+    impact_score = metadata.get("impact_score")
+    if isinstance(impact_score, (int, float)) and not isinstance(impact_score, bool):
+        derived["impact_score"] = float(impact_score)
+    impact_tier = metadata.get("impact_tier")
+    if isinstance(impact_tier, str) and impact_tier:
+        derived["impact_tier"] = impact_tier.upper()
+    region = metadata.get("region")
+    if isinstance(region, str) and region:
+        derived["region"] = region
+        token = normalize_filter_value(region)
+        if token:
+            derived[REGION_KEY_PREFIX + token] = True
+    for prefix, key in (
+        (REGION_KEY_PREFIX, "regions"),
+        (SECTOR_KEY_PREFIX, "sectors"),
+        (COMPANY_KEY_PREFIX, "companies"),
+    ):
+        for member in _as_str_list(metadata.get(key)):
+            token = normalize_filter_value(member)
+            if token:
+                derived[prefix + token] = True
+    return derived
+
+
+def build_where_clause(
+    group_guids: Optional[list[str]] = None,
+    source_guids: Optional[list[str]] = None,
+    languages: Optional[list[str]] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    min_impact_score: Optional[float] = None,
+    impact_tiers: Optional[list[str]] = None,
+    regions: Optional[list[str]] = None,
+    sectors: Optional[list[str]] = None,
+    companies: Optional[list[str]] = None,
+) -> dict[str, Any] | None:
+    """Build a Chroma where clause from search filters
+
+    Date, impact, region, sector and company predicates match the keys
+    written by filterable_metadata(); chunks indexed before those keys
+    existed need scripts/backfill_chunk_filter_metadata.py.
+    """
+    where_filters: list[dict[str, Any]] = []
+
+    if group_guids:
+        where_filters.append({"group_guid": {"$in": group_guids}})
+
+    if source_guids:
+        where_filters.append({"source_guid": {"$in": source_guids}})
+
+    if languages:
+        where_filters.append({"language": {"$in": languages}})
+
+    created_from_ts = to_epoch_seconds(created_from)
+    if created_from_ts is not None:
+        where_filters.append({"created_at_ts": {"$gte": created_from_ts}})
+
+    created_to_ts = to_epoch_seconds(created_to)
+    if created_to_ts is not None:
+        where_filters.append({"created_at_ts": {"$lte": created_to_ts}})
+
+    if min_impact_score is not None:
+        where_filters.append({"impact_score": {"$gte": float(min_impact_score)}})
+
+    if impact_tiers:
+        where_filters.append({"impact_tier": {"$in": [t.upper() for t in impact_tiers]}})
+
+    for prefix, members in (
+        (REGION_KEY_PREFIX, regions),
+        (SECTOR_KEY_PREFIX, sectors),
+        (COMPANY_KEY_PREFIX, companies),
+    ):
+        keys = sorted({prefix + normalize_filter_value(m) for m in members or [] if normalize_filter_value(m)})
+        if len(keys) == 1:
+            where_filters.append({keys[0]: True})
+        elif keys:
+            where_filters.append({"$or": [{key: True} for key in keys]})
+
+    if len(where_filters) == 1:
+        return where_filters[0]
+    if len(where_filters) > 1:
+        return {"$and": where_filters}
+    return None
+
+
 class EmbeddingIndex:
     """ChromaDB-based embedding index for document storage and search
 
@@ -261,6 +465,8 @@ class EmbeddingIndex:
         embedding_function: Optional[EmbeddingProvider] = None,
         host: Optional[str] = None,
         port: Optional[int] = None,
+        query_cache: Optional[QueryEmbeddingCache] = None,
+        chunk_store: Optional[ChunkEmbeddingStore] = None,
     ) -> None:
         """Initialize embedding index
 
@@ -275,6 +481,12 @@ class EmbeddingIndex:
             host: ChromaDB server host (HTTP client mode). If provided,
                   persist_directory is ignored.
             port: ChromaDB server port (required if host is provided)
+            query_cache: Optional cache of query embeddings; when set, search()
+                         embeds queries client-side through the cache
+            chunk_store: Optional content-addressed store of chunk embeddings;
+                         when set, chunks are embedded client-side and only
+                         chunk texts not already stored are sent to the
+                         embedding function
         """
         self.persist_directory = persist_directory
         self.collection_name = collection_name
@@ -283,6 +495,8 @@ class EmbeddingIndex:
         if host and port is None:
             raise ValueError("port is required when host is provided for ChromaDB HTTP client mode")
         self.port = port
+        self.query_cache = query_cache
+        self.chunk_store = chunk_store
         
         # Use provided embedding function or default to deterministic (for testing)
         # Note: For HTTP client mode, custom embedding functions must be registered
@@ -413,6 +627,55 @@ class EmbeddingIndex:
 
         return chunks
 
+    def prepare_document(self, document_guid: str, content: str) -> PreparedEmbedding:
+        """Chunk a document and embed its chunks without writing to the index
+
+        The result can be used as a duplicate-check probe (probe_embedding)
+        and then passed to embed_document(prepared=...) so each chunk is
+        embedded exactly once per ingest.
+
+        Args:
+            document_guid: Unique document identifier
+            content: Document text content
+
+        Returns:
+            PreparedEmbedding with chunks and their embeddings
+        """
+        chunks = self.chunk_document(document_guid, content)
+        if not chunks:
+            return PreparedEmbedding(chunks=[], embeddings=[])
+        return PreparedEmbedding(
+            chunks=chunks,
+            embeddings=self.embed_chunk_texts([chunk.content for chunk in chunks]),
+        )
+
+    def embed_chunk_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed chunk texts, reusing vectors from chunk_store when possible
+
+        Args:
+            texts: Chunk texts
+
+        Returns:
+            One embedding per text, in order
+        """
+        if not texts:
+            return []
+        if self.chunk_store is None:
+            return [[float(v) for v in embedding] for embedding in self._embedding_function(texts)]
+
+        model = self.embedding_model
+        embeddings = self.chunk_store.get_many(model, texts)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            computed = self._embedding_function([texts[i] for i in missing])
+            for i, embedding in zip(missing, computed):
+                embeddings[i] = [float(v) for v in embedding]
+            self.chunk_store.put_many(
+                model, [texts[i] for i in missing], cast(list[list[float]], [embeddings[i] for i in missing])
+            )
+        logger.debug(f"Chunk embeddings: {len(texts) - len(missing)} reused, {len(missing)} computed")
+        return cast(list[list[float]], embeddings)
+
     def embed_document(
         self,
         document_guid: str,
@@ -421,6 +684,7 @@ class EmbeddingIndex:
         source_guid: str,
         language: str,
         metadata: Optional[dict] = None,
+        prepared: Optional[PreparedEmbedding] = None,
     ) -> list[str]:
         """Embed a document into the index
 
@@ -431,12 +695,14 @@ class EmbeddingIndex:
             source_guid: Source this document came from
             language: Document language code (e.g., 'en', 'ja')
             metadata: Additional metadata to store
+            prepared: Chunks/embeddings from prepare_document(); when given,
+                      the stored vectors are reused instead of re-embedding
 
         Returns:
             List of chunk IDs that were created
         """
         # Chunk the document
-        chunks = self.chunk_document(document_guid, content)
+        chunks = prepared.chunks if prepared is not None else self.chunk_document(document_guid, content)
 
         # Prepare data for ChromaDB
         ids = [chunk.chunk_id for chunk in chunks]
@@ -457,21 +723,30 @@ class EmbeddingIndex:
                 # Add custom metadata (flatten to strings for ChromaDB)
                 for key, value in metadata.items():
                     if isinstance(value, (list, dict)):
-                        import json
-
                         chunk_meta[key] = json.dumps(value)
                     else:
                         chunk_meta[key] = value
+                # Scalar keys used by where-clause filters (see build_where_clause)
+                chunk_meta.update(filterable_metadata(metadata))
             metadatas.append(chunk_meta)
 
         # Add to collection (upsert to handle re-embedding)
-        # When in HTTP mode with custom embedding function, pre-compute embeddings
-        if self.host and self._embedding_function:
+        if prepared is not None:
+            # Embeddings were already computed for the duplicate check
+            self._collection.upsert(
+                ids=ids,
+                documents=documents,
+                metadatas=metadatas,
+                embeddings=cast(Any, prepared.embeddings),
+            )
+        # When in HTTP mode with custom embedding function (or with a chunk
+        # store), pre-compute embeddings
+        elif (self.host or self.chunk_store is not None) and self._embedding_function:
             # Generate embeddings client-side using OpenRouter
             logger.info(
                 f"Generating embeddings client-side for {len(documents)} chunks using custom embedding function"
             )
-            embeddings = self._embedding_function(documents)
+            embeddings = cast(Any, self.embed_chunk_texts(documents))
             logger.info(
                 f"Client-side embeddings generated: {len(embeddings)} vectors, dim={len(embeddings[0]) if embeddings else 0}"
             )
@@ -491,6 +766,54 @@ class EmbeddingIndex:
 
         return ids
 
+    @property
+    def embedding_model(self) -> str:
+        """Identifier of the embedding function, used to key cached embeddings"""
+        return str(getattr(self._embedding_function, "model_name", "") or type(self._embedding_function).__name__)
+
+    def embed_query(self, query: str) -> list[float]:
+        """Embed a query string, served from query_cache when possible
+
+        Args:
+            query: Query text
+
+        Returns:
+            Query embedding vector
+        """
+        cache = self.query_cache
+        if cache is not None:
+            cached = cache.get(self.embedding_model, query)
+            if cached is not None:
+                return cached
+        embedding = [float(x) for x in self._embedding_function([query])[0]]
+        if cache is not None:
+            cache.put(self.embedding_model, query, embedding)
+        return embedding
+
+    def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """embed_query for many strings, with one embedding call for the cache misses
+
+        Args:
+            queries: Query texts
+
+        Returns:
+            One embedding per query, in the same order
+        """
+        cache = self.query_cache
+        embeddings: list[list[float] | None] = [None] * len(queries)
+        if cache is not None:
+            for i, query in enumerate(queries):
+                embeddings[i] = cache.get(self.embedding_model, query)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            generated = self._embedding_function([queries[i] for i in missing])
+            for i, raw in zip(missing, generated):
+                embedding = [float(x) for x in raw]
+                embeddings[i] = embedding
+                if cache is not None:
+                    cache.put(self.embedding_model, queries[i], embedding)
+        return [embedding or [] for embedding in embeddings]
+
     def search(
         self,
         query: str,
@@ -499,6 +822,13 @@ class EmbeddingIndex:
         source_guids: Optional[list[str]] = None,
         languages: Optional[list[str]] = None,
         include_content: bool = True,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        min_impact_score: Optional[float] = None,
+        impact_tiers: Optional[list[str]] = None,
+        regions: Optional[list[str]] = None,
+        sectors: Optional[list[str]] = None,
+        companies: Optional[list[str]] = None,
     ) -> list[SimilarityResult]:
         """Search for similar documents
 
@@ -509,28 +839,30 @@ class EmbeddingIndex:
             source_guids: Filter to specific sources
             languages: Filter to specific languages
             include_content: Whether to include chunk content in results
+            created_from: Only chunks created at or after this time
+            created_to: Only chunks created at or before this time
+            min_impact_score: Minimum impact_score
+            impact_tiers: Allowed impact tiers
+            regions: Allowed regions
+            sectors: Match any of these sectors
+            companies: Match any of these companies
 
         Returns:
             List of SimilarityResult objects, sorted by similarity
         """
         # Build where clause for filtering
-        where_filters: list[dict[str, Any]] = []
-
-        if group_guids:
-            where_filters.append({"group_guid": {"$in": group_guids}})
-
-        if source_guids:
-            where_filters.append({"source_guid": {"$in": source_guids}})
-
-        if languages:
-            where_filters.append({"language": {"$in": languages}})
-
-        # Combine filters
-        where: dict[str, Any] | None = None
-        if len(where_filters) == 1:
-            where = where_filters[0]
-        elif len(where_filters) > 1:
-            where = {"$and": where_filters}
+        where = build_where_clause(
+            group_guids=group_guids,
+            source_guids=source_guids,
+            languages=languages,
+            created_from=created_from,
+            created_to=created_to,
+            min_impact_score=min_impact_score,
+            impact_tiers=impact_tiers,
+            regions=regions,
+            sectors=sectors,
+            companies=companies,
+        )
 
         # Execute query
         include: list[Any] = ["metadatas", "distances"]
@@ -539,14 +871,10 @@ class EmbeddingIndex:
 
         # When in HTTP mode with custom embedding function, generate query embedding client-side
         # This ensures the query uses the same embedding model as the indexed documents
-        if self.host and self._embedding_function:
-            logger.info(
-                "Generating query embedding client-side using custom embedding function"
-            )
-            query_embeddings = self._embedding_function([query])
-            logger.info(
-                f"Client-side query embedding generated: dim={len(query_embeddings[0]) if query_embeddings else 0}"
-            )
+        # (with a query cache, local mode embeds client-side too so repeats hit the cache)
+        if (self.host or self.query_cache is not None) and self._embedding_function:
+            query_embeddings = [self.embed_query(query)]
+            logger.debug(f"Client-side query embedding: dim={len(query_embeddings[0])}")
             results = self._collection.query(
                 query_embeddings=query_embeddings,
                 n_results=n_results,
@@ -604,69 +932,117 @@ class EmbeddingIndex:
         source_guids: Optional[list[str]] = None,
         languages: Optional[list[str]] = None,
         include_content: bool = True,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        min_impact_score: Optional[float] = None,
+        impact_tiers: Optional[list[str]] = None,
+        regions: Optional[list[str]] = None,
+        sectors: Optional[list[str]] = None,
+        companies: Optional[list[str]] = None,
     ) -> list[SimilarityResult]:
-        """Search for similar documents using a precomputed query embedding."""
+        """Search for similar documents using a precomputed query embedding.
+
+        Accepts the same filters as search().
+        """
         if not query_embedding:
             return []
+        return self.search_by_embeddings(
+            [query_embedding],
+            n_results=n_results,
+            group_guids=group_guids,
+            source_guids=source_guids,
+            languages=languages,
+            include_content=include_content,
+            created_from=created_from,
+            created_to=created_to,
+            min_impact_score=min_impact_score,
+            impact_tiers=impact_tiers,
+            regions=regions,
+            sectors=sectors,
+            companies=companies,
+        )[0]
+
+    def search_by_embeddings(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int = 10,
+        group_guids: Optional[list[str]] = None,
+        source_guids: Optional[list[str]] = None,
+        languages: Optional[list[str]] = None,
+        include_content: bool = True,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        min_impact_score: Optional[float] = None,
+        impact_tiers: Optional[list[str]] = None,
+        regions: Optional[list[str]] = None,
+        sectors: Optional[list[str]] = None,
+        companies: Optional[list[str]] = None,
+    ) -> list[list[SimilarityResult]]:
+        """search_by_embedding for many query embeddings in one ChromaDB query.
+
+        Accepts the same filters as search(); they apply to every query.
 
-        where_filters: list[dict[str, Any]] = []
-
-        if group_guids:
-            where_filters.append({"group_guid": {"$in": group_guids}})
-
-        if source_guids:
-            where_filters.append({"source_guid": {"$in": source_guids}})
-
-        if languages:
-            where_filters.append({"language": {"$in": languages}})
+        Returns:
+            One result list per query embedding, in the same order
+        """
+        if not query_embeddings:
+            return []
 
-        where: dict[str, Any] | None = None
-        if len(where_filters) == 1:
-            where = where_filters[0]
-        elif len(where_filters) > 1:
-            where = {"$and": where_filters}
+        where = build_where_clause(
+            group_guids=group_guids,
+            source_guids=source_guids,
+            languages=languages,
+            created_from=created_from,
+            created_to=created_to,
+            min_impact_score=min_impact_score,
+            impact_tiers=impact_tiers,
+            regions=regions,
+            sectors=sectors,
+            companies=companies,
+        )
 
         include: list[Any] = ["metadatas", "distances"]
         if include_content:
             include.append("documents")
 
         results = self._collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embeddings,
             n_results=n_results,
             where=cast(Any, where),
             include=cast(Any, include),
         )
 
-        similarity_results: list[SimilarityResult] = []
-
-        if not results["ids"] or not results["ids"][0]:
-            return similarity_results
-
-        ids = results["ids"][0]
-        distances = results.get("distances")
-        distances_list = distances[0] if distances else []
-        metadatas = results.get("metadatas")
-        metadatas_list = metadatas[0] if metadatas else []
-        documents = results.get("documents")
-        documents_list = documents[0] if documents else []
-
-        for i, chunk_id in enumerate(ids):
-            meta = metadatas_list[i] if i < len(metadatas_list) else {}
-            distance = distances_list[i] if i < len(distances_list) else 1.0
-            content = documents_list[i] if i < len(documents_list) else ""
-
-            score = 1.0 - float(distance)
-            similarity_results.append(
-                SimilarityResult(
-                    document_guid=str(meta.get("document_guid", "")),
-                    chunk_id=chunk_id,
-                    content=str(content) if content else "",
-                    score=score,
-                    metadata=dict(meta) if meta else {},
+        all_ids = results.get("ids") or []
+        all_distances = results.get("distances") or []
+        all_metadatas = results.get("metadatas") or []
+        all_documents = results.get("documents") or []
+
+        batches: list[list[SimilarityResult]] = []
+        for q in range(len(query_embeddings)):
+            ids = all_ids[q] if q < len(all_ids) else []
+            distances_list = all_distances[q] if q < len(all_distances) else []
+            metadatas_list = all_metadatas[q] if q < len(all_metadatas) else []
+            documents_list = all_documents[q] if q < len(all_documents) else []
+
+            similarity_results: list[SimilarityResult] = []
+            for i, chunk_id in enumerate(ids or []):
+                meta = metadatas_list[i] if i < len(metadatas_list) else {}
+                distance = distances_list[i] if i < len(distances_list) else 1.0
+                content = documents_list[i] if i < len(documents_list) else ""
+
+                score = 1.0 - float(distance)
+                similarity_results.append(
+                    SimilarityResult(
+                        document_guid=str(meta.get("document_guid", "")),
+                        chunk_id=chunk_id,
+                        content=str(content) if content else "",
+                        score=score,
+                        metadata=dict(meta) if meta else {},
+                    )
                 )
-            )
+            batches.append(similarity_results)
 
-        return similarity_results
+        return batches
 
     def search_with_access_check(
         self,
@@ -777,6 +1153,47 @@ class EmbeddingIndex:
             return len(results["ids"])
         return self._collection.count()
 
+    def backfill_filter_metadata(self, batch_size: int = 500, dry_run: bool = False) -> dict[str, int]:
+        """Add filterable metadata to chunks indexed before it existed
+
+        Values are derived from each chunk's existing metadata only, so
+        chunks missing created_at/impact/sector fields stay unfilterable
+        on those keys.
+
+        Args:
+            batch_size: Chunks read and updated per round trip
+            dry_run: Count chunks that need updating without writing
+
+        Returns:
+            Dict with "scanned" and "updated" chunk counts
+        """
+        scanned = updated = 0
+        offset = 0
+        while True:
+            page = self._collection.get(include=["metadatas"], limit=batch_size, offset=offset)
+            ids = page.get("ids") or []
+            if not ids:
+                break
+            offset += len(ids)
+            scanned += len(ids)
+
+            update_ids: list[str] = []
+            update_metadatas: list[dict[str, Any]] = []
+            for chunk_id, meta in zip(ids, page.get("metadatas") or [{}] * len(ids)):
+                meta = dict(meta or {})
+                derived = filterable_metadata(meta)
+                if all(meta.get(key) == value for key, value in derived.items()):
+                    continue
+                meta.update(derived)
+                update_ids.append(chunk_id)
+                update_metadatas.append(meta)
+
+            if update_ids and not dry_run:
+                self._collection.update(ids=update_ids, metadatas=update_metadatas)  # type: ignore[arg-type]
+            updated += len(update_ids)
+
+        return {"scanned": scanned, "updated": updated}
+
     def clear(self) -> None:
         """Clear all documents from the index"""
         # Delete the collection and recreate it
@@ -808,6 +1225,8 @@ def create_embedding_index(
     embedding_function: Optional[EmbeddingProvider] = None,
     host: Optional[str] = None,
     port: Optional[int] = None,
+    query_cache: Optional[QueryEmbeddingCache] = None,
+    chunk_store: Optional[ChunkEmbeddingStore] = None,
 ) -> EmbeddingIndex:
     """Factory function to create an embedding index
 
@@ -818,6 +1237,8 @@ def create_embedding_index(
         embedding_function: Custom embedding function for production use
         host: ChromaDB server host (HTTP client mode)
         port: ChromaDB server port (default: 8000)
+        query_cache: Optional cache of query embeddings
+        chunk_store: Optional content-addressed store of chunk embeddings
 
     Returns:
         Configured EmbeddingIndex instance
@@ -829,6 +1250,8 @@ def create_embedding_index(
         embedding_function=embedding_function,
         host=host,
         port=port,
+        query_cache=query_cache,
+        chunk_store=chunk_store,
     )
 
 
@@ -836,6 +1259,7 @@ def create_llm_embedding_function(
     llm_service: LLMService | None = None,
     model: str | None = None,
     batch_size: int = 100,
+    dispatcher: EmbeddingDispatcher | None = None,
 ) -> LLMEmbeddingFunction:
     """Factory function to create an LLM-based embedding function
     
@@ -846,6 +1270,7 @@ def create_llm_embedding_function(
         llm_service: LLM service instance (creates new one if not provided)
         model: Embedding model to use (uses service default if not specified)
         batch_size: Maximum texts to embed per API call
+        dispatcher: Optional concurrent batch dispatcher
         
     Returns:
         Configured LLMEmbeddingFunction instance
@@ -863,4 +1288,5 @@ def create_llm_embedding_function(
         llm_service=llm_service,
         model=model,
         batch_size=batch_size,
+        dispatcher=dispatcher,
     )
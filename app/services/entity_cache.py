@@ -0,0 +1,238 @@
+"""Entity Resolution Cache.
+
+Shared in-process cache of ticker -> Instrument guid and company name ->
+Company guid, so ingest and the client tools stop querying Neo4j for the
+same few thousand tickers and names on every call.
+
+- Warm-up loads every Instrument ticker and Company name from Neo4j at startup
+- Misses are cached too (negative entries), but only for a short TTL so an
+  instrument created elsewhere (universe loader, another replica) is found.
+  They suit exact lookups (tickers); company resolution is a fuzzy match,
+  so ingest only records and trusts company hits
+- Callers that create an entity put its guid, replacing any negative entry
+- Entries are bounded by an LRU limit
+
+Instrument keys are the ticker as stored (case-sensitive, like the graph
+lookup); company keys are case-folded, like the company name match.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from typing import TYPE_CHECKING, Any
+
+from app.logger import StructuredLogger
+
+if TYPE_CHECKING:
+    from app.services.graph_index import GraphIndex
+
+__all__ = [
+    "COMPANY",
+    "INSTRUMENT",
+    "EntityResolutionCache",
+    "create_entity_resolution_cache",
+]
+
+logger = StructuredLogger(__name__)
+
+INSTRUMENT = "instrument"
+COMPANY = "company"
+
+_EntityKey = tuple[str, str]
+
+
+class EntityResolutionCache:
+    """Thread-safe LRU cache of entity guids with short-lived negative entries.
+
+    Attributes:
+        max_entries: LRU bound across instruments and companies
+        negative_ttl_seconds: How long a "not in the graph" answer is trusted
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 50_000,
+        negative_ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.negative_ttl_seconds = max(0.0, negative_ttl_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (guid or None for a miss, expiry for negative entries)
+        self._entries: OrderedDict[_EntityKey, tuple[str | None, float]] = OrderedDict()
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _key(kind: str, value: str) -> _EntityKey:
+        value = value.strip()
+        return (kind, value.lower() if kind == COMPANY else value)
+
+    def lookup(self, kind: str, value: str) -> tuple[bool, str | None]:
+        """Look up a ticker or company name.
+
+        Returns:
+            (found, guid): found is False when the graph must be asked;
+            (True, None) is a cached "does not exist"
+        """
+        key = self._key(kind, value)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                guid, expires_at = entry
+                if guid is not None or expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    if guid is None:
+                        self._negative_hits += 1
+                    else:
+                        self._hits += 1
+                    return True, guid
+                del self._entries[key]
+            self._misses += 1
+            return False, None
+
+    def get_many(self, kind: str, values: Iterable[str]) -> tuple[dict[str, str | None], list[str]]:
+        """Look up several values at once.
+
+        Returns:
+            (cached, missing): cached maps each value with an entry to its
+            guid (None for negative entries); missing lists the rest
+        """
+        cached: dict[str, str | None] = {}
+        missing: list[str] = []
+        for value in values:
+            found, guid = self.lookup(kind, value)
+            if found:
+                cached[value] = guid
+            else:
+                missing.append(value)
+        return cached, missing
+
+    def put(self, kind: str, value: str, guid: str | None) -> None:
+        """Cache a resolved guid, or a negative entry when guid is None."""
+        self.put_many(kind, {value: guid})
+
+    def put_many(self, kind: str, resolved: Mapping[str, str | None]) -> None:
+        """Cache several lookups (None values are negative entries)."""
+        if not resolved:
+            return
+        with self._lock:
+            expires_at = self._clock() + self.negative_ttl_seconds
+            for value, guid in resolved.items():
+                if guid is None and self.negative_ttl_seconds <= 0:
+                    continue
+                key = self._key(kind, value)
+                self._entries[key] = (guid, expires_at if guid is None else float("inf"))
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, kind: str, value: str) -> bool:
+        """Drop one entry, e.g. after the entity was created or re-pointed.
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._lock:
+            return self._entries.pop(self._key(kind, value), None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def warm(self, graph_index: GraphIndex) -> int:
+        """Load every Instrument ticker and Company name from Neo4j.
+
+        Where several instruments share a ticker, the canonical inst-<ticker>
+        node wins, as in ingest's lookup. Companies are keyed on their own
+        name; other spellings are resolved by the graph once, then cached.
+
+        Returns:
+            Number of entries loaded
+        """
+        with graph_index._get_session() as session:
+            instruments: dict[str, str] = {}
+            for record in session.run(
+                """
+                MATCH (i:Instrument)
+                WHERE i.ticker IS NOT NULL AND i.guid IS NOT NULL
+                RETURN i.ticker AS ticker, i.guid AS guid
+                ORDER BY CASE WHEN i.guid STARTS WITH 'inst-' THEN 0 ELSE 1 END DESC, i.guid DESC
+                """
+            ):
+                # Later rows win: the preferred guid for a ticker comes last
+                instruments[record["ticker"]] = record["guid"]
+            companies: dict[str, str] = {}
+            for record in session.run(
+                """
+                MATCH (c:Company)
+                WHERE c.name IS NOT NULL AND c.guid IS NOT NULL
+                RETURN c.name AS name, c.guid AS guid
+                ORDER BY c.guid DESC
+                """
+            ):
+                companies[record["name"]] = record["guid"]
+
+        self.put_many(COMPANY, companies)
+        # Instruments last so they survive the LRU bound on a huge universe
+        self.put_many(INSTRUMENT, instruments)
+        loaded = len(self)
+        logger.info(
+            "Entity resolution cache warmed",
+            instruments=len(instruments),
+            companies=len(companies),
+            loaded=loaded,
+        )
+        return loaded
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for health_check."""
+        with self._lock:
+            lookups = self._hits + self._negative_hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "negative_hits": self._negative_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round((self._hits + self._negative_hits) / lookups, 4) if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"EntityResolutionCache(entries={len(self)}, max_entries={self.max_entries})"
+
+
+def create_entity_resolution_cache() -> EntityResolutionCache | None:
+    """Create an EntityResolutionCache from environment configuration.
+
+    Environment:
+        GOFR_IQ_ENTITY_CACHE_MAX_ENTRIES: LRU bound (default 50000; 0 disables the cache)
+        GOFR_IQ_ENTITY_CACHE_NEGATIVE_TTL_SECONDS: Lifetime of "not found" entries (default 300)
+
+    Returns:
+        EntityResolutionCache, or None when disabled
+    """
+    try:
+        max_entries = int(os.environ.get("GOFR_IQ_ENTITY_CACHE_MAX_ENTRIES", "50000"))
+    except ValueError:
+        max_entries = 50_000
+    try:
+        negative_ttl = float(os.environ.get("GOFR_IQ_ENTITY_CACHE_NEGATIVE_TTL_SECONDS", "300"))
+    except ValueError:
+        negative_ttl = 300.0
+    if max_entries <= 0:
+        return None
+    return EntityResolutionCache(max_entries=max_entries, negative_ttl_seconds=negative_ttl)
@@ -0,0 +1,287 @@
+"""Per-client Feed Cache.
+
+Caches the results of QueryService.get_top_client_news and
+QueryService.get_client_avatar_feed so dashboards polling the same client
+with identical parameters do not recompute everything from Neo4j/ChromaDB.
+
+Entries are keyed on (feed, client_guid, group set, parameters) and bounded by:
+- a TTL ceiling (the time window and the VECTOR channel are only covered by TTL)
+- an LRU entry limit
+
+Invalidation is event driven:
+- invalidate_for_document(): a newly ingested document affects one of the
+  tickers or themes an entry was computed from
+- invalidate_client(): portfolio/watchlist/profile changes for a client
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Hashable
+
+__all__ = [
+    "FeedCache",
+    "FeedCacheKey",
+    "FeedDependencies",
+    "create_feed_cache",
+]
+
+
+FeedCacheKey = tuple[Hashable, ...]
+
+
+@dataclass
+class FeedDependencies:
+    """Tickers and themes a feed result was computed from.
+
+    Filled in while a feed is computed and used to decide which cached
+    entries a newly ingested document invalidates. complete is cleared when
+    a retrieval failed open; such results are not cached.
+    """
+
+    tickers: set[str] = field(default_factory=set)
+    themes: set[str] = field(default_factory=set)
+    complete: bool = True
+
+    def add_tickers(self, tickers: Iterable[str | None]) -> None:
+        self.tickers.update(t for t in tickers if t)
+
+    def add_themes(self, themes: Iterable[str | None]) -> None:
+        self.themes.update(t for t in themes if isinstance(t, str) and t)
+
+
+@dataclass
+class _FeedCacheEntry:
+    value: Any
+    client_guid: str
+    tickers: frozenset[str]
+    themes: frozenset[str]
+    expires_at: float
+
+
+class FeedCache:
+    """Thread-safe LRU + TTL cache for per-client feed results.
+
+    Values are deep-copied on put and get so callers (e.g. MCP tools that
+    backfill impact scores) can mutate results without corrupting the cache.
+
+    Attributes:
+        max_entries: LRU bound on cached feeds
+        ttl_seconds: Maximum age of a cached feed
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[FeedCacheKey, _FeedCacheEntry] = OrderedDict()
+        self._by_client: dict[str, set[FeedCacheKey]] = {}
+        self._by_ticker: dict[str, set[FeedCacheKey]] = {}
+        self._by_theme: dict[str, set[FeedCacheKey]] = {}
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def make_key(feed: str, client_guid: str, group_guids: Iterable[str], **params: Any) -> FeedCacheKey:
+        """Build a cache key; list-valued parameters are normalized to tuples."""
+        normalized = tuple(
+            sorted(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in params.items()
+            )
+        )
+        return (feed, client_guid, frozenset(group_guids), normalized)
+
+    def generation(self) -> int:
+        """Invalidation counter; pass to put() to drop results computed across an invalidation."""
+        with self._lock:
+            return self._generation
+
+    def get(self, key: FeedCacheKey) -> Any | None:
+        """Return a copy of the cached value, or None on miss/expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= self._clock():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            value = entry.value
+        return copy.deepcopy(value)
+
+    def put(
+        self,
+        key: FeedCacheKey,
+        value: Any,
+        client_guid: str,
+        dependencies: FeedDependencies | None = None,
+        generation: int | None = None,
+    ) -> bool:
+        """Cache a feed result.
+
+        Args:
+            key: Key from make_key()
+            value: Feed result (deep-copied)
+            client_guid: Client the feed belongs to
+            dependencies: Tickers/themes the result was computed from
+            generation: Value of generation() taken before computing the
+                result; if an invalidation happened since, the result may be
+                stale and is not cached
+
+        Returns:
+            True if the value was cached
+        """
+        deps = dependencies or FeedDependencies()
+        stored = copy.deepcopy(value)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _FeedCacheEntry(
+                value=stored,
+                client_guid=client_guid,
+                tickers=frozenset(deps.tickers),
+                themes=frozenset(deps.themes),
+                expires_at=self._clock() + self.ttl_seconds,
+            )
+            self._by_client.setdefault(client_guid, set()).add(key)
+            for ticker in deps.tickers:
+                self._by_ticker.setdefault(ticker, set()).add(key)
+            for theme in deps.themes:
+                self._by_theme.setdefault(theme, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+        return True
+
+    def invalidate_client(self, client_guid: str) -> int:
+        """Drop every cached feed for a client. Returns number of entries removed."""
+        with self._lock:
+            self._generation += 1
+            keys = list(self._by_client.get(client_guid, ()))
+            for key in keys:
+                self._remove(key)
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def invalidate_for_document(
+        self,
+        tickers: Iterable[str | None] = (),
+        themes: Iterable[str | None] = (),
+    ) -> int:
+        """Drop cached feeds computed from any of the document's tickers or themes.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            self._generation += 1
+            keys: set[FeedCacheKey] = set()
+            for ticker in tickers:
+                if ticker:
+                    keys.update(self._by_ticker.get(ticker, ()))
+            for theme in themes:
+                if theme:
+                    keys.update(self._by_theme.get(theme, ()))
+            for key in keys:
+                self._remove(key)
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._by_client.clear()
+            self._by_ticker.clear()
+            self._by_theme.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for health_check."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remove(self, key: FeedCacheKey) -> None:
+        """Remove an entry and its reverse-index references. Caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._discard(self._by_client, entry.client_guid, key)
+        for ticker in entry.tickers:
+            self._discard(self._by_ticker, ticker, key)
+        for theme in entry.themes:
+            self._discard(self._by_theme, theme, key)
+
+    @staticmethod
+    def _discard(index: dict[str, set[FeedCacheKey]], name: str, key: FeedCacheKey) -> None:
+        keys = index.get(name)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del index[name]
+
+    def __repr__(self) -> str:
+        return f"FeedCache(size={len(self)}, max_entries={self.max_entries}, ttl_seconds={self.ttl_seconds})"
+
+
+def create_feed_cache() -> FeedCache | None:
+    """Create a FeedCache from environment configuration.
+
+    Environment:
+        GOFR_IQ_FEED_CACHE_TTL_SECONDS: TTL ceiling (default 300; 0 disables the cache)
+        GOFR_IQ_FEED_CACHE_MAX_ENTRIES: LRU bound (default 1024)
+
+    Returns:
+        FeedCache, or None when disabled
+    """
+    try:
+        ttl_seconds = float(os.environ.get("GOFR_IQ_FEED_CACHE_TTL_SECONDS", "300"))
+    except ValueError:
+        ttl_seconds = 300.0
+    try:
+        max_entries = int(os.environ.get("GOFR_IQ_FEED_CACHE_MAX_ENTRIES", "1024"))
+    except ValueError:
+        max_entries = 1024
+    if ttl_seconds <= 0 or max_entries <= 0:
+        return None
+    return FeedCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
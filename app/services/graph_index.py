@@ -11,6 +11,7 @@ See docs/graph_architecture.md for full schema documentation.
 """
 
 import os
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -201,6 +202,123 @@ class TraversalResult:
     paths: list[dict] = field(default_factory=list)
 
 
+@dataclass
+class DocumentGraphWrite:
+    """All graph writes for one ingested document (see GraphIndex.write_documents)
+
+    Attributes:
+        document_guid: Document GUID
+        source_guid: Source GUID (PRODUCED_BY target)
+        group_guid: Group GUID (IN_GROUP target)
+        properties: Document node properties (see GraphIndex.document_properties),
+            including impact_score/impact_tier/decay_lambda/themes when extracted
+        source: Source node properties to merge first (name, type, ...), or None
+        event_type_code: EventType code for TRIGGERED_BY, or None
+        affects: AFFECTS edges as {"instrument_guid": ..., "props": {...}}
+        mentions: MENTIONS edges as {"company_guid": ..., "name": ...}
+    """
+
+    document_guid: str
+    source_guid: str
+    group_guid: str
+    properties: dict = field(default_factory=dict)
+    source: Optional[dict] = None
+    event_type_code: Optional[str] = None
+    affects: list[dict] = field(default_factory=list)
+    mentions: list[dict] = field(default_factory=list)
+
+
+# One UNWIND statement per write kind, run in this order inside one transaction.
+# Each mirrors the per-call method noted alongside it.
+_BULK_WRITE_STATEMENTS: tuple[tuple[str, str], ...] = (
+    # create_source_node
+    (
+        "sources",
+        """
+        UNWIND $sources AS row
+        MERGE (s:Source {guid: row.guid})
+        SET s += row.props
+        WITH s, row
+        WHERE row.group_guid IS NOT NULL
+        MATCH (g:Group {guid: row.group_guid})
+        MERGE (s)-[:IN_GROUP]->(g)
+        """,
+    ),
+    # create_document_node + set_document_impact + set_document_themes
+    (
+        "documents",
+        """
+        UNWIND $documents AS row
+        MERGE (d:Document {guid: row.guid})
+        SET d += row.props
+        WITH d, row
+        OPTIONAL MATCH (s:Source {guid: row.source_guid})
+        OPTIONAL MATCH (g:Group {guid: row.group_guid})
+        FOREACH (_ IN CASE WHEN s IS NULL THEN [] ELSE [1] END | MERGE (d)-[:PRODUCED_BY]->(s))
+        FOREACH (_ IN CASE WHEN g IS NULL THEN [] ELSE [1] END | MERGE (d)-[:IN_GROUP]->(g))
+        """,
+    ),
+    # set_document_impact (TRIGGERED_BY)
+    (
+        "events",
+        """
+        UNWIND $events AS row
+        MATCH (d:Document {guid: row.document_guid})
+        MATCH (e:EventType {code: row.code})
+        MERGE (d)-[:TRIGGERED_BY]->(e)
+        """,
+    ),
+    # Canonical inst-<ticker> nodes auto-created during ingest
+    (
+        "instruments",
+        """
+        UNWIND $instruments AS row
+        MERGE (i:Instrument {guid: row.guid})
+        SET i.ticker = row.ticker,
+            i.name = coalesce(i.name, row.name),
+            i.instrument_type = coalesce(i.instrument_type, 'STOCK'),
+            i.exchange = coalesce(i.exchange, 'UNKNOWN'),
+            i.currency = coalesce(i.currency, 'USD'),
+            i.simulation_id = coalesce(i.simulation_id, 'phase1')
+        """,
+    ),
+    # add_document_affects
+    (
+        "affects",
+        """
+        UNWIND $affects AS row
+        MATCH (d:Document {guid: row.document_guid})
+        MATCH (i:Instrument {guid: row.instrument_guid})
+        MERGE (d)-[r:AFFECTS]->(i)
+        SET r += row.props
+        """,
+    ),
+    # Companies auto-created during ingest
+    (
+        "companies",
+        """
+        UNWIND $companies AS row
+        MERGE (c:Company {guid: row.guid})
+        SET c.name = coalesce(c.name, row.name),
+            c.ticker = coalesce(c.ticker, row.ticker),
+            c.aliases = coalesce(c.aliases, []),
+            c.simulation_id = coalesce(c.simulation_id, 'extracted')
+        """,
+    ),
+    # add_company_mention
+    (
+        "mentions",
+        """
+        UNWIND $mentions AS row
+        MATCH (d:Document {guid: row.document_guid})
+        MERGE (c:Company {guid: row.company_guid})
+        SET c += row.props
+        MERGE (d)-[:MENTIONS]->(c)
+        """,
+    ),
+)
+
+
 class GraphIndex:
     """Neo4j-based graph index for entity relationships
 
@@ -250,6 +368,8 @@ class GraphIndex:
         self.database = database
 
         self._driver: Optional[Driver] = None
+        # Bumped by create_instrument() so in-process ticker caches can refresh
+        self.instrument_version = 0
 
     @property
     def driver(self) -> Driver:
@@ -724,25 +844,16 @@ class GraphIndex:
         Returns:
             Created document GraphNode
         """
-        props: dict[str, Any] = {
-            "title": title,
-            "language": language,
-            "source_guid": source_guid,
-            "group_guid": group_guid,
-        }
-        if created_at:
-            props["created_at"] = created_at.isoformat()
-        if content_hash:
-            props["content_hash"] = content_hash
-        if story_fingerprint:
-            props["story_fingerprint"] = story_fingerprint
-        if metadata:
-            # Flatten metadata for Neo4j (no nested objects)
-            for key, value in metadata.items():
-                if isinstance(value, (str, int, float, bool)):
-                    props[f"meta_{key}"] = value
-                elif isinstance(value, list):
-                    props[f"meta_{key}"] = value  # Neo4j supports lists
+        props = self.document_properties(
+            source_guid=source_guid,
+            group_guid=group_guid,
+            title=title,
+            language=language,
+            created_at=created_at,
+            metadata=metadata,
+            content_hash=content_hash,
+            story_fingerprint=story_fingerprint,
+        )
 
         # Create document node
         doc_node = self.create_node(NodeLabel.DOCUMENT, document_guid, props)
@@ -773,6 +884,39 @@ class GraphIndex:
 
         return doc_node
 
+    @staticmethod
+    def document_properties(
+        source_guid: str,
+        group_guid: str,
+        title: str,
+        language: str,
+        created_at: Optional[datetime] = None,
+        metadata: Optional[dict] = None,
+        content_hash: str | None = None,
+        story_fingerprint: str | None = None,
+    ) -> dict[str, Any]:
+        """Document node properties, with metadata flattened to meta_* keys"""
+        props: dict[str, Any] = {
+            "title": title,
+            "language": language,
+            "source_guid": source_guid,
+            "group_guid": group_guid,
+        }
+        if created_at:
+            props["created_at"] = created_at.isoformat()
+        if content_hash:
+            props["content_hash"] = content_hash
+        if story_fingerprint:
+            props["story_fingerprint"] = story_fingerprint
+        if metadata:
+            # Flatten metadata for Neo4j (no nested objects)
+            for key, value in metadata.items():
+                if isinstance(value, (str, int, float, bool)):
+                    props[f"meta_{key}"] = value
+                elif isinstance(value, list):
+                    props[f"meta_{key}"] = value  # Neo4j supports lists
+        return props
+
     def create_source_node(
         self,
         source_guid: str,
@@ -890,6 +1034,7 @@ class GraphIndex:
             props["isin"] = isin
             
         instrument_node = self.create_node(NodeLabel.INSTRUMENT, guid, props)
+        self.instrument_version += 1
         
         # Create ISSUED_BY relationship to company if provided
         if company_guid:
@@ -1470,6 +1615,167 @@ class GraphIndex:
             props,
         )
 
+    # =========================================================================
+    # BULK DOCUMENT WRITES
+    # =========================================================================
+
+    def resolve_instrument_guids(self, tickers: Sequence[str]) -> dict[str, str]:
+        """Look up existing Instrument guids for many tickers in one query
+
+        Shared inst-<ticker> nodes are preferred, as in per-ticker resolution.
+
+        Args:
+            tickers: Ticker symbols
+
+        Returns:
+            ticker -> Instrument guid, for tickers that have an Instrument
+        """
+        unique = sorted({t for t in tickers if t})
+        if not unique:
+            return {}
+        with self._get_session() as session:
+            result = session.run(
+                """
+                UNWIND $tickers AS ticker
+                CALL {
+                    WITH ticker
+                    MATCH (i:Instrument {ticker: ticker})
+                    RETURN i.guid AS guid
+                    ORDER BY CASE WHEN i.guid STARTS WITH 'inst-' THEN 0 ELSE 1 END, i.guid
+                    LIMIT 1
+                }
+                RETURN ticker, guid
+                """,
+                tickers=unique,
+            )
+            return {record["ticker"]: record["guid"] for record in result if record["guid"]}
+
+    def resolve_company_guids(self, names: Sequence[str]) -> dict[str, str]:
+        """Fuzzy-match many company names to existing Company guids in one query
+
+        Uses the same name/alias containment match as per-name resolution,
+        preferring the shortest matching company name.
+
+        Args:
+            names: Company names as extracted
+
+        Returns:
+            name -> Company guid, for names that matched a Company
+        """
+        unique = sorted({n for n in names if n})
+        if not unique:
+            return {}
+        with self._get_session() as session:
+            result = session.run(
+                """
+                UNWIND $names AS name
+                CALL {
+                    WITH name
+                    MATCH (c:Company)
+                    WHERE toLower(c.name) CONTAINS toLower(name)
+                       OR toLower(name) CONTAINS toLower(c.name)
+                       OR any(alias IN c.aliases WHERE toLower(alias) CONTAINS toLower(name))
+                    RETURN c.guid AS guid
+                    ORDER BY size(c.name) ASC
+                    LIMIT 1
+                }
+                RETURN name, guid
+                """,
+                names=unique,
+            )
+            return {record["name"]: record["guid"] for record in result if record["guid"]}
+
+    def write_documents(
+        self,
+        documents: Sequence[DocumentGraphWrite],
+        instruments: Sequence[dict] = (),
+        companies: Sequence[dict] = (),
+    ) -> int:
+        """Write documents and their extraction results in one transaction
+
+        Replaces the per-call sequence create_source_node, create_document_node,
+        set_document_impact, set_document_themes, add_document_affects and
+        add_company_mention with one UNWIND statement per kind of write, so a
+        document (or a whole batch of documents) costs a fixed number of
+        statements in a single round-trip transaction. Either every write is
+        applied or none is.
+
+        Args:
+            documents: Per-document writes
+            instruments: Instrument nodes to create first, as
+                {"guid", "ticker", "name"} (canonical inst-<ticker> nodes)
+            companies: Company nodes to create first, as {"guid", "name", "ticker"}
+
+        Returns:
+            Number of documents written
+        """
+        if not documents:
+            return 0
+
+        now = datetime.utcnow().isoformat()
+        sources: dict[str, dict[str, Any]] = {}
+        params: dict[str, list[dict[str, Any]]] = {
+            "documents": [],
+            "events": [],
+            "instruments": [dict(row) for row in instruments],
+            "affects": [],
+            "companies": [dict(row) for row in companies],
+            "mentions": [],
+        }
+        for doc in documents:
+            if doc.source is not None:
+                sources[doc.source_guid] = {
+                    "guid": doc.source_guid,
+                    "group_guid": doc.group_guid,
+                    "props": {**doc.source, "guid": doc.source_guid, "created_at": now},
+                }
+            props = {**doc.properties, "guid": doc.document_guid}
+            props.setdefault("created_at", now)
+            params["documents"].append(
+                {
+                    "guid": doc.document_guid,
+                    "source_guid": doc.source_guid,
+                    "group_guid": doc.group_guid,
+                    "props": props,
+                }
+            )
+            if doc.event_type_code:
+                params["events"].append({"document_guid": doc.document_guid, "code": doc.event_type_code})
+            for edge in doc.affects:
+                params["affects"].append(
+                    {
+                        "document_guid": doc.document_guid,
+                        "instrument_guid": edge["instrument_guid"],
+                        "props": edge.get("props", {}),
+                    }
+                )
+            for mention in doc.mentions:
+                company_props: dict[str, Any] = {"ticker": mention["company_guid"], "created_at": now}
+                if mention.get("name"):
+                    company_props["name"] = mention["name"]
+                params["mentions"].append(
+                    {
+                        "document_guid": doc.document_guid,
+                        "company_guid": mention["company_guid"],
+                        "props": company_props,
+                    }
+                )
+        params["sources"] = list(sources.values())
+
+        def write(tx: Any) -> None:
+            for key, statement in _BULK_WRITE_STATEMENTS:
+                if params[key]:
+                    tx.run(statement, {key: params[key]}).consume()
+
+        with self._get_session() as session:
+            session.execute_write(write)
+
+        session_logger.debug(
+            f"Bulk graph write: documents={len(documents)}, affects={len(params['affects'])}, "
+            f"mentions={len(params['mentions'])}"
+        )
+        return len(documents)
+
     # =========================================================================
     # CLIENT FEED QUERIES
     # =========================================================================
@@ -1501,80 +1807,80 @@ class GraphIndex:
         Returns:
             List of documents with relevance scores
         """
-        # Build the query dynamically based on options
+        # Position-anchored: start from the client's held/watched instruments
+        # and follow AFFECTS back to documents, so the work depends on the
+        # documents touching those instruments, not on the group's corpus.
+        # Fully parameterized so the plan is cached across calls.
         query = """
-        // Get client and their instruments
         MATCH (c:Client {guid: $client_guid})-[:IN_GROUP]->(cg:Group)
         WHERE cg.guid IN $permitted_groups
-        
-        // Get documents in permitted groups
-        MATCH (d:Document)-[:IN_GROUP]->(g:Group)
-        WHERE g.guid IN $permitted_groups
-        """
-        
-        if min_impact_score is not None:
-            query += f"\n  AND d.impact_score >= {min_impact_score}"
-            
-        if impact_tiers:
-            tiers_str = ", ".join(f"'{t}'" for t in impact_tiers)
-            query += f"\n  AND d.impact_tier IN [{tiers_str}]"
-        
-        query += """
-        
-        // Find documents affecting instruments in portfolio or watchlist
-        OPTIONAL MATCH (d)-[affects:AFFECTS]->(inst:Instrument)
-        OPTIONAL MATCH (c)-[:HAS_PORTFOLIO]->(p:Portfolio)-[holds:HOLDS]->(inst)
-        OPTIONAL MATCH (c)-[:HAS_WATCHLIST]->(w:Watchlist)-[:WATCHES]->(inst)
-        
+
+        // Anchor instruments: portfolio holdings and/or watchlist
+        CALL {
+            WITH c
+            MATCH (c)-[:HAS_PORTFOLIO]->(:Portfolio)-[:HOLDS]->(inst:Instrument)
+            WHERE $include_portfolio
+            RETURN inst
+            UNION
+            WITH c
+            MATCH (c)-[:HAS_WATCHLIST]->(:Watchlist)-[:WATCHES]->(inst:Instrument)
+            WHERE $include_watchlist
+            RETURN inst
+        }
+
         // Scoring weights calibrated to graph_architecture.md:
         // - Position weight * 100: Higher positions get proportionally more weight
         // - Watchlist: 50 points (elevated from 25 - watchlist = active interest)
         // - Benchmark constituent: add 30 points via separate query if needed
-        WITH d, inst, affects, holds, w,
-             CASE WHEN holds IS NOT NULL THEN holds.weight * 100 ELSE 0 END AS position_boost,
-             CASE WHEN w IS NOT NULL THEN 50 ELSE 0 END AS watchlist_boost,
-             COALESCE(d.impact_score, 0) AS base_score,
-             COALESCE(d.decay_lambda, 0.15) AS decay_lambda
-        
-        WHERE (
-              ($include_portfolio AND holds IS NOT NULL)
-              OR ($include_watchlist AND w IS NOT NULL)
-           )
-        
-           // Calculate relevance without time decay for now (date parsing is complex)
-           WITH d, inst,
-               base_score + position_boost + watchlist_boost AS total_score,
-               base_score AS decayed_score
-        
-           // Group by document to prevent duplicates
-           WITH d.guid AS document_guid,
-                d.title AS title,
-                d.impact_score AS impact_score,
-                d.impact_tier AS impact_tier,
-                d.created_at AS created_at,
-                collect(DISTINCT inst.ticker) AS affected_instruments,
-                max(total_score) AS relevance_score,
-                max(decayed_score) AS current_relevance
-           
-           RETURN document_guid,
-                title,
-                impact_score,
-                impact_tier,
-                created_at,
-                affected_instruments,
-                relevance_score,
-                current_relevance
-           ORDER BY current_relevance DESC
-           LIMIT $limit
-           """
-        
+        OPTIONAL MATCH (c)-[:HAS_PORTFOLIO]->(:Portfolio)-[holds:HOLDS]->(inst)
+        OPTIONAL MATCH (c)-[:HAS_WATCHLIST]->(w:Watchlist)-[:WATCHES]->(inst)
+        WITH inst,
+             max(CASE WHEN holds IS NOT NULL THEN holds.weight * 100 ELSE 0 END) AS position_boost,
+             max(CASE WHEN w IS NOT NULL THEN 50 ELSE 0 END) AS watchlist_boost
+
+        // Documents affecting an anchor instrument, then the group check
+        MATCH (d:Document)-[:AFFECTS]->(inst)
+        WHERE ($min_impact_score IS NULL OR d.impact_score >= $min_impact_score)
+          AND ($impact_tiers IS NULL OR d.impact_tier IN $impact_tiers)
+        MATCH (d)-[:IN_GROUP]->(g:Group)
+        WHERE g.guid IN $permitted_groups
+
+        // Calculate relevance without time decay for now (date parsing is complex)
+        WITH d, inst,
+             COALESCE(d.impact_score, 0) + position_boost + watchlist_boost AS total_score,
+             COALESCE(d.impact_score, 0) AS decayed_score
+
+        // Group by document to prevent duplicates
+        WITH d.guid AS document_guid,
+             d.title AS title,
+             d.impact_score AS impact_score,
+             d.impact_tier AS impact_tier,
+             d.created_at AS created_at,
+             collect(DISTINCT inst.ticker) AS affected_instruments,
+             max(total_score) AS relevance_score,
+             max(decayed_score) AS current_relevance
+
+        RETURN document_guid,
+               title,
+               impact_score,
+               impact_tier,
+               created_at,
+               affected_instruments,
+               relevance_score,
+               current_relevance
+        ORDER BY current_relevance DESC
+        LIMIT $limit
+        """
+
         with self._get_session() as session:
             result = session.run(
-                query,  # type: ignore[arg-type]  # Dynamic query construction
+                query,
                 client_guid=client_guid,
                 permitted_groups=permitted_groups,
                 include_portfolio=include_portfolio,
                 include_watchlist=include_watchlist,
+                min_impact_score=min_impact_score,
+                impact_tiers=impact_tiers or None,
                 limit=limit,
             )
             return [dict(record) for record in result]
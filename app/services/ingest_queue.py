@@ -0,0 +1,587 @@
+"""Ingest Job Queue.
+
+Durable queue for asynchronous ingestion: ingest_document_async stores the
+raw document here and returns a job id at once, and a small worker pool runs
+the full ingest pipeline (LLM extraction, duplicate check, file, ChromaDB and
+Neo4j writes) in the background.
+
+- Jobs live in a SQLite database next to the document store, so queued work
+  survives a restart; jobs that were running when the process stopped are
+  queued again on start()
+- Each job's document GUID is fixed when it is queued. A retry first removes
+  whatever the earlier attempt wrote (IngestService.discard_document), so a
+  retried job leaves exactly one document
+- Failed attempts (indexing errors, unexpected exceptions) are retried with
+  exponential backoff up to max_attempts; invalid input (unknown source,
+  too many words) fails at once
+- An optional idempotency key per group makes re-submitting the same
+  document (a feed pusher retrying after a timeout) return the existing job
+
+One process owns a queue database: start() treats every "running" job as
+interrupted.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from app.logger import StructuredLogger
+from app.services.ingest_service import IngestError
+
+if TYPE_CHECKING:
+    from app.services.ingest_service import IngestService
+
+__all__ = [
+    "IngestJob",
+    "IngestJobQueue",
+    "IngestJobStatus",
+    "create_ingest_queue",
+]
+
+logger = StructuredLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingest_jobs (
+    job_id TEXT PRIMARY KEY,
+    document_guid TEXT NOT NULL,
+    status TEXT NOT NULL,
+    group_guid TEXT NOT NULL,
+    source_guid TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    language TEXT,
+    metadata TEXT,
+    idempotency_key TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS ingest_jobs_status ON ingest_jobs (status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS ingest_jobs_group ON ingest_jobs (group_guid, created_at);
+CREATE UNIQUE INDEX IF NOT EXISTS ingest_jobs_idempotency
+    ON ingest_jobs (group_guid, idempotency_key) WHERE idempotency_key IS NOT NULL;
+"""
+
+
+class IngestJobStatus(str, Enum):
+    """Lifecycle of a queued ingest."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass
+class IngestJob:
+    """A queued ingest and, once finished, its outcome.
+
+    Attributes:
+        job_id: Job identifier returned by ingest_document_async
+        document_guid: GUID the document is (or will be) stored under
+        status: Job status
+        group_guid: Group the document is written to
+        source_guid: Source of the document
+        title: Document title
+        attempts: Attempts started so far
+        max_attempts: Attempts allowed before the job fails
+        created_at: When the job was queued
+        updated_at: Last status change
+        next_attempt_at: Earliest start of the next attempt (queued jobs)
+        result: IngestResult.to_dict() of the finished ingest
+        error: Last error message
+        idempotency_key: Caller-supplied deduplication key
+    """
+
+    job_id: str
+    document_guid: str
+    status: IngestJobStatus
+    group_guid: str
+    source_guid: str
+    title: str
+    attempts: int
+    max_attempts: int
+    created_at: datetime
+    updated_at: datetime
+    next_attempt_at: datetime | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    idempotency_key: str | None = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (IngestJobStatus.SUCCEEDED, IngestJobStatus.FAILED)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        data: dict[str, Any] = {
+            "job_id": self.job_id,
+            "document_guid": self.document_guid,
+            "status": self.status.value,
+            "group_guid": self.group_guid,
+            "source_guid": self.source_guid,
+            "title": self.title,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+        if self.status == IngestJobStatus.QUEUED and self.next_attempt_at is not None:
+            data["next_attempt_at"] = self.next_attempt_at.isoformat()
+        if self.result is not None:
+            data["result"] = self.result
+        if self.error:
+            data["error"] = self.error
+        if self.idempotency_key:
+            data["idempotency_key"] = self.idempotency_key
+        return data
+
+
+def _timestamp(value: float) -> datetime:
+    return datetime.fromtimestamp(value, UTC)
+
+
+class IngestJobQueue:
+    """SQLite-backed ingest queue with a background worker pool.
+
+    Attributes:
+        db_path: Path of the SQLite database
+        workers: Worker threads started by start()
+        max_attempts: Attempts per job before it fails
+        retry_backoff_seconds: Delay before the first retry (doubles per attempt)
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        ingest_service: IngestService,
+        workers: int = 2,
+        max_attempts: int = 3,
+        retry_backoff_seconds: float = 30.0,
+        poll_interval_seconds: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.ingest_service = ingest_service
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff_seconds = max(0.0, retry_backoff_seconds)
+        self._poll_interval = poll_interval_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._succeeded = 0
+        self._failed = 0
+        self._retried = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit; multi-statement updates use explicit transactions
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    # -------------------------------------------------------------------------
+    # Producer side
+    # -------------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        title: str,
+        content: str,
+        source_guid: str,
+        group_guid: str,
+        language: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> tuple[IngestJob, bool]:
+        """Persist a document for background ingestion.
+
+        Returns:
+            (job, created): created is False when idempotency_key matched an
+            existing job of the group, which is returned unchanged
+        """
+        now = self._clock()
+        job_id = str(uuid.uuid4())
+        with self._lock:
+            try:
+                self._conn.execute(
+                    """
+                    INSERT INTO ingest_jobs (
+                        job_id, document_guid, status, group_guid, source_guid, title, content,
+                        language, metadata, idempotency_key, max_attempts,
+                        next_attempt_at, created_at, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        job_id,
+                        str(uuid.uuid4()),
+                        IngestJobStatus.QUEUED.value,
+                        group_guid,
+                        source_guid,
+                        title,
+                        content,
+                        language,
+                        json.dumps(metadata) if metadata else None,
+                        idempotency_key,
+                        self.max_attempts,
+                        now,
+                        now,
+                        now,
+                    ),
+                )
+                created = True
+            except sqlite3.IntegrityError:
+                row = self._conn.execute(
+                    "SELECT * FROM ingest_jobs WHERE group_guid = ? AND idempotency_key = ?",
+                    (group_guid, idempotency_key),
+                ).fetchone()
+                return self._to_job(row), False
+            row = self._conn.execute("SELECT * FROM ingest_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        self._wakeup.set()
+        logger.info("Ingest job queued", job_id=job_id, group_guid=group_guid, title=title[:50])
+        return self._to_job(row), created
+
+    def get(self, job_id: str) -> IngestJob | None:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM ingest_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row is not None else None
+
+    def list_jobs(
+        self,
+        group_guids: Collection[str] | None = None,
+        status: IngestJobStatus | None = None,
+        limit: int = 50,
+    ) -> list[IngestJob]:
+        """Most recent jobs first.
+
+        Args:
+            group_guids: Only jobs of these groups (None: every group)
+            status: Only jobs in this status
+            limit: Maximum jobs returned
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if group_guids is not None:
+            if not group_guids:
+                return []
+            clauses.append(f"group_guid IN ({', '.join('?' * len(group_guids))})")
+            params.extend(group_guids)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status.value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM ingest_jobs {where} ORDER BY created_at DESC, rowid DESC LIMIT ?",  # nosec B608 - placeholders only
+                (*params, max(1, limit)),
+            ).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    # -------------------------------------------------------------------------
+    # Workers
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Re-queue interrupted jobs and start the worker threads."""
+        if self._threads:
+            return
+        requeued = self._requeue_interrupted()
+        if requeued:
+            logger.info("Interrupted ingest jobs re-queued", jobs=requeued)
+        self._stopping.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"gofr-iq-ingest-queue_{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the workers after their current job."""
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def run_pending(self, max_jobs: int | None = None) -> int:
+        """Process due jobs on the calling thread (no workers needed).
+
+        Returns:
+            Number of jobs processed
+        """
+        processed = 0
+        while max_jobs is None or processed < max_jobs:
+            job = self._claim()
+            if job is None:
+                break
+            self._run_job(job)
+            processed += 1
+        return processed
+
+    def purge(self, older_than_seconds: float) -> int:
+        """Delete finished jobs last updated more than older_than_seconds ago."""
+        cutoff = self._clock() - older_than_seconds
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM ingest_jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (IngestJobStatus.SUCCEEDED.value, IngestJobStatus.FAILED.value, cutoff),
+            )
+        return cursor.rowcount
+
+    def _worker(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                job = self._claim()
+            except Exception as e:
+                logger.error("Ingest queue claim failed", error=str(e))
+                job = None
+            if job is None:
+                self._wakeup.wait(self._poll_interval)
+                self._wakeup.clear()
+                continue
+            self._run_job(job)
+
+    def _run_job(self, job: sqlite3.Row) -> None:
+        """Process a claimed job; any error outside the attempt itself fails the job."""
+        try:
+            self._process(job)
+        except Exception as e:
+            # e.g. a result that cannot be serialized; never leave the job "running"
+            logger.error("Ingest queue worker error", job_id=job["job_id"], error=str(e))
+            try:
+                self._finish(job["job_id"], IngestJobStatus.FAILED, error=f"Worker error: {e!s}")
+            except Exception as finish_error:
+                # Queue database unusable; the job is re-queued by the next start()
+                logger.error("Ingest job could not be marked failed", job_id=job["job_id"], error=str(finish_error))
+
+    def _requeue_interrupted(self) -> int:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                failed = self._conn.execute(
+                    """
+                    UPDATE ingest_jobs SET status = ?, error = ?, updated_at = ?
+                    WHERE status = ? AND attempts >= max_attempts
+                    """,
+                    (
+                        IngestJobStatus.FAILED.value,
+                        "Interrupted on its last attempt",
+                        now,
+                        IngestJobStatus.RUNNING.value,
+                    ),
+                ).rowcount
+                requeued = self._conn.execute(
+                    "UPDATE ingest_jobs SET status = ?, next_attempt_at = ?, updated_at = ? WHERE status = ?",
+                    (IngestJobStatus.QUEUED.value, now, now, IngestJobStatus.RUNNING.value),
+                ).rowcount
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self._failed += failed
+        return requeued
+
+    def _claim(self) -> sqlite3.Row | None:
+        """Mark the oldest due job as running and return its row."""
+        now = self._clock()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    """
+                    SELECT job_id FROM ingest_jobs
+                    WHERE status = ? AND next_attempt_at <= ?
+                    ORDER BY created_at, rowid LIMIT 1
+                    """,
+                    (IngestJobStatus.QUEUED.value, now),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE ingest_jobs SET status = ?, attempts = attempts + 1, updated_at = ? WHERE job_id = ?",
+                        (IngestJobStatus.RUNNING.value, now, row["job_id"]),
+                    )
+                    row = self._conn.execute("SELECT * FROM ingest_jobs WHERE job_id = ?", (row["job_id"],)).fetchone()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return row
+
+    def _process(self, row: sqlite3.Row) -> None:
+        job_id = row["job_id"]
+        document_guid = row["document_guid"]
+        group_guid = row["group_guid"]
+        try:
+            if row["attempts"] > 1:
+                # An earlier attempt may have got part way; start from nothing
+                self.ingest_service.discard_document(document_guid, group_guid)
+            result = self.ingest_service.ingest(
+                title=row["title"],
+                content=row["content"],
+                source_guid=row["source_guid"],
+                group_guid=group_guid,
+                language=row["language"],
+                metadata=json.loads(row["metadata"]) if row["metadata"] else None,
+                document_guid=document_guid,
+            )
+        except IngestError as e:
+            # Invalid input: retrying cannot help
+            self._finish(job_id, IngestJobStatus.FAILED, error=str(e))
+            return
+        except Exception as e:
+            logger.error("Ingest job attempt failed", job_id=job_id, attempt=row["attempts"], error=str(e))
+            self._retry_or_fail(row, f"Unexpected error: {e!s}")
+            return
+
+        if result.is_failed:
+            self._retry_or_fail(row, result.error or "Ingest failed", result.to_dict())
+        else:
+            self._finish(job_id, IngestJobStatus.SUCCEEDED, result=result.to_dict())
+
+    def _retry_or_fail(self, row: sqlite3.Row, error: str, result: dict[str, Any] | None = None) -> None:
+        attempts = row["attempts"]
+        if attempts >= row["max_attempts"]:
+            self._finish(row["job_id"], IngestJobStatus.FAILED, error=error, result=result)
+            return
+        now = self._clock()
+        delay = self.retry_backoff_seconds * (2 ** (attempts - 1))
+        with self._lock:
+            self._conn.execute(
+                """
+                UPDATE ingest_jobs SET status = ?, next_attempt_at = ?, updated_at = ?, error = ?
+                WHERE job_id = ?
+                """,
+                (IngestJobStatus.QUEUED.value, now + delay, now, error, row["job_id"]),
+            )
+            self._retried += 1
+        logger.info("Ingest job will be retried", job_id=row["job_id"], attempt=attempts, delay_seconds=delay)
+
+    def _finish(
+        self,
+        job_id: str,
+        status: IngestJobStatus,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> None:
+        # Succeeded jobs no longer need the document body
+        clear_content = status == IngestJobStatus.SUCCEEDED
+        with self._lock:
+            self._conn.execute(
+                f"""
+                UPDATE ingest_jobs SET status = ?, updated_at = ?, result = ?, error = ?
+                    {", content = '', metadata = NULL" if clear_content else ""}
+                WHERE job_id = ?
+                """,  # nosec B608 - fixed fragments only
+                (status.value, self._clock(), json.dumps(result) if result else None, error, job_id),
+            )
+            if status == IngestJobStatus.SUCCEEDED:
+                self._succeeded += 1
+            else:
+                self._failed += 1
+        logger.info("Ingest job finished", job_id=job_id, status=status.value, error=error)
+
+    # -------------------------------------------------------------------------
+    # Reporting
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for health_check."""
+        now = self._clock()
+        with self._lock:
+            counts = {status.value: 0 for status in IngestJobStatus}
+            for row in self._conn.execute("SELECT status, COUNT(*) AS n FROM ingest_jobs GROUP BY status"):
+                counts[row["status"]] = row["n"]
+            oldest = self._conn.execute(
+                "SELECT MIN(created_at) AS t FROM ingest_jobs WHERE status = ?",
+                (IngestJobStatus.QUEUED.value,),
+            ).fetchone()["t"]
+            return {
+                "workers": len(self._threads),
+                "jobs": counts,
+                "oldest_queued_seconds": round(now - oldest, 1) if oldest is not None else 0.0,
+                "succeeded": self._succeeded,
+                "failed": self._failed,
+                "retried": self._retried,
+            }
+
+    def _to_job(self, row: sqlite3.Row) -> IngestJob:
+        return IngestJob(
+            job_id=row["job_id"],
+            document_guid=row["document_guid"],
+            status=IngestJobStatus(row["status"]),
+            group_guid=row["group_guid"],
+            source_guid=row["source_guid"],
+            title=row["title"],
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            created_at=_timestamp(row["created_at"]),
+            updated_at=_timestamp(row["updated_at"]),
+            next_attempt_at=_timestamp(row["next_attempt_at"]),
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+            idempotency_key=row["idempotency_key"],
+        )
+
+    def close(self) -> None:
+        self.stop()
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"IngestJobQueue(path={self.db_path}, workers={self.workers})"
+
+
+def create_ingest_queue(storage_path: str | Path, ingest_service: IngestService) -> IngestJobQueue | None:
+    """Create an IngestJobQueue from environment configuration.
+
+    The database is ``{storage_path}/ingest_queue.db``. Workers are not
+    started; call start().
+
+    Environment:
+        GOFR_IQ_INGEST_QUEUE: Set to 0/false/no to disable asynchronous ingest (default on)
+        GOFR_IQ_INGEST_QUEUE_WORKERS: Worker threads (default 2)
+        GOFR_IQ_INGEST_QUEUE_MAX_ATTEMPTS: Attempts per job (default 3)
+        GOFR_IQ_INGEST_QUEUE_RETRY_BACKOFF_SECONDS: First retry delay, doubling (default 30)
+
+    Returns:
+        IngestJobQueue, or None when disabled
+    """
+    if os.environ.get("GOFR_IQ_INGEST_QUEUE", "").lower() in ("0", "false", "no"):
+        return None
+    try:
+        workers = int(os.environ.get("GOFR_IQ_INGEST_QUEUE_WORKERS", "2"))
+    except ValueError:
+        workers = 2
+    try:
+        max_attempts = int(os.environ.get("GOFR_IQ_INGEST_QUEUE_MAX_ATTEMPTS", "3"))
+    except ValueError:
+        max_attempts = 3
+    try:
+        backoff = float(os.environ.get("GOFR_IQ_INGEST_QUEUE_RETRY_BACKOFF_SECONDS", "30"))
+    except ValueError:
+        backoff = 30.0
+    return IngestJobQueue(
+        Path(storage_path) / "ingest_queue.db",
+        ingest_service,
+        workers=workers,
+        max_attempts=max_attempts,
+        retry_backoff_seconds=backoff,
+    )
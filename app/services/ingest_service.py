@@ -21,7 +21,11 @@ External indexing (Elasticsearch, ChromaDB, Neo4j) will be added in later phases
 from __future__ import annotations
 
 import os
+import threading
+import time
 import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -38,15 +42,20 @@ from app.services.duplicate_detector import (
     compute_story_fingerprint,
 )
 from app.services.embedding_index import EmbeddingIndex
-from app.services.graph_index import GraphIndex, NodeLabel
+from app.services.entity_cache import COMPANY, INSTRUMENT
+from app.services.graph_index import DocumentGraphWrite, GraphIndex, NodeLabel
 from app.services.language_detector import LanguageDetector, LanguageResult
 from app.services.source_registry import SourceNotFoundError, SourceRegistry
+from app.services.ticker_matcher import TickerMatcher
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Iterable, Sequence
 
     from app.prompts.graph_extraction import GraphExtractionResult
     from app.services.alias_resolver import AliasResolver
+    from app.services.client_matcher import ClientMatcher
+    from app.services.entity_cache import EntityResolutionCache
+    from app.services.feed_cache import FeedCache
     from app.services.llm_service import LLMService
 
 __all__ = [
@@ -174,6 +183,94 @@ class IngestResult:
         return result
 
 
+@dataclass
+class _PendingIngest:
+    """A document between ingest stages (validated, awaiting commit)."""
+
+    doc_guid: str
+    source: Any
+    lang_result: LanguageResult
+    language_detected: bool
+    word_count: int
+    provisional_doc: Document
+    extraction: "GraphExtractionResult | None" = None
+    prepared_embedding: Any = None
+    error: Exception | None = None
+
+
+# =============================================================================
+# GRAPH MAPPINGS
+# =============================================================================
+
+# Map LLM event types to graph EventType codes
+# LLM returns specific types like EARNINGS_BEAT, EARNINGS_MISS
+# Graph uses simplified categories like EARNINGS, M&A
+_EVENT_TYPE_MAPPING: dict[str, str | None] = {
+    "EARNINGS_BEAT": "EARNINGS",
+    "EARNINGS_MISS": "EARNINGS",
+    "EARNINGS_WARNING": "EARNINGS",
+    "GUIDANCE_RAISE": "EARNINGS",
+    "GUIDANCE_CUT": "EARNINGS",
+    "M&A_ANNOUNCE": "M&A",
+    "M&A_RUMOR": "M&A",
+    "IPO": "M&A",
+    "SECONDARY": "M&A",
+    "BUYBACK": "M&A",
+    "DIVIDEND_CHANGE": "EARNINGS",
+    "ACTIVIST": "M&A",
+    "INSIDER_TXN": "EXEC_CHANGE",
+    "INDEX_ADD": "REGULATORY",
+    "INDEX_DELETE": "REGULATORY",
+    "INDEX_REBAL": "REGULATORY",
+    "RATING_UPGRADE": "EARNINGS",
+    "RATING_DOWNGRADE": "EARNINGS",
+    "FDA_APPROVAL": "FDA_APPROVAL",
+    "FDA_REJECTION": "FDA_APPROVAL",
+    "LEGAL_RULING": "LITIGATION",
+    "FRAUD_SCANDAL": "LITIGATION",
+    "MGMT_CHANGE": "EXEC_CHANGE",
+    "PRODUCT_LAUNCH": "PRODUCT_LAUNCH",
+    "CONTRACT_WIN": "PRODUCT_LAUNCH",
+    "CONTRACT_LOSS": "PRODUCT_LAUNCH",
+    "MACRO_DATA": "MACRO_ECON",
+    "CENTRAL_BANK": "MACRO_ECON",
+    "GEOPOLITICAL": "MACRO_ECON",
+    "POSITIVE_SENTIMENT": "EARNINGS",  # Default to earnings category
+    "NEGATIVE_SENTIMENT": "EARNINGS",  # Default to earnings category
+    "OTHER": None,  # Skip generic OTHER events
+}
+
+# Map extraction direction to AFFECTS.direction
+_DIRECTION_MAP = {
+    "UP": "positive",
+    "DOWN": "negative",
+    "MIXED": "neutral",
+    "NEUTRAL": "neutral",
+}
+
+# Map extraction magnitude to AFFECTS.magnitude (expected price move)
+_MAGNITUDE_MAP = {
+    "HIGH": 0.05,
+    "MODERATE": 0.02,
+    "LOW": 0.01,
+}
+
+# Source TrustLevel -> Source.trust_level (1-10 scale)
+_TRUST_LEVEL_MAP = {
+    "high": 10,
+    "medium": 7,
+    "low": 5,
+    "unverified": 3,
+}
+
+
+def _company_guid_and_ticker(name: str) -> tuple[str, str]:
+    """Guid (comp-<normalized name>) and placeholder ticker for an auto-created Company."""
+    # Normalize name for guid generation (lowercase, replace spaces with hyphens)
+    normalized = name.lower().replace(" ", "-").replace(".", "").replace(",", "")[:50]
+    return f"comp-{normalized}", normalized.upper()[:10]
+
+
 # =============================================================================
 # INGEST SERVICE
 # =============================================================================
@@ -202,6 +299,25 @@ class IngestService:
         graph_index: Optional graph index for entity relationships
         llm_service: Optional LLM service for content extraction
         max_word_count: Maximum allowed word count (default 20,000)
+        feed_cache: Optional client feed cache, invalidated for the tickers
+            and themes of each newly indexed document
+        ticker_universe_refresh_seconds: Maximum age of the compiled ticker
+            matcher used by the regex ticker fallback before it is reloaded
+            from Neo4j (picks up instruments created by other processes)
+        overlap_llm_io: Embed chunks on a worker thread while the LLM
+            extraction request is in flight, instead of after it returns
+        batch_workers: Documents ingest_batch validates, extracts and embeds
+            concurrently (1 = one document at a time)
+        bulk_graph_writes: Write each document's graph updates (document,
+            source, impact, themes, AFFECTS, MENTIONS, TRIGGERED_BY) in one
+            UNWIND transaction via GraphIndex.write_documents
+        graph_write_batch_size: With bulk_graph_writes, documents a pipelined
+            ingest_batch groups into one graph transaction
+        entity_cache: Optional ticker/company name -> guid cache consulted
+            before Neo4j when resolving AFFECTS and MENTIONS targets
+        client_matcher: Optional standing-query matcher; each successfully
+            ingested document is scored against every client's positions
+            and mandate and recorded in the matched clients' inboxes
     """
 
     document_store: DocumentStore
@@ -214,12 +330,81 @@ class IngestService:
     llm_service: "LLMService | None" = None
     max_word_count: int = 20_000
     strict_ticker_validation: bool = False
+    feed_cache: "FeedCache | None" = None
+    ticker_universe_refresh_seconds: float = 300.0
+    overlap_llm_io: bool = False
+    batch_workers: int = 1
+    bulk_graph_writes: bool = False
+    graph_write_batch_size: int = 50
+    entity_cache: "EntityResolutionCache | None" = None
+    client_matcher: "ClientMatcher | None" = None
 
     def __post_init__(self) -> None:
         if self.graph_index and self.alias_resolver is None:
             from app.services.alias_resolver import AliasResolver
 
             self.alias_resolver = AliasResolver(self.graph_index)
+        self._ticker_matcher: TickerMatcher | None = None
+        self._ticker_matcher_loaded_at = 0.0
+        self._ticker_matcher_graph_version: object = None
+        self._io_executor: ThreadPoolExecutor | None = None
+        self._io_executor_lock = threading.Lock()
+        # Duplicate check through graph write, one document at a time, so
+        # concurrent callers (ingest queue workers) see each other's documents
+        self._commit_lock = threading.Lock()
+
+    def _get_io_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the pool that overlaps embedding with LLM extraction."""
+        with self._io_executor_lock:
+            if self._io_executor is None:
+                self._io_executor = ThreadPoolExecutor(
+                    max_workers=4,
+                    thread_name_prefix="gofr-iq-ingest-io",
+                )
+            return self._io_executor
+
+    @property
+    def _universe_tickers(self) -> set[str]:
+        """Known instrument tickers used by the regex ticker fallback."""
+        return set(self._ticker_matcher.tickers) if self._ticker_matcher else set()
+
+    @_universe_tickers.setter
+    def _universe_tickers(self, tickers: set[str]) -> None:
+        self._ticker_matcher = TickerMatcher(tickers)
+        self._ticker_matcher_loaded_at = time.monotonic()
+        self._ticker_matcher_graph_version = getattr(self.graph_index, "instrument_version", None)
+
+    def _get_ticker_matcher(self) -> TickerMatcher:
+        """Compiled matcher for the instrument universe, reloaded when stale.
+
+        Reloaded from Neo4j when GraphIndex.create_instrument() has run since
+        the last load, or after ticker_universe_refresh_seconds.
+        """
+        graph_version = getattr(self.graph_index, "instrument_version", None)
+        if (
+            self._ticker_matcher is not None
+            and graph_version == self._ticker_matcher_graph_version
+            and time.monotonic() - self._ticker_matcher_loaded_at < self.ticker_universe_refresh_seconds
+        ):
+            return self._ticker_matcher
+
+        tickers: set[str] = set()
+        try:
+            with self.graph_index.driver.session() as session:  # type: ignore[union-attr]
+                result = session.run("MATCH (i:Instrument) RETURN i.ticker AS t")
+                tickers = {r["t"] for r in result if r["t"]}
+        except Exception as e:
+            session_logger.warning(f"Could not load instrument universe for regex fallback: {e}")
+            if self._ticker_matcher is not None:
+                tickers = set(self._ticker_matcher.tickers)
+
+        if self._ticker_matcher is None:
+            self._ticker_matcher = TickerMatcher(tickers)
+        else:
+            self._ticker_matcher.update(tickers)
+        self._ticker_matcher_loaded_at = time.monotonic()
+        self._ticker_matcher_graph_version = graph_version
+        return self._ticker_matcher
 
     def _extract_graph_entities(
         self,
@@ -309,49 +494,11 @@ class IngestService:
         """
         if not self.graph_index:
             return
-        
-        # Map LLM event types to graph EventType codes
-        # LLM returns specific types like EARNINGS_BEAT, EARNINGS_MISS
-        # Graph uses simplified categories like EARNINGS, M&A
-        EVENT_TYPE_MAPPING = {
-            "EARNINGS_BEAT": "EARNINGS",
-            "EARNINGS_MISS": "EARNINGS",
-            "EARNINGS_WARNING": "EARNINGS",
-            "GUIDANCE_RAISE": "EARNINGS",
-            "GUIDANCE_CUT": "EARNINGS",
-            "M&A_ANNOUNCE": "M&A",
-            "M&A_RUMOR": "M&A",
-            "IPO": "M&A",
-            "SECONDARY": "M&A",
-            "BUYBACK": "M&A",
-            "DIVIDEND_CHANGE": "EARNINGS",
-            "ACTIVIST": "M&A",
-            "INSIDER_TXN": "EXEC_CHANGE",
-            "INDEX_ADD": "REGULATORY",
-            "INDEX_DELETE": "REGULATORY",
-            "INDEX_REBAL": "REGULATORY",
-            "RATING_UPGRADE": "EARNINGS",
-            "RATING_DOWNGRADE": "EARNINGS",
-            "FDA_APPROVAL": "FDA_APPROVAL",
-            "FDA_REJECTION": "FDA_APPROVAL",
-            "LEGAL_RULING": "LITIGATION",
-            "FRAUD_SCANDAL": "LITIGATION",
-            "MGMT_CHANGE": "EXEC_CHANGE",
-            "PRODUCT_LAUNCH": "PRODUCT_LAUNCH",
-            "CONTRACT_WIN": "PRODUCT_LAUNCH",
-            "CONTRACT_LOSS": "PRODUCT_LAUNCH",
-            "MACRO_DATA": "MACRO_ECON",
-            "CENTRAL_BANK": "MACRO_ECON",
-            "GEOPOLITICAL": "MACRO_ECON",
-            "POSITIVE_SENTIMENT": "EARNINGS",  # Default to earnings category
-            "NEGATIVE_SENTIMENT": "EARNINGS",  # Default to earnings category
-            "OTHER": None,  # Skip generic OTHER events
-        }
             
         # Get primary event type code and map it
         primary_event = extraction.primary_event
         llm_event_code = primary_event.event_type if primary_event else None
-        graph_event_code = EVENT_TYPE_MAPPING.get(llm_event_code) if llm_event_code else None
+        graph_event_code = _EVENT_TYPE_MAPPING.get(llm_event_code) if llm_event_code else None
         
         # Log event mapping
         if llm_event_code:
@@ -396,22 +543,8 @@ class IngestService:
 
                 accepted_tickers += 1
 
-                # Map direction to expected values
-                direction_map = {
-                    "UP": "positive",
-                    "DOWN": "negative",
-                    "MIXED": "neutral",
-                    "NEUTRAL": "neutral",
-                }
-                direction = direction_map.get(inst.direction, "neutral")
-                
-                # Map magnitude to numeric value
-                magnitude_map = {
-                    "HIGH": 0.05,
-                    "MODERATE": 0.02,
-                    "LOW": 0.01,
-                }
-                magnitude = magnitude_map.get(inst.magnitude, 0.01)
+                direction = _DIRECTION_MAP.get(inst.direction, "neutral")
+                magnitude = _MAGNITUDE_MAP.get(inst.magnitude, 0.01)
                 
                 try:
                     self.graph_index.add_document_affects(
@@ -461,43 +594,32 @@ class IngestService:
         When strict_ticker_validation is True, returns None for tickers not already
         in the instrument universe instead of auto-creating phantom nodes.
         """
-        # Prefer existing shared instruments (created by universe loader) before creating new
-        record = session.run(
-            """
-            MATCH (i:Instrument {ticker: $ticker})
-            RETURN i.guid AS guid
-            ORDER BY CASE WHEN i.guid STARTS WITH 'inst-' THEN 0 ELSE 1 END, i.guid
-            LIMIT 1
-            """,
-            {"ticker": ticker},
-        ).single()
-        if record and record["guid"]:
-            return record["guid"]
-
-        # Milestone M2: attempt alias resolution before auto-creating.
-        if self.alias_resolver:
-            try:
-                # Primary: ticker-level alias (if present)
-                resolved = self.alias_resolver.resolve(ticker, scheme="TICKER")
-                if resolved:
-                    return resolved
-
-                # Secondary: name-variant alias (common in newswire)
-                resolved = self.alias_resolver.resolve(name, scheme="NAME_VARIANT")
-                if resolved:
-                    return resolved
-            except Exception:  # nosec B110 - alias resolution must not break ingestion
-                # Alias resolution should never break ingestion; fall back to existing behavior.
-                pass
+        found, cached_guid = self.entity_cache.lookup(INSTRUMENT, ticker) if self.entity_cache is not None else (False, None)
+        if cached_guid:
+            return cached_guid
+
+        if not found:
+            # Prefer existing shared instruments (created by universe loader) before creating new
+            record = session.run(
+                """
+                MATCH (i:Instrument {ticker: $ticker})
+                RETURN i.guid AS guid
+                ORDER BY CASE WHEN i.guid STARTS WITH 'inst-' THEN 0 ELSE 1 END, i.guid
+                LIMIT 1
+                """,
+                {"ticker": ticker},
+            ).single()
+            if record and record["guid"]:
+                if self.entity_cache is not None:
+                    self.entity_cache.put(INSTRUMENT, ticker, record["guid"])
+                return record["guid"]
+            if self.entity_cache is not None:
+                self.entity_cache.put(INSTRUMENT, ticker, None)
+
+        guid, create = self._resolve_unknown_ticker(ticker, name)
+        if not create:
+            return guid
 
-        # Strict mode: reject tickers not in the known universe
-        if self.strict_ticker_validation:
-            session_logger.warning(
-                f"Ticker '{ticker}' not in instrument universe -- skipping AFFECTS edge"
-            )
-            return None
-
-        guid = f"inst-{ticker}"
         session.run(
             """
             MERGE (i:Instrument {guid: $guid})
@@ -510,6 +632,11 @@ class IngestService:
             """,
             {"guid": guid, "ticker": ticker, "name": name},
         )
+        if self.entity_cache is not None:
+            self.entity_cache.put(INSTRUMENT, ticker, guid)
+        matcher = getattr(self, "_ticker_matcher", None)
+        if matcher is not None:
+            matcher.add([ticker])
 
         return guid
 
@@ -520,30 +647,19 @@ class IngestService:
     ) -> int:
         """Scan article text for known tickers the LLM missed and add them.
 
-        Loads the known instrument universe from Neo4j (cached per service
-        instance), then does a case-sensitive word-boundary scan of the
-        content.  Any known ticker found in the text but absent from the
-        LLM extraction is appended as an InstrumentMention with direction
-        NEUTRAL and reason 'regex-detected'.
+        Uses a compiled TickerMatcher over the known instrument universe
+        (see _get_ticker_matcher) to do a single case-sensitive word-boundary
+        scan of the content.  Any known ticker found in the text but absent
+        from the LLM extraction is appended as an InstrumentMention with
+        direction NEUTRAL and reason 'regex-detected'.
 
         Returns the number of tickers added.
         """
         if not self.graph_index:
             return 0
 
-        # Lazy-cache the universe ticker set
-        if not hasattr(self, "_universe_tickers"):
-            try:
-                with self.graph_index.driver.session() as session:
-                    result = session.run("MATCH (i:Instrument) RETURN i.ticker AS t")
-                    self._universe_tickers: set[str] = {
-                        r["t"] for r in result if r["t"]
-                    }
-            except Exception as e:
-                session_logger.warning(f"Could not load instrument universe for regex fallback: {e}")
-                self._universe_tickers = set()
-
-        if not self._universe_tickers:
+        matcher = self._get_ticker_matcher()
+        if not len(matcher):
             return 0
 
         from app.prompts.graph_extraction import InstrumentMention
@@ -551,14 +667,11 @@ class IngestService:
         # Tickers already extracted by LLM
         llm_tickers = {inst.ticker for inst in extraction.instruments}
 
-        import re
         added = 0
-        for ticker in self._universe_tickers:
-            if ticker in llm_tickers:
-                continue
-            # Word-boundary match, case-sensitive (tickers are uppercase)
-            # Matches "NXS" but not "ANXIETY" or "nxs"
-            if re.search(rf"\b{re.escape(ticker)}\b", content):
+        # Word-boundary match, case-sensitive (tickers are uppercase)
+        # Matches "NXS" but not "ANXIETY" or "nxs"
+        for ticker in matcher.find(content):
+            if ticker not in llm_tickers:
                 extraction.instruments.append(
                     InstrumentMention(
                         ticker=ticker,
@@ -583,10 +696,17 @@ class IngestService:
         
         First tries fuzzy match on existing companies, then creates new if not found.
         Company guid format: comp-<normalized_name>
+
+        Only cached guids short-circuit the match: a cached miss for this exact
+        name says nothing about companies created since that the fuzzy match
+        would find, so it is never trusted before creating a node.
         """
-        # Normalize name for guid generation (lowercase, replace spaces with hyphens)
-        normalized = name.lower().replace(" ", "-").replace(".", "").replace(",", "")[:50]
-        
+        _, cached_guid = self.entity_cache.lookup(COMPANY, name) if self.entity_cache is not None else (False, None)
+        if cached_guid:
+            return cached_guid
+
+        guid, ticker = _company_guid_and_ticker(name)
+
         # Try fuzzy match on existing companies first
         record = session.run(
             """
@@ -602,10 +722,11 @@ class IngestService:
         ).single()
         
         if record and record["guid"]:
+            if self.entity_cache is not None:
+                self.entity_cache.put(COMPANY, name, record["guid"])
             return record["guid"]
         
         # Create new company
-        guid = f"comp-{normalized}"
         session.run(
             """
             MERGE (c:Company {guid: $guid})
@@ -614,9 +735,11 @@ class IngestService:
                 c.aliases = coalesce(c.aliases, []),
                 c.simulation_id = coalesce(c.simulation_id, 'extracted')
             """,
-            {"guid": guid, "name": name, "ticker": normalized.upper()[:10]},
+            {"guid": guid, "name": name, "ticker": ticker},
         )
         session_logger.info(f"Auto-created company: {name} ({guid})")
+        if self.entity_cache is not None:
+            self.entity_cache.put(COMPANY, name, guid)
         
         return guid
 
@@ -628,6 +751,7 @@ class IngestService:
         group_guid: str,
         language: str | None = None,
         metadata: dict[str, Any] | None = None,
+        document_guid: str | None = None,
     ) -> IngestResult:
         """Ingest a document into the repository.
 
@@ -638,10 +762,55 @@ class IngestService:
             group_guid: GUID of the group this document belongs to
             language: Language code (auto-detected if not provided)
             metadata: Optional metadata dictionary
+            document_guid: GUID to assign (default: a new UUID v4); queued
+                jobs fix it up front so a retry writes the same document
 
         Returns:
             IngestResult with document details
 
+        Raises:
+            SourceValidationError: If source_guid is invalid
+            WordCountError: If content exceeds word count limit
+        """
+        pending = self._begin_ingest(title, content, source_guid, group_guid, language, metadata, document_guid)
+        self._run_llm_stage(pending)
+        with self._commit_lock:
+            result = self._finish_ingest(pending)
+        self._match_clients(pending, result)
+        return result
+
+    def discard_document(self, guid: str, group_guid: str) -> bool:
+        """Remove everything an earlier, possibly interrupted, ingest of guid wrote.
+
+        Used before retrying a queued ingest job, so the retry neither finds
+        its own first attempt as a duplicate nor leaves a second copy.
+
+        Returns:
+            True if the document file existed
+        """
+        with self._commit_lock:
+            existing = self.get_document(guid, group_guid)
+            self.duplicate_detector.unregister(guid)
+            self._rollback_document(
+                guid,
+                group_guid,
+                existing.created_at if existing else None,
+                saved_to_file=existing is not None,
+            )
+        return existing is not None
+
+    def _begin_ingest(
+        self,
+        title: str,
+        content: str,
+        source_guid: str,
+        group_guid: str,
+        language: str | None,
+        metadata: dict[str, Any] | None,
+        document_guid: str | None = None,
+    ) -> _PendingIngest:
+        """Steps 1-5: validate the input and build the provisional document.
+
         Raises:
             SourceValidationError: If source_guid is invalid
             WordCountError: If content exceeds word count limit
@@ -650,7 +819,7 @@ class IngestService:
         from app.services.language_detector import APAC_LANGUAGES
 
         # Step 1: Generate document GUID first (so we can return it on error)
-        doc_guid = str(uuid.uuid4())
+        doc_guid = document_guid or str(uuid.uuid4())
         session_logger.info(f"Starting document ingestion: guid={doc_guid}, title='{title[:50]}...', source={source_guid}, group={group_guid}")
 
         # Step 2: Validate source exists (sources are now global, not group-specific)
@@ -709,12 +878,26 @@ class IngestService:
             metadata=metadata or {},
         )
 
-        doc = provisional_doc
-        saved_to_file = False
+        return _PendingIngest(
+            doc_guid=doc_guid,
+            source=source,
+            lang_result=lang_result,
+            language_detected=language_detected,
+            word_count=word_count,
+            provisional_doc=provisional_doc,
+        )
 
-        # Step 6+: Extraction/duplicate decision + indexing with Rollback
-        try:
+    def _run_llm_stage(self, pending: _PendingIngest) -> None:
+        """Step 8 LLM extraction and Step 5a chunk embedding.
 
+        Writes to no store, so it can run for several documents at once.
+        A failure is kept on ``pending`` and raised by _finish_ingest, which
+        rolls back and returns a FAILED result as for any indexing error.
+        """
+        provisional_doc = pending.provisional_doc
+        doc_guid = pending.doc_guid
+        content = provisional_doc.content
+        try:
             # Step 8: LLM extraction FIRST (before embedding, so we can include impact_score in metadata)
             # If we have a graph index, we MUST have entity extraction to populate relationships.
             # Fail hard if graph is enabled but LLM service is missing.
@@ -726,9 +909,63 @@ class IngestService:
                     "or set GOFR_IQ_OPENROUTER_API_KEY as an override."
                 )
             
+            # Step 5a does not depend on extraction; with overlap_llm_io the chunk
+            # embeddings are requested while the extraction call is in flight
+            pending_embedding: Future[Any] | None = None
+            if self.overlap_llm_io and self.embedding_index and self.llm_service:
+                pending_embedding = self._get_io_executor().submit(
+                    self.embedding_index.prepare_document, doc_guid, content
+                )
+
             require_extraction = bool(self.graph_index)
             extraction = self._extract_graph_entities(provisional_doc, require_extraction=require_extraction)
 
+            # Step 5a: Embed chunks once; the duplicate probe and Step 9 reuse these vectors
+            # (the probe is content-only, like the indexed chunks; the title is not embedded)
+            if pending_embedding is not None:
+                prepared_embedding = pending_embedding.result()
+            else:
+                prepared_embedding = (
+                    self.embedding_index.prepare_document(doc_guid, content) if self.embedding_index else None
+                )
+        except Exception as e:
+            pending.error = e
+            return
+        pending.extraction = extraction
+        pending.prepared_embedding = prepared_embedding
+
+    def _finish_ingest(
+        self,
+        pending: _PendingIngest,
+        deferred_graph_writes: list[DocumentGraphWrite] | None = None,
+    ) -> IngestResult:
+        """Steps 5b-13: duplicate check, persist, index and graph write.
+
+        Batches run this one document at a time in input order, so each
+        document's duplicate check sees every earlier document of the batch.
+        With bulk_graph_writes, a batch may pass ``deferred_graph_writes`` to
+        collect the graph write instead of applying it (see
+        _flush_deferred_graph_writes).
+        """
+        doc_guid = pending.doc_guid
+        provisional_doc = pending.provisional_doc
+        title, content, group_guid = provisional_doc.title, provisional_doc.content, provisional_doc.group_guid
+        source = pending.source
+        lang_result = pending.lang_result
+        language_detected = pending.language_detected
+        word_count = pending.word_count
+        extraction = pending.extraction
+        prepared_embedding = pending.prepared_embedding
+
+        doc = provisional_doc
+        saved_to_file = False
+        story_fingerprint: str | None = None
+
+        # Step 6+: Extraction/duplicate decision + indexing with Rollback
+        try:
+            if pending.error is not None:
+                raise pending.error
+
             # Step 5b: Duplicate detection after extraction so we can include fingerprints.
             dup_result: DuplicateResult = self.duplicate_detector.check(
                 title,
@@ -738,6 +975,7 @@ class IngestService:
                 graph_index=self.graph_index,
                 created_at=provisional_doc.created_at,
                 extraction=extraction,
+                query_embedding=prepared_embedding.probe_embedding if prepared_embedding else None,
             )
 
             # Final document model (persisted) keeps the provisional created_at.
@@ -766,6 +1004,16 @@ class IngestService:
                 if extraction:
                     embedding_metadata["impact_score"] = extraction.impact_score
                     embedding_metadata["impact_tier"] = extraction.impact_tier
+                    # Filterable membership (caller-supplied metadata wins)
+                    if extraction.sectors:
+                        embedding_metadata.setdefault("sectors", extraction.sectors)
+                    if extraction.companies:
+                        embedding_metadata.setdefault("companies", extraction.companies)
+                    if extraction.regions and not (
+                        "region" in embedding_metadata or "regions" in embedding_metadata
+                    ):
+                        embedding_metadata["region"] = extraction.regions[0]
+                        embedding_metadata["regions"] = extraction.regions
                 
                 self.embedding_index.embed_document(
                     document_guid=doc.guid,
@@ -774,6 +1022,7 @@ class IngestService:
                     source_guid=doc.source_guid,
                     language=doc.language,
                     metadata=embedding_metadata,
+                    prepared=prepared_embedding,
                 )
 
             # Step 10: Index in Neo4j (if configured)
@@ -789,21 +1038,40 @@ class IngestService:
                 trust_level = None
                 if source and source.trust_level:
                     # Convert TrustLevel enum to integer (1-10 scale)
-                    trust_level_map = {
-                        "high": 10,
-                        "medium": 7,
-                        "low": 5,
-                        "unverified": 3,
-                    }
-                    trust_level = trust_level_map.get(source.trust_level.value, 5)
-                
+                    trust_level = _TRUST_LEVEL_MAP.get(source.trust_level.value, 5)
+
+                source_props = {
+                    "reliability": doc.metadata.get("reliability", 0.8)
+                }
+                if trust_level is not None:
+                    source_props["trust_level"] = trust_level
+
+                if extraction:
+                    story_fingerprint = compute_story_fingerprint(
+                        tickers=[i.ticker for i in extraction.instruments if i.ticker],
+                        event_type=(extraction.primary_event.event_type if extraction.primary_event else "OTHER"),
+                        created_at=doc.created_at,
+                    )
+
+            if self.graph_index and self.bulk_graph_writes:
+                # Steps 10-11 in one transaction (or one per group of batch documents)
+                if extraction:
+                    # Regex ticker fallback: catch known tickers the LLM missed
+                    self._augment_extraction_with_regex_tickers(doc.content, extraction)
+                graph_write = self._plan_graph_write(
+                    doc,
+                    source_name=source_name,
+                    source_props=source_props,
+                    story_fingerprint=story_fingerprint,
+                    extraction=extraction,
+                )
+                if deferred_graph_writes is not None:
+                    deferred_graph_writes.append(graph_write)
+                else:
+                    self._write_graph_documents([graph_write])
+
+            elif self.graph_index:
                 try:
-                    source_props = {
-                        "reliability": doc.metadata.get("reliability", 0.8)
-                    }
-                    if trust_level is not None:
-                        source_props["trust_level"] = trust_level
-                    
                     self.graph_index.create_source_node(
                         source_guid=doc.source_guid, 
                         name=source_name,
@@ -823,19 +1091,11 @@ class IngestService:
                     created_at=doc.created_at,
                     metadata=doc.metadata,
                     content_hash=compute_content_hash(f"{doc.title} {doc.content}".strip()),
-                    story_fingerprint=(
-                        None
-                        if not extraction
-                        else compute_story_fingerprint(
-                            tickers=[i.ticker for i in extraction.instruments if i.ticker],
-                            event_type=(extraction.primary_event.event_type if extraction.primary_event else "OTHER"),
-                            created_at=doc.created_at,
-                        )
-                    ),
+                    story_fingerprint=story_fingerprint,
                 )
 
             # Step 11: Update graph with extracted entities (if extraction succeeded)
-            if extraction and self.graph_index:
+            if extraction and self.graph_index and not self.bulk_graph_writes:
                 # Regex ticker fallback: catch known tickers the LLM missed
                 self._augment_extraction_with_regex_tickers(doc.content, extraction)
                 self._apply_extraction_to_graph(doc.guid, extraction)
@@ -843,27 +1103,7 @@ class IngestService:
         except Exception as e:
             # Rollback on failure
             session_logger.error(f"Error indexing document {doc_guid}: {e}. Rolling back.")
-
-            # 1. Remove from file store
-            if saved_to_file:
-                try:
-                    self.document_store.delete(doc.guid, doc.group_guid, doc.created_at)
-                except Exception as rollback_error:
-                    session_logger.error(f"CRITICAL: Failed to rollback file store for {doc_guid}: {rollback_error}")
-
-            # 2. Remove from embedding index
-            if self.embedding_index:
-                try:
-                    self.embedding_index.delete_document(doc_guid)
-                except Exception as rollback_error:
-                    session_logger.error(f"CRITICAL: Failed to rollback embedding index for {doc_guid}: {rollback_error}")
-
-            # 3. Remove from graph index
-            if self.graph_index:
-                try:
-                    self.graph_index.delete_node(NodeLabel.DOCUMENT, doc_guid)
-                except Exception as rollback_error:
-                    session_logger.error(f"CRITICAL: Failed to rollback graph index for {doc_guid}: {rollback_error}")
+            self._rollback_document(doc_guid, doc.group_guid, doc.created_at, saved_to_file)
 
             return IngestResult(
                 guid=doc_guid,
@@ -876,7 +1116,19 @@ class IngestService:
             )
 
         # Step 12: Register with duplicate detector for future checks
-        self.duplicate_detector.register(doc_guid, title, content)
+        self.duplicate_detector.register(
+            doc_guid,
+            title,
+            content,
+            created_at=provisional_doc.created_at,
+            group=group_guid,
+            story_fingerprint=story_fingerprint,
+        )
+
+        # Step 13: Drop cached client feeds this document could change
+        # (a deferred graph write invalidates once it is flushed instead)
+        if deferred_graph_writes is None:
+            self._invalidate_feeds_for_document(extraction)
 
         # Determine status
         status = IngestStatus.DUPLICATE if dup_result.is_duplicate else IngestStatus.SUCCESS
@@ -900,6 +1152,296 @@ class IngestService:
             extraction=extraction,
         )
 
+    def _invalidate_feeds_for_document(self, extraction: "GraphExtractionResult | None") -> None:
+        """Drop cached client feeds for a document's tickers and themes.
+
+        Must run after the document's graph write: a feed computed before it
+        would otherwise be cached under the new generation without the document.
+        """
+        if self.feed_cache is not None and extraction:
+            self.feed_cache.invalidate_for_document(
+                tickers=[i.ticker.upper() for i in extraction.instruments if i.ticker],
+                themes=extraction.themes,
+            )
+
+    def _match_clients(self, pending: _PendingIngest, result: IngestResult) -> None:
+        """Step 14: Score a newly indexed document against every client's standing query.
+
+        Runs after the commit lock is released; a matcher failure is logged
+        and never fails the ingest.
+        """
+        if self.client_matcher is None or result.status != IngestStatus.SUCCESS:
+            return
+        doc = pending.provisional_doc
+        extraction = result.extraction
+        try:
+            self.client_matcher.match_document(
+                document_guid=result.guid,
+                group_guid=doc.group_guid,
+                title=doc.title,
+                tickers=[i.ticker for i in extraction.instruments if i.ticker] if extraction else [],
+                embeddings=pending.prepared_embedding.embeddings if pending.prepared_embedding else [],
+                impact_score=extraction.impact_score if extraction else None,
+                impact_tier=extraction.impact_tier if extraction else None,
+                created_at=result.created_at,
+            )
+        except Exception as e:
+            session_logger.warning(f"Client matching failed for document {result.guid}: {e}")
+
+    def _rollback_document(
+        self,
+        doc_guid: str,
+        group_guid: str,
+        created_at: datetime | None,
+        saved_to_file: bool,
+    ) -> None:
+        """Remove a partially indexed document from every store."""
+        # 1. Remove from file store
+        if saved_to_file:
+            try:
+                self.document_store.delete(doc_guid, group_guid, created_at)
+            except Exception as rollback_error:
+                session_logger.error(f"CRITICAL: Failed to rollback file store for {doc_guid}: {rollback_error}")
+
+        # 2. Remove from embedding index
+        if self.embedding_index:
+            try:
+                self.embedding_index.delete_document(doc_guid)
+            except Exception as rollback_error:
+                session_logger.error(f"CRITICAL: Failed to rollback embedding index for {doc_guid}: {rollback_error}")
+
+        # 3. Remove from graph index
+        if self.graph_index:
+            try:
+                self.graph_index.delete_node(NodeLabel.DOCUMENT, doc_guid)
+            except Exception as rollback_error:
+                session_logger.error(f"CRITICAL: Failed to rollback graph index for {doc_guid}: {rollback_error}")
+
+    def _plan_graph_write(
+        self,
+        doc: Document,
+        source_name: str,
+        source_props: dict[str, Any],
+        story_fingerprint: str | None,
+        extraction: "GraphExtractionResult | None",
+    ) -> DocumentGraphWrite:
+        """Collect Steps 10-11 for one document as a DocumentGraphWrite.
+
+        AFFECTS and MENTIONS targets are left unresolved (ticker / company
+        name); _write_graph_documents resolves them for all documents at once.
+        """
+        properties = GraphIndex.document_properties(
+            source_guid=doc.source_guid,
+            group_guid=doc.group_guid,
+            title=doc.title,
+            language=doc.language,
+            created_at=doc.created_at,
+            metadata=doc.metadata,
+            content_hash=compute_content_hash(f"{doc.title} {doc.content}".strip()),
+            story_fingerprint=story_fingerprint,
+        )
+        graph_write = DocumentGraphWrite(
+            document_guid=doc.guid,
+            source_guid=doc.source_guid,
+            group_guid=doc.group_guid,
+            properties=properties,
+            source={
+                **source_props,
+                "name": source_name,
+                "type": doc.metadata.get("source_type", "synthetic"),
+            },
+        )
+        if not extraction:
+            return graph_write
+
+        primary_event = extraction.primary_event
+        llm_event_code = primary_event.event_type if primary_event else None
+        graph_write.event_type_code = _EVENT_TYPE_MAPPING.get(llm_event_code) if llm_event_code else None
+        properties.update(
+            {
+                "impact_score": extraction.impact_score,
+                "impact_tier": extraction.impact_tier,
+                "decay_lambda": 0.15,
+            }
+        )
+        if extraction.themes:
+            properties["themes"] = extraction.themes
+
+        for inst in extraction.instruments:
+            if not inst.ticker:
+                continue
+            graph_write.affects.append(
+                {
+                    "ticker": inst.ticker,
+                    "name": inst.name or inst.ticker,
+                    "props": {
+                        "confidence": 1.0,
+                        "direction": _DIRECTION_MAP.get(inst.direction, "neutral"),
+                        "magnitude": _MAGNITUDE_MAP.get(inst.magnitude, 0.01),
+                    },
+                }
+            )
+        graph_write.mentions = [{"name": name} for name in extraction.companies if name]
+        return graph_write
+
+    def _write_graph_documents(self, graph_writes: list[DocumentGraphWrite]) -> None:
+        """Resolve entities for planned graph writes and apply them in one transaction.
+
+        Instrument and company lookups are batched across all documents;
+        misses go through alias resolution / strict validation and
+        auto-creation as in per-document ingest.
+        """
+        assert self.graph_index is not None  # nosec B101 - callers check graph_index
+
+        tickers = {edge["ticker"]: edge["name"] for w in graph_writes for edge in w.affects}
+        names = {m["name"] for w in graph_writes for m in w.mentions}
+
+        instrument_guids = self._lookup_entity_guids(INSTRUMENT, tickers, self.graph_index.resolve_instrument_guids)
+        new_instruments: list[dict[str, Any]] = []
+        for ticker, name in tickers.items():
+            if instrument_guids.get(ticker):
+                continue
+            guid, create = self._resolve_unknown_ticker(ticker, name)
+            instrument_guids[ticker] = guid
+            if create:
+                new_instruments.append({"guid": guid, "ticker": ticker, "name": name})
+
+        company_guids = self._lookup_entity_guids(
+            COMPANY, names, self.graph_index.resolve_company_guids, trust_misses=False
+        )
+        new_companies: list[dict[str, Any]] = []
+        for name in sorted(name for name in names if not company_guids.get(name)):
+            guid, placeholder_ticker = _company_guid_and_ticker(name)
+            company_guids[name] = guid
+            new_companies.append({"guid": guid, "name": name, "ticker": placeholder_ticker})
+
+        for graph_write in graph_writes:
+            graph_write.affects = [
+                {"instrument_guid": instrument_guids[edge["ticker"]], "props": edge["props"]}
+                for edge in graph_write.affects
+                if instrument_guids.get(edge["ticker"])
+            ]
+            graph_write.mentions = [
+                {"company_guid": company_guids[m["name"]], "name": m["name"]} for m in graph_write.mentions
+            ]
+
+        self.graph_index.write_documents(graph_writes, instruments=new_instruments, companies=new_companies)
+        if self.entity_cache is not None:
+            self.entity_cache.put_many(INSTRUMENT, {row["ticker"]: row["guid"] for row in new_instruments})
+            self.entity_cache.put_many(COMPANY, {row["name"]: row["guid"] for row in new_companies})
+        matcher = getattr(self, "_ticker_matcher", None)
+        if new_instruments and matcher is not None:
+            matcher.add([row["ticker"] for row in new_instruments])
+        if new_companies:
+            session_logger.info(f"Auto-created {len(new_companies)} companies: {[c['name'] for c in new_companies][:5]}")
+
+    def _lookup_entity_guids(
+        self,
+        kind: str,
+        values: "Iterable[str]",
+        resolve: "Callable[[list[str]], dict[str, str]]",
+        trust_misses: bool = True,
+    ) -> dict[str, str | None]:
+        """Resolve tickers or company names from entity_cache, querying Neo4j for the rest.
+
+        Args:
+            trust_misses: Use and record negative entries. Only valid for exact
+                lookups (tickers); fuzzy company matches always re-query misses.
+
+        Returns:
+            Value -> guid, or None for values not in the graph
+        """
+        if self.entity_cache is None:
+            return dict(resolve(list(values)))
+        resolved, missing = self.entity_cache.get_many(kind, values)
+        if not trust_misses:
+            missing.extend(value for value, guid in resolved.items() if guid is None)
+            resolved = {value: guid for value, guid in resolved.items() if guid is not None}
+        if missing:
+            found = resolve(missing)
+            looked_up: dict[str, str | None] = {value: found.get(value) for value in missing}
+            self.entity_cache.put_many(
+                kind, looked_up if trust_misses else {v: g for v, g in looked_up.items() if g is not None}
+            )
+            resolved.update(looked_up)
+        return resolved
+
+    def _resolve_unknown_ticker(self, ticker: str, name: str) -> tuple[str | None, bool]:
+        """Resolve a ticker that has no Instrument node.
+
+        Returns:
+            (guid, create): an alias target, the canonical inst-<ticker> guid
+            with create=True, or (None, False) when strict validation rejects it
+        """
+        # Milestone M2: attempt alias resolution before auto-creating.
+        if self.alias_resolver:
+            try:
+                # Primary: ticker-level alias (if present)
+                resolved = self.alias_resolver.resolve(ticker, scheme="TICKER")
+                if resolved:
+                    return resolved, False
+
+                # Secondary: name-variant alias (common in newswire)
+                resolved = self.alias_resolver.resolve(name, scheme="NAME_VARIANT")
+                if resolved:
+                    return resolved, False
+            except Exception:  # nosec B110 - alias resolution must not break ingestion
+                # Alias resolution should never break ingestion; fall back to existing behavior.
+                pass
+
+        # Strict mode: reject tickers not in the known universe
+        if self.strict_ticker_validation:
+            session_logger.warning(
+                f"Ticker '{ticker}' not in instrument universe -- skipping AFFECTS edge"
+            )
+            return None, False
+
+        return f"inst-{ticker}", True
+
+    def _flush_deferred_graph_writes(
+        self,
+        graph_writes: list[DocumentGraphWrite],
+        results: list[IngestResult],
+    ) -> None:
+        """Apply a pipelined batch's deferred graph writes in one transaction.
+
+        Cached client feeds are invalidated for each document once the
+        transaction has committed. If it fails, none of its documents reached
+        Neo4j: each is rolled back from the file store and ChromaDB,
+        unregistered from the duplicate detector and its result replaced with
+        FAILED.
+        """
+        if not graph_writes:
+            return
+        positions = {result.guid: i for i, result in enumerate(results)}
+        try:
+            self._write_graph_documents(graph_writes)
+        except Exception as e:
+            session_logger.error(f"Bulk graph write failed for {len(graph_writes)} documents: {e}. Rolling back.")
+            for graph_write in graph_writes:
+                i = positions.get(graph_write.document_guid)
+                if i is None:
+                    continue
+                result = results[i]
+                self._rollback_document(result.guid, graph_write.group_guid, result.created_at, saved_to_file=True)
+                self.duplicate_detector.unregister(result.guid)
+                results[i] = IngestResult(
+                    guid=result.guid,
+                    status=IngestStatus.FAILED,
+                    language=result.language,
+                    language_detected=result.language_detected,
+                    word_count=result.word_count,
+                    error=f"Indexing failed: {str(e)}",
+                    created_at=result.created_at,
+                )
+        else:
+            for graph_write in graph_writes:
+                i = positions.get(graph_write.document_guid)
+                if i is not None:
+                    self._invalidate_feeds_for_document(results[i].extraction)
+        finally:
+            graph_writes.clear()
+
     def ingest_from_input(
         self,
         input_data: DocumentCreate,
@@ -925,16 +1467,30 @@ class IngestService:
         self,
         documents: Sequence[DocumentCreate],
         stop_on_error: bool = False,
+        max_workers: int | None = None,
     ) -> list[IngestResult]:
         """Ingest multiple documents.
 
+        With more than one worker the batch is pipelined. Validation,
+        language detection, LLM extraction and chunk embedding run on a
+        worker pool, at most 2 x workers documents ahead of the commit stage.
+        The commit stage (duplicate check, file and ChromaDB writes, graph
+        writes) runs on the calling thread one document at a time in input
+        order. Duplicates within the batch and per-document rollback
+        therefore behave as in sequential ingest.
+
         Args:
             documents: Sequence of DocumentCreate inputs
             stop_on_error: Stop on first error (default False)
+            max_workers: Pipeline workers (default: batch_workers)
 
         Returns:
-            List of IngestResult for each document
+            List of IngestResult for each document, in input order
         """
+        workers = self.batch_workers if max_workers is None else max_workers
+        if workers > 1 and len(documents) > 1:
+            return self._ingest_batch_pipelined(documents, stop_on_error, workers)
+
         results: list[IngestResult] = []
 
         for doc_input in documents:
@@ -942,17 +1498,98 @@ class IngestService:
                 result = self.ingest_from_input(doc_input)
                 results.append(result)
             except IngestError as e:
-                error_result = IngestResult(
-                    guid=str(uuid.uuid4()),
-                    status=IngestStatus.FAILED,
-                    error=str(e),
-                )
-                results.append(error_result)
+                results.append(self._batch_error_result(e))
                 if stop_on_error:
                     break
 
         return results
 
+    @staticmethod
+    def _batch_error_result(error: IngestError) -> IngestResult:
+        """FAILED result for a document rejected before indexing."""
+        return IngestResult(
+            guid=str(uuid.uuid4()),
+            status=IngestStatus.FAILED,
+            error=str(error),
+        )
+
+    def _prepare_batch_document(self, doc_input: DocumentCreate) -> _PendingIngest | IngestError:
+        """Pipeline front stages for one document (runs on a worker)."""
+        try:
+            pending = self._begin_ingest(
+                doc_input.title,
+                doc_input.content,
+                doc_input.source_guid,
+                doc_input.group_guid,
+                doc_input.language,
+                doc_input.metadata,
+            )
+        except IngestError as e:
+            return e
+        self._run_llm_stage(pending)
+        return pending
+
+    def _ingest_batch_pipelined(
+        self,
+        documents: Sequence[DocumentCreate],
+        stop_on_error: bool,
+        workers: int,
+    ) -> list[IngestResult]:
+        """Run ingest_batch with concurrent front stages and an ordered commit."""
+        results: list[IngestResult] = []
+        committed: dict[str, _PendingIngest] = {}
+        inputs = iter(documents)
+        in_flight: deque[Future[_PendingIngest | IngestError]] = deque()
+        max_ahead = 2 * workers
+        started = time.perf_counter()
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gofr-iq-ingest-batch")
+
+        def fill() -> None:
+            # Bounded look-ahead: workers never run more than max_ahead
+            # documents in front of the commit stage
+            while len(in_flight) < max_ahead:
+                doc_input = next(inputs, None)
+                if doc_input is None:
+                    return
+                in_flight.append(executor.submit(self._prepare_batch_document, doc_input))
+
+        # Graph writes for up to graph_write_batch_size documents share one transaction
+        deferred: list[DocumentGraphWrite] | None = (
+            [] if self.graph_index and self.bulk_graph_writes and self.graph_write_batch_size > 1 else None
+        )
+
+        try:
+            fill()
+            while in_flight:
+                prepared = in_flight.popleft().result()
+                fill()
+                if isinstance(prepared, IngestError):
+                    results.append(self._batch_error_result(prepared))
+                    if stop_on_error:
+                        break
+                    continue
+                with self._commit_lock:
+                    results.append(self._finish_ingest(prepared, deferred))
+                committed[prepared.doc_guid] = prepared
+                if deferred is not None and len(deferred) >= self.graph_write_batch_size:
+                    self._flush_deferred_graph_writes(deferred, results)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            if deferred:
+                self._flush_deferred_graph_writes(deferred, results)
+
+        # After the last deferred graph write, so rolled-back documents are not matched
+        for result in results:
+            if result.guid in committed:
+                self._match_clients(committed[result.guid], result)
+
+        session_logger.info(
+            f"Pipelined batch ingest: documents={len(results)}, workers={workers}, "
+            f"elapsed_ms={(time.perf_counter() - started) * 1000:.0f}"
+        )
+        return results
+
     def get_document(self, guid: str, group_guid: str) -> Document | None:
         """Retrieve a document by GUID.
 
@@ -1003,30 +1640,58 @@ def create_ingest_service(
     embedding_index: EmbeddingIndex | None = None,
     graph_index: GraphIndex | None = None,
     llm_service: LLMService | None = None,
+    feed_cache: FeedCache | None = None,
+    entity_cache: EntityResolutionCache | None = None,
+    client_matcher: "ClientMatcher | None" = None,
+    document_store: DocumentStore | None = None,
+    source_registry: SourceRegistry | None = None,
 ) -> IngestService:
     """Create an IngestService with standard configuration.
 
+    Environment:
+        GOFR_IQ_STRICT_TICKER_VALIDATION: Set to 1/true/yes to skip tickers
+            outside the instrument universe instead of creating them
+        GOFR_IQ_INGEST_OVERLAP_LLM_IO: Set to 1/true/yes to embed while the
+            extraction call is in flight
+        GOFR_IQ_INGEST_BATCH_WORKERS: ingest_batch pipeline workers (default 1)
+        GOFR_IQ_BULK_GRAPH_WRITES: Set to 1/true/yes to write each document's
+            graph updates in one transaction
+
     Args:
         storage_path: Path to storage directory
         max_word_count: Maximum word count (default 20,000)
         embedding_index: Optional embedding index
         graph_index: Optional graph index
         llm_service: Optional LLM service for content extraction
+        feed_cache: Optional client feed cache to invalidate on ingest
+        entity_cache: Optional shared entity resolution cache
+        client_matcher: Optional ingest-time client matcher
+        document_store: Document store shared with other services
+            (default: one under storage_path / "documents")
+        source_registry: Source registry shared with other services
+            (default: one under storage_path / "sources")
 
     Returns:
         Configured IngestService
     """
     storage_path = Path(storage_path)
 
-    document_store = DocumentStore(base_path=storage_path / "documents")
+    if document_store is None:
+        document_store = DocumentStore(base_path=storage_path / "documents")
     language_detector = LanguageDetector()
     duplicate_detector = DuplicateDetector()
 
     # Initialize SourceRegistry with Neo4j sync if graph_index is provided
-    source_registry = SourceRegistry(
-        base_path=storage_path / "sources",
-        graph_index=graph_index,
-    )
+    if source_registry is None:
+        source_registry = SourceRegistry(
+            base_path=storage_path / "sources",
+            graph_index=graph_index,
+        )
+
+    try:
+        batch_workers = int(os.environ.get("GOFR_IQ_INGEST_BATCH_WORKERS", "1"))
+    except ValueError:
+        batch_workers = 1
 
     return IngestService(
         document_store=document_store,
@@ -1037,5 +1702,11 @@ def create_ingest_service(
         graph_index=graph_index,
         llm_service=llm_service,
         max_word_count=max_word_count,
+        feed_cache=feed_cache,
         strict_ticker_validation=os.environ.get("GOFR_IQ_STRICT_TICKER_VALIDATION", "").lower() in ("1", "true", "yes"),
+        overlap_llm_io=os.environ.get("GOFR_IQ_INGEST_OVERLAP_LLM_IO", "").lower() in ("1", "true", "yes"),
+        batch_workers=batch_workers,
+        bulk_graph_writes=os.environ.get("GOFR_IQ_BULK_GRAPH_WRITES", "").lower() in ("1", "true", "yes"),
+        entity_cache=entity_cache,
+        client_matcher=client_matcher,
     )
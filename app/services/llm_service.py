@@ -8,10 +8,18 @@ Features:
 - Embedding generation for ChromaDB
 - Automatic retries with exponential backoff
 - Rate limiting and error handling
+- AsyncLLMService: the same API as coroutines on a pooled httpx.AsyncClient
+  (HTTP/2 when the ``h2`` package is installed), so callers on an event loop
+  can overlap LLM requests instead of serializing them
+
+LLMService and AsyncLLMService share payload building, response parsing and
+error mapping; only the transport and the backoff sleep differ.
 """
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import json
 import time
 from dataclasses import dataclass, field
@@ -148,22 +156,9 @@ class EmbeddingResult:
         return len(self.embeddings[0]) if self.embeddings else 0
 
 
-class LLMService:
-    """Service for LLM chat completion and embedding generation
-    
-    Uses OpenRouter API which provides access to multiple LLM providers
-    through a unified OpenAI-compatible interface.
-    
-    Example:
-        >>> service = LLMService()
-        >>> result = service.chat_completion(
-        ...     messages=[ChatMessage("user", "Hello!")],
-        ... )
-        >>> print(result.content)
-        
-        >>> embeddings = service.generate_embeddings(["Hello", "World"])
-        >>> print(embeddings.dimensions)
-    """
+class _LLMServiceBase:
+    """Settings, request payloads and response parsing shared by the sync
+    and async services (no I/O happens here)."""
 
     def __init__(
         self,
@@ -212,7 +207,6 @@ class LLMService:
                 max_retries=int(os.environ.get("GOFR_IQ_LLM_MAX_RETRIES", "3")),
                 timeout=int(os.environ.get("GOFR_IQ_LLM_TIMEOUT", "60")),
             )
-        self._client: httpx.Client | None = None
 
     @property
     def is_available(self) -> bool:
@@ -227,18 +221,139 @@ class LLMService:
                 "or set GOFR_IQ_OPENROUTER_API_KEY as an override."
             )
 
+    def _headers(self) -> dict[str, str]:
+        """Headers sent with every OpenRouter request"""
+        return {
+            "Authorization": f"Bearer {self.settings.api_key}",
+            "HTTP-Referer": "https://github.com/gofr/gofr-iq",
+            "X-Title": "Gofr-IQ News Intelligence",
+            "Content-Type": "application/json",
+        }
+
+    @staticmethod
+    def _rate_limit_wait(response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait after a 429 (Retry-After, else exponential)"""
+        retry_after = response.headers.get("Retry-After")
+        return float(retry_after) if retry_after else float(2**attempt)
+
+    @staticmethod
+    def _raise_for_error(response: httpx.Response) -> None:
+        """Raise LLMAPIError for 4xx/5xx responses (other than 429)"""
+        if response.status_code < 400:
+            return
+        error_detail = response.text
+        try:
+            error_json = response.json()
+            error_detail = error_json.get("error", {}).get(
+                "message", response.text
+            )
+        except Exception:
+            pass  # nosec B110
+        raise LLMAPIError(response.status_code, error_detail)
+
+    def _chat_payload(
+        self,
+        messages: list[ChatMessage],
+        model: str | None,
+        json_mode: bool,
+        temperature: float,
+        max_tokens: int | None,
+    ) -> dict[str, Any]:
+        """Build a /chat/completions request body"""
+        payload: dict[str, Any] = {
+            "model": model or self.settings.chat_model,
+            "messages": [m.to_dict() for m in messages],
+            "temperature": temperature,
+        }
+
+        if json_mode:
+            payload["response_format"] = {"type": "json_object"}
+
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
+
+        logger.info(f"LLM chat completion: model={payload['model']}, json_mode={json_mode}, messages={len(messages)}")
+        return payload
+
+    @staticmethod
+    def _parse_chat(response: dict[str, Any], payload: dict[str, Any]) -> ChatCompletionResult:
+        """Convert a /chat/completions response"""
+        choice = response["choices"][0]
+        return ChatCompletionResult(
+            content=choice["message"]["content"],
+            model=response.get("model", payload["model"]),
+            usage=response.get("usage", {}),
+            finish_reason=choice.get("finish_reason"),
+        )
+
+    def _embedding_payload(self, texts: list[str], model: str | None) -> dict[str, Any]:
+        """Build an /embeddings request body"""
+        payload = {
+            "model": model or self.settings.embedding_model,
+            "input": texts,
+        }
+        logger.info(f"LLM embeddings: model={payload['model']}, texts={len(texts)}")
+        return payload
+
+    @staticmethod
+    def _parse_embeddings(response: dict[str, Any], payload: dict[str, Any]) -> EmbeddingResult:
+        """Convert an /embeddings response
+
+        Raises:
+            LLMAPIError: If the embedding API returned an error
+        """
+        # Check for error in response body (OpenRouter returns 200 with error object)
+        if "error" in response:
+            error_msg = response["error"].get("message", "Unknown embedding error")
+            error_code = response["error"].get("code", 500)
+            raise LLMAPIError(error_code, f"Embedding failed: {error_msg}")
+
+        # Extract embeddings from response
+        if "data" not in response:
+            raise LLMAPIError(500, f"Invalid embedding response: missing 'data' field. Response: {response}")
+
+        embeddings = [item["embedding"] for item in response["data"]]
+
+        return EmbeddingResult(
+            embeddings=embeddings,
+            model=response.get("model", payload["model"]),
+            usage=response.get("usage", {}),
+        )
+
+
+class LLMService(_LLMServiceBase):
+    """Service for LLM chat completion and embedding generation
+    
+    Uses OpenRouter API which provides access to multiple LLM providers
+    through a unified OpenAI-compatible interface.
+    
+    Example:
+        >>> service = LLMService()
+        >>> result = service.chat_completion(
+        ...     messages=[ChatMessage("user", "Hello!")],
+        ... )
+        >>> print(result.content)
+        
+        >>> embeddings = service.generate_embeddings(["Hello", "World"])
+        >>> print(embeddings.dimensions)
+    """
+
+    def __init__(
+        self,
+        settings: LLMSettings | None = None,
+        config: GofrIqConfig | None = None,
+        openrouter_key_provider: OpenRouterKeyProvider | None = None,
+    ) -> None:
+        super().__init__(settings=settings, config=config, openrouter_key_provider=openrouter_key_provider)
+        self._client: httpx.Client | None = None
+
     @property
     def client(self) -> httpx.Client:
         """Get or create HTTP client"""
         if self._client is None:
             self._client = httpx.Client(
                 base_url=self.settings.base_url,
-                headers={
-                    "Authorization": f"Bearer {self.settings.api_key}",
-                    "HTTP-Referer": "https://github.com/gofr/gofr-iq",
-                    "X-Title": "Gofr-IQ News Intelligence",
-                    "Content-Type": "application/json",
-                },
+                headers=self._headers(),
                 timeout=self.settings.timeout,
             )
         return self._client
@@ -281,24 +396,13 @@ class LLMService:
 
                 if response.status_code == 429:
                     # Rate limited
-                    retry_after = response.headers.get("Retry-After")
-                    wait_time = float(retry_after) if retry_after else (2**attempt)
+                    wait_time = self._rate_limit_wait(response, attempt)
                     if attempt < max_retries:
                         time.sleep(wait_time)
                         continue
                     raise LLMRateLimitError(wait_time)
 
-                if response.status_code >= 400:
-                    error_detail = response.text
-                    try:
-                        error_json = response.json()
-                        error_detail = error_json.get("error", {}).get(
-                            "message", response.text
-                        )
-                    except Exception:
-                        pass  # nosec B110
-                    raise LLMAPIError(response.status_code, error_detail)
-
+                self._raise_for_error(response)
                 return response.json()  # type: ignore[no-any-return]
 
             except httpx.TransportError as e:
@@ -330,39 +434,23 @@ class LLMService:
         Returns:
             ChatCompletionResult with generated content
         """
-        payload: dict[str, Any] = {
-            "model": model or self.settings.chat_model,
-            "messages": [m.to_dict() for m in messages],
-            "temperature": temperature,
-        }
-
-        if json_mode:
-            payload["response_format"] = {"type": "json_object"}
-
-        if max_tokens:
-            payload["max_tokens"] = max_tokens
-
-        logger.info(f"LLM chat completion: model={payload['model']}, json_mode={json_mode}, messages={len(messages)}")
+        payload = self._chat_payload(messages, model, json_mode, temperature, max_tokens)
         response = self._make_request("/chat/completions", payload)
-
-        choice = response["choices"][0]
-        return ChatCompletionResult(
-            content=choice["message"]["content"],
-            model=response.get("model", payload["model"]),
-            usage=response.get("usage", {}),
-            finish_reason=choice.get("finish_reason"),
-        )
+        return self._parse_chat(response, payload)
 
     def generate_embeddings(
         self,
         texts: list[str],
         model: str | None = None,
+        retries: int | None = None,
     ) -> EmbeddingResult:
         """Generate embeddings for texts
         
         Args:
             texts: List of texts to embed
             model: Embedding model to use (uses settings default if not specified)
+            retries: Number of retries (uses settings default if not specified);
+                with 0, a 429 raises LLMRateLimitError instead of sleeping
             
         Returns:
             EmbeddingResult with embedding vectors
@@ -370,31 +458,9 @@ class LLMService:
         Raises:
             LLMAPIError: If the embedding API returns an error
         """
-        payload = {
-            "model": model or self.settings.embedding_model,
-            "input": texts,
-        }
-
-        logger.info(f"LLM embeddings: model={payload['model']}, texts={len(texts)}")
-        response = self._make_request("/embeddings", payload)
-
-        # Check for error in response body (OpenRouter returns 200 with error object)
-        if "error" in response:
-            error_msg = response["error"].get("message", "Unknown embedding error")
-            error_code = response["error"].get("code", 500)
-            raise LLMAPIError(error_code, f"Embedding failed: {error_msg}")
-
-        # Extract embeddings from response
-        if "data" not in response:
-            raise LLMAPIError(500, f"Invalid embedding response: missing 'data' field. Response: {response}")
-        
-        embeddings = [item["embedding"] for item in response["data"]]
-
-        return EmbeddingResult(
-            embeddings=embeddings,
-            model=response.get("model", payload["model"]),
-            usage=response.get("usage", {}),
-        )
+        payload = self._embedding_payload(texts, model)
+        response = self._make_request("/embeddings", payload, retries=retries)
+        return self._parse_embeddings(response, payload)
 
     def generate_embedding(self, text: str, model: str | None = None) -> list[float]:
         """Generate embedding for a single text
@@ -413,6 +479,167 @@ class LLMService:
         return [float(x) for x in result.embeddings[0]]
 
 
+def http2_available() -> bool:
+    """Check if httpx can negotiate HTTP/2 (needs the ``h2`` package)"""
+    return importlib.util.find_spec("h2") is not None
+
+
+class AsyncLLMService(_LLMServiceBase):
+    """Async variant of LLMService for callers running on an event loop
+    
+    One pooled httpx.AsyncClient is shared by every request, so concurrent
+    calls (e.g. ``asyncio.gather`` over chat and embedding requests) reuse
+    warm connections instead of each paying a TLS handshake. HTTP/2 is used
+    when available, multiplexing concurrent requests over one connection.
+    Backoff on 429s and network errors awaits ``asyncio.sleep`` so other
+    requests keep running while one waits.
+    
+    Example:
+        >>> async with AsyncLLMService() as service:
+        ...     chat, vectors = await asyncio.gather(
+        ...         service.chat_completion([ChatMessage("user", "Hello!")]),
+        ...         service.generate_embeddings(["Hello", "World"]),
+        ...     )
+    
+    Attributes:
+        http2: Whether the client negotiates HTTP/2
+        limits: Connection pool and keep-alive limits
+    """
+
+    def __init__(
+        self,
+        settings: LLMSettings | None = None,
+        config: GofrIqConfig | None = None,
+        openrouter_key_provider: OpenRouterKeyProvider | None = None,
+        http2: bool | None = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize async LLM service
+        
+        Args:
+            settings: Legacy LLM settings (deprecated, use config instead)
+            config: GofrIqConfig instance (preferred)
+            http2: Use HTTP/2 (default: when the h2 package is installed)
+            max_connections: Maximum open connections in the pool
+            max_keepalive_connections: Idle connections kept for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            transport: Optional httpx transport (for tests)
+        """
+        super().__init__(settings=settings, config=config, openrouter_key_provider=openrouter_key_provider)
+        available = http2_available()
+        if http2 and not available:
+            logger.warning("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1")
+        self.http2 = available if http2 is None else (http2 and available)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get or create the pooled async HTTP client"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.settings.base_url,
+                headers=self._headers(),
+                timeout=self.settings.timeout,
+                http2=self.http2,
+                limits=self.limits,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and its pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncLLMService":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.aclose()
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        payload: dict[str, Any],
+        retries: int | None = None,
+    ) -> dict[str, Any]:
+        """Make an API request with retries, awaiting (not blocking) on backoff
+        
+        Args:
+            endpoint: API endpoint path
+            payload: Request payload
+            retries: Number of retries (uses settings default if not specified)
+            
+        Returns:
+            API response as dictionary
+        """
+        self._ensure_configured()
+        max_retries = retries if retries is not None else self.settings.max_retries
+        last_error: Exception | None = None
+
+        for attempt in range(max_retries + 1):
+            try:
+                response = await self.client.post(endpoint, json=payload)
+
+                if response.status_code == 429:
+                    wait_time = self._rate_limit_wait(response, attempt)
+                    if attempt < max_retries:
+                        await asyncio.sleep(wait_time)
+                        continue
+                    raise LLMRateLimitError(wait_time)
+
+                self._raise_for_error(response)
+                return response.json()  # type: ignore[no-any-return]
+
+            except httpx.TransportError as e:
+                last_error = e
+                if attempt < max_retries:
+                    await asyncio.sleep(2**attempt)
+                    continue
+                raise LLMServiceError(f"Network error: {e}") from e
+
+        raise last_error or LLMServiceError("Request failed after all retries")
+
+    async def chat_completion(
+        self,
+        messages: list[ChatMessage],
+        model: str | None = None,
+        json_mode: bool = False,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> ChatCompletionResult:
+        """Generate a chat completion (see LLMService.chat_completion)"""
+        payload = self._chat_payload(messages, model, json_mode, temperature, max_tokens)
+        response = await self._make_request("/chat/completions", payload)
+        return self._parse_chat(response, payload)
+
+    async def generate_embeddings(
+        self,
+        texts: list[str],
+        model: str | None = None,
+        retries: int | None = None,
+    ) -> EmbeddingResult:
+        """Generate embeddings for texts (see LLMService.generate_embeddings)"""
+        payload = self._embedding_payload(texts, model)
+        response = await self._make_request("/embeddings", payload, retries=retries)
+        return self._parse_embeddings(response, payload)
+
+    async def generate_embedding(self, text: str, model: str | None = None) -> list[float]:
+        """Generate embedding for a single text"""
+        result = await self.generate_embeddings([text], model)
+        return [float(x) for x in result.embeddings[0]]
+
+
 def create_llm_service(
     settings: LLMSettings | None = None,
     config: GofrIqConfig | None = None,
@@ -429,6 +656,40 @@ def create_llm_service(
     return LLMService(settings=settings, config=config)
 
 
+def create_async_llm_service(
+    settings: LLMSettings | None = None,
+    config: GofrIqConfig | None = None,
+) -> AsyncLLMService:
+    """Factory function to create the async LLM service
+    
+    Environment:
+        GOFR_IQ_LLM_MAX_CONNECTIONS: Connection pool size (default 20)
+        GOFR_IQ_LLM_HTTP2: Set to 0/false/no to force HTTP/1.1
+    
+    Args:
+        settings: Optional legacy LLM settings (deprecated)
+        config: Optional GofrIqConfig instance (preferred)
+        
+    Returns:
+        Configured AsyncLLMService instance
+    """
+    import os
+    try:
+        max_connections = int(os.environ.get("GOFR_IQ_LLM_MAX_CONNECTIONS", "20"))
+    except ValueError:
+        max_connections = 20
+    http2 = None
+    if os.environ.get("GOFR_IQ_LLM_HTTP2", "").lower() in ("0", "false", "no"):
+        http2 = False
+    return AsyncLLMService(
+        settings=settings,
+        config=config,
+        http2=http2,
+        max_connections=max_connections,
+        max_keepalive_connections=max(1, max_connections // 2),
+    )
+
+
 def llm_available() -> bool:
     """Check if LLM service is available
     
@@ -0,0 +1,170 @@
+"""Mandate Embedding Store.
+
+Persistent float32 store of client mandate embeddings, keyed by ClientProfile
+guid, so the vectors no longer live as several-thousand-element list
+properties on the Neo4j ``ClientProfile`` node. Profile reads stay small
+and a vector is only loaded when the VECTOR retrieval channel needs it.
+
+Vectors live in a VectorLog under ``base_path`` with one
+``profile_guid<TAB>offset<TAB>dim`` index line per write; the latest line for
+a profile wins and ``dim`` 0 records a deletion. Mandates change rarely, so
+replaced vectors are left in place (reported as dead in stats()).
+
+scripts/migrate_mandate_embeddings.py moves existing ``cp.mandate_embedding``
+properties into the store.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from app.logger import StructuredLogger
+from app.services.vector_log import VectorLog
+
+__all__ = [
+    "MandateEmbeddingStore",
+    "create_mandate_embedding_store",
+]
+
+logger = StructuredLogger(__name__)
+
+
+class MandateEmbeddingStore:
+    """Thread-safe store of mandate embeddings keyed by profile guid.
+
+    Attributes:
+        base_path: Directory holding vectors.f32, index.tsv and write.lock
+    """
+
+    def __init__(self, base_path: Path) -> None:
+        self.base_path = Path(base_path)
+        self._log = VectorLog(self.base_path)
+        self._lock = threading.Lock()
+        # profile_guid -> (offset in floats, dimensions)
+        self._index: dict[str, tuple[int, int]] = {}
+        self._dead = 0
+        self._hits = 0
+        self._misses = 0
+        with self._lock:
+            self._refresh_index()
+
+    def get(self, profile_guid: str) -> list[float] | None:
+        """Return a profile's mandate embedding, or None if not stored."""
+        with self._lock:
+            # Another process may have written (or replaced) it since we last looked
+            self._refresh_index()
+            location = self._index.get(profile_guid)
+            vector = self._log.read(*location) if location is not None else None
+            if vector is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return vector
+
+    def get_many(self, profile_guids: Iterable[str]) -> dict[str, list[float]]:
+        """Return the stored mandate embeddings for many profiles.
+
+        The index is refreshed once for the whole batch. Profiles without a
+        stored embedding are left out of the result.
+        """
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            self._refresh_index()
+            for profile_guid in profile_guids:
+                location = self._index.get(profile_guid)
+                vector = self._log.read(*location) if location is not None else None
+                if vector is None:
+                    self._misses += 1
+                else:
+                    self._hits += 1
+                    found[profile_guid] = vector
+        return found
+
+    def put(self, profile_guid: str, embedding: Sequence[float]) -> int:
+        """Store (or replace) a profile's mandate embedding.
+
+        Returns:
+            Number of dimensions written
+        """
+        if not embedding:
+            raise ValueError("embedding must not be empty")
+        with self._lock, self._log.writer_lock():
+            self._refresh_index()
+            [(offset, dim)] = self._log.append_vectors([embedding])
+            # Index line only after the vector is on disk
+            self._log.append_index([(profile_guid, offset, dim)])
+            self._refresh_index()
+        return dim
+
+    def delete(self, profile_guid: str) -> bool:
+        """Forget a profile's mandate embedding.
+
+        Returns:
+            True if an embedding was stored
+        """
+        with self._lock, self._log.writer_lock():
+            self._refresh_index()
+            if profile_guid not in self._index:
+                return False
+            self._log.append_index([(profile_guid, 0, 0)])
+            self._refresh_index()
+            return True
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for health_check."""
+        with self._lock:
+            self._refresh_index()
+            lookups = self._hits + self._misses
+            return {
+                "profiles": len(self._index),
+                "dead_vectors": self._dead,
+                "bytes": self._log.size_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def __contains__(self, profile_guid: object) -> bool:
+        with self._lock:
+            self._refresh_index()
+            return profile_guid in self._index
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def _refresh_index(self) -> None:
+        """Replay index lines appended since the last refresh. Caller holds the lock."""
+        for parts in self._log.read_index():
+            if len(parts) != 3:
+                continue
+            profile_guid, offset, dim = parts
+            if self._index.pop(profile_guid, None) is not None:
+                self._dead += 1
+            if int(dim) > 0:
+                self._index[profile_guid] = (int(offset), int(dim))
+
+    def __repr__(self) -> str:
+        return f"MandateEmbeddingStore(path={self.base_path}, profiles={len(self)})"
+
+
+def create_mandate_embedding_store(base_path: Path) -> MandateEmbeddingStore | None:
+    """Create a MandateEmbeddingStore from environment configuration.
+
+    Environment:
+        GOFR_IQ_MANDATE_EMBEDDING_STORE: Set to 0/false/no to keep mandate
+            embeddings on the Neo4j ClientProfile node (default on)
+
+    Args:
+        base_path: Directory for the store (e.g. <storage>/mandate_embeddings)
+
+    Returns:
+        MandateEmbeddingStore, or None when disabled
+    """
+    if os.environ.get("GOFR_IQ_MANDATE_EMBEDDING_STORE", "").lower() in ("0", "false", "no"):
+        return None
+    return MandateEmbeddingStore(base_path)
@@ -0,0 +1,345 @@
+"""Query Embedding Cache.
+
+Caches query embeddings so repeated searches (canned dashboard queries, the
+mandate_text fallback in QueryService.get_top_client_news) do not make an
+embeddings API call every time EmbeddingIndex.search runs.
+
+Entries are keyed on (embedding model, SHA-256 of the whitespace-normalized
+query text) and stored as float32 vectors, bounded by:
+- a size-in-bytes limit (LRU eviction)
+- a TTL, in wall-clock time so it still holds after a restart
+
+Optional persistence writes the cache to two files next to ``persist_path``:
+- ``<persist_path>.f32``: all vectors as one contiguous float32 array
+- ``<persist_path>.json``: key, offset, dimension and expiry per vector
+
+Periodic saves triggered by put() run on a background thread, so a search
+that adds an entry never waits on the rewrite.
+
+On startup the ``.f32`` file is memory-mapped and vectors are served straight
+from the mapping, so a large cache loads without reading every vector.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import mmap
+import os
+import sys
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from app.logger import StructuredLogger
+
+__all__ = [
+    "QueryEmbeddingCache",
+    "create_query_embedding_cache",
+]
+
+logger = StructuredLogger(__name__)
+
+QueryEmbeddingKey = tuple[str, str]
+
+# Approximate per-entry bookkeeping cost on top of the vector itself
+_ENTRY_OVERHEAD_BYTES = 160
+_FORMAT_VERSION = 1
+
+
+@dataclass
+class _CacheEntry:
+    vector: array | memoryview
+    expires_at: float
+    nbytes: int
+
+
+class QueryEmbeddingCache:
+    """Thread-safe LRU + TTL cache of query embeddings.
+
+    Attributes:
+        max_bytes: Size limit for cached vectors (plus per-entry overhead)
+        ttl_seconds: Maximum age of a cached embedding
+        persist_path: Optional path prefix for on-disk persistence
+        persist_every: Write to disk (in the background) after this many new entries
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float = 86400.0,
+        persist_path: Path | None = None,
+        persist_every: int = 64,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_bytes = max(0, max_bytes)
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self.persist_path = persist_path
+        self.persist_every = max(1, persist_every)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._save_thread: threading.Thread | None = None
+        self._entries: OrderedDict[QueryEmbeddingKey, _CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._unsaved = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        if persist_path is not None:
+            self._load()
+
+    @staticmethod
+    def make_key(model: str, text: str) -> QueryEmbeddingKey:
+        """Build a cache key from the model name and normalized query text."""
+        normalized = " ".join(unicodedata.normalize("NFC", text).split())
+        return (model, hashlib.sha256(normalized.encode("utf-8")).hexdigest())
+
+    def get(self, model: str, text: str) -> list[float] | None:
+        """Return the cached embedding, or None on miss/expiry."""
+        key = self.make_key(model, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= self._clock():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.vector.tolist()
+
+    def put(self, model: str, text: str, embedding: Sequence[float]) -> bool:
+        """Cache an embedding (stored as float32).
+
+        Returns:
+            True if the embedding was cached (False if larger than max_bytes)
+        """
+        vector = array("f", embedding)
+        nbytes = vector.itemsize * len(vector) + _ENTRY_OVERHEAD_BYTES
+        if nbytes > self.max_bytes:
+            return False
+        key = self.make_key(model, text)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _CacheEntry(
+                vector=vector,
+                expires_at=self._clock() + self.ttl_seconds,
+                nbytes=nbytes,
+            )
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+            self._unsaved += 1
+            save_now = self.persist_path is not None and self._unsaved >= self.persist_every
+            if save_now and self._save_thread is not None and self._save_thread.is_alive():
+                # Entries added meanwhile are picked up by the next save
+                save_now = False
+            if save_now:
+                self._save_thread = threading.Thread(
+                    target=self._background_save, name="gofr-iq-query-embedding-save", daemon=True
+                )
+                self._save_thread.start()
+        return True
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Wait for a background save started by put() to finish."""
+        thread = self._save_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for health_check."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "persistent": self.persist_path is not None,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remove(self, key: QueryEmbeddingKey) -> None:
+        """Remove an entry. Caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.nbytes
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def _files(self) -> tuple[Path, Path]:
+        assert self.persist_path is not None
+        return (
+            self.persist_path.with_name(self.persist_path.name + ".f32"),
+            self.persist_path.with_name(self.persist_path.name + ".json"),
+        )
+
+    def save(self) -> int:
+        """Write live entries to disk (LRU order preserved).
+
+        Files are written to temporary names and swapped in, so a reader
+        holding the previous memory map is unaffected.
+
+        Returns:
+            Number of entries written
+        """
+        if self.persist_path is None:
+            return 0
+        now = self._clock()
+        with self._lock:
+            snapshot = [(key, entry) for key, entry in self._entries.items() if entry.expires_at > now]
+            self._unsaved = 0
+
+        data_path, index_path = self._files()
+        with self._save_lock:
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+            records: list[dict[str, Any]] = []
+            offset = 0
+            tmp_data = data_path.with_name(data_path.name + ".tmp")
+            tmp_index = index_path.with_name(index_path.name + ".tmp")
+            with open(tmp_data, "wb") as fh:
+                for (model, digest), entry in snapshot:
+                    vector = entry.vector if isinstance(entry.vector, array) else array("f", entry.vector)
+                    if sys.byteorder != "little":
+                        vector = array("f", vector)
+                        vector.byteswap()
+                    fh.write(vector.tobytes())
+                    records.append(
+                        {
+                            "model": model,
+                            "digest": digest,
+                            "offset": offset,
+                            "dim": len(vector),
+                            "expires_at": entry.expires_at,
+                        }
+                    )
+                    offset += len(vector)
+            tmp_index.write_text(json.dumps({"version": _FORMAT_VERSION, "entries": records}))
+            # Data first: a crash in between leaves an index that still fits the data
+            os.replace(tmp_data, data_path)
+            os.replace(tmp_index, index_path)
+        return len(records)
+
+    def _background_save(self) -> None:
+        try:
+            self.save()
+        except OSError as exc:
+            logger.warning("Query embedding cache save failed", path=str(self.persist_path), error=str(exc))
+
+    def _load(self) -> None:
+        """Memory-map persisted vectors written by save()."""
+        data_path, index_path = self._files()
+        if not data_path.exists() or not index_path.exists():
+            return
+        try:
+            index = json.loads(index_path.read_text())
+            if index.get("version") != _FORMAT_VERSION:
+                return
+            records = index.get("entries", [])
+            if not records or data_path.stat().st_size == 0:
+                return
+            with open(data_path, "rb") as fh:
+                mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:
+            logger.warning("Query embedding cache load failed", path=str(data_path), error=str(exc))
+            return
+
+        if sys.byteorder == "little":
+            floats: memoryview | array = memoryview(mapped).cast("f")
+        else:
+            floats = array("f", mapped)
+            floats.byteswap()
+
+        now = self._clock()
+        loaded = 0
+        with self._lock:
+            for record in records:
+                offset, dim = int(record["offset"]), int(record["dim"])
+                if record["expires_at"] <= now or offset + dim > len(floats):
+                    continue
+                key = (str(record["model"]), str(record["digest"]))
+                nbytes = 4 * dim + _ENTRY_OVERHEAD_BYTES
+                if key in self._entries:
+                    self._remove(key)
+                self._entries[key] = _CacheEntry(
+                    vector=floats[offset : offset + dim],
+                    expires_at=float(record["expires_at"]),
+                    nbytes=nbytes,
+                )
+                self._bytes += nbytes
+                loaded += 1
+            while self._bytes > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+        logger.info("Query embedding cache loaded", path=str(data_path), entries=loaded)
+
+    def __repr__(self) -> str:
+        return (
+            f"QueryEmbeddingCache(size={len(self)}, max_bytes={self.max_bytes}, "
+            f"ttl_seconds={self.ttl_seconds})"
+        )
+
+
+def create_query_embedding_cache() -> QueryEmbeddingCache | None:
+    """Create a QueryEmbeddingCache from environment configuration.
+
+    Environment:
+        GOFR_IQ_QUERY_EMBEDDING_CACHE_MAX_MB: Size limit (default 64; 0 disables the cache)
+        GOFR_IQ_QUERY_EMBEDDING_CACHE_TTL_SECONDS: TTL (default 86400)
+        GOFR_IQ_QUERY_EMBEDDING_CACHE_PATH: Optional path prefix for persistence
+
+    Returns:
+        QueryEmbeddingCache, or None when disabled
+    """
+    try:
+        max_mb = float(os.environ.get("GOFR_IQ_QUERY_EMBEDDING_CACHE_MAX_MB", "64"))
+    except ValueError:
+        max_mb = 64.0
+    try:
+        ttl_seconds = float(os.environ.get("GOFR_IQ_QUERY_EMBEDDING_CACHE_TTL_SECONDS", "86400"))
+    except ValueError:
+        ttl_seconds = 86400.0
+    if max_mb <= 0 or ttl_seconds <= 0:
+        return None
+    persist = os.environ.get("GOFR_IQ_QUERY_EMBEDDING_CACHE_PATH", "").strip()
+    cache = QueryEmbeddingCache(
+        max_bytes=int(max_mb * 1024 * 1024),
+        ttl_seconds=ttl_seconds,
+        persist_path=Path(persist) if persist else None,
+    )
+    if cache.persist_path is not None:
+        # Entries added since the last periodic save
+        atexit.register(cache.save)
+    return cache
@@ -12,25 +12,69 @@ Query Flow:
 6. Return ranked results
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import json
 import math
 import os
-from typing import Any, Optional, TYPE_CHECKING
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional, TYPE_CHECKING
 
 from app.models import count_words
 from app.services.document_store import DocumentStore
-from app.services.embedding_index import EmbeddingIndex, SimilarityResult
+from app.services.embedding_index import (
+    EmbeddingIndex,
+    SimilarityResult,
+    normalize_filter_value,
+    to_epoch_seconds,
+)
+from app.services.feed_cache import FeedCache, FeedDependencies
 from app.services.graph_index import GraphIndex, NodeLabel
+from app.services.mandate_embedding_store import MandateEmbeddingStore
 from app.services.source_registry import SourceRegistry
 from app.logger import StructuredLogger
 
 if TYPE_CHECKING:
-    from app.services.llm_service import LLMService
+    from app.services.llm_service import AsyncLLMService, ChatCompletionResult, LLMService
 
 logger = StructuredLogger(__name__)
 
+# Adaptive overfetch: chunks requested per wanted document before any filter
+OVERFETCH_CHUNK_SLACK = 1.5
+# Assumed pass rate of each post-filter before anything has been observed
+OVERFETCH_FILTER_PASS_PRIOR = 0.5
+# Minimum growth of the candidate page between rounds
+OVERFETCH_GROWTH = 2.0
+
+# Batch feed: mandate embeddings searched per ChromaDB query
+MANDATE_SEARCH_BATCH_SIZE = 256
+
+# Dependencies of the feed currently being computed; feed helpers that fail
+# open mark it incomplete so the partial result is not cached
+_feed_dependencies: ContextVar[Optional[FeedDependencies]] = ContextVar("feed_dependencies", default=None)
+
+
+@contextmanager
+def _track_feed_reads(dependencies: FeedDependencies) -> Iterator[None]:
+    """Record fail-open helper failures in dependencies while the block runs."""
+    token = _feed_dependencies.set(dependencies)
+    try:
+        yield
+    finally:
+        _feed_dependencies.reset(token)
+
+
+def _note_feed_read_failure() -> None:
+    """Mark the feed being computed (if any) as built from a failed read."""
+    dependencies = _feed_dependencies.get()
+    if dependencies is not None:
+        dependencies.complete = False
+
 
 @dataclass
 class QueryFilters:
@@ -240,6 +284,63 @@ class ScoringConfig:
         )
 
 
+@dataclass(frozen=True)
+class PortfolioRankIndex:
+    """Precomputed position boosts for a client's holdings.
+
+    Holdings are ranked once by weight (descending); each ticker maps to
+    0.3 * log2(1 + rank_percentile), where the largest position has
+    percentile 1.0 and the smallest 0.0. Built once per feed request so the
+    scoring loop does a dict lookup per affected instrument instead of
+    re-sorting the portfolio for every candidate.
+
+    Attributes:
+        boosts: ticker -> undampened position boost (0.0 - 0.3)
+        size: Number of ranked holdings
+    """
+
+    boosts: dict[str, float] = field(default_factory=dict)
+    size: int = 0
+
+    @classmethod
+    def from_holdings(cls, holdings: list[dict[str, Any]]) -> "PortfolioRankIndex":
+        ranked = sorted(
+            [h for h in holdings if h.get("ticker")],
+            key=lambda x: float(x.get("weight") or 0.0),
+            reverse=True,
+        )
+        ticker_to_rank = {h["ticker"]: idx for idx, h in enumerate(ranked)}
+        n = max(1, len(ranked))
+        boosts: dict[str, float] = {}
+        for ticker, rank in ticker_to_rank.items():
+            rank_percentile = 1.0 if n == 1 else 1.0 - (rank / (n - 1))
+            boosts[ticker] = 0.3 * (math.log(1 + rank_percentile) / math.log(2))
+        return cls(boosts=boosts, size=len(ranked))
+
+    def boost_for(self, tickers: list[str] | None) -> float:
+        """Best position boost across a candidate's affected instruments."""
+        best = 0.0
+        for t in tickers or []:
+            boost = self.boosts.get(t)
+            if boost is not None and boost > best:
+                best = boost
+        return best
+
+
+@dataclass
+class _ClientFeedPlan:
+    """Per-client inputs for get_top_client_news_batch, resolved from a feed context."""
+
+    client_guid: str
+    profile: dict[str, Any]
+    holdings: list[dict[str, Any]]
+    exclusions: dict[str, list[str]]
+    channel_tickers: list[tuple[str, list[str]]]
+    themes: list[str]
+    min_impact_score: float | None
+    best_sim: dict[str, float] = field(default_factory=dict)
+
+
 @dataclass
 class QueryResult:
     """A single query result
@@ -295,6 +396,8 @@ class QueryResponse:
         total_found: Total matching documents (before limit)
         filters_applied: Filters that were applied
         execution_time_ms: Query execution time in milliseconds
+        retrieval_rounds: ChromaDB similarity searches issued
+        candidates_scanned: Chunks returned by ChromaDB across all rounds
     """
 
     query: str
@@ -302,6 +405,8 @@ class QueryResponse:
     total_found: int
     filters_applied: dict = field(default_factory=dict)
     execution_time_ms: float = 0.0
+    retrieval_rounds: int = 0
+    candidates_scanned: int = 0
 
 
 # =============================================================================
@@ -377,6 +482,15 @@ class QueryService:
         source_registry: SourceRegistry,
         graph_index: Optional[GraphIndex] = None,
         default_weights: Optional[ScoringWeights] = None,
+        batch_graph_expansion: bool = True,
+        consolidated_feed_retrieval: bool = False,
+        concurrent_feed_fanout: bool = False,
+        feed_fanout_workers: int = 8,
+        feed_cache: Optional[FeedCache] = None,
+        filter_pushdown: bool = False,
+        adaptive_overfetch: bool = False,
+        max_overfetch_candidates: int = 500,
+        mandate_store: Optional[MandateEmbeddingStore] = None,
     ) -> None:
         """Initialize query service
 
@@ -386,12 +500,45 @@ class QueryService:
             source_registry: Source registry for trust levels
             graph_index: Optional Neo4j graph index for enrichment
             default_weights: Default scoring weights
+            batch_graph_expansion: Expand all seed documents in a single
+                UNWIND query instead of one query per hit/instrument/peer
+            consolidated_feed_retrieval: Gather client context and all
+                get_top_client_news channel candidates in two Cypher calls
+                instead of one session per helper
+            concurrent_feed_fanout: Run independent feed retrievals (holdings,
+                watchlist, lateral, thematic, vector) concurrently
+            feed_fanout_workers: Thread pool size shared by all feed requests
+            feed_cache: Optional per-client cache for get_top_client_news and
+                get_client_avatar_feed results
+            filter_pushdown: Push date/impact/tier/region/sector/company
+                filters into the ChromaDB where clause (requires chunks
+                indexed or backfilled with filterable metadata)
+            adaptive_overfetch: Size the first similarity page from the
+                expected filter selectivity and deepen geometrically until
+                n_results distinct documents survive, instead of a fixed
+                n_results * 3 overfetch
+            max_overfetch_candidates: Cap on the adaptive candidate page
+                (raised to n_results * 3 for large requests)
+            mandate_store: Client mandate embeddings keyed by profile guid,
+                read only when the VECTOR channel is active (profiles not yet
+                migrated fall back to their Neo4j property)
         """
         self.embedding_index = embedding_index
         self.document_store = document_store
         self.source_registry = source_registry
         self.graph_index = graph_index
         self.default_weights = default_weights or ScoringWeights()
+        self.batch_graph_expansion = batch_graph_expansion
+        self.consolidated_feed_retrieval = consolidated_feed_retrieval
+        self.concurrent_feed_fanout = concurrent_feed_fanout
+        self.feed_fanout_workers = max(1, feed_fanout_workers)
+        self._feed_executor: Optional[ThreadPoolExecutor] = None
+        self._feed_executor_lock = threading.Lock()
+        self.feed_cache = feed_cache
+        self.filter_pushdown = filter_pushdown
+        self.adaptive_overfetch = adaptive_overfetch
+        self.max_overfetch_candidates = max_overfetch_candidates
+        self.mandate_store = mandate_store
 
     def query(
         self,
@@ -420,23 +567,16 @@ class QueryService:
         Returns:
             QueryResponse with ranked results from both semantic and graph sources
         """
-        import time
-
         start_time = time.time()
         filters = filters or QueryFilters()
         weights = weights or self.default_weights
 
-        # Step 1: Execute ChromaDB similarity search with group filtering
-        similarity_results = self._execute_similarity_search(
+        # Steps 1-2: ChromaDB similarity search with group filtering,
+        # then metadata filters (deepened until enough documents survive)
+        filtered_results, retrieval_rounds, candidates_scanned = self._retrieve_filtered_candidates(
             query_text=query_text,
             group_guids=group_guids,
-            n_results=n_results * 3,  # Fetch extra for filtering
-            filters=filters,
-        )
-
-        # Step 2: Apply metadata filters
-        filtered_results = self._apply_metadata_filters(
-            results=similarity_results,
+            n_results=n_results,
             filters=filters,
         )
 
@@ -476,6 +616,8 @@ class QueryService:
             total_found=len(filtered_results) + len([r for r in query_results if r.discovered_via == "graph"]),
             filters_applied=self._filters_to_dict(filters),
             execution_time_ms=execution_time,
+            retrieval_rounds=retrieval_rounds,
+            candidates_scanned=candidates_scanned,
         )
 
     def get_top_client_news(
@@ -495,7 +637,67 @@ class QueryService:
         """Get top news for a client using graph/ephemeral data only.
 
         This method is deterministic and does not perform any LLM calls.
+        Results are served from feed_cache when configured (custom weights
+        bypass the cache); a feed computed after a failed Neo4j/ChromaDB read
+        is returned but not cached.
         """
+        cache_key = None
+        generation = None
+        if self.feed_cache is not None and weights is None:
+            cache_key = self.feed_cache.make_key(
+                "top_client_news",
+                client_guid,
+                group_guids,
+                limit=limit,
+                time_window_hours=time_window_hours,
+                include_portfolio=include_portfolio,
+                include_watchlist=include_watchlist,
+                include_lateral_graph=include_lateral_graph,
+                min_impact_score=min_impact_score,
+                impact_tiers=impact_tiers,
+                opportunity_bias=opportunity_bias,
+            )
+            cached = self.feed_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            generation = self.feed_cache.generation()
+
+        dependencies = FeedDependencies()
+        with _track_feed_reads(dependencies):
+            top_news = self._compute_top_client_news(
+                client_guid=client_guid,
+                group_guids=group_guids,
+                limit=limit,
+                time_window_hours=time_window_hours,
+                include_portfolio=include_portfolio,
+                include_watchlist=include_watchlist,
+                include_lateral_graph=include_lateral_graph,
+                min_impact_score=min_impact_score,
+                impact_tiers=impact_tiers,
+                weights=weights,
+                opportunity_bias=opportunity_bias,
+                dependencies=dependencies,
+            )
+        if cache_key is not None and self.feed_cache is not None and dependencies.complete:
+            self.feed_cache.put(cache_key, top_news, client_guid, dependencies, generation)
+        return top_news
+
+    def _compute_top_client_news(
+        self,
+        client_guid: str,
+        group_guids: list[str],
+        limit: int,
+        time_window_hours: int,
+        include_portfolio: bool,
+        include_watchlist: bool,
+        include_lateral_graph: bool,
+        min_impact_score: float | None,
+        impact_tiers: list[str] | None,
+        weights: ClientNewsWeights | None,
+        opportunity_bias: float,
+        dependencies: FeedDependencies,
+    ) -> list[dict[str, Any]]:
+        """Uncached get_top_client_news; records the tickers/themes it reads in dependencies."""
         if not self.graph_index:
             logger.warning("Top client news requested without graph index")
             return []
@@ -503,16 +705,29 @@ class QueryService:
         if limit <= 0:
             return []
 
-        profile = self._get_client_profile_context(client_guid, group_guids)
-        if not profile:
-            return []
-
-        holdings = self._get_client_holdings(client_guid) if include_portfolio else []
-        watchlist = self._get_client_watchlist(client_guid) if include_watchlist else []
-        exclusions = self._get_client_exclusions(client_guid) if profile.get("esg_constrained") else {
-            "companies": [],
-            "sectors": [],
-        }
+        feed_context: dict[str, Any] | None = None
+        if self.consolidated_feed_retrieval:
+            feed_context = self._get_client_feed_context(client_guid, group_guids)
+            if not feed_context:
+                return []
+            profile = feed_context["profile"]
+            holdings = feed_context["holdings"] if include_portfolio else []
+            watchlist = feed_context["watchlist"] if include_watchlist else []
+            exclusions = feed_context["exclusions"] if profile.get("esg_constrained") else {
+                "companies": [],
+                "sectors": [],
+            }
+        else:
+            profile = self._get_client_profile_context(client_guid, group_guids)
+            if not profile:
+                return []
+
+            holdings = self._get_client_holdings(client_guid) if include_portfolio else []
+            watchlist = self._get_client_watchlist(client_guid) if include_watchlist else []
+            exclusions = self._get_client_exclusions(client_guid) if profile.get("esg_constrained") else {
+                "companies": [],
+                "sectors": [],
+            }
 
         benchmark = profile.get("benchmark")
         holding_tickers = [h["ticker"] for h in holdings if h.get("ticker")]
@@ -520,6 +735,7 @@ class QueryService:
 
         if benchmark:
             watchlist_tickers.append(benchmark)
+        dependencies.add_tickers(holding_tickers + watchlist_tickers)
 
         resolved_min_impact = min_impact_score
         if resolved_min_impact is None:
@@ -537,170 +753,597 @@ class QueryService:
         # ------------------------------------------------------------
         graph_candidates: dict[str, dict[str, Any]] = {}
 
-        def add_graph_candidates(
-            docs: list[dict[str, Any]],
-            reason: str,
-            base_score: float,
-            position_weights: dict[str, float] | None = None,
-        ) -> None:
-            for doc in docs:
-                guid = doc.get("document_guid")
-                if not guid:
-                    continue
-                entry = graph_candidates.setdefault(guid, {
-                    "document_guid": guid,
-                    "title": doc.get("title"),
-                    "created_at": doc.get("created_at"),
-                    "impact_score": doc.get("impact_score"),
-                    "impact_tier": doc.get("impact_tier"),
-                    "affected_instruments": doc.get("affected_instruments", []),
-                    "themes": doc.get("themes", []) if isinstance(doc.get("themes"), list) else [],
-                    "reasons": set(),
-                    "graph_score": 0.0,
-                    "vector_score": 0.0,
-                })
-                entry["reasons"].add(reason)
-
-                weight_boost = 0.0
-                if position_weights:
-                    for ticker in entry.get("affected_instruments", []):
-                        weight_boost = max(weight_boost, position_weights.get(ticker, 0.0))
-
-                entry["graph_score"] = max(
-                    entry["graph_score"],
-                    min(1.0, base_score + min(0.3, weight_boost)),
-                )
-
-        if holding_tickers:
-            holding_weights = {h["ticker"]: h.get("weight", 0.0) for h in holdings if h.get("ticker")}
-            direct_docs = self._get_documents_for_tickers(
-                tickers=holding_tickers,
-                group_guids=group_guids,
-                min_impact_score=resolved_min_impact,
-                impact_tiers=resolved_impact_tiers,
-            )
-            add_graph_candidates(direct_docs, "DIRECT_HOLDING", scoring.direct_holding_base, holding_weights)
-
-        if watchlist_tickers:
-            watch_docs = self._get_documents_for_tickers(
-                tickers=watchlist_tickers,
+        holding_weights = {h["ticker"]: h.get("weight", 0.0) for h in holdings if h.get("ticker")}
+        vector_active = bool(self.embedding_index) and (
+            scoring.opportunity_bias > scoring.vector_activation_threshold
+        )
+        document_entities: dict[str, dict[str, list[str]]] | None = None
+
+        if feed_context is not None:
+            # Consolidated path: one Cypher call for every channel, rows tagged
+            # with their reason code and replayed in the legacy channel order so
+            # candidate merging (and therefore ranking) is unchanged.
+            lateral = feed_context["lateral"] if (include_lateral_graph and holding_tickers) else {}
+            # Same fallback as the legacy THEMATIC channel
+            raw_themes = profile.get("mandate_themes") or self._get_client_mandate_themes(client_guid)
+            mandate_themes = [t for t in raw_themes if isinstance(t, str) and t]
+            best_sim = self._search_mandate_vectors(profile, group_guids, scoring) if vector_active else {}
+            dependencies.add_themes(mandate_themes)
+            for key in ("competitors", "suppliers", "peers"):
+                dependencies.add_tickers(lateral.get(key, []))
+            channel_tickers = [
+                ("DIRECT_HOLDING", holding_tickers),
+                ("WATCHLIST", watchlist_tickers),
+                ("COMPETITOR", lateral.get("competitors", [])),
+                ("SUPPLY_CHAIN", lateral.get("suppliers", [])),
+                ("PEER", lateral.get("peers", [])),
+            ]
+            need_entities = bool(exclusions["companies"] or exclusions["sectors"])
+            by_reason, document_entities = self._get_client_feed_candidates(
+                channel_tickers=channel_tickers,
+                themes=mandate_themes,
+                vector_guids=list(best_sim.keys()),
                 group_guids=group_guids,
                 min_impact_score=resolved_min_impact,
                 impact_tiers=resolved_impact_tiers,
+                include_entities=need_entities,
+                created_after=time_cutoff,
             )
-            add_graph_candidates(watch_docs, "WATCHLIST", scoring.watchlist_base)
-
-        if include_lateral_graph and holding_tickers:
-            lateral = self._expand_lateral_tickers(holding_tickers)
-
-            if lateral.get("competitors"):
-                comp_docs = self._get_documents_for_tickers(
-                    tickers=lateral.get("competitors", []),
+            self._merge_channel_candidates(graph_candidates, by_reason, best_sim, scoring, holding_weights)
+        else:
+            def fetch_holdings() -> list[dict[str, Any]]:
+                if not holding_tickers:
+                    return []
+                return self._get_documents_for_tickers(
+                    tickers=holding_tickers,
                     group_guids=group_guids,
                     min_impact_score=resolved_min_impact,
                     impact_tiers=resolved_impact_tiers,
+                    created_after=time_cutoff,
                 )
-                add_graph_candidates(comp_docs, "COMPETITOR", scoring.competitor_base)
 
-            if lateral.get("suppliers"):
-                supply_docs = self._get_documents_for_tickers(
-                    tickers=lateral.get("suppliers", []),
+            def fetch_watchlist() -> list[dict[str, Any]]:
+                if not watchlist_tickers:
+                    return []
+                return self._get_documents_for_tickers(
+                    tickers=watchlist_tickers,
                     group_guids=group_guids,
                     min_impact_score=resolved_min_impact,
                     impact_tiers=resolved_impact_tiers,
+                    created_after=time_cutoff,
                 )
-                add_graph_candidates(supply_docs, "SUPPLY_CHAIN", scoring.supplier_base)
 
-            if lateral.get("peers"):
-                peer_docs = self._get_documents_for_tickers(
-                    tickers=lateral.get("peers", []),
+            def fetch_lateral() -> dict[str, list[dict[str, Any]]]:
+                lateral_docs: dict[str, list[dict[str, Any]]] = {}
+                if not (include_lateral_graph and holding_tickers):
+                    return lateral_docs
+                lateral = self._expand_lateral_tickers(holding_tickers)
+                for key in ("competitors", "suppliers", "peers"):
+                    dependencies.add_tickers(lateral.get(key, []))
+                for key, reason in (
+                    ("competitors", "COMPETITOR"),
+                    ("suppliers", "SUPPLY_CHAIN"),
+                    ("peers", "PEER"),
+                ):
+                    if lateral.get(key):
+                        lateral_docs[reason] = self._get_documents_for_tickers(
+                            tickers=lateral.get(key, []),
+                            group_guids=group_guids,
+                            min_impact_score=resolved_min_impact,
+                            impact_tiers=resolved_impact_tiers,
+                            created_after=time_cutoff,
+                        )
+                return lateral_docs
+
+            def fetch_thematic() -> list[dict[str, Any]]:
+                # Thematic candidates: mandate_themes tags on documents
+                mandate_themes = profile.get("mandate_themes") or []
+                if not mandate_themes:
+                    mandate_themes = self._get_client_mandate_themes(client_guid)
+                if not mandate_themes:
+                    return []
+                dependencies.add_themes(mandate_themes)
+                return self._get_documents_by_themes(
+                    themes=[t for t in mandate_themes if isinstance(t, str) and t],
                     group_guids=group_guids,
+                    exclude_tickers=[],
                     min_impact_score=resolved_min_impact,
                     impact_tiers=resolved_impact_tiers,
+                    limit=50,
+                    created_after=time_cutoff,
                 )
-                add_graph_candidates(peer_docs, "PEER", scoring.peer_base)
 
-        # Thematic candidates: mandate_themes tags on documents
-        mandate_themes = profile.get("mandate_themes") or []
-        if not mandate_themes:
-            mandate_themes = self._get_client_mandate_themes(client_guid)
+            def fetch_vector() -> tuple[dict[str, float], list[dict[str, Any]]]:
+                # Vector candidates: mandate embedding similarity (semantic "unknown knowns")
+                if not vector_active:
+                    return {}, []
+                best_sim = self._search_mandate_vectors(profile, group_guids, scoring)
+                if not best_sim:
+                    return best_sim, []
+                return best_sim, self._get_documents_by_guids(list(best_sim.keys()), group_guids)
+
+            fetched, timings = self._run_feed_branches({
+                "holdings": fetch_holdings,
+                "watchlist": fetch_watchlist,
+                "lateral": fetch_lateral,
+                "thematic": fetch_thematic,
+                "vector": fetch_vector,
+            })
+            logger.debug(
+                "Top client news retrieval timings",
+                client_guid=client_guid,
+                concurrent=self.concurrent_feed_fanout,
+                **{f"{name}_ms": round(ms, 2) for name, ms in timings.items()},
+            )
+
+            # Merge in the sequential channel order so candidate merging is unchanged
+            self._add_graph_candidates(graph_candidates, fetched["holdings"], "DIRECT_HOLDING", scoring.direct_holding_base, holding_weights)
+            self._add_graph_candidates(graph_candidates, fetched["watchlist"], "WATCHLIST", scoring.watchlist_base)
+            lateral_docs = fetched["lateral"]
+            self._add_graph_candidates(graph_candidates, lateral_docs.get("COMPETITOR", []), "COMPETITOR", scoring.competitor_base)
+            self._add_graph_candidates(graph_candidates, lateral_docs.get("SUPPLY_CHAIN", []), "SUPPLY_CHAIN", scoring.supplier_base)
+            self._add_graph_candidates(graph_candidates, lateral_docs.get("PEER", []), "PEER", scoring.peer_base)
+            self._add_graph_candidates(graph_candidates, fetched["thematic"], "THEMATIC", scoring.thematic_base)
+            best_sim, summaries = fetched["vector"]
+            self._add_vector_candidates(graph_candidates, summaries, best_sim, scoring.vector_base)
+
+        return self._rank_client_candidates(
+            graph_candidates,
+            holdings=holdings,
+            exclusions=exclusions,
+            document_entities=document_entities,
+            weights=weights,
+            scoring=scoring,
+            now=now,
+            time_cutoff=time_cutoff,
+            limit=limit,
+        )
 
-        if mandate_themes:
-            thematic_docs = self._get_documents_by_themes(
-                themes=[t for t in mandate_themes if isinstance(t, str) and t],
+    def get_top_client_news_batch(
+        self,
+        client_guids: list[str],
+        group_guids: list[str],
+        limit: int = 3,
+        time_window_hours: int = 24,
+        include_portfolio: bool = True,
+        include_watchlist: bool = True,
+        include_lateral_graph: bool = True,
+        min_impact_score: float | None = None,
+        impact_tiers: list[str] | None = None,
+        opportunity_bias: float = 0.0,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """get_top_client_news for many clients, scored against a shared candidate pool.
+
+        See iter_top_client_news_batch; this collects the stream into
+        client_guid -> top news.
+        """
+        return dict(
+            self.iter_top_client_news_batch(
+                client_guids=client_guids,
                 group_guids=group_guids,
-                exclude_tickers=[],
-                min_impact_score=resolved_min_impact,
-                impact_tiers=resolved_impact_tiers,
-                limit=50,
+                limit=limit,
+                time_window_hours=time_window_hours,
+                include_portfolio=include_portfolio,
+                include_watchlist=include_watchlist,
+                include_lateral_graph=include_lateral_graph,
+                min_impact_score=min_impact_score,
+                impact_tiers=impact_tiers,
+                opportunity_bias=opportunity_bias,
             )
-            add_graph_candidates(thematic_docs, "THEMATIC", scoring.thematic_base)
+        )
 
-        # Vector candidates: mandate embedding similarity (semantic "unknown knowns")
-        if self.embedding_index and scoring.opportunity_bias > scoring.vector_activation_threshold:
-            mandate_embedding = profile.get("mandate_embedding") or []
-            mandate_text = profile.get("mandate_text")
+    def iter_top_client_news_batch(
+        self,
+        client_guids: list[str],
+        group_guids: list[str],
+        limit: int = 3,
+        time_window_hours: int = 24,
+        include_portfolio: bool = True,
+        include_watchlist: bool = True,
+        include_lateral_graph: bool = True,
+        min_impact_score: float | None = None,
+        impact_tiers: list[str] | None = None,
+        opportunity_bias: float = 0.0,
+        pool_limit: int = 5000,
+        context_chunk_size: int = 1000,
+    ) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+        """Stream (client_guid, top news) for many clients.
+
+        Client contexts are loaded with one UNWIND query per
+        context_chunk_size clients. The union of every client's channel
+        tickers, mandate themes and vector hits is then fetched once as a
+        shared candidate pool, and each client's channels are cut from it with
+        the same per-channel limits, impact threshold and time window as
+        get_top_client_news. Neo4j round trips are therefore
+        ceil(len(client_guids) / context_chunk_size) + 1 instead of several per
+        client, and rankings match the per-client path. If the pool is
+        truncated at pool_limit, clients with a channel cut short of its
+        per-channel limit (so possibly missing older matches) are fetched
+        with their own candidate query instead. When the VECTOR channel is active,
+        mandate searches go to ChromaDB MANDATE_SEARCH_BATCH_SIZE clients per
+        query.
+
+        Clients not visible in group_guids yield an empty list. Results are
+        written to feed_cache under the same keys as get_top_client_news,
+        except those computed after a failed read.
+        """
+        ordered = list(dict.fromkeys(client_guids))
+        if not self.graph_index or limit <= 0:
+            for client_guid in ordered:
+                yield client_guid, []
+            return
+
+        generation = self.feed_cache.generation() if self.feed_cache is not None else None
+        # Failed shared reads (contexts, mandate search, pool) keep every feed out of the cache
+        shared_reads = FeedDependencies()
+        contexts: dict[str, dict[str, Any]] = {}
+        chunk = max(1, context_chunk_size)
+        with _track_feed_reads(shared_reads):
+            for i in range(0, len(ordered), chunk):
+                contexts.update(self._get_client_feed_contexts(ordered[i:i + chunk], group_guids))
 
-            vector_hits: list[SimilarityResult] = []
-            try:
-                if isinstance(mandate_embedding, list) and mandate_embedding:
-                    vector_hits = self.embedding_index.search_by_embedding(
-                        query_embedding=mandate_embedding,
-                        n_results=25,
-                        group_guids=group_guids,
-                        include_content=False,
+        resolved_impact_tiers = impact_tiers or ["PLATINUM", "GOLD", "SILVER"]
+        scoring = ScoringConfig.from_opportunity_bias(opportunity_bias)
+        vector_active = bool(self.embedding_index) and (
+            scoring.opportunity_bias > scoring.vector_activation_threshold
+        )
+        now = datetime.utcnow()
+        time_cutoff = now - timedelta(hours=time_window_hours)
+
+        plans: dict[str, _ClientFeedPlan] = {}
+        for client_guid in ordered:
+            context = contexts.get(client_guid)
+            if context is not None:
+                plans[client_guid] = self._plan_client_feed(
+                    client_guid,
+                    context,
+                    include_portfolio=include_portfolio,
+                    include_watchlist=include_watchlist,
+                    include_lateral_graph=include_lateral_graph,
+                    min_impact_score=min_impact_score,
+                )
+        if vector_active and plans:
+            # Every client's mandate search in as few ChromaDB queries as possible
+            with _track_feed_reads(shared_reads):
+                best_sims = self._search_mandate_vectors_batch(
+                    [plan.profile for plan in plans.values()], group_guids, scoring
+                )
+            for plan, best_sim in zip(plans.values(), best_sims):
+                plan.best_sim = best_sim
+
+        # ------------------------------------------------------------
+        # Shared candidate pool (one Cypher call for every client)
+        # ------------------------------------------------------------
+        pool_tickers = sorted({t for plan in plans.values() for _, tickers in plan.channel_tickers for t in tickers})
+        pool_themes = sorted({t for plan in plans.values() for t in plan.themes})
+        pool_vector_guids = sorted({g for plan in plans.values() for g in plan.best_sim})
+        thresholds = [plan.min_impact_score for plan in plans.values()]
+        pool_min_impact = None if not thresholds or None in thresholds else min(t for t in thresholds if t is not None)
+        need_entities = any(p.exclusions["companies"] or p.exclusions["sectors"] for p in plans.values())
+
+        by_reason: dict[str, list[dict[str, Any]]] = {}
+        document_entities: dict[str, dict[str, list[str]]] | None = None
+        if plans:
+            with _track_feed_reads(shared_reads):
+                by_reason, document_entities = self._get_client_feed_candidates(
+                    channel_tickers=[("POOL", pool_tickers)],
+                    themes=pool_themes,
+                    vector_guids=pool_vector_guids,
+                    group_guids=group_guids,
+                    min_impact_score=pool_min_impact,
+                    impact_tiers=resolved_impact_tiers,
+                    include_entities=need_entities,
+                    ticker_limit=pool_limit,
+                    theme_limit=pool_limit,
+                    created_after=time_cutoff,
+                )
+
+        ticker_pool = by_reason.get("POOL", [])
+        theme_pool = by_reason.get("THEMATIC", [])
+        ticker_truncated = len(ticker_pool) >= pool_limit
+        theme_truncated = len(theme_pool) >= pool_limit
+        if ticker_truncated or theme_truncated:
+            logger.warning(
+                "Batch candidate pool truncated; affected clients are re-queried individually",
+                pool_limit=pool_limit,
+                ticker_pool=len(ticker_pool),
+                theme_pool=len(theme_pool),
+            )
+        requeried = 0
+        ticker_postings = self._build_pool_postings(ticker_pool, "affected_instruments")
+        theme_postings = self._build_pool_postings(theme_pool, "themes")
+        vector_docs = {d["document_guid"]: d for d in by_reason.get("VECTOR", []) if d.get("document_guid")}
+
+        for client_guid in ordered:
+            plan = plans.get(client_guid)
+            if plan is None:
+                yield client_guid, []
+                continue
+
+            has_exclusions = bool(plan.exclusions["companies"] or plan.exclusions["sectors"])
+            client_entities = document_entities if has_exclusions else None
+            # A channel cut short of its LIMIT from a truncated pool may be
+            # missing older matches that the per-client query would return
+            complete = True
+            client_by_reason: dict[str, list[dict[str, Any]]] = {}
+            for reason, tickers in plan.channel_tickers:
+                if not tickers:
+                    continue
+                wanted = set(tickers)
+                selected = self._cut_pool_channel(
+                    ticker_pool, ticker_postings, wanted, plan.min_impact_score, 100
+                )
+                complete = complete and not (ticker_truncated and len(selected) < 100)
+                client_by_reason[reason] = [
+                    dict(
+                        ticker_pool[idx],
+                        affected_instruments=[
+                            t for t in ticker_pool[idx].get("affected_instruments") or [] if t in wanted
+                        ],
                     )
-                elif isinstance(mandate_text, str) and mandate_text.strip():
-                    # Fallback: derive the query embedding from mandate_text at query time.
-                    # This unblocks VECTOR even if client profiles have not been backfilled
-                    # with a stored mandate_embedding in Neo4j.
-                    vector_hits = self.embedding_index.search(
-                        query=mandate_text.strip(),
-                        n_results=25,
+                    for idx in selected
+                ]
+            if plan.themes:
+                selected = self._cut_pool_channel(
+                    theme_pool, theme_postings, set(plan.themes), plan.min_impact_score, 50
+                )
+                complete = complete and not (theme_truncated and len(selected) < 50)
+                client_by_reason["THEMATIC"] = [dict(theme_pool[idx]) for idx in selected]
+            client_by_reason["VECTOR"] = [dict(vector_docs[g]) for g in plan.best_sim if g in vector_docs]
+
+            dependencies = FeedDependencies(complete=shared_reads.complete)
+            if not complete:
+                requeried += 1
+                with _track_feed_reads(dependencies):
+                    client_by_reason, client_entities = self._get_client_feed_candidates(
+                        channel_tickers=plan.channel_tickers,
+                        themes=plan.themes,
+                        vector_guids=list(plan.best_sim),
                         group_guids=group_guids,
-                        include_content=False,
+                        min_impact_score=plan.min_impact_score,
+                        impact_tiers=resolved_impact_tiers,
+                        include_entities=has_exclusions,
+                        created_after=time_cutoff,
                     )
-            except Exception:
-                vector_hits = []
 
-            best_sim: dict[str, float] = {}
-            for hit in vector_hits:
-                if not hit.document_guid:
-                    continue
-                if hit.score < scoring.vector_similarity_threshold:
+            graph_candidates: dict[str, dict[str, Any]] = {}
+            holding_weights = {h["ticker"]: h.get("weight", 0.0) for h in plan.holdings if h.get("ticker")}
+            self._merge_channel_candidates(graph_candidates, client_by_reason, plan.best_sim, scoring, holding_weights)
+            top_news = self._rank_client_candidates(
+                graph_candidates,
+                holdings=plan.holdings,
+                exclusions=plan.exclusions,
+                document_entities=client_entities,
+                weights=ClientNewsWeights.for_client_type(plan.profile.get("client_type")),
+                scoring=scoring,
+                now=now,
+                time_cutoff=time_cutoff,
+                limit=limit,
+            )
+
+            if self.feed_cache is not None and dependencies.complete:
+                for _, tickers in plan.channel_tickers:
+                    dependencies.add_tickers(tickers)
+                dependencies.add_themes(plan.themes)
+                cache_key = self.feed_cache.make_key(
+                    "top_client_news",
+                    client_guid,
+                    group_guids,
+                    limit=limit,
+                    time_window_hours=time_window_hours,
+                    include_portfolio=include_portfolio,
+                    include_watchlist=include_watchlist,
+                    include_lateral_graph=include_lateral_graph,
+                    min_impact_score=min_impact_score,
+                    impact_tiers=impact_tiers,
+                    opportunity_bias=opportunity_bias,
+                )
+                self.feed_cache.put(cache_key, top_news, client_guid, dependencies, generation)
+
+            yield client_guid, top_news
+
+        if requeried:
+            logger.info("Batch clients re-queried after pool truncation", clients=requeried)
+
+    def _plan_client_feed(
+        self,
+        client_guid: str,
+        context: dict[str, Any],
+        include_portfolio: bool,
+        include_watchlist: bool,
+        include_lateral_graph: bool,
+        min_impact_score: float | None,
+    ) -> _ClientFeedPlan:
+        """Resolve a client's channels exactly as the consolidated get_top_client_news path does.
+
+        best_sim is left empty; iter_top_client_news_batch fills it for every
+        client with one batched mandate search.
+        """
+        profile = context["profile"]
+        holdings = context["holdings"] if include_portfolio else []
+        watchlist = context["watchlist"] if include_watchlist else []
+        exclusions = context["exclusions"] if profile.get("esg_constrained") else {
+            "companies": [],
+            "sectors": [],
+        }
+        holding_tickers = [h["ticker"] for h in holdings if h.get("ticker")]
+        watchlist_tickers = [t for t in watchlist if t]
+        if profile.get("benchmark"):
+            watchlist_tickers.append(profile["benchmark"])
+        lateral = context["lateral"] if (include_lateral_graph and holding_tickers) else {}
+
+        resolved_min_impact = min_impact_score
+        if resolved_min_impact is None:
+            resolved_min_impact = profile.get("impact_threshold")
+
+        raw_themes = profile.get("mandate_themes") or self._get_client_mandate_themes(client_guid)
+        return _ClientFeedPlan(
+            client_guid=client_guid,
+            profile=profile,
+            holdings=holdings,
+            exclusions=exclusions,
+            channel_tickers=[
+                ("DIRECT_HOLDING", holding_tickers),
+                ("WATCHLIST", watchlist_tickers),
+                ("COMPETITOR", lateral.get("competitors", [])),
+                ("SUPPLY_CHAIN", lateral.get("suppliers", [])),
+                ("PEER", lateral.get("peers", [])),
+            ],
+            themes=[t for t in raw_themes if isinstance(t, str) and t],
+            min_impact_score=resolved_min_impact,
+        )
+
+    @staticmethod
+    def _build_pool_postings(pool: list[dict[str, Any]], field_name: str) -> dict[str, list[int]]:
+        """key -> ascending pool indices (pool is ordered newest first)."""
+        postings: dict[str, list[int]] = {}
+        for idx, doc in enumerate(pool):
+            values = doc.get(field_name)
+            if not isinstance(values, list):
+                continue
+            for value in dict.fromkeys(values):
+                if value:
+                    postings.setdefault(value, []).append(idx)
+        return postings
+
+    @staticmethod
+    def _cut_pool_channel(
+        pool: list[dict[str, Any]],
+        postings: dict[str, list[int]],
+        keys: set[str],
+        min_impact_score: float | None,
+        limit: int,
+    ) -> list[int]:
+        """Newest pool documents matching any key, with the client's impact threshold and channel LIMIT."""
+        selected: list[int] = []
+        for idx in sorted({i for key in keys for i in postings.get(key, ())}):
+            if min_impact_score is not None:
+                impact = pool[idx].get("impact_score")
+                if impact is None or impact < min_impact_score:
                     continue
-                best_sim[hit.document_guid] = max(best_sim.get(hit.document_guid, 0.0), float(hit.score))
+            selected.append(idx)
+            if len(selected) >= limit:
+                break
+        return selected
 
-            if best_sim:
-                summaries = self._get_documents_by_guids(list(best_sim.keys()), group_guids)
-                for doc in summaries:
-                    guid = doc.get("document_guid")
-                    if not guid:
-                        continue
-                    entry = graph_candidates.setdefault(guid, {
-                        "document_guid": guid,
-                        "title": doc.get("title"),
-                        "created_at": doc.get("created_at"),
-                        "impact_score": doc.get("impact_score"),
-                        "impact_tier": doc.get("impact_tier"),
-                        "affected_instruments": doc.get("affected_instruments", []),
-                        "themes": doc.get("themes", []) if isinstance(doc.get("themes"), list) else [],
-                        "reasons": set(),
-                        "graph_score": 0.0,
-                        "vector_score": 0.0,
-                    })
-                    entry["reasons"].add("VECTOR")
-                    sim = best_sim.get(guid, 0.0)
-                    entry["vector_score"] = max(entry.get("vector_score", 0.0), min(1.0, scoring.vector_base * sim))
+    @staticmethod
+    def _new_client_candidate(doc: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "document_guid": doc.get("document_guid"),
+            "title": doc.get("title"),
+            "created_at": doc.get("created_at"),
+            "impact_score": doc.get("impact_score"),
+            "impact_tier": doc.get("impact_tier"),
+            "affected_instruments": doc.get("affected_instruments", []),
+            "themes": doc.get("themes", []) if isinstance(doc.get("themes"), list) else [],
+            "reasons": set(),
+            "graph_score": 0.0,
+            "vector_score": 0.0,
+        }
 
-        # ------------------------------------------------------------
-        # Apply time window + ESG exclusions
-        # ------------------------------------------------------------
+    @classmethod
+    def _add_graph_candidates(
+        cls,
+        graph_candidates: dict[str, dict[str, Any]],
+        docs: list[dict[str, Any]],
+        reason: str,
+        base_score: float,
+        position_weights: dict[str, float] | None = None,
+    ) -> None:
+        """Merge channel documents into the candidate map, keeping the best graph score."""
+        for doc in docs:
+            guid = doc.get("document_guid")
+            if not guid:
+                continue
+            entry = graph_candidates.get(guid)
+            if entry is None:
+                entry = graph_candidates[guid] = cls._new_client_candidate(doc)
+            entry["reasons"].add(reason)
+
+            weight_boost = 0.0
+            if position_weights:
+                for ticker in entry.get("affected_instruments", []):
+                    weight_boost = max(weight_boost, position_weights.get(ticker, 0.0))
+
+            entry["graph_score"] = max(
+                entry["graph_score"],
+                min(1.0, base_score + min(0.3, weight_boost)),
+            )
+
+    @classmethod
+    def _add_vector_candidates(
+        cls,
+        graph_candidates: dict[str, dict[str, Any]],
+        docs: list[dict[str, Any]],
+        best_sim: dict[str, float],
+        vector_base: float,
+    ) -> None:
+        """Merge VECTOR channel documents into the candidate map."""
+        for doc in docs:
+            guid = doc.get("document_guid")
+            if not guid:
+                continue
+            entry = graph_candidates.get(guid)
+            if entry is None:
+                entry = graph_candidates[guid] = cls._new_client_candidate(doc)
+            entry["reasons"].add("VECTOR")
+            sim = best_sim.get(guid, 0.0)
+            entry["vector_score"] = max(entry.get("vector_score", 0.0), min(1.0, vector_base * sim))
+
+    @classmethod
+    def _merge_channel_candidates(
+        cls,
+        graph_candidates: dict[str, dict[str, Any]],
+        by_reason: dict[str, list[dict[str, Any]]],
+        best_sim: dict[str, float],
+        scoring: ScoringConfig,
+        holding_weights: dict[str, float],
+    ) -> None:
+        """Merge reason-tagged channel documents in the legacy channel order."""
+        channel_bases = {
+            "DIRECT_HOLDING": scoring.direct_holding_base,
+            "WATCHLIST": scoring.watchlist_base,
+            "COMPETITOR": scoring.competitor_base,
+            "SUPPLY_CHAIN": scoring.supplier_base,
+            "PEER": scoring.peer_base,
+            "THEMATIC": scoring.thematic_base,
+        }
+        for reason, base_score in channel_bases.items():
+            cls._add_graph_candidates(
+                graph_candidates,
+                by_reason.get(reason, []),
+                reason,
+                base_score,
+                holding_weights if reason == "DIRECT_HOLDING" else None,
+            )
+        cls._add_vector_candidates(graph_candidates, by_reason.get("VECTOR", []), best_sim, scoring.vector_base)
+
+    def _rank_client_candidates(
+        self,
+        graph_candidates: dict[str, dict[str, Any]],
+        holdings: list[dict[str, Any]],
+        exclusions: dict[str, list[str]],
+        document_entities: dict[str, dict[str, list[str]]] | None,
+        weights: ClientNewsWeights,
+        scoring: ScoringConfig,
+        now: datetime,
+        time_cutoff: datetime,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Apply time window + ESG exclusions, score, rank and dedupe candidates.
+
+        document_entities may be pre-fetched; otherwise entities are loaded
+        for the surviving candidates when the client has exclusions.
+        """
+        # The cutoff is pushed into Cypher; this check is kept as a safety net.
         candidates = list(graph_candidates.values())
         candidates = [c for c in candidates if self._within_time_window(c.get("created_at"), time_cutoff)]
 
         if exclusions["companies"] or exclusions["sectors"]:
-            entities = self._get_document_entities([c["document_guid"] for c in candidates])
+            if document_entities is not None:
+                entities = document_entities
+            else:
+                entities = self._get_document_entities([c["document_guid"] for c in candidates])
             filtered: list[dict[str, Any]] = []
             for c in candidates:
                 doc_entities = entities.get(c["document_guid"], {"companies": [], "sectors": []})
@@ -712,6 +1355,7 @@ class QueryService:
         # ------------------------------------------------------------
         # Final scoring
         # ------------------------------------------------------------
+        rank_index = PortfolioRankIndex.from_holdings(holdings)
         scored: list[dict[str, Any]] = []
         for candidate in candidates:
             impact_score = candidate.get("impact_score")
@@ -731,24 +1375,8 @@ class QueryService:
             distinct_paths = len(reasons_set) if isinstance(reasons_set, set) else 1
             influence_boost = min(0.3, 0.1 * max(0, distinct_paths - 1))
 
-            pos_boost = 0.0
-            if holdings:
-                ranked = sorted(
-                    [h for h in holdings if h.get("ticker")],
-                    key=lambda x: float(x.get("weight") or 0.0),
-                    reverse=True,
-                )
-                ticker_to_rank = {h["ticker"]: idx for idx, h in enumerate(ranked)}
-                n = max(1, len(ranked))
-                for t in candidate.get("affected_instruments", []) or []:
-                    if t in ticker_to_rank:
-                        rank = ticker_to_rank[t]
-                        rank_percentile = 1.0 if n == 1 else 1.0 - (rank / (n - 1))
-                        pos_boost = max(
-                            pos_boost,
-                            0.3 * (math.log(1 + rank_percentile) / math.log(2)),
-                        )
-            
+            pos_boost = rank_index.boost_for(candidate.get("affected_instruments"))
+
             # In Alpha mode (high lambda), we care less about reinforcing existing positions.
             # Dampen the position boost as opportunity bias increases.
             # lambda=0 -> 1.0x factor. lambda=1 -> 0.5x factor.
@@ -860,7 +1488,45 @@ class QueryService:
         - why_it_matters: <= 30 words, client-specific
         - story_summary: <= 30 words, story-only
         """
+        from app.services.llm_service import ChatMessage
+
+        prompt = self._why_it_matters_prompt(client_guid, document_guid, group_guids)
+        try:
+            result = llm_service.chat_completion(
+                messages=[ChatMessage(role="user", content=prompt)],
+                json_mode=True,
+                temperature=0.2,
+                max_tokens=250,
+            )
+        except Exception as exc:
+            raise RuntimeError(f"LLM augmentation failed: {exc}")
+        return self._parse_why_it_matters(result)
+
+    async def awhy_it_matters_to_client(
+        self,
+        client_guid: str,
+        document_guid: str,
+        group_guids: list[str],
+        llm_service: "AsyncLLMService",
+    ) -> dict[str, str]:
+        """Async why_it_matters_to_client: graph/document reads run on a
+        worker thread, the LLM call is awaited on the caller's event loop."""
+        from app.services.llm_service import ChatMessage
+
+        prompt = await asyncio.to_thread(self._why_it_matters_prompt, client_guid, document_guid, group_guids)
+        try:
+            result = await llm_service.chat_completion(
+                messages=[ChatMessage(role="user", content=prompt)],
+                json_mode=True,
+                temperature=0.2,
+                max_tokens=250,
+            )
+        except Exception as exc:
+            raise RuntimeError(f"LLM augmentation failed: {exc}")
+        return self._parse_why_it_matters(result)
 
+    def _why_it_matters_prompt(self, client_guid: str, document_guid: str, group_guids: list[str]) -> str:
+        """Build the why_it_matters_to_client prompt from client and document context."""
         if not self.graph_index:
             raise RuntimeError("why_it_matters_to_client requires graph index")
 
@@ -911,28 +1577,22 @@ class QueryService:
             "content_excerpt": excerpt,
         }
 
-        try:
-            from app.services.llm_service import ChatMessage
-
-            prompt = (
-                "You are assisting a sales trader briefing a client.\n"
-                "Use ONLY the provided client context and story excerpt. Do NOT invent facts.\n\n"
-                "Return ONLY valid JSON with exactly these keys:\n"
-                "{\"why_it_matters\": \"...\", \"story_summary\": \"...\"}\n\n"
-                "Constraints:\n"
-                "- why_it_matters: max 30 words, must be specific to the client\n"
-                "- story_summary: max 30 words, story-only summary\n\n"
-                f"Client: {json.dumps(client_context, ensure_ascii=True)}\n"
-                f"Story: {json.dumps(document_context, ensure_ascii=True)}\n"
-            )
-
-            result = llm_service.chat_completion(
-                messages=[ChatMessage(role="user", content=prompt)],
-                json_mode=True,
-                temperature=0.2,
-                max_tokens=250,
-            )
+        return (
+            "You are assisting a sales trader briefing a client.\n"
+            "Use ONLY the provided client context and story excerpt. Do NOT invent facts.\n\n"
+            "Return ONLY valid JSON with exactly these keys:\n"
+            "{\"why_it_matters\": \"...\", \"story_summary\": \"...\"}\n\n"
+            "Constraints:\n"
+            "- why_it_matters: max 30 words, must be specific to the client\n"
+            "- story_summary: max 30 words, story-only summary\n\n"
+            f"Client: {json.dumps(client_context, ensure_ascii=True)}\n"
+            f"Story: {json.dumps(document_context, ensure_ascii=True)}\n"
+        )
 
+    @staticmethod
+    def _parse_why_it_matters(result: "ChatCompletionResult") -> dict[str, str]:
+        """Validate the LLM JSON and cap both fields at 30 words."""
+        try:
             payload = result.as_json()
             if not isinstance(payload, dict):
                 raise ValueError("LLM returned non-object JSON")
@@ -999,6 +1659,49 @@ class QueryService:
         Returns:
             AvatarFeed with maintenance, opportunity, and combined lists
         """
+        cache_key = None
+        generation = None
+        if self.feed_cache is not None:
+            cache_key = self.feed_cache.make_key(
+                "client_avatar_feed",
+                client_guid,
+                group_guids,
+                limit=limit,
+                time_window_hours=time_window_hours,
+                min_impact_score=min_impact_score,
+                impact_tiers=impact_tiers,
+            )
+            cached = self.feed_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            generation = self.feed_cache.generation()
+
+        dependencies = FeedDependencies()
+        with _track_feed_reads(dependencies):
+            feed = self._compute_client_avatar_feed(
+                client_guid=client_guid,
+                group_guids=group_guids,
+                limit=limit,
+                time_window_hours=time_window_hours,
+                min_impact_score=min_impact_score,
+                impact_tiers=impact_tiers,
+                dependencies=dependencies,
+            )
+        if cache_key is not None and self.feed_cache is not None and dependencies.complete:
+            self.feed_cache.put(cache_key, feed, client_guid, dependencies, generation)
+        return feed
+
+    def _compute_client_avatar_feed(
+        self,
+        client_guid: str,
+        group_guids: list[str],
+        limit: int,
+        time_window_hours: int,
+        min_impact_score: float | None,
+        impact_tiers: list[str] | None,
+        dependencies: FeedDependencies,
+    ) -> AvatarFeed:
+        """Uncached get_client_avatar_feed; records the tickers/themes it reads in dependencies."""
         if not self.graph_index:
             logger.warning("Avatar feed requested without graph index")
             return AvatarFeed(client_guid=client_guid)
@@ -1026,6 +1729,7 @@ class QueryService:
         if benchmark and benchmark not in all_position_tickers:
             watchlist_tickers.append(benchmark)
             all_position_tickers.append(benchmark)
+        dependencies.add_tickers(all_position_tickers)
 
         resolved_min_impact = min_impact_score
         if resolved_min_impact is None:
@@ -1046,23 +1750,57 @@ class QueryService:
         # Weights for position size
         holding_weights = {h["ticker"]: h.get("weight", 0.0) for h in holdings if h.get("ticker")}
 
-        # ─────────────────────────────────────────────────────────────────────
-        # CHANNEL 1: MAINTENANCE (news about what the client owns)
-        # ─────────────────────────────────────────────────────────────────────
-        maintenance_items: list[AvatarFeedItem] = []
-
-        if all_position_tickers:
-            position_docs = self._get_documents_for_tickers(
+        def fetch_maintenance() -> list[dict[str, Any]]:
+            if not all_position_tickers:
+                return []
+            return self._get_documents_for_tickers(
                 tickers=all_position_tickers,
                 group_guids=group_guids,
                 min_impact_score=resolved_min_impact,
                 impact_tiers=maintenance_impact_tiers,
                 limit=limit * 3,  # Fetch extra for filtering
+                created_after=time_cutoff,
+            )
+
+        def fetch_opportunity() -> tuple[list[str], list[dict[str, Any]]]:
+            # Get mandate_themes from profile (stored on ClientProfile node)
+            themes = self._get_client_mandate_themes(client_guid)
+            if not themes:
+                return themes, []
+            return themes, self._get_documents_by_themes(
+                themes=themes,
+                group_guids=group_guids,
+                exclude_tickers=all_position_tickers,
+                min_impact_score=resolved_min_impact,
+                impact_tiers=opportunity_impact_tiers,
+                limit=limit * 3,
+                created_after=time_cutoff,
             )
+
+        # Both channels are independent; fan out when concurrent_feed_fanout is on
+        fetched, timings = self._run_feed_branches({
+            "maintenance": fetch_maintenance,
+            "opportunity": fetch_opportunity,
+        })
+        logger.debug(
+            "Avatar feed retrieval timings",
+            client_guid=client_guid,
+            concurrent=self.concurrent_feed_fanout,
+            **{f"{name}_ms": round(ms, 2) for name, ms in timings.items()},
+        )
+
+        # ─────────────────────────────────────────────────────────────────────
+        # CHANNEL 1: MAINTENANCE (news about what the client owns)
+        # ─────────────────────────────────────────────────────────────────────
+        maintenance_items: list[AvatarFeedItem] = []
+
+        if all_position_tickers:
+            position_docs = fetched["maintenance"]
             # DEBUG: Log query results
             logger.info(f"[AVATAR_DEBUG] position_docs count={len(position_docs)} docs={[d.get('title','?')[:30] for d in position_docs]}")
 
             for doc in position_docs:
+                # Safety net: the cutoff is already applied in Cypher
                 if not self._within_time_window(doc.get("created_at"), time_cutoff):
                     continue
 
@@ -1109,19 +1847,10 @@ class QueryService:
         # ─────────────────────────────────────────────────────────────────────
         opportunity_items: list[AvatarFeedItem] = []
 
-        # Get mandate_themes from profile (stored on ClientProfile node)
-        mandate_themes = self._get_client_mandate_themes(client_guid)
+        mandate_themes, theme_docs = fetched["opportunity"]
+        dependencies.add_themes(mandate_themes)
 
         if mandate_themes:
-            theme_docs = self._get_documents_by_themes(
-                themes=mandate_themes,
-                group_guids=group_guids,
-                exclude_tickers=all_position_tickers,
-                min_impact_score=resolved_min_impact,
-                impact_tiers=opportunity_impact_tiers,
-                limit=limit * 3,
-            )
-
             for doc in theme_docs:
                 if not self._within_time_window(doc.get("created_at"), time_cutoff):
                     continue
@@ -1209,6 +1938,7 @@ class QueryService:
                         return []
                 return [t for t in themes if isinstance(t, str) and t]
         except Exception:
+            _note_feed_read_failure()
             return []
 
     def _build_client_query_text(
@@ -1270,6 +2000,506 @@ class QueryService:
         except Exception:
             return query
 
+    def _get_feed_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the bounded pool shared by all feed fan-outs."""
+        with self._feed_executor_lock:
+            if self._feed_executor is None:
+                self._feed_executor = ThreadPoolExecutor(
+                    max_workers=self.feed_fanout_workers,
+                    thread_name_prefix="gofr-iq-feed",
+                )
+            return self._feed_executor
+
+    def _run_feed_branches(
+        self, branches: dict[str, Callable[[], Any]]
+    ) -> tuple[dict[str, Any], dict[str, float]]:
+        """Run independent feed retrievals and time each one.
+
+        Branches run in dict order on the calling thread unless
+        concurrent_feed_fanout is enabled, in which case they are submitted to
+        the shared pool. Each branch opens its own Neo4j session; the driver
+        and the Chroma client are shared. Only the calling thread submits
+        work, so branches never wait on the pool they run in.
+
+        Returns:
+            (branch name -> result, branch name -> elapsed milliseconds)
+        """
+        timings: dict[str, float] = {}
+
+        def timed(name: str, fn: Callable[[], Any]) -> Any:
+            start = time.perf_counter()
+            try:
+                return fn()
+            finally:
+                timings[name] = (time.perf_counter() - start) * 1000
+
+        if not self.concurrent_feed_fanout or len(branches) < 2:
+            return {name: timed(name, fn) for name, fn in branches.items()}, timings
+
+        executor = self._get_feed_executor()
+        # Branches run in the caller's context so helper failures reach its FeedDependencies
+        futures = {name: executor.submit(copy_context().run, timed, name, fn) for name, fn in branches.items()}
+        return {name: future.result() for name, future in futures.items()}, timings
+
+    def _search_mandate_vectors(
+        self,
+        profile: dict[str, Any],
+        group_guids: list[str],
+        scoring: ScoringConfig,
+    ) -> dict[str, float]:
+        """Mandate-similarity search for the VECTOR channel.
+
+        Returns document_guid -> best chunk similarity for hits at or above
+        scoring.vector_similarity_threshold.
+        """
+        mandate_embedding = self._load_mandate_embedding(profile)
+        mandate_text = profile.get("mandate_text")
+
+        vector_hits: list[SimilarityResult] = []
+        try:
+            if isinstance(mandate_embedding, list) and mandate_embedding:
+                vector_hits = self.embedding_index.search_by_embedding(
+                    query_embedding=mandate_embedding,
+                    n_results=25,
+                    group_guids=group_guids,
+                    include_content=False,
+                )
+            elif isinstance(mandate_text, str) and mandate_text.strip():
+                # Fallback: derive the query embedding from mandate_text at query time.
+                # This unblocks VECTOR even if client profiles have not been backfilled
+                # with a stored mandate embedding.
+                vector_hits = self.embedding_index.search(
+                    query=mandate_text.strip(),
+                    n_results=25,
+                    group_guids=group_guids,
+                    include_content=False,
+                )
+        except Exception:
+            _note_feed_read_failure()
+            vector_hits = []
+
+        return self._best_mandate_similarity(vector_hits, scoring)
+
+    def _search_mandate_vectors_batch(
+        self,
+        profiles: list[dict[str, Any]],
+        group_guids: list[str],
+        scoring: ScoringConfig,
+    ) -> list[dict[str, float]]:
+        """_search_mandate_vectors for many profiles with batched lookups.
+
+        Stored mandate embeddings are loaded in one pass, profiles with only
+        mandate_text are embedded with one embedding call, and the vectors go
+        to ChromaDB MANDATE_SEARCH_BATCH_SIZE at a time (grouped by dimension).
+
+        Returns:
+            document_guid -> best chunk similarity, one dict per profile
+        """
+        best_sims: list[dict[str, float]] = [{} for _ in profiles]
+        embeddings = self._load_mandate_embeddings(profiles)
+
+        text_slots = [
+            i for i, embedding in enumerate(embeddings)
+            if not embedding
+            and isinstance(profiles[i].get("mandate_text"), str)
+            and profiles[i]["mandate_text"].strip()
+        ]
+        if text_slots:
+            # Fallback: derive the query embedding from mandate_text at query time
+            try:
+                generated = self.embedding_index.embed_queries(
+                    [profiles[i]["mandate_text"].strip() for i in text_slots]
+                )
+            except Exception:
+                _note_feed_read_failure()
+                generated = []
+            for i, embedding in zip(text_slots, generated):
+                embeddings[i] = embedding
+
+        by_dim: dict[int, list[int]] = {}
+        for i, embedding in enumerate(embeddings):
+            if embedding:
+                by_dim.setdefault(len(embedding), []).append(i)
+        for slots in by_dim.values():
+            for start in range(0, len(slots), MANDATE_SEARCH_BATCH_SIZE):
+                batch = slots[start:start + MANDATE_SEARCH_BATCH_SIZE]
+                try:
+                    hits = self.embedding_index.search_by_embeddings(
+                        [embeddings[i] for i in batch],
+                        n_results=25,
+                        group_guids=group_guids,
+                        include_content=False,
+                    )
+                except Exception:
+                    _note_feed_read_failure()
+                    continue
+                for i, vector_hits in zip(batch, hits):
+                    best_sims[i] = self._best_mandate_similarity(vector_hits, scoring)
+        return best_sims
+
+    @staticmethod
+    def _best_mandate_similarity(
+        vector_hits: list[SimilarityResult], scoring: ScoringConfig
+    ) -> dict[str, float]:
+        """document_guid -> best chunk similarity at or above the VECTOR threshold."""
+        best_sim: dict[str, float] = {}
+        for hit in vector_hits:
+            if not hit.document_guid:
+                continue
+            if hit.score < scoring.vector_similarity_threshold:
+                continue
+            best_sim[hit.document_guid] = max(best_sim.get(hit.document_guid, 0.0), float(hit.score))
+        return best_sim
+
+    def _load_mandate_embeddings(self, profiles: list[dict[str, Any]]) -> list[list[float]]:
+        """_load_mandate_embedding for many profiles: one store pass, one Neo4j query."""
+        embeddings: list[list[float]] = []
+        for profile in profiles:
+            embedding = profile.get("mandate_embedding")
+            embeddings.append(embedding if isinstance(embedding, list) and embedding else [])
+
+        wanted = {
+            profile["profile_guid"]: i
+            for i, profile in enumerate(profiles)
+            if not embeddings[i] and profile.get("profile_guid")
+        }
+        if wanted and self.mandate_store is not None:
+            for profile_guid, stored in self.mandate_store.get_many(list(wanted)).items():
+                if stored:
+                    embeddings[wanted.pop(profile_guid)] = stored
+
+        unmigrated = [guid for guid, i in wanted.items() if profiles[i].get("mandate_embedding_in_graph")]
+        if not unmigrated or not self.graph_index:
+            return embeddings
+        try:
+            with self.graph_index._get_session() as session:
+                result = session.run(
+                    """
+                    UNWIND $profile_guids AS profile_guid
+                    MATCH (cp:ClientProfile {guid: profile_guid})
+                    RETURN cp.guid AS profile_guid, cp.mandate_embedding AS mandate_embedding
+                    """,
+                    profile_guids=unmigrated,
+                )
+                for record in result:
+                    value = record.get("mandate_embedding")
+                    if isinstance(value, list) and value:
+                        embeddings[wanted[record["profile_guid"]]] = list(value)
+        except Exception:
+            _note_feed_read_failure()
+        return embeddings
+
+    def _load_mandate_embedding(self, profile: dict[str, Any]) -> list[float]:
+        """Load a client's mandate embedding for the VECTOR channel.
+
+        Profile contexts carry only the profile guid; the vector is read from
+        mandate_store here, so it is fetched only when the channel is active.
+        Profiles whose node still has a mandate_embedding property (not yet
+        migrated by scripts/migrate_mandate_embeddings.py) are read from Neo4j.
+        """
+        embedding = profile.get("mandate_embedding")
+        if isinstance(embedding, list) and embedding:
+            return embedding
+        profile_guid = profile.get("profile_guid")
+        if not profile_guid:
+            return []
+        if self.mandate_store is not None:
+            stored = self.mandate_store.get(profile_guid)
+            if stored:
+                return stored
+        if not profile.get("mandate_embedding_in_graph") or not self.graph_index:
+            return []
+        try:
+            with self.graph_index._get_session() as session:
+                record = session.run(
+                    """
+                    MATCH (cp:ClientProfile {guid: $profile_guid})
+                    RETURN cp.mandate_embedding AS mandate_embedding
+                    """,
+                    profile_guid=profile_guid,
+                ).single()
+        except Exception:
+            _note_feed_read_failure()
+            return []
+        value = record.get("mandate_embedding") if record else None
+        return list(value) if isinstance(value, list) else []
+
+    def _get_client_feed_context(
+        self, client_guid: str, group_guids: list[str]
+    ) -> dict[str, Any] | None:
+        """Fetch everything get_top_client_news needs about a client in one query.
+
+        Combines _get_client_profile_context, _get_client_holdings,
+        _get_client_watchlist, _get_client_exclusions and
+        _expand_lateral_tickers (over the client's holdings) into a single
+        Cypher round trip with the same group permission check.
+
+        Returns:
+            Dict with 'profile', 'holdings', 'watchlist', 'exclusions' and
+            'lateral' keys in the same shapes as the individual helpers, or
+            None if the client is not visible in group_guids.
+        """
+        return self._get_client_feed_contexts([client_guid], group_guids).get(client_guid)
+
+    def _get_client_feed_contexts(
+        self, client_guids: list[str], group_guids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Batched _get_client_feed_context: one Cypher round trip for many clients.
+
+        Returns:
+            client_guid -> feed context for every client visible in group_guids
+        """
+        if not self.graph_index or not client_guids:
+            return {}
+        try:
+            with self.graph_index._get_session() as session:
+                result = session.run(
+                    """
+                    UNWIND $client_guids AS client_guid
+                    MATCH (c:Client {guid: client_guid})-[:IN_GROUP]->(g:Group)
+                    WHERE g.guid IN $group_guids
+                    WITH DISTINCT c
+                    OPTIONAL MATCH (c)-[:IS_TYPE_OF]->(ct:ClientType)
+                    OPTIONAL MATCH (c)-[:HAS_PROFILE]->(cp:ClientProfile)
+                    OPTIONAL MATCH (cp)-[:BENCHMARKED_TO]->(b:Instrument)
+                    WITH c, ct, cp, b,
+                         [(c)-[:HAS_PORTFOLIO]->(:Portfolio)-[h:HOLDS]->(i:Instrument)
+                            | {ticker: i.ticker, weight: h.weight}] AS holdings,
+                         [(c)-[:HAS_WATCHLIST]->(:Watchlist)-[:WATCHES]->(i:Instrument)
+                            | i.ticker] AS watchlist,
+                         [(cp)-[:EXCLUDES]->(x:Company) | x.name] AS excluded_companies,
+                         [(cp)-[:EXCLUDES]->(x:Sector) | x.name] AS excluded_sectors
+                    CALL {
+                        WITH c
+                        OPTIONAL MATCH (c)-[:HAS_PORTFOLIO]->(:Portfolio)-[:HOLDS]->(hi:Instrument)-[:ISSUED_BY]->(hc:Company)
+                        WITH collect(DISTINCT hc) AS holding_companies
+                        RETURN
+                            reduce(acc = [], hc IN holding_companies |
+                                acc + [(hc)-[:COMPETES_WITH]-(:Company)-[:ISSUED_BY]->(ci:Instrument) | ci.ticker]
+                            ) AS competitors,
+                            reduce(acc = [], hc IN holding_companies |
+                                acc + [(hc)<-[:SUPPLIES_TO|SUPPLIER_OF|PARTNER_OF]-(:Company)-[:ISSUED_BY]->(si:Instrument) | si.ticker]
+                            ) AS suppliers,
+                            reduce(acc = [], hc IN holding_companies |
+                                acc + [(hc)-[:BELONGS_TO]->(:Sector)<-[:BELONGS_TO]-(:Company)-[:ISSUED_BY]->(pi:Instrument) | pi.ticker]
+                            ) AS peers
+                    }
+                    RETURN c.guid AS client_guid,
+                           c.impact_threshold AS impact_threshold,
+                           ct.code AS client_type,
+                           cp.mandate_type AS mandate_type,
+                           cp.mandate_text AS mandate_text,
+                           cp.mandate_themes AS mandate_themes,
+                           cp.guid AS profile_guid,
+                           cp.mandate_embedding IS NOT NULL AS mandate_embedding_in_graph,
+                           cp.horizon AS horizon,
+                           cp.esg_constrained AS esg_constrained,
+                           cp.restrictions AS restrictions_json,
+                           b.ticker AS benchmark,
+                           cp IS NOT NULL AS has_profile,
+                           holdings, watchlist,
+                           excluded_companies, excluded_sectors,
+                           competitors, suppliers, peers
+                    """,
+                    client_guids=client_guids,
+                    group_guids=group_guids,
+                )
+                rows = [dict(record) for record in result]
+        except Exception as e:
+            _note_feed_read_failure()
+            logger.warning(f"Error fetching client feed context: {e}")
+            return {}
+
+        contexts: dict[str, dict[str, Any]] = {}
+        for row in rows:
+            context = self._feed_context_from_row(row)
+            if context is not None:
+                contexts[row["client_guid"]] = context
+        return contexts
+
+    def _feed_context_from_row(self, row: dict[str, Any]) -> dict[str, Any] | None:
+        """Shape one client feed context row like the individual helpers."""
+        from app.models.client_profile import ClientProfile
+
+        profile_fields = (
+            "client_guid", "impact_threshold", "client_type", "mandate_type",
+            "mandate_text", "mandate_themes", "profile_guid", "mandate_embedding_in_graph",
+            "horizon", "esg_constrained", "restrictions_json", "benchmark",
+        )
+        try:
+            profile = ClientProfile.model_validate({k: row.get(k) for k in profile_fields}).model_dump()
+        except Exception:
+            return None
+
+        def _distinct(values: list[Any]) -> list[str]:
+            return list(dict.fromkeys(v for v in values or [] if v))
+
+        exclusions: dict[str, list[str]] = {"companies": [], "sectors": []}
+        if row.get("has_profile"):
+            try:
+                exclusions = self._merge_restriction_exclusions(
+                    companies=_distinct(row.get("excluded_companies")),
+                    sectors=_distinct(row.get("excluded_sectors")),
+                    restrictions_json=row.get("restrictions_json"),
+                )
+            except Exception:
+                pass  # nosec B110 - same fail-open behaviour as _get_client_exclusions
+
+        return {
+            "profile": profile,
+            "holdings": [h for h in row.get("holdings") or [] if h.get("ticker")],
+            "watchlist": _distinct(row.get("watchlist")),
+            "exclusions": exclusions,
+            "lateral": {
+                "competitors": _distinct(row.get("competitors")),
+                "suppliers": _distinct(row.get("suppliers")),
+                "peers": _distinct(row.get("peers")),
+            },
+        }
+
+    def _get_client_feed_candidates(
+        self,
+        channel_tickers: list[tuple[str, list[str]]],
+        themes: list[str],
+        vector_guids: list[str],
+        group_guids: list[str],
+        min_impact_score: float | None = None,
+        impact_tiers: list[str] | None = None,
+        include_entities: bool = False,
+        ticker_limit: int = 100,
+        theme_limit: int = 50,
+        created_after: datetime | None = None,
+    ) -> tuple[dict[str, list[dict[str, Any]]], dict[str, dict[str, list[str]]] | None]:
+        """Fetch candidates for every top-client-news channel in one query.
+
+        Each ticker channel is evaluated exactly like _get_documents_for_tickers
+        (own LIMIT, affected_instruments restricted to the channel's tickers),
+        the THEMATIC channel like _get_documents_by_themes and the VECTOR
+        channel like _get_documents_by_guids. Every row carries its reason code.
+
+        Args:
+            channel_tickers: (reason, tickers) pairs, e.g. ("DIRECT_HOLDING", [...])
+            themes: Mandate themes for the THEMATIC channel
+            vector_guids: Document GUIDs from the mandate vector search
+            group_guids: Permitted group GUIDs for access control
+            min_impact_score: Minimum impact score filter (ticker/theme channels)
+            impact_tiers: Impact tier filter (ticker/theme channels)
+            include_entities: Also return company/sector names per document
+                for ESG exclusion checks
+            ticker_limit: Per-channel limit for ticker channels
+            theme_limit: Limit for the THEMATIC channel
+            created_after: Optional time-window cutoff applied to every channel
+
+        Returns:
+            (reason -> documents in created_at DESC order,
+             document_guid -> {'companies', 'sectors'} or None if not requested)
+        """
+        by_reason: dict[str, list[dict[str, Any]]] = {}
+        channels = [
+            {"reason": reason, "tickers": tickers}
+            for reason, tickers in channel_tickers
+            if tickers
+        ]
+        if not self.graph_index or not (channels or themes or vector_guids):
+            return by_reason, ({} if include_entities else None)
+
+        query = """
+        UNWIND $channels AS ch
+        CALL {
+            WITH ch
+            MATCH (d:Document)-[:AFFECTS]->(i:Instrument)
+            WHERE i.ticker IN ch.tickers
+            MATCH (d)-[:IN_GROUP]->(g:Group)
+            WHERE g.guid IN $group_guids
+              AND ($min_impact_score IS NULL OR d.impact_score >= $min_impact_score)
+              AND (size($impact_tiers) = 0 OR d.impact_tier IN $impact_tiers)
+              AND ($created_after IS NULL OR d.created_at >= $created_after)
+            WITH d, collect(DISTINCT i.ticker) AS affected_instruments
+            ORDER BY d.created_at DESC
+            LIMIT $ticker_limit
+            RETURN d, affected_instruments
+        }
+        RETURN ch.reason AS reason, d, affected_instruments, null AS event_type
+        UNION ALL
+        MATCH (d:Document)-[:IN_GROUP]->(g:Group)
+        WHERE size($themes) > 0
+          AND g.guid IN $group_guids
+          AND d.themes IS NOT NULL
+          AND any(t IN d.themes WHERE t IN $themes)
+          AND ($min_impact_score IS NULL OR d.impact_score >= $min_impact_score)
+          AND (size($impact_tiers) = 0 OR d.impact_tier IN $impact_tiers)
+          AND ($created_after IS NULL OR d.created_at >= $created_after)
+        OPTIONAL MATCH (d)-[:AFFECTS]->(i:Instrument)
+        WITH d, collect(DISTINCT i.ticker) AS affected_instruments
+        ORDER BY d.created_at DESC
+        LIMIT $theme_limit
+        RETURN 'THEMATIC' AS reason, d, affected_instruments, null AS event_type
+        UNION ALL
+        MATCH (d:Document)
+        WHERE d.guid IN $vector_guids
+        MATCH (d)-[:IN_GROUP]->(g:Group)
+        WHERE g.guid IN $group_guids
+          AND ($created_after IS NULL OR d.created_at >= $created_after)
+        OPTIONAL MATCH (d)-[:AFFECTS]->(i:Instrument)
+        OPTIONAL MATCH (d)-[:TRIGGERED_BY]->(e:EventType)
+        WITH d, e, collect(DISTINCT i.ticker) AS affected_instruments
+        RETURN 'VECTOR' AS reason, d, affected_instruments, e.code AS event_type
+        """
+        entity_projection = ""
+        if include_entities:
+            entity_projection = """,
+               [(d)-[:AFFECTS]->(:Instrument)-[:ISSUED_BY]->(co:Company)-[:BELONGS_TO]->(:Sector) | co.name] AS companies,
+               [(d)-[:AFFECTS]->(:Instrument)-[:ISSUED_BY]->(:Company)-[:BELONGS_TO]->(se:Sector) | se.name] AS sectors"""
+        query = f"""
+        CALL {{
+        {query}
+        }}
+        RETURN reason,
+               d.guid AS document_guid,
+               d.title AS title,
+               d.created_at AS created_at,
+               d.impact_score AS impact_score,
+               d.impact_tier AS impact_tier,
+               CASE WHEN reason IN ['THEMATIC', 'VECTOR'] THEN d.themes ELSE null END AS themes,
+               event_type,
+               affected_instruments{entity_projection}
+        """  # nosec B608 - projection is a fixed literal; all values are parameters
+
+        try:
+            with self.graph_index._get_session() as session:
+                result = session.run(
+                    query,
+                    channels=channels,
+                    themes=themes or [],
+                    vector_guids=vector_guids or [],
+                    group_guids=group_guids,
+                    min_impact_score=min_impact_score,
+                    impact_tiers=impact_tiers or [],
+                    ticker_limit=ticker_limit,
+                    theme_limit=theme_limit,
+                    created_after=self._created_after_param(created_after),
+                )
+                rows = [dict(record) for record in result]
+        except Exception as e:
+            _note_feed_read_failure()
+            logger.warning(f"Error fetching consolidated client feed candidates: {e}")
+            return by_reason, ({} if include_entities else None)
+
+        entities: dict[str, dict[str, list[str]]] | None = {} if include_entities else None
+        for row in rows:
+            guid = row.get("document_guid")
+            reason = row.pop("reason")
+            if entities is not None and guid:
+                companies = [c for c in row.pop("companies", None) or [] if c]
+                sectors = [x for x in row.pop("sectors", None) or [] if x]
+                if companies or sectors:
+                    entities[guid] = {
+                        "companies": list(dict.fromkeys(companies)),
+                        "sectors": list(dict.fromkeys(sectors)),
+                    }
+            by_reason.setdefault(reason, []).append(row)
+        return by_reason, entities
+
     def _get_client_profile_context(
         self, client_guid: str, group_guids: list[str]
     ) -> dict[str, Any] | None:
@@ -1296,8 +2526,9 @@ class QueryService:
                            ct.code AS client_type,
                            cp.mandate_type AS mandate_type,
                            cp.mandate_text AS mandate_text,
-                              cp.mandate_themes AS mandate_themes,
-                              cp.mandate_embedding AS mandate_embedding,
+                           cp.mandate_themes AS mandate_themes,
+                           cp.guid AS profile_guid,
+                           cp.mandate_embedding IS NOT NULL AS mandate_embedding_in_graph,
                            cp.horizon AS horizon,
                            cp.esg_constrained AS esg_constrained,
                            cp.restrictions AS restrictions_json,
@@ -1316,6 +2547,7 @@ class QueryService:
                 profile = ClientProfile.model_validate(profile_dict)
                 return profile.model_dump()
         except Exception:
+            _note_feed_read_failure()
             return None
 
     def _get_client_holdings(self, client_guid: str) -> list[dict[str, Any]]:
@@ -1332,6 +2564,7 @@ class QueryService:
                 )
                 return [dict(record) for record in result if record.get("ticker")]
         except Exception:
+            _note_feed_read_failure()
             return []
 
     def _get_client_watchlist(self, client_guid: str) -> list[str]:
@@ -1348,6 +2581,7 @@ class QueryService:
                 )
                 return [record["ticker"] for record in result if record.get("ticker")]
         except Exception:
+            _note_feed_read_failure()
             return []
 
     def _get_client_exclusions(self, client_guid: str) -> dict[str, list[str]]:
@@ -1378,30 +2612,40 @@ class QueryService:
                 if not record:
                     return {"companies": [], "sectors": []}
                 
-                companies = [c for c in record["companies"] if c]
-                sectors = [s for s in record["sectors"] if s]
-                
-                # Add excluded_industries from restrictions JSON
-                restrictions_json = record.get("restrictions_json")
-                if restrictions_json:
-                    try:
-                        restrictions = json.loads(restrictions_json)
-                        ethical_sector = restrictions.get("ethical_sector") or {}
-                        excluded_industries = ethical_sector.get("excluded_industries") or []
-                        # Add to sectors list (industries map to sectors)
-                        for industry in excluded_industries:
-                            if industry and industry not in sectors:
-                                sectors.append(industry)
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-                
-                return {
-                    "companies": companies,
-                    "sectors": sectors,
-                }
+                return self._merge_restriction_exclusions(
+                    companies=[c for c in record["companies"] if c],
+                    sectors=[s for s in record["sectors"] if s],
+                    restrictions_json=record.get("restrictions_json"),
+                )
         except Exception:
+            _note_feed_read_failure()
             return {"companies": [], "sectors": []}
 
+    @staticmethod
+    def _merge_restriction_exclusions(
+        companies: list[str],
+        sectors: list[str],
+        restrictions_json: str | None,
+    ) -> dict[str, list[str]]:
+        """Combine graph EXCLUDES names with restrictions.ethical_sector.excluded_industries."""
+        sectors = list(sectors)
+        if restrictions_json:
+            try:
+                restrictions = json.loads(restrictions_json)
+                ethical_sector = restrictions.get("ethical_sector") or {}
+                excluded_industries = ethical_sector.get("excluded_industries") or []
+                # Add to sectors list (industries map to sectors)
+                for industry in excluded_industries:
+                    if industry and industry not in sectors:
+                        sectors.append(industry)
+            except (json.JSONDecodeError, TypeError):
+                pass
+
+        return {
+            "companies": list(companies),
+            "sectors": sectors,
+        }
+
     def _get_document_entities(self, document_guids: list[str]) -> dict[str, dict[str, list[str]]]:
         if not self.graph_index or not document_guids:
             return {}
@@ -1426,6 +2670,7 @@ class QueryService:
                     if record.get("guid")
                 }
         except Exception:
+            _note_feed_read_failure()
             return {}
 
     def _get_documents_for_tickers(
@@ -1435,7 +2680,14 @@ class QueryService:
         min_impact_score: float | None = None,
         impact_tiers: list[str] | None = None,
         limit: int = 100,
+        created_after: datetime | None = None,
     ) -> list[dict[str, Any]]:
+        """Get documents affecting any of the tickers, newest first.
+
+        Args:
+            created_after: Optional time-window cutoff evaluated in Cypher so
+                stale documents do not consume the LIMIT
+        """
         if not self.graph_index or not tickers:
             return []
         query = """
@@ -1448,6 +2700,8 @@ class QueryService:
             query += "\n  AND d.impact_score >= $min_impact_score"
         if impact_tiers:
             query += "\n  AND d.impact_tier IN $impact_tiers"
+        if created_after is not None:
+            query += "\n  AND d.created_at >= $created_after"
         query += """
         RETURN d.guid AS document_guid,
                d.title AS title,
@@ -1468,11 +2722,13 @@ class QueryService:
                     min_impact_score=min_impact_score,
                     impact_tiers=impact_tiers,
                     limit=limit,
+                    created_after=self._created_after_param(created_after),
                 )
                 docs = [dict(record) for record in result]
                 logger.info(f"[AVATAR_DEBUG] _get_documents_for_tickers returned {len(docs)} docs for tickers={tickers}")
                 return docs
         except Exception as e:
+            _note_feed_read_failure()
             logger.error(f"[AVATAR_DEBUG] _get_documents_for_tickers EXCEPTION: {e}")
             return []
 
@@ -1503,6 +2759,7 @@ class QueryService:
                     "peers": [t for t in record["peers"] if t],
                 }
         except Exception:
+            _note_feed_read_failure()
             return {"competitors": [], "suppliers": [], "peers": []}
 
     def _get_documents_by_themes(
@@ -1513,6 +2770,7 @@ class QueryService:
         min_impact_score: float | None = None,
         impact_tiers: list[str] | None = None,
         limit: int = 50,
+        created_after: datetime | None = None,
     ) -> list[dict[str, Any]]:
         """Get documents matching themes but NOT affecting excluded tickers.
 
@@ -1526,6 +2784,7 @@ class QueryService:
             min_impact_score: Minimum impact score filter
             impact_tiers: Impact tier filter
             limit: Maximum results
+            created_after: Optional time-window cutoff evaluated in Cypher
 
         Returns:
             List of document dicts with themes and affected_instruments
@@ -1544,6 +2803,8 @@ class QueryService:
             query += "\n  AND d.impact_score >= $min_impact_score"
         if impact_tiers:
             query += "\n  AND d.impact_tier IN $impact_tiers"
+        if created_after is not None:
+            query += "\n  AND d.created_at >= $created_after"
 
         # Get affected instruments to filter out overlap with existing positions
         query += """
@@ -1579,9 +2840,11 @@ class QueryService:
                     min_impact_score=min_impact_score,
                     impact_tiers=impact_tiers,
                     limit=limit,
+                    created_after=self._created_after_param(created_after),
                 )
                 return [dict(record) for record in result]
         except Exception as e:
+            _note_feed_read_failure()
             logger.warning(f"Error fetching documents by themes: {e}")
             return []
 
@@ -1617,8 +2880,26 @@ class QueryService:
                 )
                 return [dict(r) for r in result]
         except Exception:
+            _note_feed_read_failure()
             return []
 
+    @staticmethod
+    def _created_after_param(created_after: datetime | None) -> str | None:
+        """Format a time-window cutoff for comparison with Document.created_at.
+
+        created_at is stored as an ISO-8601 UTC string, so the cutoff is
+        normalized to naive UTC and truncated to whole seconds; string
+        comparison is then never stricter than _within_time_window, which
+        stays as the exact filter.
+        """
+        if created_after is None:
+            return None
+        if created_after.tzinfo is not None:
+            from datetime import timezone
+
+            created_after = created_after.astimezone(timezone.utc).replace(tzinfo=None)
+        return created_after.strftime("%Y-%m-%dT%H:%M:%S")
+
     def _within_time_window(self, created_at: Any, cutoff: datetime) -> bool:
         if created_at is None:
             return True
@@ -1684,73 +2965,200 @@ class QueryService:
         except Exception:
             return base
 
-    def _execute_similarity_search(
+    def _retrieve_filtered_candidates(
         self,
         query_text: str,
         group_guids: list[str],
         n_results: int,
         filters: QueryFilters,
-    ) -> list[SimilarityResult]:
-        """Execute ChromaDB similarity search"""
-        return self.embedding_index.search(
-            query=query_text,
+    ) -> tuple[list[SimilarityResult], int, int]:
+        """Fetch similarity candidates that pass the metadata filters
+
+        Without adaptive_overfetch this is a single n_results * 3 page.
+        Otherwise the first page is sized from the number of post-filters
+        (each assumed to pass OVERFETCH_FILTER_PASS_PRIOR of chunks) and
+        re-issued with a larger page - at least OVERFETCH_GROWTH times
+        bigger, or as big as the observed documents-per-chunk yield says is
+        needed - until n_results distinct documents survive, ChromaDB runs
+        out of chunks, or max_overfetch_candidates is reached.
+
+        Returns:
+            (filtered results, retrieval rounds, candidates scanned)
+        """
+        if not self.adaptive_overfetch:
+            similarity_results = self._execute_similarity_search(
+                query_text=query_text,
+                group_guids=group_guids,
+                n_results=n_results * 3,  # Fetch extra for filtering
+                filters=filters,
+            )
+            filtered = self._apply_metadata_filters(results=similarity_results, filters=filters)
+            return filtered, 1, len(similarity_results)
+
+        # Never shallower than the fixed overfetch it replaces
+        cap = max(1, n_results * 3, self.max_overfetch_candidates)
+        selectivity = OVERFETCH_FILTER_PASS_PRIOR ** self._count_post_filters(filters)
+        page = min(cap, max(1, math.ceil(n_results * OVERFETCH_CHUNK_SLACK / selectivity)))
+        rounds = 0
+        scanned = 0
+        # Embed once: every round re-queries with the same vector
+        query_embedding = self.embedding_index.embed_query(query_text)
+        while True:
+            rounds += 1
+            similarity_results = self._execute_similarity_search(
+                query_text=query_text,
+                group_guids=group_guids,
+                n_results=page,
+                filters=filters,
+                query_embedding=query_embedding,
+            )
+            scanned += len(similarity_results)
+            filtered = self._apply_metadata_filters(results=similarity_results, filters=filters)
+            distinct = len({r.document_guid for r in filtered})
+            if distinct >= n_results or len(similarity_results) < page or page >= cap:
+                break
+            # Distinct surviving documents per chunk scanned this round
+            doc_yield = max(distinct, 1) / len(similarity_results)
+            needed = math.ceil(n_results / doc_yield * OVERFETCH_CHUNK_SLACK)
+            page = min(cap, max(math.ceil(page * OVERFETCH_GROWTH), needed))
+
+        logger.debug(
+            "query_overfetch",
             n_results=n_results,
-            group_guids=group_guids if group_guids else None,
-            source_guids=filters.sources,
-            languages=filters.languages,
+            rounds=rounds,
+            candidates_scanned=scanned,
+            documents=distinct,
+        )
+        return filtered, rounds, scanned
+
+    def _count_post_filters(self, filters: QueryFilters) -> int:
+        """Number of metadata filters ChromaDB does not evaluate for this service"""
+        if self.filter_pushdown:
+            return 0
+        return sum(
+            1
+            for active in (
+                filters.date_from is not None or filters.date_to is not None,
+                bool(filters.regions),
+                bool(filters.sectors),
+                bool(filters.companies),
+                filters.min_impact_score is not None,
+                bool(filters.impact_tiers),
+            )
+            if active
         )
 
+    def _execute_similarity_search(
+        self,
+        query_text: str,
+        group_guids: list[str],
+        n_results: int,
+        filters: QueryFilters,
+        query_embedding: list[float] | None = None,
+    ) -> list[SimilarityResult]:
+        """Execute ChromaDB similarity search
+
+        With filter_pushdown, metadata filters are evaluated by ChromaDB so
+        restrictive filters still return a full page of candidates.
+
+        Args:
+            query_embedding: Precomputed embedding of query_text; searched with
+                search_by_embedding() so repeated pages do not re-embed the query
+        """
+        search_filters: dict[str, Any] = {
+            "n_results": n_results,
+            "group_guids": group_guids if group_guids else None,
+            "source_guids": filters.sources,
+            "languages": filters.languages,
+        }
+        if self.filter_pushdown:
+            search_filters.update(
+                created_from=filters.date_from,
+                created_to=filters.date_to,
+                min_impact_score=filters.min_impact_score,
+                impact_tiers=filters.impact_tiers,
+                regions=filters.regions,
+                sectors=filters.sectors,
+                companies=filters.companies,
+            )
+        if query_embedding is not None:
+            return self.embedding_index.search_by_embedding(query_embedding=query_embedding, **search_filters)
+        return self.embedding_index.search(query=query_text, **search_filters)
+
     def _apply_metadata_filters(
         self,
         results: list[SimilarityResult],
         filters: QueryFilters,
     ) -> list[SimilarityResult]:
-        """Apply in-memory metadata filters"""
+        """Apply in-memory metadata filters
+
+        Mirrors the ChromaDB where clause used with filter_pushdown, so results
+        are the same with or without pushdown.
+        """
         filtered: list[SimilarityResult] = []
+        date_from_ts = to_epoch_seconds(filters.date_from)
+        date_to_ts = to_epoch_seconds(filters.date_to)
+        tiers = {t.upper() for t in filters.impact_tiers} if filters.impact_tiers else None
+        regions = {normalize_filter_value(r) for r in filters.regions} if filters.regions else None
+        sectors = {normalize_filter_value(s) for s in filters.sectors} if filters.sectors else None
+        companies = {normalize_filter_value(c) for c in filters.companies} if filters.companies else None
 
         for result in results:
             # Get document metadata
             metadata = result.metadata
 
-            # Date filtering
-            if filters.date_from or filters.date_to:
-                created_at_str = metadata.get("created_at")
-                if created_at_str:
+            # Date filtering (epoch comparison; naive datetimes are UTC)
+            if date_from_ts is not None or date_to_ts is not None:
+                created_ts = metadata.get("created_at_ts")
+                if not isinstance(created_ts, (int, float)):
+                    created_ts = to_epoch_seconds(metadata.get("created_at"))
+                if created_ts is not None:
+                    if date_from_ts is not None and created_ts < date_from_ts:
+                        continue
+                    if date_to_ts is not None and created_ts > date_to_ts:
+                        continue
+
+            # Impact filtering
+            if filters.min_impact_score is not None:
+                impact_score = metadata.get("impact_score")
+                if not isinstance(impact_score, (int, float)) or impact_score < filters.min_impact_score:
+                    continue
+            if tiers is not None:
+                if str(metadata.get("impact_tier") or "").upper() not in tiers:
+                    continue
+
+            # Region filtering (any of the document's regions)
+            if regions:
+                doc_regions = metadata.get("regions", [])
+                if isinstance(doc_regions, str):
                     try:
-                        created_at = datetime.fromisoformat(str(created_at_str))
-                        if filters.date_from and created_at < filters.date_from:
-                            continue
-                        if filters.date_to and created_at > filters.date_to:
-                            continue
-                    except (ValueError, TypeError):
-                        pass  # Skip date filter if can't parse
-
-            # Region filtering
-            if filters.regions:
-                doc_region = metadata.get("region", "")
-                if doc_region not in filters.regions:
+                        doc_regions = json.loads(doc_regions)
+                    except json.JSONDecodeError:
+                        doc_regions = [doc_regions]
+                doc_regions = [*doc_regions, metadata.get("region") or ""]
+                if not regions.intersection(normalize_filter_value(r) for r in doc_regions):
                     continue
 
             # Sector filtering
-            if filters.sectors:
+            if sectors:
                 doc_sectors = metadata.get("sectors", [])
                 if isinstance(doc_sectors, str):
                     try:
                         doc_sectors = json.loads(doc_sectors)
                     except json.JSONDecodeError:
                         doc_sectors = [doc_sectors]
-                if not any(s in doc_sectors for s in filters.sectors):
+                if not sectors.intersection(normalize_filter_value(s) for s in doc_sectors):
                     continue
 
             # Company filtering
-            if filters.companies:
+            if companies:
                 doc_companies = metadata.get("companies", [])
                 if isinstance(doc_companies, str):
                     try:
                         doc_companies = json.loads(doc_companies)
                     except json.JSONDecodeError:
                         doc_companies = [doc_companies]
-                if not any(c in doc_companies for c in filters.companies):
+                if not companies.intersection(normalize_filter_value(c) for c in doc_companies):
                     continue
 
             filtered.append(result)
@@ -1916,44 +3324,24 @@ class QueryService:
         if not self.graph_index:
             return []
             
-        expanded_docs: dict[str, dict[str, Any]] = {}  # guid -> {score, via, ...}
-        
-        # For each semantic result, traverse the graph
-        for result in semantic_results[:5]:  # Limit traversal to top 5
-            try:
-                # Get instruments this document affects
-                instruments = self._get_document_instruments(result.document_guid)
-                
-                for inst_ticker in instruments:
-                    # Find other documents affecting the same instrument
-                    related = self._get_documents_affecting_instrument(
-                        ticker=inst_ticker,
-                        group_guids=group_guids,
-                        limit=5,
-                    )
-                    for doc_guid, doc_data in related.items():
-                        if doc_guid not in exclude_guids and doc_guid not in expanded_docs:
-                            doc_data["via"] = f"instrument:{inst_ticker}"
-                            doc_data["via_doc"] = result.document_guid
-                            expanded_docs[doc_guid] = doc_data
-                    
-                    # Find documents affecting peer instruments
-                    peer_tickers = self._get_peer_instruments(inst_ticker)
-                    for peer_ticker in peer_tickers[:3]:  # Limit peer traversal
-                        peer_related = self._get_documents_affecting_instrument(
-                            ticker=peer_ticker,
-                            group_guids=group_guids,
-                            limit=3,
-                        )
-                        for doc_guid, doc_data in peer_related.items():
-                            if doc_guid not in exclude_guids and doc_guid not in expanded_docs:
-                                doc_data["via"] = f"peer:{inst_ticker}→{peer_ticker}"
-                                doc_data["via_doc"] = result.document_guid
-                                expanded_docs[doc_guid] = doc_data
-                                
-            except Exception:
-                continue  # nosec B112 - Don't fail on graph traversal errors
-                
+        seed_guids = [r.document_guid for r in semantic_results[:5]]  # Limit traversal to top 5
+        if not seed_guids:
+            return []
+
+        expanded_docs: Optional[dict[str, dict[str, Any]]] = None
+        if self.batch_graph_expansion:
+            expanded_docs = self._collect_graph_expansion_batched(
+                seed_guids=seed_guids,
+                group_guids=group_guids,
+                exclude_guids=exclude_guids,
+            )
+        if expanded_docs is None:
+            expanded_docs = self._collect_graph_expansion_per_hit(
+                seed_guids=seed_guids,
+                group_guids=group_guids,
+                exclude_guids=exclude_guids,
+            )
+
         # Convert to QueryResults with graph-based scoring
         graph_results: list[QueryResult] = []
         now = datetime.now()
@@ -1994,6 +3382,161 @@ class QueryService:
             
         return graph_results
 
+    @staticmethod
+    def _peer_via(inst_ticker: str, peer_ticker: str) -> str:
+        """Provenance label for a document reached through a sector peer"""
+        return f"peer:{inst_ticker}\u2192{peer_ticker}"
+
+    def _collect_graph_expansion_per_hit(
+        self,
+        seed_guids: list[str],
+        group_guids: list[str],
+        exclude_guids: set[str],
+    ) -> dict[str, dict[str, Any]]:
+        """Expand seed documents with one Neo4j query per hit, instrument and peer
+
+        Reference implementation for the batched path; also used as a fallback
+        when the batched query fails.
+        """
+        expanded_docs: dict[str, dict[str, Any]] = {}  # guid -> {score, via, ...}
+
+        for seed_guid in seed_guids:
+            try:
+                # Get instruments this document affects
+                instruments = self._get_document_instruments(seed_guid)
+
+                for inst_ticker in instruments:
+                    # Find other documents affecting the same instrument
+                    related = self._get_documents_affecting_instrument(
+                        ticker=inst_ticker,
+                        group_guids=group_guids,
+                        limit=5,
+                    )
+                    for doc_guid, doc_data in related.items():
+                        if doc_guid not in exclude_guids and doc_guid not in expanded_docs:
+                            doc_data["via"] = f"instrument:{inst_ticker}"
+                            doc_data["via_doc"] = seed_guid
+                            expanded_docs[doc_guid] = doc_data
+
+                    # Find documents affecting peer instruments
+                    peer_tickers = self._get_peer_instruments(inst_ticker)
+                    for peer_ticker in peer_tickers[:3]:  # Limit peer traversal
+                        peer_related = self._get_documents_affecting_instrument(
+                            ticker=peer_ticker,
+                            group_guids=group_guids,
+                            limit=3,
+                        )
+                        for doc_guid, doc_data in peer_related.items():
+                            if doc_guid not in exclude_guids and doc_guid not in expanded_docs:
+                                doc_data["via"] = self._peer_via(inst_ticker, peer_ticker)
+                                doc_data["via_doc"] = seed_guid
+                                expanded_docs[doc_guid] = doc_data
+
+            except Exception:
+                continue  # nosec B112 - Don't fail on graph traversal errors
+
+        return expanded_docs
+
+    def _collect_graph_expansion_batched(
+        self,
+        seed_guids: list[str],
+        group_guids: list[str],
+        exclude_guids: set[str],
+        instrument_doc_limit: int = 5,
+        peer_limit: int = 3,
+        peer_doc_limit: int = 3,
+    ) -> Optional[dict[str, dict[str, Any]]]:
+        """Expand all seed documents in a single Neo4j round trip
+
+        Walks seed -> AFFECTS -> Instrument -> (documents affecting it) and
+        Instrument -> ISSUED_BY -> Company -> Sector peers -> (documents
+        affecting the peer) for every seed at once via UNWIND. Rows come back
+        ordered by seed rank, instrument, hop and recency so first-seen
+        provenance (via / via_doc) matches the per-hit traversal.
+
+        Returns:
+            guid -> document data with via/via_doc, or None if the query failed
+            (caller falls back to the per-hit path)
+        """
+        if not self.graph_index:
+            return {}
+
+        try:
+            with self.graph_index._get_session() as session:
+                result = session.run(
+                    """
+                    UNWIND range(0, size($seed_guids) - 1) AS seed_rank
+                    MATCH (seed:Document {guid: $seed_guids[seed_rank]})-[:AFFECTS]->(i:Instrument)
+                    WHERE i.ticker IS NOT NULL
+                    CALL {
+                        WITH i
+                        MATCH (d:Document)-[:AFFECTS]->(i)
+                        MATCH (d)-[:IN_GROUP]->(g:Group)
+                        WHERE g.guid IN $group_guids
+                        WITH d ORDER BY d.created_at DESC LIMIT $instrument_doc_limit
+                        RETURN d, 0 AS hop, null AS peer_ticker
+                        UNION ALL
+                        WITH i
+                        MATCH (i)-[:ISSUED_BY]->(:Company)-[:BELONGS_TO]->(sec:Sector)
+                        MATCH (p:Instrument)-[:ISSUED_BY]->(:Company)-[:BELONGS_TO]->(sec)
+                        WHERE p.ticker IS NOT NULL AND p.ticker <> i.ticker
+                        WITH DISTINCT p ORDER BY p.ticker LIMIT $peer_limit
+                        CALL {
+                            WITH p
+                            MATCH (d:Document)-[:AFFECTS]->(p)
+                            MATCH (d)-[:IN_GROUP]->(g:Group)
+                            WHERE g.guid IN $group_guids
+                            WITH d ORDER BY d.created_at DESC LIMIT $peer_doc_limit
+                            RETURN d
+                        }
+                        RETURN d, 1 AS hop, p.ticker AS peer_ticker
+                    }
+                    OPTIONAL MATCH (d)-[:PRODUCED_BY]->(s:Source)
+                    OPTIONAL MATCH (d)-[:TRIGGERED_BY]->(e:EventType)
+                    RETURN seed_rank, seed.guid AS seed_guid, i.ticker AS ticker,
+                           hop, peer_ticker,
+                           d.guid AS guid, d.title AS title,
+                           d.created_at AS created_at, d.language AS language,
+                           d.impact_score AS impact_score, d.impact_tier AS impact_tier,
+                           e.code AS event_type,
+                           s.guid AS source_guid, s.name AS source_name
+                    ORDER BY seed_rank, ticker, hop, peer_ticker, created_at DESC
+                    """,
+                    seed_guids=seed_guids,
+                    group_guids=group_guids,
+                    instrument_doc_limit=instrument_doc_limit,
+                    peer_limit=peer_limit,
+                    peer_doc_limit=peer_doc_limit,
+                )
+                records = list(result)
+        except Exception as e:
+            logger.warning(f"Batched graph expansion failed, using per-hit traversal: {e}")
+            return None
+
+        expanded_docs: dict[str, dict[str, Any]] = {}
+        for record in records:
+            doc_guid = record["guid"]
+            if not doc_guid or doc_guid in exclude_guids or doc_guid in expanded_docs:
+                continue
+            if record["hop"] == 0:
+                via = f"instrument:{record['ticker']}"
+            else:
+                via = self._peer_via(record["ticker"], record["peer_ticker"])
+            expanded_docs[doc_guid] = {
+                "guid": doc_guid,
+                "title": record["title"],
+                "created_at": record["created_at"],
+                "language": record["language"],
+                "impact_score": record["impact_score"],
+                "impact_tier": record["impact_tier"],
+                "event_type": record["event_type"],
+                "source_guid": record["source_guid"],
+                "source_name": record["source_name"],
+                "via": via,
+                "via_doc": record["seed_guid"],
+            }
+        return expanded_docs
+
     def _get_document_instruments(self, document_guid: str) -> list[str]:
         """Get instruments affected by a document (via AFFECTS relationship)"""
         if not self.graph_index:
@@ -0,0 +1,131 @@
+"""Ticker Matcher.
+
+Finds known instrument tickers in article text in one pass. Used by the
+ingest regex ticker fallback instead of running one ``re.search`` per
+ticker per document.
+
+All tickers are compiled into a single regular expression shaped as a
+prefix trie, wrapped in word boundaries. Results are identical to testing
+every ticker with ``re.search(rf"\\b{re.escape(ticker)}\\b", text)``:
+- the scan restarts one character after every match, so overlapping
+  mentions are found
+- a ticker that is a prefix of a longer matched ticker (e.g. ``BRK`` in
+  ``BRK.B``) is reported when the boundary after it holds
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Iterable
+
+__all__ = [
+    "TickerMatcher",
+]
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation from a character trie (longest match preferred)."""
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def render(node: dict[str, dict]) -> str:
+        terminal = "" in node
+        branches = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if terminal:
+            # Greedy optional: try the longer ticker first, backtrack to this one
+            return body + "?" if len(branches) == 1 and len(branches[0]) == 1 else "(?:" + body + ")?"
+        return body
+
+    return render(trie)
+
+
+class TickerMatcher:
+    """Thread-safe compiled matcher for a set of tickers.
+
+    Attributes:
+        version: Incremented every time the compiled pattern changes
+    """
+
+    def __init__(self, tickers: Iterable[str] = ()) -> None:
+        self._lock = threading.Lock()
+        self._tickers: frozenset[str] = frozenset()
+        self._pattern: re.Pattern[str] | None = None
+        self._prefixes: dict[str, tuple[str, ...]] = {}
+        self.version = 0
+        self.update(tickers)
+
+    @property
+    def tickers(self) -> frozenset[str]:
+        return self._tickers
+
+    def update(self, tickers: Iterable[str]) -> None:
+        """Replace the ticker set and recompile."""
+        self._compile(frozenset(t for t in tickers if t))
+
+    def add(self, tickers: Iterable[str]) -> bool:
+        """Add tickers; recompiles only if any are new. Returns True if the set changed."""
+        new = {t for t in tickers if t} - self._tickers
+        if not new:
+            return False
+        self._compile(self._tickers | new)
+        return True
+
+    def _compile(self, tickers: frozenset[str]) -> None:
+        pattern = re.compile(r"\b(?:" + _trie_pattern(tickers) + r")\b") if tickers else None
+        # Shorter tickers that start a longer one with a word boundary right after them
+        prefixes: dict[str, tuple[str, ...]] = {}
+        for ticker in tickers:
+            found = tuple(
+                ticker[:n]
+                for n in range(1, len(ticker))
+                if ticker[:n] in tickers and _is_word(ticker[n - 1]) != _is_word(ticker[n])
+            )
+            if found:
+                prefixes[ticker] = found
+        with self._lock:
+            self._tickers = tickers
+            self._pattern = pattern
+            self._prefixes = prefixes
+            self.version += 1
+
+    def find(self, text: str) -> list[str]:
+        """Return the distinct known tickers mentioned in text (first-seen order)."""
+        with self._lock:
+            pattern = self._pattern
+            prefixes = self._prefixes
+        if pattern is None or not text:
+            return []
+
+        found: dict[str, None] = {}
+        pos = 0
+        while True:
+            match = pattern.search(text, pos)
+            if match is None:
+                break
+            ticker = match.group(0)
+            found[ticker] = None
+            for prefix in prefixes.get(ticker, ()):
+                found[prefix] = None
+            pos = match.start() + 1
+        return list(found)
+
+    def __contains__(self, ticker: object) -> bool:
+        return ticker in self._tickers
+
+    def __len__(self) -> int:
+        return len(self._tickers)
+
+    def __repr__(self) -> str:
+        return f"TickerMatcher(tickers={len(self)}, version={self.version})"
@@ -0,0 +1,139 @@
+"""Append-only float32 vector log.
+
+Storage shared by ChunkEmbeddingStore and MandateEmbeddingStore. Three files
+under ``base_path``:
+- ``vectors.f32``: float32 vectors back to back (little-endian)
+- ``index.tsv``: tab-separated index lines; their fields are up to the owner
+- ``write.lock``: sidecar file for the inter-process write lock
+
+Writes from every process sharing ``base_path`` are serialised by an
+exclusive ``flock`` on ``write.lock``, so offsets taken from the end of
+``vectors.f32`` always match the index lines written for them. Reads are
+served from a memory map of ``vectors.f32`` that is re-mapped when another
+writer has grown the file. Nothing is ever rewritten in place.
+
+VectorLog is not thread-safe on its own: owners call it under their own
+lock, which also covers the in-memory index they build from read_index().
+"""
+
+from __future__ import annotations
+
+import fcntl
+import mmap
+import os
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+
+__all__ = [
+    "VectorLog",
+]
+
+_FLOAT_BYTES = 4
+
+
+class VectorLog:
+    """vectors.f32 + index.tsv pair shared by several processes.
+
+    Attributes:
+        base_path: Directory holding vectors.f32, index.tsv and write.lock
+    """
+
+    def __init__(self, base_path: Path) -> None:
+        self.base_path = Path(base_path)
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self._data_path = self.base_path / "vectors.f32"
+        self._index_path = self.base_path / "index.tsv"
+        self._lock_path = self.base_path / "write.lock"
+        self._index_bytes_read = 0
+        self._mapped: mmap.mmap | None = None
+        self._floats: memoryview | None = None
+        self._data_path.touch(exist_ok=True)
+        self._index_path.touch(exist_ok=True)
+        self._lock_path.touch(exist_ok=True)
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of vectors.f32."""
+        return self._data_path.stat().st_size if self._data_path.exists() else 0
+
+    @contextmanager
+    def writer_lock(self) -> Iterator[None]:
+        """Hold the inter-process write lock."""
+        with open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def read_index(self) -> list[list[str]]:
+        """Return the fields of index lines appended since the last call."""
+        if self._index_path.stat().st_size == self._index_bytes_read:
+            return []
+        with open(self._index_path, "rb") as fh:
+            fh.seek(self._index_bytes_read)
+            tail = fh.read()
+        # Ignore a trailing partial line from a concurrent writer
+        complete = tail[: tail.rfind(b"\n") + 1]
+        self._index_bytes_read += len(complete)
+        return [raw.split("\t") for raw in complete.decode("utf-8").splitlines()]
+
+    def append_vectors(self, vectors: Iterable[Sequence[float]]) -> list[tuple[int, int]]:
+        """Append vectors and fsync them. Caller holds writer_lock().
+
+        Returns:
+            (offset in floats, dimensions) for each vector, in order
+        """
+        locations: list[tuple[int, int]] = []
+        with open(self._data_path, "ab") as data:
+            offset = data.tell() // _FLOAT_BYTES
+            for embedding in vectors:
+                vector = array("f", embedding)
+                if sys.byteorder != "little":
+                    vector.byteswap()
+                data.write(vector.tobytes())
+                locations.append((offset, len(vector)))
+                offset += len(vector)
+            data.flush()
+            os.fsync(data.fileno())
+        return locations
+
+    def append_index(self, lines: Sequence[Sequence[object]]) -> None:
+        """Append index lines, one per field sequence. Caller holds writer_lock().
+
+        Write the vectors they point at first, so a reader never sees an
+        index line ahead of its data.
+        """
+        with open(self._index_path, "a", encoding="utf-8") as index:
+            index.write("".join("\t".join(str(f) for f in fields) + "\n" for fields in lines))
+
+    def read(self, offset: int, dim: int) -> list[float] | None:
+        """Read a vector from the memory map, re-mapping if the file grew."""
+        end = offset + dim
+        if self._floats is None or end > len(self._floats):
+            self._remap()
+        if self._floats is None or end > len(self._floats):
+            return None
+        vector = self._floats[offset:end]
+        if sys.byteorder == "little":
+            return vector.tolist()
+        swapped = array("f", vector.tobytes())
+        swapped.byteswap()
+        return swapped.tolist()
+
+    def _remap(self) -> None:
+        size = self._data_path.stat().st_size
+        usable = size - size % _FLOAT_BYTES
+        if usable == 0:
+            return
+        with open(self._data_path, "rb") as fh:
+            mapped = mmap.mmap(fh.fileno(), usable, access=mmap.ACCESS_READ)
+        # Slices handed out earlier are copied by tolist(), so the old map can go
+        self._floats = memoryview(mapped).cast("f")
+        self._mapped = mapped
+
+    def __repr__(self) -> str:
+        return f"VectorLog(path={self.base_path})"
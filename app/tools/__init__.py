@@ -9,6 +9,7 @@ Tools are organized by functionality:
 - health_tools: Infrastructure health checks
 - client_tools: Client management and personalized feeds
 - graph_tools: Knowledge graph exploration
+- tool_executor: Runs tools on worker pools off the event loop
 
 Usage:
     from app.tools import register_all_tools
@@ -27,6 +28,7 @@ from app.tools.health_tools import register_health_tools
 from app.tools.ingest_tools import register_ingest_tools
 from app.tools.query_tools import register_query_tools
 from app.tools.source_tools import register_source_tools
+from app.tools.tool_executor import ToolExecutor, create_tool_executor
 
 if TYPE_CHECKING:
     from mcp.server.fastmcp import FastMCP
@@ -34,7 +36,8 @@ if TYPE_CHECKING:
     from app.services import DocumentStore, IngestService, QueryService, SourceRegistry
     from app.services.embedding_index import EmbeddingIndex
     from app.services.graph_index import GraphIndex
-    from app.services.llm_service import LLMService
+    from app.services.ingest_queue import IngestJobQueue
+    from app.services.llm_service import AsyncLLMService, LLMService
 
 __all__ = [
     "register_ingest_tools",
@@ -43,6 +46,8 @@ __all__ = [
     "register_health_tools",
     "register_client_tools",
     "register_graph_tools",
+    "ToolExecutor",
+    "create_tool_executor",
     "register_all_tools",
 ]
 
@@ -56,6 +61,9 @@ def register_all_tools(
     graph_index: "Optional[GraphIndex]" = None,
     embedding_index: "Optional[EmbeddingIndex]" = None,
     llm_service: "Optional[LLMService]" = None,
+    async_llm_service: "Optional[AsyncLLMService]" = None,
+    tool_executor: "Optional[ToolExecutor]" = None,
+    ingest_queue: "Optional[IngestJobQueue]" = None,
 ) -> None:
     """Register all MCP tools with the server.
 
@@ -68,13 +76,39 @@ def register_all_tools(
         graph_index: GraphIndex instance for Neo4j connectivity (optional)
         embedding_index: EmbeddingIndex instance for ChromaDB connectivity (optional)
         llm_service: LLMService instance for LLM API connectivity (optional)
+        async_llm_service: Registers why_it_matters_to_client as a native async tool (optional)
+        tool_executor: Runs the tools on worker pools instead of the event loop (optional)
+        ingest_queue: Queue behind the asynchronous ingest tools (optional)
     """
-    register_ingest_tools(mcp, ingest_service)
+    if tool_executor is not None:
+        mcp = tool_executor.bind(mcp)  # type: ignore[assignment]
+
+    register_ingest_tools(mcp, ingest_service, ingest_queue=ingest_queue)
     register_source_tools(mcp, source_registry)
     register_query_tools(mcp, document_store, query_service)
-    register_health_tools(mcp, graph_index, embedding_index, llm_service)
+    register_health_tools(
+        mcp,
+        graph_index,
+        embedding_index,
+        llm_service,
+        feed_cache=getattr(query_service, "feed_cache", None),
+        entity_cache=getattr(ingest_service, "entity_cache", None),
+        tool_executor=tool_executor,
+        ingest_queue=ingest_queue,
+        mandate_store=getattr(query_service, "mandate_store", None),
+        client_matcher=getattr(ingest_service, "client_matcher", None),
+    )
     
     # Register client and graph tools if graph_index is available
     if graph_index is not None:
-        register_client_tools(mcp, graph_index, query_service=query_service, llm_service=llm_service)
+        register_client_tools(
+            mcp,
+            graph_index,
+            query_service=query_service,
+            llm_service=llm_service,
+            async_llm_service=async_llm_service,
+            entity_cache=getattr(ingest_service, "entity_cache", None),
+            mandate_store=getattr(query_service, "mandate_store", None),
+            client_matcher=getattr(ingest_service, "client_matcher", None),
+        )
         register_graph_tools(mcp, graph_index)
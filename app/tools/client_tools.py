@@ -10,6 +10,8 @@ Group Access Control:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import math
 from contextlib import nullcontext
@@ -25,6 +27,7 @@ from mcp.types import EmbeddedResource, ImageContent, TextContent
 from app.logger import StructuredLogger
 from app.models.restrictions import ClientRestrictions
 from app.services.client_service import ClientService
+from app.services.entity_cache import INSTRUMENT
 from app.services.graph_index import GraphIndex, NodeLabel, RelationType
 from app.services.group_service import (
     get_group_uuid_by_name,
@@ -34,7 +37,10 @@ from app.services.group_service import (
 )
 
 if TYPE_CHECKING:
-    from app.services.llm_service import LLMService
+    from app.services.client_matcher import ClientMatcher
+    from app.services.entity_cache import EntityResolutionCache
+    from app.services.llm_service import AsyncLLMService, LLMService
+    from app.services.mandate_embedding_store import MandateEmbeddingStore
     from app.services.query_service import QueryService
 
 # Type alias for MCP tool response
@@ -63,6 +69,35 @@ def _normalize_embedding(value: Any) -> list[float] | None:
     return normalized if normalized else None
 
 
+def _backfill_impact_scores(graph_index: GraphIndex, articles: list[dict[str, Any]]) -> None:
+    """Fill in impact_score from the Document node for articles that lack one (in place)."""
+    missing_impact_guids = list(dict.fromkeys(
+        article["document_guid"]
+        for article in articles
+        if article.get("impact_score") is None and article.get("document_guid")
+    ))
+    if not missing_impact_guids:
+        return
+    try:
+        with graph_index._get_session() as session:
+            result = session.run(
+                """
+                MATCH (d:Document)
+                WHERE d.guid IN $guids
+                RETURN d.guid AS guid, d.impact_score AS impact_score
+                """,
+                guids=missing_impact_guids,
+            )
+            impact_map = {record["guid"]: record["impact_score"] for record in result}
+
+        for article in articles:
+            doc_guid = article.get("document_guid")
+            if doc_guid in impact_map and article.get("impact_score") is None:
+                article["impact_score"] = impact_map.get(doc_guid)
+    except Exception:  # nosec B110 - silent fail for optional backfill
+        pass
+
+
 def _require_admin_group(auth_tokens: list[str] | None) -> tuple[bool, list[str]]:
     group_names = resolve_permitted_groups(auth_tokens=auth_tokens)
     return "admin" in group_names, group_names
@@ -72,6 +107,7 @@ def _resolve_instrument_guid(
     graph_index: GraphIndex,
     ticker: str,
     instrument_type: str = "STOCK",
+    entity_cache: "EntityResolutionCache | None" = None,
 ) -> str:
     """Find an existing Instrument by ticker, or create one.
 
@@ -80,19 +116,34 @@ def _resolve_instrument_guid(
     resolve the *actual* GUID stored in the graph to avoid dangling
     relationship errors.
 
+    With an entity_cache (shared with ingest), known tickers resolve
+    without a Neo4j round trip.
+
     Returns:
         The ``guid`` of the matched or newly-created Instrument node.
     """
     upper = ticker.upper()
+    found, guid = entity_cache.lookup(INSTRUMENT, upper) if entity_cache is not None else (False, None)
+    if guid:
+        return guid
+
     # 1. Look up by ticker property (covers instruments from any source)
-    with graph_index._get_session() as session:
-        result = session.run(
-            "MATCH (i:Instrument {ticker: $ticker}) RETURN i.guid AS guid",
-            ticker=upper,
-        )
-        record = result.single()
-        if record:
-            return record["guid"]
+    if not found:
+        with graph_index._get_session() as session:
+            result = session.run(
+                """
+                MATCH (i:Instrument {ticker: $ticker})
+                RETURN i.guid AS guid
+                ORDER BY CASE WHEN i.guid STARTS WITH 'inst-' THEN 0 ELSE 1 END, i.guid
+                LIMIT 1
+                """,
+                ticker=upper,
+            )
+            record = result.single()
+            if record:
+                if entity_cache is not None:
+                    entity_cache.put(INSTRUMENT, upper, record["guid"])
+                return record["guid"]
 
     # 2. Not found – create a minimal placeholder so the relationship works
     node = graph_index.create_instrument(
@@ -101,6 +152,8 @@ def _resolve_instrument_guid(
         instrument_type=instrument_type,
         exchange="UNKNOWN",
     )
+    if entity_cache is not None:
+        entity_cache.put(INSTRUMENT, upper, node.guid)
     return node.guid
 
 
@@ -109,10 +162,29 @@ def register_client_tools(
     graph_index: GraphIndex,
     query_service: "QueryService | None" = None,
     llm_service: "LLMService | None" = None,
+    async_llm_service: "AsyncLLMService | None" = None,
+    entity_cache: "EntityResolutionCache | None" = None,
+    mandate_store: "MandateEmbeddingStore | None" = None,
+    client_matcher: "ClientMatcher | None" = None,
 ) -> None:
-    """Register client tools with the MCP server."""
+    """Register client tools with the MCP server.
+
+    When mandate_store is given, mandate embeddings are written there and the
+    ClientProfile node keeps only ``mandate_embedding_dim``. When
+    client_matcher is given, get_client_matches reads its per-client inboxes.
+    When async_llm_service is given, why_it_matters_to_client is registered
+    as a native async tool that awaits the LLM call.
+    """
     client_service = ClientService(graph_index)
 
+    def _invalidate_client_feeds(client_guid: str) -> None:
+        """Drop cached feeds after a portfolio/watchlist/profile change."""
+        feed_cache = getattr(query_service, "feed_cache", None)
+        if feed_cache is not None:
+            feed_cache.invalidate_client(client_guid)
+        if client_matcher is not None:
+            client_matcher.invalidate()
+
     @mcp.tool(
         name="create_client",
         description=(
@@ -362,7 +434,18 @@ def register_client_tools(
                                 mandate_text_len=len(mandate_text.strip()),
                                 mandate_embedding_len=len(embedding),
                             )
-                        if embedding is not None:
+                        if embedding is not None and mandate_store is not None:
+                            emb_len = mandate_store.put(profile_guid, embedding)
+                            with graph_index._get_session() as session:
+                                session.run(
+                                    """
+                                    MATCH (cp:ClientProfile {guid: $profile_guid})
+                                    SET cp.mandate_embedding_dim = $dim
+                                    """,
+                                    profile_guid=profile_guid,
+                                    dim=emb_len,
+                                )
+                        elif embedding is not None:
                             with graph_index._get_session() as session:
                                 rec = session.run(
                                     """
@@ -425,6 +508,9 @@ def register_client_tools(
                 )
             except RuntimeError:
                 pass
+
+            if client_matcher is not None:
+                client_matcher.invalidate()
             
             return success_response(
                 data={
@@ -602,6 +688,9 @@ def register_client_tools(
                 details={"client_guid": client_guid, "limit": limit},
             )
 
+    if client_matcher is not None:
+        _register_client_matches_tool(mcp, graph_index, client_matcher)
+
     @mcp.tool(
         name="get_client_avatar_feed",
         description=(
@@ -847,31 +936,7 @@ def register_client_tools(
             )
 
             resolved_min_impact = min_impact_score if min_impact_score is not None else 0.0
-            missing_impact_guids = [
-                article.get("document_guid")
-                for article in top_news
-                if article.get("impact_score") is None and article.get("document_guid")
-            ]
-
-            if missing_impact_guids:
-                try:
-                    with graph_index._get_session() as session:
-                        result = session.run(
-                            """
-                            MATCH (d:Document)
-                            WHERE d.guid IN $guids
-                            RETURN d.guid AS guid, d.impact_score AS impact_score
-                            """,
-                            guids=missing_impact_guids,
-                        )
-                        impact_map = {record["guid"]: record["impact_score"] for record in result}
-
-                    for article in top_news:
-                        doc_guid = article.get("document_guid")
-                        if doc_guid in impact_map and article.get("impact_score") is None:
-                            article["impact_score"] = impact_map.get(doc_guid)
-                except Exception:  # nosec B110 - silent fail for optional backfill
-                    pass
+            _backfill_impact_scores(graph_index, top_news)
 
             top_news = [
                 article for article in top_news
@@ -905,34 +970,71 @@ def register_client_tools(
             )
 
     @mcp.tool(
-        name="why_it_matters_to_client",
+        name="get_top_client_news_batch",
         description=(
-            "LLM augmentation for a specific (client, document) pair. "
-            "RETURNS: (1) <=30 words why it matters to the client, (2) <=30 words story summary. "
-            "USE FOR: turning a shortlisted story into a client-ready blurb."
+            "Get top client news for many clients in one call (no LLM). "
+            "USE FOR: Morning runs that build feeds for every client in a group. "
+            "Same ranking as get_top_client_news, but candidate documents are fetched once "
+            "for the union of all clients' tickers/themes and shared across clients. "
+            "RETURNS: One feed per client plus lists of unknown and defunct clients (skipped). "
+            "USES OUTPUT FROM: list_clients (client_guid). "
+            "PREREQUISITE: Clients must exist (use create_client first)."
         ),
     )
-    def why_it_matters_to_client(
-        client_guid: Annotated[str, Field(
-            min_length=36,
-            max_length=36,
-            pattern=r"^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$",
-            description="UUID of the client",
-            examples=["550e8400-e29b-41d4-a716-446655440000"],
-        )],
-        document_guid: Annotated[str, Field(
-            min_length=36,
-            max_length=36,
-            pattern=r"^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$",
-            description="UUID of the document",
-            examples=["550e8400-e29b-41d4-a716-446655440000"],
+    def get_top_client_news_batch(
+        client_guids: Annotated[list[str], Field(
+            min_length=1,
+            max_length=5000,
+            description="UUIDs of the clients to build feeds for (max 5000)",
+            examples=[["550e8400-e29b-41d4-a716-446655440000"]],
         )],
+        limit: Annotated[int, Field(
+            default=3,
+            ge=1,
+            le=10,
+            description="Maximum news items per client (default: 3, max: 10)",
+        )] = 3,
+        time_window_hours: Annotated[int, Field(
+            default=24,
+            ge=1,
+            le=168,
+            description="How far back to search (hours). Default 24, max 168.",
+        )] = 24,
+        min_impact_score: Annotated[float | None, Field(
+            default=None,
+            ge=0.0,
+            le=100.0,
+            description="Minimum impact score 0-100 to filter news",
+        )] = None,
+        impact_tiers: Annotated[list[str] | None, Field(
+            default=None,
+            description="Filter by impact tiers: PLATINUM, GOLD, SILVER, BRONZE, STANDARD",
+            examples=[["PLATINUM", "GOLD", "SILVER"]],
+        )] = None,
+        include_portfolio: Annotated[bool, Field(
+            default=True,
+            description="Include portfolio holdings in relevance (default: True)",
+        )] = True,
+        include_watchlist: Annotated[bool, Field(
+            default=True,
+            description="Include watchlist instruments (default: True)",
+        )] = True,
+        include_lateral_graph: Annotated[bool, Field(
+            default=True,
+            description="Include lateral graph relations like competitors/suppliers (default: True)",
+        )] = True,
+        opportunity_bias: Annotated[float, Field(
+            default=0.0,
+            ge=0.0,
+            le=1.0,
+            description="Opportunity bias lambda in [0,1]. 0=defense, 1=offense.",
+        )] = 0.0,
         auth_tokens: Annotated[list[str] | None, Field(
             default=None,
             description="JWT tokens for authentication (pass via API when headers not available)",
         )] = None,
     ) -> ToolResponse:
-        """Generate LLM why/summary for a single story and client."""
+        """Get top client news for many clients from a shared candidate pool."""
         try:
             group_names = resolve_permitted_groups(auth_tokens=auth_tokens)
             group_guids = get_group_uuids_by_names(group_names)
@@ -940,63 +1042,227 @@ def register_client_tools(
             if query_service is None:
                 return error_response(
                     error_code="QUERY_SERVICE_UNAVAILABLE",
-                    message="Query service not configured for why_it_matters_to_client",
+                    message="Query service not configured for top client news",
                     recovery_strategy="Ensure MCP server initializes QueryService and passes it to client tools.",
-                    details={"client_guid": client_guid, "document_guid": document_guid},
-                )
-
-            if llm_service is None:
-                return error_response(
-                    error_code="LLM_SERVICE_UNAVAILABLE",
-                    message="LLM service not configured",
-                    recovery_strategy="Configure OpenRouter key in Vault (gofr/config/api-keys/openrouter) and restart the service.",
-                    details={"client_guid": client_guid, "document_guid": document_guid},
+                    details={"client_count": len(client_guids)},
                 )
 
-            # Validate client exists and is permitted
-            client_node = graph_index.get_node(NodeLabel.CLIENT, client_guid)
-            if not client_node:
-                return error_response(
-                    error_code="CLIENT_NOT_FOUND",
-                    message=f"Client not found: {client_guid}",
-                    recovery_strategy="Call list_clients to find valid client GUIDs, or create_client to create one.",
-                    details={"client_guid": client_guid},
+            requested = list(dict.fromkeys(client_guids))
+            with graph_index._get_session() as session:
+                result = session.run(
+                    """
+                    MATCH (c:Client)
+                    WHERE c.guid IN $guids
+                    RETURN c.guid AS guid, c.status AS status
+                    """,
+                    guids=requested,
                 )
+                statuses = {record["guid"]: record["status"] for record in result}
 
-            if client_node.properties.get("status") == "defunct":
-                return error_response(
-                    error_code="CLIENT_DEFUNCT",
-                    message="Client is defunct and cannot receive news",
-                    recovery_strategy="Restore the client or select an active client.",
-                    details={
-                        "client_guid": client_guid,
-                        "defunct_at": client_node.properties.get("defunct_at"),
-                        "defunct_reason": client_node.properties.get("defunct_reason"),
-                    },
-                )
+            unknown = [guid for guid in requested if guid not in statuses]
+            defunct = [guid for guid in requested if statuses.get(guid) == "defunct"]
+            active = [guid for guid in requested if guid in statuses and statuses[guid] != "defunct"]
 
-            augmentation = query_service.why_it_matters_to_client(
-                client_guid=client_guid,
-                document_guid=document_guid,
+            resolved_min_impact = min_impact_score if min_impact_score is not None else 0.0
+            client_news: list[tuple[str, list[dict[str, Any]]]] = list(query_service.iter_top_client_news_batch(
+                client_guids=active,
                 group_guids=group_guids,
-                llm_service=llm_service,
-            )
+                limit=limit,
+                time_window_hours=time_window_hours,
+                include_portfolio=include_portfolio,
+                include_watchlist=include_watchlist,
+                include_lateral_graph=include_lateral_graph,
+                min_impact_score=min_impact_score,
+                impact_tiers=impact_tiers,
+                opportunity_bias=opportunity_bias,
+            ))
+            # Same impact_score backfill as get_top_client_news, one query for every client
+            _backfill_impact_scores(graph_index, [a for _, top_news in client_news for a in top_news])
+
+            feeds: list[dict[str, Any]] = []
+            for guid, top_news in client_news:
+                articles = [
+                    article for article in top_news
+                    if float(article.get("impact_score") or 0.0) >= resolved_min_impact
+                ][:limit]
+                feeds.append({
+                    "client_guid": guid,
+                    "articles": articles,
+                    "total_count": len(articles),
+                })
 
             return success_response(
                 data={
-                    "client_guid": client_guid,
-                    "document_guid": document_guid,
-                    **augmentation,
+                    "feeds": feeds,
+                    "client_count": len(feeds),
+                    "unknown_clients": unknown,
+                    "defunct_clients": defunct,
+                    "filters_applied": {
+                        "time_window_hours": time_window_hours,
+                        "min_impact_score": resolved_min_impact,
+                        "impact_tiers": impact_tiers,
+                        "include_portfolio": include_portfolio,
+                        "include_watchlist": include_watchlist,
+                        "include_lateral_graph": include_lateral_graph,
+                    },
                 },
-                message="Generated client-specific story augmentation",
+                message=f"Retrieved top news for {len(feeds)} clients",
             )
+
         except Exception as e:
+            return error_response(
+                error_code="TOP_NEWS_BATCH_FAILED",
+                message=f"Failed to retrieve batch top client news: {e!s}",
+                recovery_strategy="Verify clients exist and QueryService is configured. Run health_check if needed.",
+                details={"client_count": len(client_guids), "limit": limit},
+            )
+
+    def _why_it_matters_preflight(
+        client_guid: str,
+        document_guid: str,
+        auth_tokens: list[str] | None,
+        llm: Any,
+    ) -> tuple[list[str], ToolResponse | None]:
+        """Resolve groups and check services/client for why_it_matters_to_client.
+
+        Returns (group_guids, error response or None).
+        """
+        group_names = resolve_permitted_groups(auth_tokens=auth_tokens)
+        group_guids = get_group_uuids_by_names(group_names)
+
+        if query_service is None:
+            return group_guids, error_response(
+                error_code="QUERY_SERVICE_UNAVAILABLE",
+                message="Query service not configured for why_it_matters_to_client",
+                recovery_strategy="Ensure MCP server initializes QueryService and passes it to client tools.",
+                details={"client_guid": client_guid, "document_guid": document_guid},
+            )
+
+        if llm is None:
+            return group_guids, error_response(
+                error_code="LLM_SERVICE_UNAVAILABLE",
+                message="LLM service not configured",
+                recovery_strategy="Configure OpenRouter key in Vault (gofr/config/api-keys/openrouter) and restart the service.",
+                details={"client_guid": client_guid, "document_guid": document_guid},
+            )
+
+        # Validate client exists and is permitted
+        client_node = graph_index.get_node(NodeLabel.CLIENT, client_guid)
+        if not client_node:
+            return group_guids, error_response(
+                error_code="CLIENT_NOT_FOUND",
+                message=f"Client not found: {client_guid}",
+                recovery_strategy="Call list_clients to find valid client GUIDs, or create_client to create one.",
+                details={"client_guid": client_guid},
+            )
+
+        if client_node.properties.get("status") == "defunct":
+            return group_guids, error_response(
+                error_code="CLIENT_DEFUNCT",
+                message="Client is defunct and cannot receive news",
+                recovery_strategy="Restore the client or select an active client.",
+                details={
+                    "client_guid": client_guid,
+                    "defunct_at": client_node.properties.get("defunct_at"),
+                    "defunct_reason": client_node.properties.get("defunct_reason"),
+                },
+            )
+        return group_guids, None
+
+    def _why_it_matters_response(
+        client_guid: str,
+        document_guid: str,
+        augmentation: dict[str, str] | None = None,
+        error: Exception | None = None,
+    ) -> ToolResponse:
+        if error is not None:
             return error_response(
                 error_code="WHY_IT_MATTERS_FAILED",
-                message=f"Failed to generate why/summary: {e!s}",
+                message=f"Failed to generate why/summary: {error!s}",
                 recovery_strategy="Verify client/document access and confirm LLM service is configured.",
                 details={"client_guid": client_guid, "document_guid": document_guid},
             )
+        return success_response(
+            data={
+                "client_guid": client_guid,
+                "document_guid": document_guid,
+                **(augmentation or {}),
+            },
+            message="Generated client-specific story augmentation",
+        )
+
+    def why_it_matters_to_client(
+        client_guid: Annotated[str, Field(
+            min_length=36,
+            max_length=36,
+            pattern=r"^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$",
+            description="UUID of the client",
+            examples=["550e8400-e29b-41d4-a716-446655440000"],
+        )],
+        document_guid: Annotated[str, Field(
+            min_length=36,
+            max_length=36,
+            pattern=r"^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$",
+            description="UUID of the document",
+            examples=["550e8400-e29b-41d4-a716-446655440000"],
+        )],
+        auth_tokens: Annotated[list[str] | None, Field(
+            default=None,
+            description="JWT tokens for authentication (pass via API when headers not available)",
+        )] = None,
+    ) -> ToolResponse:
+        """Generate LLM why/summary for a single story and client."""
+        try:
+            group_guids, error = _why_it_matters_preflight(client_guid, document_guid, auth_tokens, llm_service)
+            if error is not None:
+                return error
+            assert query_service is not None  # nosec B101 - checked by preflight
+            augmentation = query_service.why_it_matters_to_client(
+                client_guid=client_guid,
+                document_guid=document_guid,
+                group_guids=group_guids,
+                llm_service=llm_service,
+            )
+            return _why_it_matters_response(client_guid, document_guid, augmentation)
+        except Exception as e:
+            return _why_it_matters_response(client_guid, document_guid, error=e)
+
+    @functools.wraps(why_it_matters_to_client)
+    async def why_it_matters_to_client_async(
+        client_guid: str,
+        document_guid: str,
+        auth_tokens: list[str] | None = None,
+    ) -> ToolResponse:
+        """Generate LLM why/summary for a single story and client."""
+        try:
+            # Group/graph checks block on Neo4j; only the LLM call is awaited on the loop
+            group_guids, error = await asyncio.to_thread(
+                _why_it_matters_preflight, client_guid, document_guid, auth_tokens, async_llm_service
+            )
+            if error is not None:
+                return error
+            assert query_service is not None and async_llm_service is not None  # nosec B101 - checked by preflight
+            augmentation = await query_service.awhy_it_matters_to_client(
+                client_guid=client_guid,
+                document_guid=document_guid,
+                group_guids=group_guids,
+                llm_service=async_llm_service,
+            )
+            return _why_it_matters_response(client_guid, document_guid, augmentation)
+        except Exception as e:
+            return _why_it_matters_response(client_guid, document_guid, error=e)
+
+    # The native async variant waits on the LLM without holding a worker thread
+    mcp.tool(
+        name="why_it_matters_to_client",
+        description=(
+            "LLM augmentation for a specific (client, document) pair. "
+            "RETURNS: (1) <=30 words why it matters to the client, (2) <=30 words story summary. "
+            "USE FOR: turning a shortlisted story into a client-ready blurb."
+        ),
+    )(
+        why_it_matters_to_client_async if async_llm_service is not None else why_it_matters_to_client
+    )
 
     @mcp.tool(
         name="add_to_portfolio",
@@ -1077,7 +1343,7 @@ def register_client_tools(
                 portfolio_guid = record["portfolio_guid"]
             
             # Resolve instrument (look up by ticker, create if missing)
-            instrument_guid = _resolve_instrument_guid(graph_index, ticker)
+            instrument_guid = _resolve_instrument_guid(graph_index, ticker, entity_cache=entity_cache)
 
             # Add holding
             graph_index.add_holding(
@@ -1088,6 +1354,7 @@ def register_client_tools(
                 avg_cost=avg_cost,
             )
             
+            _invalidate_client_feeds(client_guid)
             return success_response(
                 data={
                     "ticker": ticker.upper(),
@@ -1171,7 +1438,7 @@ def register_client_tools(
                 watchlist_guid = record["watchlist_guid"]
             
             # Resolve instrument (look up by ticker, create if missing)
-            instrument_guid = _resolve_instrument_guid(graph_index, ticker)
+            instrument_guid = _resolve_instrument_guid(graph_index, ticker, entity_cache=entity_cache)
 
             # Add to watchlist (WATCHES relationship)
             props: dict[str, Any] = {}
@@ -1187,6 +1454,7 @@ def register_client_tools(
                 props,
             )
             
+            _invalidate_client_feeds(client_guid)
             return success_response(
                 data={
                     "ticker": ticker.upper(),
@@ -1531,10 +1799,9 @@ def register_client_tools(
                                WHEN cp.mandate_themes IS NULL THEN 0
                                ELSE size(cp.mandate_themes)
                            END AS mandate_themes_len,
-                           CASE
-                               WHEN cp.mandate_embedding IS NULL THEN 0
-                               ELSE size(cp.mandate_embedding)
-                           END AS mandate_embedding_len,
+                           coalesce(
+                               cp.mandate_embedding_dim, size(cp.mandate_embedding), 0
+                           ) AS mandate_embedding_len,
                            cp.horizon AS horizon,
                            cp.esg_constrained AS esg_constrained,
                            cp.restrictions AS restrictions_json,
@@ -2243,6 +2510,11 @@ def register_client_tools(
                     )
 
                 # Update profile node properties
+                store_embedding: list[float] | None = None
+                if mandate_store is not None and "mandate_embedding" in updates_profile:
+                    # The vector goes to the mandate store; the node keeps its length
+                    store_embedding = updates_profile.pop("mandate_embedding")
+                    updates_profile["mandate_embedding_dim"] = len(store_embedding)
                 if updates_profile:
                     if "mandate_embedding" in updates_profile:
                         emb = updates_profile.get("mandate_embedding")
@@ -2253,22 +2525,35 @@ def register_client_tools(
                             mandate_embedding_len=emb_len,
                         )
                     set_clauses = ", ".join([f"cp.{k} = ${k}" for k in updates_profile])
+                    remove_clause = "REMOVE cp.mandate_embedding" if store_embedding is not None else ""
                     query = f"""
                         MATCH (c:Client {{guid: $client_guid}})-[:HAS_PROFILE]->(cp:ClientProfile)
                         SET {set_clauses}
+                        {remove_clause}
+                        RETURN cp.guid AS profile_guid
                         """  # type: ignore[assignment]
-                    session.run(
+                    profile_record = session.run(
                         query,  # type: ignore[arg-type]
                         client_guid=client_guid,
                         **updates_profile,
-                    )
+                    ).single()
+                    if store_embedding is not None and profile_record and profile_record["profile_guid"]:
+                        if store_embedding:
+                            mandate_store.put(profile_record["profile_guid"], store_embedding)
+                        else:
+                            mandate_store.delete(profile_record["profile_guid"])
+                        logger.info(
+                            "Updating mandate embedding in mandate store",
+                            client_guid=client_guid,
+                            mandate_embedding_len=len(store_embedding),
+                        )
 
                 # Handle benchmark update (creates/updates relationship)
                 if benchmark is not None:
                     changes.append("benchmark")
                     # Resolve instrument (look up by ticker, create if missing)
                     instrument_guid = _resolve_instrument_guid(
-                        graph_index, benchmark, instrument_type="ETF",
+                        graph_index, benchmark, instrument_type="ETF", entity_cache=entity_cache,
                     )
 
                     # Remove old benchmark relationship and create new one
@@ -2317,6 +2602,7 @@ def register_client_tools(
                         details={"client_guid": client_guid},
                     )
 
+            _invalidate_client_feeds(client_guid)
             return success_response(
                 data={
                     "client_guid": updated["client_guid"],
@@ -2463,6 +2749,7 @@ def register_client_tools(
                 count_record = count_result.single()
                 remaining = count_record["remaining"] if count_record else 0
 
+            _invalidate_client_feeds(client_guid)
             return success_response(
                 data={
                     "client_guid": client_guid,
@@ -2596,6 +2883,7 @@ def register_client_tools(
                 count_record = count_result.single()
                 remaining = count_record["remaining"] if count_record else 0
 
+            _invalidate_client_feeds(client_guid)
             return success_response(
                 data={
                     "client_guid": client_guid,
@@ -2676,6 +2964,7 @@ def register_client_tools(
                         details={"client_guid": client_guid},
                     )
 
+            _invalidate_client_feeds(client_guid)
             return success_response(
                 data={
                     "client_guid": record["client_guid"],
@@ -2743,6 +3032,7 @@ def register_client_tools(
                         details={"client_guid": client_guid},
                     )
 
+            _invalidate_client_feeds(client_guid)
             return success_response(
                 data={
                     "client_guid": record["client_guid"],
@@ -2835,6 +3125,7 @@ def register_client_tools(
                         group_guid,
                     )
 
+            _invalidate_client_feeds(client_guid)
             return success_response(
                 data={
                     "client_guid": record["client_guid"],
@@ -2916,6 +3207,7 @@ def register_client_tools(
                 client_type,
             )
 
+            _invalidate_client_feeds(client_guid)
             return success_response(
                 data={
                     "client_guid": client_guid,
@@ -3085,6 +3377,7 @@ def register_client_tools(
                     group_guid,
                 )
 
+            _invalidate_client_feeds(client_guid)
             return success_response(
                 data={
                     "client_guid": client_guid,
@@ -3153,6 +3446,7 @@ def register_client_tools(
                         details={"client_guid": client_guid},
                     )
 
+            _invalidate_client_feeds(client_guid)
             return success_response(
                 data={"client_guid": record["client_guid"]},
                 message=f"Client deleted: {client_guid}",
@@ -3164,3 +3458,77 @@ def register_client_tools(
                 recovery_strategy="Run health_check to verify Neo4j connectivity.",
                 details={"client_guid": client_guid},
             )
+
+
+def _register_client_matches_tool(
+    mcp: FastMCP,
+    graph_index: GraphIndex,
+    client_matcher: "ClientMatcher",
+) -> None:
+    """Register get_client_matches (reads the ingest-time client inboxes)."""
+
+    @mcp.tool(
+        name="get_client_matches",
+        description=(
+            "Get documents matched to a client at ingest time, newest first. "
+            "USE FOR: 'What has come in for Citadel since I last looked?' without recomputing a feed. "
+            "MATCHED BY: holdings (DIRECT_HOLDING), watchlist (WATCHLIST) and mandate similarity (VECTOR). "
+            "NOTE: Only documents ingested since the server started; use get_top_client_news for a full ranked feed. "
+            "RETURNS: Matches with document_guid, title, score, reasons, matched tickers and impact."
+        ),
+    )
+    def get_client_matches(
+        client_guid: Annotated[str, Field(
+            min_length=36,
+            max_length=36,
+            pattern=r"^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$",
+            description="UUID of the client",
+            examples=["550e8400-e29b-41d4-a716-446655440000"],
+        )],
+        limit: Annotated[int, Field(
+            default=20,
+            ge=1,
+            le=200,
+            description="Maximum matches to return (default: 20, max: 200)",
+        )] = 20,
+        auth_tokens: Annotated[list[str] | None, Field(
+            default=None,
+            description="JWT tokens for authentication (pass via API when headers not available)",
+        )] = None,
+    ) -> ToolResponse:
+        """Read a client's inbox of ingest-time matches.
+
+        Limited to documents in groups you have permission to access.
+
+        Errors:
+            - CLIENT_NOT_FOUND: Unknown client
+        """
+        try:
+            group_names = resolve_permitted_groups(auth_tokens=auth_tokens)
+            group_guids = get_group_uuids_by_names(group_names)
+
+            if not graph_index.get_node(NodeLabel.CLIENT, client_guid):
+                return error_response(
+                    error_code="CLIENT_NOT_FOUND",
+                    message=f"Client not found: {client_guid}",
+                    recovery_strategy="Call list_clients to find valid client GUIDs, or create_client to create one.",
+                    details={"client_guid": client_guid},
+                )
+
+            matches = client_matcher.get_matches(client_guid, group_guids=group_guids, limit=limit)
+            return success_response(
+                data={
+                    "client_guid": client_guid,
+                    "matches": [m.to_dict() for m in matches],
+                    "total_count": len(matches),
+                },
+                message=f"Retrieved {len(matches)} matches for client",
+            )
+
+        except Exception as e:
+            return error_response(
+                error_code="CLIENT_MATCHES_FAILED",
+                message=f"Failed to read client matches: {e!s}",
+                recovery_strategy="Verify client with get_client_profile. Run health_check to check the client matcher.",
+                details={"client_guid": client_guid},
+            )
@@ -13,9 +13,15 @@ from mcp.server.fastmcp import FastMCP
 from mcp.types import EmbeddedResource, ImageContent, TextContent
 
 if TYPE_CHECKING:
+    from app.services.client_matcher import ClientMatcher
     from app.services.embedding_index import EmbeddingIndex
+    from app.services.entity_cache import EntityResolutionCache
+    from app.services.feed_cache import FeedCache
     from app.services.graph_index import GraphIndex
+    from app.services.ingest_queue import IngestJobQueue
     from app.services.llm_service import LLMService
+    from app.services.mandate_embedding_store import MandateEmbeddingStore
+    from app.tools.tool_executor import ToolExecutor
 
 # Type alias for MCP tool response
 ToolResponse = Sequence[TextContent | ImageContent | EmbeddedResource]
@@ -26,6 +32,12 @@ def register_health_tools(
     graph_index: "GraphIndex | None" = None,
     embedding_index: "EmbeddingIndex | None" = None,
     llm_service: "LLMService | None" = None,
+    feed_cache: "FeedCache | None" = None,
+    entity_cache: "EntityResolutionCache | None" = None,
+    tool_executor: "ToolExecutor | None" = None,
+    ingest_queue: "IngestJobQueue | None" = None,
+    mandate_store: "MandateEmbeddingStore | None" = None,
+    client_matcher: "ClientMatcher | None" = None,
 ) -> None:
     """Register health check tools with the MCP server.
     
@@ -34,6 +46,12 @@ def register_health_tools(
         graph_index: GraphIndex instance for Neo4j connectivity
         embedding_index: EmbeddingIndex instance for ChromaDB connectivity
         llm_service: LLMService instance for LLM API connectivity
+        feed_cache: FeedCache whose hit/miss counters are reported
+        entity_cache: EntityResolutionCache whose hit/miss counters are reported
+        tool_executor: ToolExecutor whose pool and queue counters are reported
+        ingest_queue: IngestJobQueue whose job counts are reported
+        mandate_store: MandateEmbeddingStore whose size and hit counters are reported
+        client_matcher: ClientMatcher whose client and inbox counters are reported
     """
 
     @mcp.tool(
@@ -56,6 +74,7 @@ def register_health_tools(
         Returns:
             status: Overall health status (healthy, degraded, unhealthy)
             services: Individual service statuses with details
+            caches: Cache counters (informational, not part of status)
             timestamp: When the check was performed
         """
         from datetime import datetime, timezone
@@ -105,6 +124,20 @@ def register_health_tools(
                 "status": overall_status,
                 "message": message,
                 "services": services,
+                "caches": {
+                    "feed": _component_stats("Feed cache", feed_cache),
+                    "query_embedding": _component_stats(
+                        "Query embedding cache", getattr(embedding_index, "query_cache", None)
+                    ),
+                    "chunk_embeddings": _component_stats(
+                        "Chunk embedding store", getattr(embedding_index, "chunk_store", None)
+                    ),
+                    "entity_resolution": _component_stats("Entity resolution cache", entity_cache),
+                    "mandate_embeddings": _component_stats("Mandate embedding store", mandate_store),
+                },
+                "tool_execution": _component_stats("Tool executor", tool_executor),
+                "ingest_queue": _component_stats("Ingest queue", ingest_queue),
+                "client_matcher": _component_stats("Client matcher", client_matcher),
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
         )
@@ -239,3 +272,13 @@ def _check_llm(llm_service: "LLMService | None") -> dict[str, Any]:
             "message": f"LLM error: {e!s}",
             "configured": False,
         }
+
+
+def _component_stats(label: str, component: Any) -> dict[str, Any]:
+    """Report an optional component's stats() counters (label names it in errors)."""
+    if component is None:
+        return {"enabled": False}
+    try:
+        return {"enabled": True, **component.stats()}
+    except Exception as e:
+        return {"enabled": True, "message": f"{label} error: {e!s}"}
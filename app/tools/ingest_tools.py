@@ -16,6 +16,11 @@ Document Deletion:
     - Admin-only operation for complete document removal
     - Removes from document store, embedding index, and graph index
     - Requires explicit confirmation parameter for safety
+
+Asynchronous Ingest (when an ingest queue is configured):
+    - ingest_document_async queues the document and returns a job id at once
+    - get_ingest_status / list_ingest_jobs report job progress and results
+    - Jobs are visible to members of the group they write to (admins see all)
 """
 
 from __future__ import annotations
@@ -33,26 +38,38 @@ from app.services.document_store import DocumentNotFoundError
 from app.services.group_service import (
     AdminAccessDeniedError,
     get_group_uuid_by_name,
+    get_group_uuids_by_names,
     require_admin,
     resolve_permitted_groups,
     resolve_write_group,
 )
+from app.services.ingest_queue import IngestJobStatus
 from app.services.ingest_service import (
     IngestError,
     IngestService,
     SourceValidationError,
     WordCountError,
+    count_words,
 )
 
 if TYPE_CHECKING:
-    pass
+    from app.services.ingest_queue import IngestJobQueue
 
 # Type alias for MCP tool response
 ToolResponse = Sequence[TextContent | ImageContent | EmbeddedResource]
 
 
-def register_ingest_tools(mcp: FastMCP, ingest_service: IngestService) -> None:
-    """Register ingest tools with the MCP server."""
+def register_ingest_tools(
+    mcp: FastMCP,
+    ingest_service: IngestService,
+    ingest_queue: IngestJobQueue | None = None,
+) -> None:
+    """Register ingest tools with the MCP server.
+
+    The asynchronous ingest tools are registered only when ingest_queue is given.
+    """
+    if ingest_queue is not None:
+        _register_ingest_queue_tools(mcp, ingest_service, ingest_queue)
 
     @mcp.tool(
         name="ingest_document",
@@ -328,8 +345,6 @@ def register_ingest_tools(mcp: FastMCP, ingest_service: IngestService) -> None:
                 issues.append(f"Source not found: {source_guid}")
 
             # Step 2: Validate word count
-            from app.services.ingest_service import count_words
-
             word_count = count_words(content)
             validation_result["word_count"] = word_count
             max_word_count = ingest_service.max_word_count
@@ -581,3 +596,232 @@ def register_ingest_tools(mcp: FastMCP, ingest_service: IngestService) -> None:
                 message=f"Unexpected error during deletion: {e!s}",
                 recovery_strategy="Run health_check to verify services. Check input parameters and try again.",
             )
+
+
+def _register_ingest_queue_tools(
+    mcp: FastMCP,
+    ingest_service: IngestService,
+    ingest_queue: IngestJobQueue,
+) -> None:
+    """Register ingest_document_async, get_ingest_status and list_ingest_jobs."""
+
+    def visible_group_guids(auth_tokens: list[str] | None) -> list[str] | None:
+        """Group UUIDs whose jobs the caller may see (None: every group, for admins)."""
+        group_names = resolve_permitted_groups(auth_tokens=auth_tokens)
+        if "admin" in group_names:
+            return None
+        return get_group_uuids_by_names(group_names)
+
+    @mcp.tool(
+        name="ingest_document_async",
+        description=(
+            "Queue a news article for ingestion and return immediately. "
+            "USE FOR: Feed pushers and bulk loads that cannot hold a request open for LLM extraction. "
+            "WORKFLOW: list_sources -> ingest_document_async -> get_ingest_status (poll job_id). "
+            "SAME INPUT AS: ingest_document, plus an optional idempotency_key. "
+            "REQUIRES AUTH: Must have a valid token. "
+            "IDEMPOTENT: Re-sending the same idempotency_key returns the existing job. "
+            "RETURNS: job_id, document_guid (assigned now, stored when the job succeeds), status."
+        ),
+    )
+    def ingest_document_async(
+        title: Annotated[str, Field(
+            min_length=1,
+            max_length=500,
+            description="Article headline/title",
+        )],
+        content: Annotated[str, Field(
+            min_length=10,
+            description="Full article text content",
+        )],
+        source_guid: Annotated[str, Field(
+            min_length=36,
+            max_length=36,
+            pattern=r"^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$",
+            description="UUID of the source (use list_sources to find valid sources)",
+            examples=["550e8400-e29b-41d4-a716-446655440000"],
+        )],
+        language: Annotated[str | None, Field(
+            default=None,
+            min_length=2,
+            max_length=5,
+            description="ISO 639-1 language code (en/zh/ja) - auto-detected if omitted",
+            examples=["en", "zh", "ja"],
+        )] = None,
+        metadata: Annotated[dict[str, Any] | None, Field(
+            default=None,
+            description="Optional extra attributes as key-value pairs",
+        )] = None,
+        idempotency_key: Annotated[str | None, Field(
+            default=None,
+            min_length=1,
+            max_length=200,
+            description="Caller's unique id for this document (e.g. feed item id); repeats return the first job",
+        )] = None,
+        auth_tokens: Annotated[list[str] | None, Field(
+            default=None,
+            description="JWT tokens for authentication (pass via API when headers not available)",
+        )] = None,
+    ) -> ToolResponse:
+        """Queue a document for background ingestion.
+
+        The document is written to the group of your authentication token,
+        as with ingest_document. Source and extraction errors are reported
+        in the job status.
+
+        Returns:
+            job_id: Job to poll with get_ingest_status
+            document_guid: GUID the document will be stored under
+            status: "queued" (or the existing job's status for a repeated idempotency_key)
+            created: False when an existing job was returned
+        """
+        try:
+            group_name = resolve_write_group(auth_tokens=auth_tokens)
+            session_logger.info(
+                f"Tool call: ingest_document_async, title='{title[:50]}...', source={source_guid}, group={group_name}"
+            )
+            if group_name is None:
+                return error_response(
+                    error_code="AUTH_REQUIRED",
+                    message="Authentication required for document ingestion",
+                    recovery_strategy="Pass auth_tokens parameter or include Authorization header with Bearer token.",
+                )
+
+            group_guid = get_group_uuid_by_name(group_name)
+            if group_guid is None:
+                return error_response(
+                    error_code="INVALID_GROUP",
+                    message=f"Group '{group_name}' not found",
+                    recovery_strategy="Verify the group exists and your token has access to it.",
+                )
+
+            # Cheap check up front so oversize documents are never queued
+            word_count = count_words(content)
+            if word_count > ingest_service.max_word_count:
+                raise WordCountError(word_count, ingest_service.max_word_count)
+
+            job, created = ingest_queue.enqueue(
+                title=title,
+                content=content,
+                source_guid=source_guid,
+                group_guid=group_guid,
+                language=language,
+                metadata=metadata,
+                idempotency_key=idempotency_key,
+            )
+            return success_response(
+                data={**job.to_dict(), "created": created},
+                message="Document queued for ingestion" if created else "Document already queued (same idempotency_key)",
+            )
+
+        except WordCountError as e:
+            return error_response(
+                error_code="WORD_COUNT_EXCEEDED",
+                message=str(e),
+                recovery_strategy="Reduce content to under 20,000 words or split into multiple documents.",
+            )
+
+        except Exception as e:
+            session_logger.error(f"ingest_document_async: Unexpected error: {e}", exc_info=True)
+            return error_response(
+                error_code="INGEST_QUEUE_ERROR",
+                message=f"Could not queue document: {e!s}",
+                recovery_strategy="Run health_check to verify the ingest queue. Retry with the same idempotency_key.",
+            )
+
+    @mcp.tool(
+        name="get_ingest_status",
+        description=(
+            "Get the status of an asynchronous ingest job. "
+            "INPUT FROM: ingest_document_async (job_id). "
+            "STATUSES: queued, running, succeeded, failed (queued again between retries). "
+            "RETURNS: Job status, attempts, last error, and the ingest result "
+            "(document guid, success/duplicate, language, word_count) once finished."
+        ),
+    )
+    def get_ingest_status(
+        job_id: Annotated[str, Field(
+            min_length=36,
+            max_length=36,
+            description="Job ID returned by ingest_document_async",
+        )],
+        auth_tokens: Annotated[list[str] | None, Field(
+            default=None,
+            description="JWT tokens for authentication (pass via API when headers not available)",
+        )] = None,
+    ) -> ToolResponse:
+        """Report one ingest job.
+
+        Errors:
+            - JOB_NOT_FOUND: Unknown job, or a job of a group you cannot access
+        """
+        try:
+            group_guids = visible_group_guids(auth_tokens)
+            job = ingest_queue.get(job_id)
+            if job is None or (group_guids is not None and job.group_guid not in group_guids):
+                return error_response(
+                    error_code="JOB_NOT_FOUND",
+                    message=f"Ingest job {job_id} not found",
+                    recovery_strategy="Check the job_id returned by ingest_document_async, or call list_ingest_jobs.",
+                )
+            return success_response(data=job.to_dict(), message=f"Ingest job {job.status.value}")
+
+        except Exception as e:
+            return error_response(
+                error_code="INGEST_QUEUE_ERROR",
+                message=f"Could not read ingest job: {e!s}",
+                recovery_strategy="Run health_check to verify the ingest queue.",
+            )
+
+    @mcp.tool(
+        name="list_ingest_jobs",
+        description=(
+            "List recent asynchronous ingest jobs for your groups, newest first. "
+            "USE FOR: Checking a feed's backlog or finding failed jobs. "
+            "FILTER: status (queued/running/succeeded/failed). "
+            "RETURNS: Jobs with status, attempts, document_guid and last error."
+        ),
+    )
+    def list_ingest_jobs(
+        status: Annotated[str | None, Field(
+            default=None,
+            description="Only jobs in this status",
+            examples=["queued", "failed"],
+        )] = None,
+        limit: Annotated[int, Field(
+            default=20,
+            ge=1,
+            le=200,
+            description="Maximum jobs to return",
+        )] = 20,
+        auth_tokens: Annotated[list[str] | None, Field(
+            default=None,
+            description="JWT tokens for authentication (pass via API when headers not available)",
+        )] = None,
+    ) -> ToolResponse:
+        """List ingest jobs visible to the caller."""
+        try:
+            try:
+                status_filter = IngestJobStatus(status) if status else None
+            except ValueError:
+                return error_response(
+                    error_code="INVALID_STATUS",
+                    message=f"Unknown job status '{status}'",
+                    recovery_strategy=f"Use one of: {', '.join(s.value for s in IngestJobStatus)}.",
+                )
+            jobs = ingest_queue.list_jobs(
+                group_guids=visible_group_guids(auth_tokens),
+                status=status_filter,
+                limit=limit,
+            )
+            return success_response(
+                data={"jobs": [job.to_dict() for job in jobs], "count": len(jobs)},
+                message=f"Found {len(jobs)} ingest jobs",
+            )
+
+        except Exception as e:
+            return error_response(
+                error_code="INGEST_QUEUE_ERROR",
+                message=f"Could not list ingest jobs: {e!s}",
+                recovery_strategy="Run health_check to verify the ingest queue.",
+            )
@@ -279,6 +279,8 @@ def register_query_tools(
                 results: Ranked articles with title, snippet, scores, source, timestamps
                 total_found: Total matches
                 execution_time_ms: Query time
+                retrieval_rounds: Similarity searches issued
+                candidates_scanned: Candidate chunks examined
             """
             try:
                 # Get permitted groups from explicit tokens or context header
@@ -373,6 +375,8 @@ def register_query_tools(
                         "total_found": response.total_found,
                         "filters_applied": response.filters_applied,
                         "execution_time_ms": response.execution_time_ms,
+                        "retrieval_rounds": response.retrieval_rounds,
+                        "candidates_scanned": response.candidates_scanned,
                     }
                 )
 
@@ -0,0 +1,283 @@
+"""Tool Executor.
+
+Runs the (synchronous) MCP tool functions on worker threads so a slow tool
+no longer blocks the server's event loop: while one ingest waits on LLM
+extraction, health checks and queries keep being served.
+
+- Two thread pools: one for LLM-bound tools (extraction, embeddings, LLM
+  augmentation), one for tools that only talk to Neo4j/ChromaDB/files, so
+  reads never wait behind a burst of ingests for a free worker
+- Optional per-tool concurrency limits; callers over the limit wait on the
+  event loop without holding a worker
+- Per-tool and per-pool counters (running, queued, max queue depth, wait
+  time) for health_check
+- Tools that are already ``async def`` run on the event loop, with the same
+  limits and counters
+
+Tools are wrapped at registration: pass ``executor.bind(mcp)`` to a
+``register_*_tools`` function in place of the FastMCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
+__all__ = [
+    "DB_POOL",
+    "LLM_BOUND_TOOLS",
+    "LLM_POOL",
+    "ToolExecutor",
+    "create_tool_executor",
+]
+
+LLM_POOL = "llm"
+DB_POOL = "db"
+
+# Tools that wait on the LLM API (extraction, embeddings, completions)
+LLM_BOUND_TOOLS = frozenset(
+    {
+        "ingest_document",
+        "validate_document",
+        "query_documents",
+        "why_it_matters_to_client",
+        "create_client",
+        "update_client_profile",
+    }
+)
+
+# Each synchronous ingest holds an LLM-pool worker for a whole extraction;
+# capping them leaves the rest of that pool to query_documents and the other
+# LLM-bound tools. Bulk loads should go through the ingest queue, whose
+# workers are not counted here (IngestService serialises commits either way).
+DEFAULT_TOOL_LIMITS: dict[str, int] = {"ingest_document": 1}
+
+
+@dataclass
+class _ToolStats:
+    pool: str
+    limit: int | None = None
+    running: int = 0
+    queued: int = 0
+    max_queued: int = 0
+    calls: int = 0
+    errors: int = 0
+    wait_seconds: float = 0.0
+    run_seconds: float = 0.0
+
+
+class ToolExecutor:
+    """Runs MCP tools on sized worker pools with per-tool limits and counters.
+
+    Attributes:
+        pool_sizes: Worker threads per pool (LLM_POOL, DB_POOL)
+        tool_limits: Maximum concurrent calls per tool name
+    """
+
+    def __init__(
+        self,
+        llm_workers: int = 8,
+        db_workers: int = 16,
+        tool_limits: Mapping[str, int] | None = None,
+        llm_bound_tools: frozenset[str] = LLM_BOUND_TOOLS,
+    ) -> None:
+        self.pool_sizes = {LLM_POOL: max(1, llm_workers), DB_POOL: max(1, db_workers)}
+        self.tool_limits = {name: limit for name, limit in (tool_limits or {}).items() if limit > 0}
+        self._llm_bound_tools = llm_bound_tools
+        self._pools = {
+            pool: ThreadPoolExecutor(max_workers=size, thread_name_prefix=f"gofr-iq-tool-{pool}")
+            for pool, size in self.pool_sizes.items()
+        }
+        self._lock = threading.Lock()
+        self._stats: dict[str, _ToolStats] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def pool_for(self, tool_name: str) -> str:
+        return LLM_POOL if tool_name in self._llm_bound_tools else DB_POOL
+
+    def wrap(self, tool_name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Return an async version of a tool function that runs on its pool.
+
+        The wrapper keeps the function's name, docstring and signature
+        (FastMCP builds the tool's input schema from them).
+        """
+        stats = self._stats_for(tool_name)
+        limit = self.tool_limits.get(tool_name)
+        is_async = inspect.iscoroutinefunction(fn)
+        pool = self._pools[stats.pool]
+
+        @functools.wraps(fn)
+        async def run_tool(*args: Any, **kwargs: Any) -> Any:
+            queued_at = time.perf_counter()
+            with self._lock:
+                stats.queued += 1
+                stats.max_queued = max(stats.max_queued, stats.queued)
+            semaphore = self._semaphore(tool_name, limit) if limit else None
+            started = False
+
+            def start() -> None:
+                nonlocal started
+                with self._lock:
+                    stats.queued -= 1
+                    stats.running += 1
+                    stats.wait_seconds += time.perf_counter() - queued_at
+                started = True
+
+            def call() -> Any:
+                start()
+                return fn(*args, **kwargs)
+
+            try:
+                if semaphore is not None:
+                    await semaphore.acquire()
+                try:
+                    if is_async:
+                        start()
+                        return await fn(*args, **kwargs)
+                    # Carry context variables (e.g. request auth) onto the worker thread
+                    context = contextvars.copy_context()
+                    return await asyncio.get_running_loop().run_in_executor(
+                        pool, functools.partial(context.run, call)
+                    )
+                finally:
+                    if semaphore is not None:
+                        semaphore.release()
+            except Exception:
+                with self._lock:
+                    stats.errors += 1
+                raise
+            finally:
+                with self._lock:
+                    if started:
+                        stats.running -= 1
+                        stats.calls += 1
+                        stats.run_seconds += time.perf_counter() - queued_at
+                    else:
+                        # Cancelled while waiting for a slot
+                        stats.queued -= 1
+
+        return run_tool
+
+    def bind(self, mcp: FastMCP) -> _ExecutorBoundMCP:
+        """Wrap a FastMCP server so every tool registered through it runs on this executor."""
+        return _ExecutorBoundMCP(mcp, self)
+
+    def stats(self) -> dict[str, Any]:
+        """Pool and per-tool counters for health_check."""
+        with self._lock:
+            pools: dict[str, dict[str, Any]] = {
+                pool: {"workers": size, "running": 0, "queued": 0} for pool, size in self.pool_sizes.items()
+            }
+            tools: dict[str, dict[str, Any]] = {}
+            for name, s in sorted(self._stats.items()):
+                pools[s.pool]["running"] += s.running
+                pools[s.pool]["queued"] += s.queued
+                if not s.calls and not s.running and not s.queued:
+                    continue
+                finished = max(1, s.calls)
+                tools[name] = {
+                    "pool": s.pool,
+                    "limit": s.limit,
+                    "running": s.running,
+                    "queued": s.queued,
+                    "max_queued": s.max_queued,
+                    "calls": s.calls,
+                    "errors": s.errors,
+                    "avg_wait_ms": round(1000 * s.wait_seconds / finished, 2),
+                    "avg_total_ms": round(1000 * s.run_seconds / finished, 2),
+                }
+            return {"pools": pools, "tools": tools}
+
+    def shutdown(self, wait: bool = False) -> None:
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait)
+
+    def _stats_for(self, tool_name: str) -> _ToolStats:
+        with self._lock:
+            stats = self._stats.get(tool_name)
+            if stats is None:
+                stats = _ToolStats(pool=self.pool_for(tool_name), limit=self.tool_limits.get(tool_name))
+                self._stats[tool_name] = stats
+            return stats
+
+    def _semaphore(self, tool_name: str, limit: int) -> asyncio.Semaphore:
+        # Created on first use so it belongs to the server's running loop
+        semaphore = self._semaphores.get(tool_name)
+        if semaphore is None:
+            semaphore = self._semaphores[tool_name] = asyncio.Semaphore(limit)
+        return semaphore
+
+    def __repr__(self) -> str:
+        return f"ToolExecutor(pools={self.pool_sizes}, tool_limits={self.tool_limits})"
+
+
+class _ExecutorBoundMCP:
+    """FastMCP stand-in whose ``tool()`` decorator wraps functions with a ToolExecutor."""
+
+    def __init__(self, mcp: FastMCP, executor: ToolExecutor) -> None:
+        self._mcp = mcp
+        self._executor = executor
+
+    def tool(self, name: str | None = None, **kwargs: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        register = self._mcp.tool(name=name, **kwargs)
+
+        def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+            register(self._executor.wrap(name or fn.__name__, fn))
+            # Return the plain function, as FastMCP does, for direct calls
+            return fn
+
+        return decorator
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._mcp, attr)
+
+
+def _parse_tool_limits(value: str) -> dict[str, int]:
+    """Parse ``name=limit,name=limit``; malformed items are ignored."""
+    limits: dict[str, int] = {}
+    for item in value.split(","):
+        name, _, limit = item.partition("=")
+        try:
+            limits[name.strip()] = int(limit)
+        except ValueError:
+            continue
+    return limits
+
+
+def create_tool_executor() -> ToolExecutor | None:
+    """Create a ToolExecutor from environment configuration.
+
+    Environment:
+        GOFR_IQ_TOOL_EXECUTOR: Set to 0/false/no to run tools on the event loop (default on)
+        GOFR_IQ_TOOL_LLM_WORKERS: Threads for LLM-bound tools (default 8)
+        GOFR_IQ_TOOL_DB_WORKERS: Threads for other tools (default 16)
+        GOFR_IQ_TOOL_CONCURRENCY: Per-tool limits, e.g. "ingest_document=2,query_documents=8"
+            (default "ingest_document=1"; 0 removes a limit)
+
+    Returns:
+        ToolExecutor, or None when disabled
+    """
+    if os.environ.get("GOFR_IQ_TOOL_EXECUTOR", "").lower() in ("0", "false", "no"):
+        return None
+    try:
+        llm_workers = int(os.environ.get("GOFR_IQ_TOOL_LLM_WORKERS", "8"))
+    except ValueError:
+        llm_workers = 8
+    try:
+        db_workers = int(os.environ.get("GOFR_IQ_TOOL_DB_WORKERS", "16"))
+    except ValueError:
+        db_workers = 16
+    tool_limits = {**DEFAULT_TOOL_LIMITS, **_parse_tool_limits(os.environ.get("GOFR_IQ_TOOL_CONCURRENCY", ""))}
+    return ToolExecutor(llm_workers=llm_workers, db_workers=db_workers, tool_limits=tool_limits)
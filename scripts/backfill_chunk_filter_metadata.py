@@ -0,0 +1,86 @@
+"""Backfill filterable metadata on existing ChromaDB chunks.
+
+Adds created_at_ts, impact_score, impact_tier, region and region_*/sector_*/company_*
+keys (see app.services.embedding_index.filterable_metadata) to chunks that
+were embedded before query filters were pushed into the Chroma where-clause.
+Values are derived from each chunk's existing metadata only. Idempotent.
+
+Run this before enabling GOFR_IQ_CHROMA_FILTER_PUSHDOWN on an existing
+collection.
+
+Usage:
+  uv run python scripts/backfill_chunk_filter_metadata.py --dry-run
+  uv run python scripts/backfill_chunk_filter_metadata.py --host gofr-chromadb --port 8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Ensure project imports resolve (same pattern as simulation runner)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "lib" / "gofr-common" / "src"))
+
+# Auto-load docker/.env if present
+_docker_env = PROJECT_ROOT / "docker" / ".env"
+if _docker_env.exists():
+    for line in _docker_env.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, val = line.partition("=")
+        os.environ.setdefault(key.strip(), val.strip())
+
+from app.config import get_config  # noqa: E402 - path modification required before import
+from app.logger import StructuredLogger  # noqa: E402 - path modification required before import
+from app.services.embedding_index import EmbeddingIndex  # noqa: E402 - path modification required before import
+
+
+logger = StructuredLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backfill filterable metadata on ChromaDB chunks")
+    parser.add_argument("--host", default=None, help="Override ChromaDB host")
+    parser.add_argument("--port", type=int, default=None, help="Override ChromaDB port")
+    parser.add_argument(
+        "--collection",
+        default=EmbeddingIndex.DEFAULT_COLLECTION,
+        help=f"Collection name (default: {EmbeddingIndex.DEFAULT_COLLECTION})",
+    )
+    parser.add_argument("--batch-size", type=int, default=500, help="Chunks per read/update round trip")
+    parser.add_argument("--dry-run", action="store_true", help="Count chunks to update without writing")
+    args = parser.parse_args()
+
+    config = get_config()
+    host = args.host or config.chroma_host
+    port = args.port or config.chroma_port
+    if not host:
+        print("ChromaDB host not configured (set GOFR_IQ_CHROMA_HOST or pass --host)", flush=True)
+        return 1
+
+    index = EmbeddingIndex(host=host, port=port, collection_name=args.collection)
+    total = index.count()
+    mode = "dry-run" if args.dry_run else "write"
+    print(f"Backfill chunks: {total} in {args.collection} at {host}:{port} ({mode})", flush=True)
+
+    t_start = time.time()
+    result = index.backfill_filter_metadata(batch_size=max(1, args.batch_size), dry_run=args.dry_run)
+    elapsed = time.time() - t_start
+
+    logger.info("chunk_filter_metadata_backfilled", collection=args.collection, dry_run=args.dry_run, **result)
+    verb = "would update" if args.dry_run else "updated"
+    print(
+        f"Backfill complete: {verb}={result['updated']}/{result['scanned']} in {elapsed:.1f}s",
+        flush=True,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,14 @@
 """Backfill mandate_themes and mandate_embedding for existing ClientProfile nodes.
 
 This is intended for simulation/demo environments and is idempotent.
+Embeddings are written to the mandate embedding store under --storage (the
+node keeps only ``cp.mandate_embedding_dim``), as the client tools do. With
+GOFR_IQ_MANDATE_EMBEDDING_STORE=0 they are written to the ClientProfile node.
 
 Usage:
   uv run python scripts/backfill_client_mandates.py --limit 50
   uv run python scripts/backfill_client_mandates.py --group-name group-simulation --limit 200
+  uv run python scripts/backfill_client_mandates.py --storage /data/storage
 """
 
 from __future__ import annotations
@@ -36,10 +40,12 @@ if not os.environ.get("GOFR_IQ_NEO4J_PASSWORD") and os.environ.get("NEO4J_PASSWO
 if not os.environ.get("GOFR_IQ_NEO4J_URI"):
     os.environ["GOFR_IQ_NEO4J_URI"] = "bolt://gofr-neo4j:7687"
 
-from app.logger import StructuredLogger
-from app.services.graph_index import GraphIndex
-from app.services.llm_service import create_llm_service
-from app.services.mandate_enrichment import extract_themes_from_mandate
+from app.config import get_config  # noqa: E402 - path modification required before import
+from app.logger import StructuredLogger  # noqa: E402 - path modification required before import
+from app.services.graph_index import GraphIndex  # noqa: E402 - path modification required before import
+from app.services.llm_service import create_llm_service  # noqa: E402 - path modification required before import
+from app.services.mandate_embedding_store import create_mandate_embedding_store  # noqa: E402 - path modification required before import
+from app.services.mandate_enrichment import extract_themes_from_mandate  # noqa: E402 - path modification required before import
 
 
 logger = StructuredLogger(__name__)
@@ -57,10 +63,17 @@ def main() -> int:
             "If omitted, backfills all ClientProfile nodes with mandate_text." 
         ),
     )
+    parser.add_argument(
+        "--storage",
+        default=None,
+        help="Storage directory (default: <project>/data/storage, as used by the MCP server)",
+    )
     parser.add_argument("--neo4j-uri", default=None, help="Override Neo4j bolt URI")
     parser.add_argument("--neo4j-password", default=None, help="Override Neo4j password")
     args = parser.parse_args()
 
+    storage_path = Path(args.storage) if args.storage else get_config().project_root / "data" / "storage"
+    mandate_store = create_mandate_embedding_store(storage_path / "mandate_embeddings")
     graph = GraphIndex(uri=args.neo4j_uri, password=args.neo4j_password)
     graph.init_schema()
 
@@ -71,7 +84,7 @@ def main() -> int:
                     """
                     MATCH (g:Group {name: $group_name})<-[:IN_GROUP]-(c:Client)-[:HAS_PROFILE]->(cp:ClientProfile)
                     WHERE cp.mandate_text IS NOT NULL AND trim(cp.mandate_text) <> ''
-                        AND (cp.mandate_themes IS NULL OR size(cp.mandate_themes) = 0 OR cp.mandate_embedding IS NULL)
+                        AND (cp.mandate_themes IS NULL OR size(cp.mandate_themes) = 0 OR (cp.mandate_embedding IS NULL AND cp.mandate_embedding_dim IS NULL))
                     RETURN c.name AS client_name, cp.guid AS guid, cp.mandate_text AS mandate_text
                     LIMIT $limit
                     """,
@@ -83,7 +96,7 @@ def main() -> int:
                     """
                     MATCH (c:Client)-[:HAS_PROFILE]->(cp:ClientProfile)
                     WHERE cp.mandate_text IS NOT NULL AND trim(cp.mandate_text) <> ''
-                        AND (cp.mandate_themes IS NULL OR size(cp.mandate_themes) = 0 OR cp.mandate_embedding IS NULL)
+                        AND (cp.mandate_themes IS NULL OR size(cp.mandate_themes) = 0 OR (cp.mandate_embedding IS NULL AND cp.mandate_embedding_dim IS NULL))
                     RETURN c.name AS client_name, cp.guid AS guid, cp.mandate_text AS mandate_text
                     LIMIT $limit
                     """,
@@ -128,7 +141,19 @@ def main() -> int:
                     guid=guid,
                     themes=themes_result.themes,
                 )
-                if embedding is not None:
+                if embedding is not None and mandate_store is not None:
+                    # The vector goes to the mandate store; the node keeps its length
+                    mandate_store.put(guid, embedding)
+                    session.run(
+                        """
+                        MATCH (cp:ClientProfile {guid: $guid})
+                        SET cp.mandate_embedding_dim = $dim
+                        REMOVE cp.mandate_embedding
+                        """,
+                        guid=guid,
+                        dim=len(embedding),
+                    )
+                elif embedding is not None:
                     session.run(
                         """
                         MATCH (cp:ClientProfile {guid: $guid})
@@ -0,0 +1,157 @@
+"""Move ClientProfile.mandate_embedding properties into the mandate embedding store.
+
+Copies every ``cp.mandate_embedding`` list property into
+{storage}/mandate_embeddings (see app.services.mandate_embedding_store), then
+replaces the property on the node with ``cp.mandate_embedding_dim``. Profile
+reads then no longer carry the vector over Bolt, and the VECTOR channel loads
+it from the store only when it is active.
+
+Idempotent: migrated profiles no longer have the property, so a second run
+finds nothing to do. Run it after upgrading, and again after any script that
+still writes the property (the simulation runner's mandate backfill, or
+backfill_client_mandates.py with GOFR_IQ_MANDATE_EMBEDDING_STORE=0). Until
+then, queries fall back to the property.
+
+Usage:
+  uv run python scripts/migrate_mandate_embeddings.py --dry-run
+  uv run python scripts/migrate_mandate_embeddings.py --storage /data/storage
+  uv run python scripts/migrate_mandate_embeddings.py --keep-properties
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Ensure project imports resolve (same pattern as simulation runner)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "lib" / "gofr-common" / "src"))
+
+# Auto-load docker/.env if present (bridge NEO4J_PASSWORD -> GOFR_IQ_NEO4J_PASSWORD)
+_docker_env = PROJECT_ROOT / "docker" / ".env"
+if _docker_env.exists():
+    for line in _docker_env.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, val = line.partition("=")
+        os.environ.setdefault(key.strip(), val.strip())
+
+# Bridge common env var names to GOFR_IQ_* names expected by GraphIndex
+if not os.environ.get("GOFR_IQ_NEO4J_PASSWORD") and os.environ.get("NEO4J_PASSWORD"):
+    os.environ["GOFR_IQ_NEO4J_PASSWORD"] = os.environ["NEO4J_PASSWORD"]
+if not os.environ.get("GOFR_IQ_NEO4J_URI"):
+    os.environ["GOFR_IQ_NEO4J_URI"] = "bolt://gofr-neo4j:7687"
+
+from app.config import get_config  # noqa: E402 - path modification required before import
+from app.logger import StructuredLogger  # noqa: E402 - path modification required before import
+from app.services.graph_index import GraphIndex  # noqa: E402 - path modification required before import
+from app.services.mandate_embedding_store import MandateEmbeddingStore  # noqa: E402 - path modification required before import
+
+
+logger = StructuredLogger(__name__)
+
+
+def _as_vector(value: object) -> list[float] | None:
+    """Coerce a stored property to a float list (None if it is not one)."""
+    if not isinstance(value, list):
+        return None
+    try:
+        return [float(v) for v in value]
+    except (TypeError, ValueError):
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Move ClientProfile mandate embeddings into the mandate embedding store")
+    parser.add_argument(
+        "--storage",
+        default=None,
+        help="Storage directory (default: <project>/data/storage, as used by the MCP server)",
+    )
+    parser.add_argument("--batch-size", type=int, default=100, help="Profiles read per Neo4j round trip")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be migrated without writing")
+    parser.add_argument(
+        "--keep-properties",
+        action="store_true",
+        help="Copy into the store but leave cp.mandate_embedding on the nodes",
+    )
+    parser.add_argument("--neo4j-uri", default=None, help="Override Neo4j bolt URI")
+    parser.add_argument("--neo4j-password", default=None, help="Override Neo4j password")
+    args = parser.parse_args()
+
+    storage_path = Path(args.storage) if args.storage else get_config().project_root / "data" / "storage"
+    store = None if args.dry_run else MandateEmbeddingStore(storage_path / "mandate_embeddings")
+    graph = GraphIndex(uri=args.neo4j_uri, password=args.neo4j_password)
+
+    t_start = time.time()
+    migrated = 0
+    invalid = 0
+    after = ""
+    while True:
+        # Page by guid so --keep-properties (which leaves the property set) still terminates
+        with graph._get_session() as session:
+            rows = [
+                dict(r)
+                for r in session.run(
+                    """
+                    MATCH (cp:ClientProfile)
+                    WHERE cp.mandate_embedding IS NOT NULL AND cp.guid > $after
+                    RETURN cp.guid AS guid, cp.mandate_embedding AS embedding
+                    ORDER BY cp.guid
+                    LIMIT $limit
+                    """,
+                    after=after,
+                    limit=int(args.batch_size),
+                )
+            ]
+        if not rows:
+            break
+        after = rows[-1]["guid"]
+
+        updates: list[dict[str, object]] = []
+        for row in rows:
+            vector = _as_vector(row["embedding"])
+            if vector is None:
+                invalid += 1
+                print(f"  {row['guid']}: not a float list, skipped", flush=True)
+                continue
+            if store is not None and vector:
+                store.put(row["guid"], vector)
+            updates.append({"guid": row["guid"], "dim": len(vector)})
+        migrated += len(updates)
+
+        if store is not None and updates:
+            remove_clause = "" if args.keep_properties else "REMOVE cp.mandate_embedding"
+            with graph._get_session() as session:
+                session.run(
+                    f"""
+                    UNWIND $updates AS u
+                    MATCH (cp:ClientProfile {{guid: u.guid}})
+                    SET cp.mandate_embedding_dim = u.dim
+                    {remove_clause}
+                    """,
+                    updates=updates,
+                )
+        print(f"  {migrated} profiles {'found' if args.dry_run else 'migrated'}...", flush=True)
+
+    graph.close()
+    elapsed = time.time() - t_start
+    logger.info(
+        "mandate_embeddings_migrated",
+        profiles=migrated,
+        invalid=invalid,
+        dry_run=args.dry_run,
+        path=str(storage_path / "mandate_embeddings"),
+    )
+    verb = "Would migrate" if args.dry_run else "Migrated"
+    print(f"{verb} {migrated} mandate embeddings ({invalid} invalid) in {elapsed:.1f}s", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,66 @@
+"""Rebuild the DocumentStore GUID -> path index.
+
+Rescans {storage}/documents/documents/{group}/{YYYY-MM-DD}/{guid}.json and
+writes a compacted guid_index.tsv (see app.services.document_index). Only
+directory entries are read, not the JSON files. Running servers pick up the
+new index on their next lookup.
+
+Use it after copying document files in by hand, restoring a backup, or to
+drop the deleted/overwritten entries an old index has accumulated.
+
+Usage:
+  uv run python scripts/rebuild_document_index.py
+  uv run python scripts/rebuild_document_index.py --storage /data/storage
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Ensure project imports resolve (same pattern as simulation runner)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "lib" / "gofr-common" / "src"))
+
+from app.config import get_config  # noqa: E402 - path modification required before import
+from app.logger import StructuredLogger  # noqa: E402 - path modification required before import
+from app.services.document_index import DocumentPathIndex  # noqa: E402 - path modification required before import
+
+
+logger = StructuredLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild the DocumentStore GUID -> path index")
+    parser.add_argument(
+        "--storage",
+        default=None,
+        help="Storage directory (default: <project>/data/storage, as used by the MCP server)",
+    )
+    args = parser.parse_args()
+
+    storage_path = Path(args.storage) if args.storage else get_config().project_root / "data" / "storage"
+    store_path = storage_path / "documents"
+    documents_path = store_path / "documents"
+    if not documents_path.exists():
+        print(f"No documents directory at {documents_path}", flush=True)
+        return 1
+
+    index = DocumentPathIndex(store_path / "guid_index.tsv")
+    before = index.stats() if index.exists() else None
+
+    t_start = time.time()
+    count = index.rebuild(documents_path)
+    elapsed = time.time() - t_start
+
+    logger.info("document_index_rebuilt", documents=count, path=str(index.index_path))
+    previous = f" (was {before['documents']} entries, {before['dead_lines']} dead lines)" if before else ""
+    print(f"Rebuilt {index.index_path}: {count} documents in {elapsed:.1f}s{previous}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
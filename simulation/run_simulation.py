@@ -463,7 +463,8 @@ def backfill_group_simulation_mandate_embeddings(limit: int = 200) -> None:
     """Backfill ClientProfile.mandate_embedding for group-simulation clients only.
 
     This is intended for simulation runs to ensure VECTOR eligibility is real.
-    It is idempotent and scoped to group-simulation (fail closed).
+    It is idempotent and scoped to group-simulation (fail closed). Profiles
+    whose vector is already in the mandate embedding store are skipped.
     """
     from neo4j import GraphDatabase
 
@@ -490,6 +491,7 @@ def backfill_group_simulation_mandate_embeddings(limit: int = 200) -> None:
                     MATCH (g:Group {name: $group_name})<-[:IN_GROUP]-(c:Client)-[:HAS_PROFILE]->(cp:ClientProfile)
                     WHERE cp.mandate_text IS NOT NULL AND trim(cp.mandate_text) <> ''
                       AND (cp.mandate_embedding IS NULL OR size(cp.mandate_embedding) = 0)
+                      AND coalesce(cp.mandate_embedding_dim, 0) = 0
                     RETURN c.guid AS client_guid, c.name AS name, cp.guid AS profile_guid, cp.mandate_text AS mandate_text
                     LIMIT $limit
                     """,
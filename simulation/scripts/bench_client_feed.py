@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Client Feed Benchmark.
+
+Loads a synthetic corpus into Neo4j in growing steps (default 10k, 100k,
+1M documents) and times GraphIndex.get_client_feed at each size against
+the previous group-scan query (every document of the permitted groups,
+then OPTIONAL MATCH AFFECTS/HOLDS/WATCHES per document).
+
+The benchmark client holds and watches a few instruments. A fixed number of
+documents (--relevant-docs) affect those instruments; every other document
+affects the rest of the universe. A position-anchored feed should stay flat
+as the corpus grows, because it only reads the documents that touch the
+client's instruments; the group scan grows with the corpus.
+
+All benchmark nodes use guids starting with "bench-feed-" and are deleted
+at the end (unless --keep). Needs a Neo4j server (GOFR_IQ_NEO4J_* env) with
+room for the largest step; use a scratch database, not production.
+
+Usage:
+  uv run simulation/scripts/bench_client_feed.py
+  uv run simulation/scripts/bench_client_feed.py --sizes 10000,100000 --iterations 50
+  uv run simulation/scripts/bench_client_feed.py --skip-legacy --json out.json
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.graph_index import GraphIndex  # noqa: E402
+
+PREFIX = "bench-feed-"
+GROUP_GUID = f"{PREFIX}group"
+CLIENT_GUID = f"{PREFIX}client"
+LOAD_BATCH = 10_000
+TIERS = ("PLATINUM", "GOLD", "SILVER", "BRONZE", "STANDARD")
+
+# The group-scan query get_client_feed used before it was position-anchored
+LEGACY_FEED_QUERY = """
+MATCH (c:Client {guid: $client_guid})-[:IN_GROUP]->(cg:Group)
+WHERE cg.guid IN $permitted_groups
+MATCH (d:Document)-[:IN_GROUP]->(g:Group)
+WHERE g.guid IN $permitted_groups
+OPTIONAL MATCH (d)-[affects:AFFECTS]->(inst:Instrument)
+OPTIONAL MATCH (c)-[:HAS_PORTFOLIO]->(p:Portfolio)-[holds:HOLDS]->(inst)
+OPTIONAL MATCH (c)-[:HAS_WATCHLIST]->(w:Watchlist)-[:WATCHES]->(inst)
+WITH d, inst, affects, holds, w,
+     CASE WHEN holds IS NOT NULL THEN holds.weight * 100 ELSE 0 END AS position_boost,
+     CASE WHEN w IS NOT NULL THEN 50 ELSE 0 END AS watchlist_boost,
+     COALESCE(d.impact_score, 0) AS base_score
+WHERE (($include_portfolio AND holds IS NOT NULL) OR ($include_watchlist AND w IS NOT NULL))
+WITH d, inst, base_score + position_boost + watchlist_boost AS total_score, base_score AS decayed_score
+WITH d.guid AS document_guid, d.title AS title, d.impact_score AS impact_score,
+     d.impact_tier AS impact_tier, d.created_at AS created_at,
+     collect(DISTINCT inst.ticker) AS affected_instruments,
+     max(total_score) AS relevance_score, max(decayed_score) AS current_relevance
+RETURN document_guid, title, impact_score, impact_tier, created_at,
+       affected_instruments, relevance_score, current_relevance
+ORDER BY current_relevance DESC
+LIMIT $limit
+"""
+
+
+def _setup_universe(graph: GraphIndex, instruments: int, held: int, watched: int) -> tuple[list[str], list[str]]:
+    """Create the group, instrument universe and the client's portfolio and watchlist.
+
+    Returns:
+        (client instrument guids, other instrument guids)
+    """
+    guids = [f"{PREFIX}inst-{i}" for i in range(instruments)]
+    client_guids, other_guids = guids[: held + watched], guids[held + watched :]
+    with graph._get_session() as session:
+        session.run("MERGE (g:Group {guid: $guid}) SET g.name = 'Feed benchmark'", guid=GROUP_GUID)
+        session.run(
+            """
+            UNWIND $guids AS guid
+            MERGE (i:Instrument {guid: guid})
+            SET i.ticker = 'BF' + substring(guid, size($prefix) + 5), i.name = guid
+            """,
+            guids=guids,
+            prefix=PREFIX,
+        )
+        session.run(
+            """
+            MATCH (g:Group {guid: $group})
+            MERGE (c:Client {guid: $client}) SET c.name = 'Feed benchmark client'
+            MERGE (c)-[:IN_GROUP]->(g)
+            MERGE (c)-[:HAS_PORTFOLIO]->(:Portfolio {guid: $client + '-portfolio'})
+            MERGE (c)-[:HAS_WATCHLIST]->(:Watchlist {guid: $client + '-watchlist'})
+            """,
+            group=GROUP_GUID,
+            client=CLIENT_GUID,
+        )
+        session.run(
+            """
+            MATCH (p:Portfolio {guid: $portfolio})
+            UNWIND $held AS guid
+            MATCH (i:Instrument {guid: guid})
+            MERGE (p)-[h:HOLDS]->(i) SET h.weight = 1.0 / size($held)
+            """,
+            portfolio=f"{CLIENT_GUID}-portfolio",
+            held=client_guids[:held],
+        )
+        session.run(
+            """
+            MATCH (w:Watchlist {guid: $watchlist})
+            UNWIND $watched AS guid
+            MATCH (i:Instrument {guid: guid})
+            MERGE (w)-[:WATCHES]->(i)
+            """,
+            watchlist=f"{CLIENT_GUID}-watchlist",
+            watched=client_guids[held:],
+        )
+    return client_guids, other_guids
+
+
+def _load_documents(graph: GraphIndex, start: int, stop: int, targets: list[str], rng: random.Random) -> None:
+    """Create documents start..stop-1, each affecting 1-3 instruments from targets."""
+    now = datetime.now(UTC)
+    for batch_start in range(start, stop, LOAD_BATCH):
+        rows = []
+        for n in range(batch_start, min(stop, batch_start + LOAD_BATCH)):
+            rows.append(
+                {
+                    "guid": f"{PREFIX}doc-{n}",
+                    "title": f"Benchmark story {n}",
+                    "impact_score": round(rng.uniform(5, 95), 1),
+                    "impact_tier": rng.choice(TIERS),
+                    "created_at": (now - timedelta(minutes=n)).isoformat(),
+                    "instruments": rng.sample(targets, k=min(len(targets), rng.randint(1, 3))),
+                }
+            )
+        with graph._get_session() as session:
+            session.run(
+                """
+                MATCH (g:Group {guid: $group})
+                UNWIND $rows AS row
+                CREATE (d:Document {guid: row.guid, title: row.title, impact_score: row.impact_score,
+                                    impact_tier: row.impact_tier, created_at: row.created_at})
+                CREATE (d)-[:IN_GROUP]->(g)
+                WITH d, row
+                UNWIND row.instruments AS inst_guid
+                MATCH (i:Instrument {guid: inst_guid})
+                CREATE (d)-[:AFFECTS]->(i)
+                """,
+                group=GROUP_GUID,
+                rows=rows,
+            )
+
+
+def _cleanup(graph: GraphIndex) -> None:
+    with graph._get_session() as session:
+        for label in ("Document", "Instrument", "Portfolio", "Watchlist", "Client", "Group"):
+            session.run(
+                f"""
+                MATCH (n:{label}) WHERE n.guid STARTS WITH $prefix
+                CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF 10000 ROWS
+                """,  # nosec B608 - fixed label list
+                prefix=PREFIX,
+            )
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def _time(fn: Any, iterations: int) -> tuple[dict[str, float], Any]:
+    result = fn()  # warm-up (plan cache, page cache)
+    latencies_ms: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = fn()
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+    return {
+        "p50_ms": _percentile(latencies_ms, 50),
+        "p95_ms": _percentile(latencies_ms, 95),
+        "mean_ms": statistics.mean(latencies_ms),
+    }, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark get_client_feed latency against corpus size")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Corpus sizes to measure (comma separated)")
+    parser.add_argument("--instruments", type=int, default=5000, help="Instrument universe size (default: 5000)")
+    parser.add_argument("--held", type=int, default=20, help="Instruments the client holds (default: 20)")
+    parser.add_argument("--watched", type=int, default=10, help="Instruments the client watches (default: 10)")
+    parser.add_argument("--relevant-docs", type=int, default=2000, help="Documents affecting the client's instruments")
+    parser.add_argument("--limit", type=int, default=50, help="Feed size (default: 50)")
+    parser.add_argument("--iterations", type=int, default=30, help="Timed calls per size for get_client_feed")
+    parser.add_argument("--legacy-iterations", type=int, default=3, help="Timed calls per size for the group scan")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time get_client_feed")
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark nodes afterwards")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed")
+    parser.add_argument("--json", dest="json_out", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+    if sizes[0] < args.relevant_docs:
+        print(f"[ERROR] Smallest size must be at least --relevant-docs ({args.relevant_docs})")
+        sys.exit(1)
+
+    try:
+        graph = GraphIndex()
+        graph.init_schema()
+    except Exception as e:
+        print(f"[ERROR] Could not connect to Neo4j: {e}")
+        sys.exit(1)
+
+    rng = random.Random(args.seed)
+    _cleanup(graph)
+    client_instruments, other_instruments = _setup_universe(graph, args.instruments, args.held, args.watched)
+
+    def feed() -> list[dict[str, Any]]:
+        return graph.get_client_feed(CLIENT_GUID, [GROUP_GUID], limit=args.limit)
+
+    def legacy_feed() -> list[dict[str, Any]]:
+        with graph._get_session() as session:
+            return [
+                dict(r)
+                for r in session.run(
+                    LEGACY_FEED_QUERY,
+                    client_guid=CLIENT_GUID,
+                    permitted_groups=[GROUP_GUID],
+                    include_portfolio=True,
+                    include_watchlist=True,
+                    limit=args.limit,
+                )
+            ]
+
+    print("=" * 78)
+    print(
+        f"CLIENT FEED BENCHMARK  instruments={args.instruments} held={args.held} "
+        f"watched={args.watched} relevant_docs={args.relevant_docs}"
+    )
+    print("=" * 78)
+    print(f"{'documents':>10} {'load s':>8} {'anchored p50':>13} {'p95':>9} {'group-scan p50':>15} {'p95':>9} {'same':>5}")
+
+    rows: list[dict[str, Any]] = []
+    loaded = 0
+    try:
+        for size in sizes:
+            start = time.perf_counter()
+            if loaded == 0:
+                _load_documents(graph, 0, args.relevant_docs, client_instruments, rng)
+                loaded = args.relevant_docs
+            _load_documents(graph, loaded, size, other_instruments, rng)
+            loaded = size
+            load_s = time.perf_counter() - start
+
+            anchored, anchored_result = _time(feed, args.iterations)
+            row: dict[str, Any] = {"documents": size, "load_seconds": load_s, "anchored": anchored}
+            legacy_cols = f"{'-':>15} {'-':>9} {'-':>5}"
+            if not args.skip_legacy:
+                legacy, legacy_result = _time(legacy_feed, args.legacy_iterations)
+                # Compare scores, not guids: equal scores may be returned in either order
+                same = [r["current_relevance"] for r in legacy_result] == [
+                    r["current_relevance"] for r in anchored_result
+                ]
+                row["group_scan"] = legacy
+                row["same_results"] = same
+                legacy_cols = f"{legacy['p50_ms']:>13.1f}ms {legacy['p95_ms']:>7.1f}ms {'yes' if same else 'NO':>5}"
+            rows.append(row)
+            print(
+                f"{size:>10,} {load_s:>8.1f} {anchored['p50_ms']:>11.1f}ms {anchored['p95_ms']:>7.1f}ms {legacy_cols}",
+                flush=True,
+            )
+    finally:
+        if not args.keep:
+            _cleanup(graph)
+        graph.close()
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump({"args": vars(args), "results": rows}, f, indent=2)
+        print(f"\nResults written to: {args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
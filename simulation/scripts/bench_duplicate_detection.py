@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Duplicate Detection Benchmark.
+
+Ingests synthetic stories into DuplicateDetector and measures the in-memory
+near-duplicate check: the legacy linear token-cosine scan versus the
+MinHash/LSH-indexed lookup. Reports ingest throughput, p50/p99 check latency
+and near-duplicate recall.
+
+Stories are rendered offline from the scenario templates, sources and ticker
+universe in simulation/generate_synthetic_stories.py (no LLM calls), with a
+share of paraphrased re-publications so there are real near-duplicates to find.
+The legacy scan is O(N) per check, so it is timed on a sample of checks only.
+
+No Neo4j, ChromaDB or OpenRouter access is required.
+
+Usage:
+  uv run simulation/scripts/bench_duplicate_detection.py
+  uv run simulation/scripts/bench_duplicate_detection.py --stories 20000 --legacy-checks 50
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from string import Formatter
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.duplicate_detector import DuplicateDetector, cosine_similarity, tokenize  # noqa: E402
+from simulation.generate_synthetic_stories import MOCK_SOURCES, SCENARIOS, UNIVERSE  # noqa: E402
+
+FILLER = (
+    "analysts shares investors guidance quarter outlook margin demand supply regulators "
+    "forecast revenue capital dividend buyback pricing volume inventory exposure risk "
+    "management statement market session trading futures bond yield currency earnings "
+    "segment growth decline contract partner customer factory shipment order backlog"
+).split()
+
+# Long-tail vocabulary so unrelated stories share only common words, as real wires do
+_SYLLABLES = ["ka", "lo", "mer", "tis", "van", "dre", "po", "sul", "ne", "gra", "ri", "tho", "bel", "cu", "zan"]
+VOCAB = FILLER + [a + b + c for a in _SYLLABLES for b in _SYLLABLES for c in _SYLLABLES]
+
+
+class _Missing(dict):
+    def __missing__(self, key: str) -> str:
+        return "N/A"
+
+
+def _render_story(i: int, rng: random.Random, tickers: list[Any]) -> tuple[str, str]:
+    scenario = rng.choices(SCENARIOS, weights=[s.weight for s in SCENARIOS], k=1)[0]
+    ticker = rng.choice(tickers)
+    related = rng.choice(tickers)
+    source = rng.choice(MOCK_SOURCES)
+    values = _Missing(
+        ticker=ticker.ticker,
+        name=ticker.name,
+        sector=ticker.sector,
+        style_guide=source.style_guide,
+        related_ticker=related.ticker,
+        related_name=related.name,
+        affected_tickers_csv=ticker.ticker,
+    )
+    brief = Formatter().vformat(scenario.template, (), values)
+    # Mostly long-tail words with some common market vocabulary mixed in
+    body = " ".join(
+        rng.choice(FILLER) if rng.random() < 0.2 else rng.choice(VOCAB) for _ in range(rng.randint(60, 140))
+    )
+    body += f" {rng.uniform(1, 500):.2f} {rng.randint(1, 99)}%"
+    title = f"{ticker.name} ({ticker.ticker}): {scenario.description} #{i}"
+    return title, f"{brief} {source.name} reports {body}"
+
+
+def _paraphrase(content: str, rng: random.Random, edits: int) -> str:
+    words = content.split()
+    for _ in range(edits):
+        words[rng.randrange(len(words))] = rng.choice(VOCAB)
+    return " ".join(words)
+
+
+def _build_corpus(n: int, dup_rate: float, seed: int) -> list[tuple[str, str, str, datetime, str | None]]:
+    """(guid, title, content, created_at, original_guid) in ingest order."""
+    rng = random.Random(seed)
+    tickers = UNIVERSE.get_tickers()
+    start = datetime(2026, 1, 1)
+    corpus: list[tuple[str, str, str, datetime, str | None]] = []
+    for i in range(n):
+        created_at = start + timedelta(seconds=30 * i)
+        guid = f"doc-{i:07d}"
+        if corpus and rng.random() < dup_rate:
+            # Re-publication of a story from the last ~12 hours
+            orig = corpus[max(0, len(corpus) - rng.randint(1, 1440))]
+            content = _paraphrase(orig[2], rng, edits=rng.randint(1, 3))
+            corpus.append((guid, orig[1], content, created_at, orig[4] or orig[0]))
+        else:
+            title, content = _render_story(i, rng, tickers)
+            corpus.append((guid, title, content, created_at, None))
+    return corpus
+
+
+def _legacy_check(detector: DuplicateDetector, title: str, content: str) -> str | None:
+    """Pre-index scan: re-tokenize every registered document."""
+    tokens = tokenize(f"{title} {content}".strip())
+    best_guid, best_score = None, 0.0
+    for candidate in detector._similarity_index.values():
+        similarity = cosine_similarity(tokens, tokenize(f"{candidate.title} {candidate.content}".strip()))
+        if similarity >= detector.similarity_threshold and similarity > best_score:
+            best_guid, best_score = candidate.guid, similarity
+    return best_guid
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark indexed vs linear near-duplicate detection")
+    parser.add_argument("--stories", type=int, default=100_000, help="Stories to ingest (default: 100000)")
+    parser.add_argument("--dup-rate", type=float, default=0.1, help="Share of paraphrased re-publications")
+    parser.add_argument("--threshold", type=float, default=0.85, help="Similarity threshold")
+    parser.add_argument("--legacy-checks", type=int, default=5, help="Checks timed with the linear scan")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed")
+    args = parser.parse_args()
+
+    print(f"Rendering {args.stories} synthetic stories...")
+    corpus = _build_corpus(args.stories, args.dup_rate, args.seed)
+
+    detector = DuplicateDetector(similarity_threshold=args.threshold, use_hash_detection=False)
+    check_ms: list[float] = []
+    found = expected = 0
+    start = time.perf_counter()
+    for guid, title, content, created_at, original in corpus:
+        t0 = time.perf_counter()
+        result = detector.check(title, content, created_at=created_at)
+        check_ms.append((time.perf_counter() - t0) * 1000)
+        if original is not None:
+            expected += 1
+            found += int(result.is_duplicate)
+        detector.register(guid, title, content, created_at=created_at)
+    elapsed = time.perf_counter() - start
+
+    # Legacy linear scan against the fully loaded detector
+    rng = random.Random(args.seed)
+    sample = rng.sample(corpus, k=min(args.legacy_checks, len(corpus)))
+    legacy_ms: list[float] = []
+    for _, title, content, _, _ in sample:
+        t0 = time.perf_counter()
+        _legacy_check(detector, title, content)
+        legacy_ms.append((time.perf_counter() - t0) * 1000)
+
+    print("=" * 70)
+    print(f"DUPLICATE DETECTION BENCHMARK  stories={len(corpus)} threshold={args.threshold}")
+    print("=" * 70)
+    print(f"{'mode':<10} {'p50 ms':>10} {'p99 ms':>10} {'checks':>8}")
+    print(f"{'linear':<10} {_percentile(legacy_ms, 50):>10.2f} {_percentile(legacy_ms, 99):>10.2f} {len(legacy_ms):>8d}")
+    print(f"{'lsh':<10} {_percentile(check_ms, 50):>10.3f} {_percentile(check_ms, 99):>10.3f} {len(check_ms):>8d}")
+    print("-" * 70)
+    print(f"Ingest throughput (check + register): {len(corpus) / elapsed:,.0f} stories/s")
+    if expected:
+        print(f"Near-duplicate recall: {found}/{expected} ({found / expected:.2%})")
+    print(f"Median speedup per check: {statistics.median(legacy_ms) / max(statistics.median(check_ms), 1e-9):,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
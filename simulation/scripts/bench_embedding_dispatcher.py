@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Embedding Dispatcher Benchmark.
+
+Embeds a synthetic bulk load (chunks of rendered stories) through a local
+stub of the OpenRouter /embeddings endpoint and compares:
+- sequential: LLMEmbeddingFunction sending batch_size batches one by one
+  (LLMService sleeps on every 429)
+- dispatcher: EmbeddingDispatcher with concurrent, token-sized batches and
+  a shared Retry-After pause
+
+The stub simulates per-request latency plus per-text cost, and answers 429
+with Retry-After once its own request-rate limit is exceeded.
+
+No OpenRouter access, Neo4j or ChromaDB server is required.
+
+Usage:
+  uv run simulation/scripts/bench_embedding_dispatcher.py
+  uv run simulation/scripts/bench_embedding_dispatcher.py --texts 5000 --concurrency 16 --server-rps 40
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.embedding_dispatcher import EmbeddingDispatcher  # noqa: E402
+from app.services.embedding_index import LLMEmbeddingFunction  # noqa: E402
+from app.services.llm_service import LLMService, LLMSettings  # noqa: E402
+
+WORDS = (
+    "analysts shares investors guidance quarter outlook margin demand supply regulators forecast "
+    "revenue capital dividend buyback pricing volume inventory exposure risk management statement "
+    "market session trading futures bond yield currency earnings segment growth decline contract"
+).split()
+
+
+class StubState:
+    """Server-side request-rate limiter and counters."""
+
+    def __init__(self, rps: float, base_latency: float, per_text_latency: float, dims: int) -> None:
+        self.rps = rps
+        self.base_latency = base_latency
+        self.per_text_latency = per_text_latency
+        self.dims = dims
+        self.lock = threading.Lock()
+        self.window_start = time.monotonic()
+        self.window_count = 0
+        self.requests = 0
+        self.throttled = 0
+
+    def admit(self) -> float | None:
+        """Return None to serve, or seconds until the next one-second window."""
+        with self.lock:
+            self.requests += 1
+            now = time.monotonic()
+            if now - self.window_start >= 1.0:
+                self.window_start, self.window_count = now, 0
+            if self.window_count >= self.rps:
+                self.throttled += 1
+                return max(0.05, 1.0 - (now - self.window_start))
+            self.window_count += 1
+            return None
+
+
+def _make_handler(state: StubState) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # noqa: N802
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            texts: list[str] = body.get("input", [])
+            retry_after = state.admit()
+            if retry_after is not None:
+                self._send(429, {"error": {"message": "rate limited"}}, {"Retry-After": f"{retry_after:.2f}"})
+                return
+            time.sleep(state.base_latency + state.per_text_latency * len(texts))
+            data = [
+                {"index": i, "embedding": [float(len(t) % 97) / 97.0] * state.dims} for i, t in enumerate(texts)
+            ]
+            self._send(200, {"data": data, "model": body.get("model"), "usage": {}})
+
+        def _send(self, status: int, payload: dict[str, Any], headers: dict[str, str] | None = None) -> None:
+            raw = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(raw)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+def _make_texts(n: int, seed: int) -> list[str]:
+    """Chunk-sized texts with a realistic length spread (~50-250 words)."""
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(50, 250))) for _ in range(n)]
+
+
+def _run(label: str, state: StubState, fn: Any, texts: list[str]) -> float:
+    state.requests = state.throttled = 0
+    start = time.perf_counter()
+    vectors = fn(texts)
+    elapsed = time.perf_counter() - start
+    if len(vectors) != len(texts) or any(v[0] != float(len(t) % 97) / 97.0 for v, t in zip(vectors, texts)):
+        print(f"[ERROR] {label}: results missing or out of order")
+        sys.exit(1)
+    print(
+        f"{label:<12} {elapsed:>9.2f}s {len(texts) / elapsed:>11,.0f} {state.requests:>9d} {state.throttled:>10d}"
+    )
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark EmbeddingDispatcher vs sequential batches")
+    parser.add_argument("--texts", type=int, default=2000, help="Texts to embed (default: 2000)")
+    parser.add_argument("--batch-size", type=int, default=100, help="Sequential batch size (default: 100)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Dispatcher concurrency (default: 8)")
+    parser.add_argument("--batch-tokens", type=int, default=8000, help="Dispatcher tokens per batch (default: 8000)")
+    parser.add_argument("--server-rps", type=float, default=20, help="Stub requests/s before 429 (default: 20)")
+    parser.add_argument("--latency-ms", type=float, default=150, help="Stub latency per request (default: 150)")
+    parser.add_argument("--per-text-ms", type=float, default=2, help="Stub latency per text (default: 2)")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed")
+    args = parser.parse_args()
+
+    state = StubState(args.server_rps, args.latency_ms / 1000, args.per_text_ms / 1000, dims=8)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    texts = _make_texts(args.texts, args.seed)
+    settings = LLMSettings(api_key="bench", base_url=base_url, max_retries=20, timeout=30)
+
+    print("=" * 70)
+    print(
+        f"EMBEDDING DISPATCHER BENCHMARK  texts={len(texts)} server_rps={args.server_rps} "
+        f"latency={args.latency_ms:.0f}ms"
+    )
+    print("=" * 70)
+    print(f"{'mode':<12} {'elapsed':>10} {'texts/s':>11} {'requests':>9} {'throttled':>10}")
+
+    with LLMService(settings=settings) as llm:
+        sequential = LLMEmbeddingFunction(llm, batch_size=args.batch_size)
+        seq_elapsed = _run("sequential", state, sequential, texts)
+
+    with LLMService(settings=settings) as llm:
+        dispatcher = EmbeddingDispatcher(
+            llm,
+            max_concurrency=args.concurrency,
+            requests_per_second=args.server_rps,
+            max_batch_texts=args.batch_size,
+            max_batch_tokens=args.batch_tokens,
+            max_retries=20,
+        )
+        concurrent = LLMEmbeddingFunction(llm, dispatcher=dispatcher)
+        disp_elapsed = _run("dispatcher", state, concurrent, texts)
+        dispatcher.close()
+
+    server.shutdown()
+    print("-" * 70)
+    print(f"Speedup: {seq_elapsed / disp_elapsed:.1f}x (results identical and in input order)")
+
+
+if __name__ == "__main__":
+    main()
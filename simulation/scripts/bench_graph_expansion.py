@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Graph Expansion Benchmark.
+
+Compares the per-hit graph expansion path (one Cypher query per seed hit,
+instrument and peer) against the batched single-UNWIND path used by
+QueryService._expand_via_graph. Reports Neo4j round trips per call and
+p50/p99 latency for each mode.
+
+Seeds are the most recent documents that AFFECT at least one instrument,
+so the benchmark exercises the same shape as a query_documents call.
+
+Usage:
+  uv run simulation/scripts/bench_graph_expansion.py
+  uv run simulation/scripts/bench_graph_expansion.py --seeds 5 --iterations 200
+  uv run simulation/scripts/bench_graph_expansion.py --group <group-guid> --json out.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.graph_index import GraphIndex  # noqa: E402
+from app.services.query_service import QueryResult, QueryService, ScoringWeights  # noqa: E402
+
+
+class _CountingSession:
+    """Session proxy that counts session.run round trips."""
+
+    def __init__(self, session: Any, counter: dict[str, int]) -> None:
+        self._session = session
+        self._counter = counter
+
+    def run(self, *args: Any, **kwargs: Any) -> Any:
+        self._counter["runs"] += 1
+        return self._session.run(*args, **kwargs)
+
+    def __enter__(self) -> "_CountingSession":
+        self._session.__enter__()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._session.__exit__(*exc)
+
+
+def _install_counter(graph: GraphIndex) -> dict[str, int]:
+    """Wrap graph._get_session so every session.run is counted."""
+    counter = {"runs": 0}
+    original = graph._get_session
+
+    def counting_session() -> Any:
+        return _CountingSession(original(), counter)
+
+    graph._get_session = counting_session  # type: ignore[method-assign]
+    return counter
+
+
+def _pick_seeds(graph: GraphIndex, n_seeds: int, group_guids: list[str] | None) -> tuple[list[str], list[str]]:
+    """Pick recent seed documents with AFFECTS edges and the groups to expand within."""
+    with graph._get_session() as session:
+        if not group_guids:
+            group_guids = [r["guid"] for r in session.run("MATCH (g:Group) RETURN g.guid AS guid")]
+        result = session.run(
+            """
+            MATCH (d:Document)-[:AFFECTS]->(:Instrument)
+            MATCH (d)-[:IN_GROUP]->(g:Group)
+            WHERE g.guid IN $group_guids
+            RETURN DISTINCT d.guid AS guid, d.created_at AS created_at
+            ORDER BY created_at DESC
+            LIMIT $limit
+            """,
+            group_guids=group_guids,
+            limit=n_seeds,
+        )
+        return [r["guid"] for r in result], group_guids
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def _run_mode(
+    service: QueryService,
+    counter: dict[str, int],
+    seeds: list[QueryResult],
+    group_guids: list[str],
+    iterations: int,
+    batched: bool,
+) -> dict[str, Any]:
+    service.batch_graph_expansion = batched
+    weights = ScoringWeights()
+    exclude = {s.document_guid for s in seeds}
+    latencies_ms: list[float] = []
+    round_trips: list[int] = []
+    expanded = 0
+
+    # Warm-up (plan cache, connection pool)
+    service._expand_via_graph(seeds, group_guids, weights, exclude)
+
+    for _ in range(iterations):
+        counter["runs"] = 0
+        start = time.perf_counter()
+        results = service._expand_via_graph(seeds, group_guids, weights, exclude)
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+        round_trips.append(counter["runs"])
+        expanded = len(results)
+
+    return {
+        "mode": "batched" if batched else "per_hit",
+        "iterations": iterations,
+        "round_trips_mean": statistics.mean(round_trips),
+        "round_trips_max": max(round_trips),
+        "p50_ms": _percentile(latencies_ms, 50),
+        "p99_ms": _percentile(latencies_ms, 99),
+        "mean_ms": statistics.mean(latencies_ms),
+        "expanded_docs": expanded,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark graph expansion round trips and latency")
+    parser.add_argument("--seeds", type=int, default=5, help="Number of seed documents (default: 5)")
+    parser.add_argument("--iterations", type=int, default=100, help="Timed iterations per mode")
+    parser.add_argument("--group", action="append", dest="groups", help="Group GUID (repeatable)")
+    parser.add_argument("--json", dest="json_out", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    try:
+        graph = GraphIndex()
+    except Exception as e:
+        print(f"[ERROR] Could not connect to Neo4j: {e}")
+        sys.exit(1)
+
+    seed_guids, group_guids = _pick_seeds(graph, args.seeds, args.groups)
+    if not seed_guids:
+        print("[ERROR] No documents with AFFECTS relationships found")
+        sys.exit(1)
+
+    counter = _install_counter(graph)
+    service = QueryService(
+        embedding_index=None,  # type: ignore[arg-type]
+        document_store=None,  # type: ignore[arg-type]
+        source_registry=None,  # type: ignore[arg-type]
+        graph_index=graph,
+    )
+    seeds = [_seed(guid) for guid in seed_guids]
+
+    rows = [
+        _run_mode(service, counter, seeds, group_guids, args.iterations, batched=False),
+        _run_mode(service, counter, seeds, group_guids, args.iterations, batched=True),
+    ]
+
+    print("=" * 70)
+    print(f"GRAPH EXPANSION BENCHMARK  seeds={len(seed_guids)} groups={len(group_guids)}")
+    print("=" * 70)
+    print(f"{'mode':<10} {'trips(mean)':>12} {'trips(max)':>11} {'p50 ms':>9} {'p99 ms':>9} {'docs':>6}")
+    for row in rows:
+        print(
+            f"{row['mode']:<10} {row['round_trips_mean']:>12.1f} {row['round_trips_max']:>11d} "
+            f"{row['p50_ms']:>9.2f} {row['p99_ms']:>9.2f} {row['expanded_docs']:>6d}"
+        )
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump({"seeds": seed_guids, "group_guids": group_guids, "results": rows}, f, indent=2)
+        print(f"\nResults written to: {args.json_out}")
+
+    graph.close()
+
+
+def _seed(guid: str) -> QueryResult:
+    """Minimal semantic hit used as an expansion seed."""
+    return QueryResult(
+        document_guid=guid,
+        title="",
+        content_snippet="",
+        score=1.0,
+        similarity_score=1.0,
+    )
+
+
+if __name__ == "__main__":
+    main()
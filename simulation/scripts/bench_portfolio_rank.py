@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Portfolio Rank Micro-Benchmark.
+
+Measures the position-boost step of QueryService.get_top_client_news:
+the legacy per-candidate re-sort of holdings versus a PortfolioRankIndex
+built once per request. Portfolios are inflated from the synthetic clients
+in simulation/generate_synthetic_clients.py so holdings/candidate counts
+match production-sized books (default 200 holdings x 500 candidates).
+
+No Neo4j or ChromaDB is required.
+
+Usage:
+  uv run simulation/scripts/bench_portfolio_rank.py
+  uv run simulation/scripts/bench_portfolio_rank.py --holdings 500 --candidates 2000 --iterations 50
+"""
+
+import argparse
+import math
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.query_service import PortfolioRankIndex  # noqa: E402
+from simulation.generate_synthetic_clients import ClientGenerator  # noqa: E402
+from simulation.universe.builder import UniverseBuilder  # noqa: E402
+
+
+def _inflate_portfolio(base: list[Any], universe: list[str], size: int, rng: random.Random) -> list[dict[str, Any]]:
+    """Grow a synthetic client's book to `size` holdings with decaying weights."""
+    holdings = [{"ticker": p.ticker, "weight": p.weight} for p in base]
+    i = 0
+    while len(holdings) < size:
+        ticker = f"{universe[i % len(universe)]}.{i // len(universe)}"
+        holdings.append({"ticker": ticker, "weight": rng.uniform(0.0005, 0.05)})
+        i += 1
+    return holdings[:size]
+
+
+def _make_candidates(holdings: list[dict[str, Any]], n: int, rng: random.Random) -> list[dict[str, Any]]:
+    tickers = [h["ticker"] for h in holdings] + [f"OTHER{i}" for i in range(len(holdings))]
+    return [{"affected_instruments": rng.sample(tickers, k=rng.randint(1, 4))} for _ in range(n)]
+
+
+def _legacy_boosts(holdings: list[dict[str, Any]], candidates: list[dict[str, Any]]) -> list[float]:
+    """Pre-index scoring loop: re-sort holdings for every candidate."""
+    out: list[float] = []
+    for candidate in candidates:
+        pos_boost = 0.0
+        ranked = sorted(
+            [h for h in holdings if h.get("ticker")],
+            key=lambda x: float(x.get("weight") or 0.0),
+            reverse=True,
+        )
+        ticker_to_rank = {h["ticker"]: idx for idx, h in enumerate(ranked)}
+        n = max(1, len(ranked))
+        for t in candidate.get("affected_instruments", []) or []:
+            if t in ticker_to_rank:
+                rank = ticker_to_rank[t]
+                rank_percentile = 1.0 if n == 1 else 1.0 - (rank / (n - 1))
+                pos_boost = max(pos_boost, 0.3 * (math.log(1 + rank_percentile) / math.log(2)))
+        out.append(pos_boost)
+    return out
+
+
+def _indexed_boosts(holdings: list[dict[str, Any]], candidates: list[dict[str, Any]]) -> list[float]:
+    rank_index = PortfolioRankIndex.from_holdings(holdings)
+    return [rank_index.boost_for(c.get("affected_instruments")) for c in candidates]
+
+
+def _time(fn: Any, iterations: int) -> tuple[float, float, list[float]]:
+    samples: list[float] = []
+    result: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(round(0.99 * (len(ordered) - 1))))]
+    return statistics.median(samples), p99, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark PortfolioRankIndex vs per-candidate re-sort")
+    parser.add_argument("--holdings", type=int, default=200, help="Holdings per client (default: 200)")
+    parser.add_argument("--candidates", type=int, default=500, help="Candidates per feed (default: 500)")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed iterations per client")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    builder = UniverseBuilder(seed=args.seed)
+    universe = [t.ticker for t in builder.get_tickers()]
+    clients = ClientGenerator(builder).generate_clients()
+
+    print("=" * 78)
+    print(f"PORTFOLIO RANK BENCHMARK  holdings={args.holdings} candidates={args.candidates}")
+    print("=" * 78)
+    print(f"{'client':<32} {'legacy p50':>11} {'index p50':>10} {'legacy p99':>11} {'index p99':>10} {'x':>6}")
+
+    speedups: list[float] = []
+    for client in clients:
+        holdings = _inflate_portfolio(client.portfolio, universe, args.holdings, rng)
+        candidates = _make_candidates(holdings, args.candidates, rng)
+
+        legacy_p50, legacy_p99, legacy = _time(lambda: _legacy_boosts(holdings, candidates), args.iterations)
+        index_p50, index_p99, indexed = _time(lambda: _indexed_boosts(holdings, candidates), args.iterations)
+
+        if any(abs(a - b) > 1e-12 for a, b in zip(legacy, indexed)):
+            print(f"[ERROR] Boost mismatch for client {client.name}")
+            sys.exit(1)
+
+        speedup = legacy_p50 / index_p50 if index_p50 > 0 else float("inf")
+        speedups.append(speedup)
+        print(
+            f"{client.name[:32]:<32} {legacy_p50:>9.2f}ms {index_p50:>8.3f}ms "
+            f"{legacy_p99:>9.2f}ms {index_p99:>8.3f}ms {speedup:>5.0f}x"
+        )
+
+    print("-" * 78)
+    print(f"Median speedup: {statistics.median(speedups):.0f}x (boosts identical for all clients)")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,9 @@ Phase 0 Fixtures:
     - server_manager: ServerManager for integration tests
     - test_env: Environment variables for test mode
 
+Clock Fixtures:
+    - clock: FakeClock for components with an injectable clock
+
 Auth Fixtures:
     - vault_auth_service: AuthService with Vault backend (shared with servers)
     - auth_service_isolated: AuthService with memory backend (isolated unit tests)
@@ -651,6 +654,32 @@ def infra_available(chromadb_available: bool, neo4j_available: bool, vault_avail
     }
 
 
+# =============================================================================
+# Clock Fixtures
+# =============================================================================
+
+
+class FakeClock:
+    """Injectable monotonic clock: advance by bumping ``now``; sleep() advances it."""
+
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Fake clock for components that take a ``clock`` (and ``sleep``) callable."""
+    return FakeClock()
+
+
 # =============================================================================
 # Pytest Markers
 # =============================================================================
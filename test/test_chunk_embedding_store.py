@@ -0,0 +1,78 @@
+"""Tests for the content-addressed chunk embedding store."""
+
+from __future__ import annotations
+
+import multiprocessing
+
+import pytest
+
+from app.services.chunk_embedding_store import ChunkEmbeddingStore, create_chunk_embedding_store
+
+
+def test_put_and_get_by_content(tmp_path):
+    store = ChunkEmbeddingStore(tmp_path / "embeddings")
+    assert store.get_many("m1", ["alpha", "beta"]) == [None, None]
+
+    assert store.put_many("m1", ["alpha", "beta"], [[0.5, 0.25], [1.0, -1.0]]) == 2
+    assert store.get_many("m1", ["beta", "gamma", "alpha"]) == [[1.0, -1.0], None, [0.5, 0.25]]
+    # Same text under another model is a different entry
+    assert store.get_many("m2", ["alpha"]) == [None]
+
+    stats = store.stats()
+    assert stats["vectors"] == 2
+    assert stats["hits"] == 2
+    assert stats["bytes"] == 16
+
+
+def test_put_skips_known_and_repeated_texts(tmp_path):
+    store = ChunkEmbeddingStore(tmp_path)
+    store.put_many("m1", ["alpha"], [[0.5]])
+    assert store.put_many("m1", ["alpha", "beta", "beta"], [[9.0], [0.25], [0.25]]) == 1
+    assert store.get_many("m1", ["alpha", "beta"]) == [[0.5], [0.25]]
+    assert len(store) == 2
+
+    with pytest.raises(ValueError):
+        store.put_many("m1", ["a", "b"], [[0.0]])
+
+
+def test_survives_restart_and_sees_other_writers(tmp_path):
+    first = ChunkEmbeddingStore(tmp_path)
+    first.put_many("m1", ["alpha"], [[0.125, 0.5]])
+
+    second = ChunkEmbeddingStore(tmp_path)
+    assert second.get_many("m1", ["alpha"]) == [[0.125, 0.5]]
+
+    # Appends by one instance are picked up by the other on lookup
+    second.put_many("m1", ["beta"], [[0.75, 0.5]])
+    assert first.get_many("m1", ["beta", "alpha"]) == [[0.75, 0.5], [0.125, 0.5]]
+
+
+def test_create_chunk_embedding_store_from_env(monkeypatch, tmp_path):
+    monkeypatch.delenv("GOFR_IQ_CHUNK_EMBEDDING_STORE", raising=False)
+    assert isinstance(create_chunk_embedding_store(tmp_path), ChunkEmbeddingStore)
+
+    monkeypatch.setenv("GOFR_IQ_CHUNK_EMBEDDING_STORE", "false")
+    assert create_chunk_embedding_store(tmp_path) is None
+
+
+def _put_from_process(base_path, worker: int, count: int) -> None:
+    store = ChunkEmbeddingStore(base_path)
+    for i in range(count):
+        store.put_many("m1", [f"w{worker}-c{i}"], [[float(worker), float(i)]])
+
+
+def test_concurrent_processes_keep_offsets_consistent(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    workers, count = 4, 200
+    procs = [ctx.Process(target=_put_from_process, args=(tmp_path, w, count)) for w in range(workers)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(timeout=120)
+        assert proc.exitcode == 0
+
+    store = ChunkEmbeddingStore(tmp_path)
+    assert len(store) == workers * count
+    for w in range(workers):
+        texts = [f"w{w}-c{i}" for i in range(count)]
+        assert store.get_many("m1", texts) == [[float(w), float(i)] for i in range(count)]
@@ -0,0 +1,202 @@
+"""Tests for ingest-time client matching."""
+
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models import Source, SourceType, TrustLevel
+from app.services import DocumentStore, IngestService, SourceRegistry
+from app.services.client_matcher import ClientMatcher, create_client_matcher
+from app.services.mandate_embedding_store import MandateEmbeddingStore
+
+
+def client_row(client_guid, profile_guid=None, holdings=(), watchlist=()) -> dict:
+    return {
+        "client_guid": client_guid,
+        "profile_guid": profile_guid,
+        "holdings": list(holdings),
+        "watchlist": list(watchlist),
+    }
+
+
+def make_graph(rows: list[dict], graph_vectors: list[dict] | None = None) -> MagicMock:
+    """GraphIndex stand-in: the universe query returns rows, the unmigrated query graph_vectors."""
+    graph_index = MagicMock()
+    session = graph_index._get_session.return_value.__enter__.return_value
+    session.run.side_effect = lambda query, **kwargs: (
+        list(graph_vectors or []) if "UNWIND $profile_guids" in query else list(rows)
+    )
+    return graph_index
+
+
+@pytest.fixture
+def mandate_store(tmp_path: Path) -> MandateEmbeddingStore:
+    store = MandateEmbeddingStore(tmp_path / "mandate_embeddings")
+    store.put("profile-semis", [1.0, 0.0, 0.0])
+    store.put("profile-energy", [0.0, 1.0, 0.0])
+    return store
+
+
+class TestClientMatcher:
+    def test_matches_positions_and_mandates(self, mandate_store, clock):
+        graph_index = make_graph([
+            client_row("holder", holdings=["TSM"]),
+            client_row("watcher", watchlist=["tsm"]),
+            client_row("semis", profile_guid="profile-semis"),
+            client_row("energy", profile_guid="profile-energy"),
+        ])
+        matcher = ClientMatcher(graph_index, mandate_store, clock=clock)
+
+        recorded = matcher.match_document(
+            "doc-1", "group-1", "Foundry capex jumps",
+            tickers=["TSM"],
+            # Best chunk for "semis" is the second one
+            embeddings=[[0.0, 0.0, 1.0], [0.9, 0.1, 0.0]],
+            impact_score=72.0,
+            impact_tier="GOLD",
+        )
+
+        assert [client for client, _ in recorded] == ["holder", "semis", "watcher"]
+        by_client = dict(recorded)
+        assert by_client["holder"].reasons == ("DIRECT_HOLDING",)
+        assert by_client["holder"].tickers == ("TSM",)
+        assert by_client["watcher"].score == pytest.approx(0.8)
+        assert by_client["semis"].reasons == ("VECTOR",)
+        assert by_client["semis"].similarity == pytest.approx(0.9 / (0.82 ** 0.5), rel=1e-5)
+        assert matcher.get_matches("energy") == []
+
+    def test_inbox_is_bounded_newest_first_and_group_filtered(self, mandate_store, clock):
+        graph_index = make_graph([client_row("holder", holdings=["TSM"])])
+        matcher = ClientMatcher(graph_index, mandate_store, inbox_size=2, clock=clock)
+
+        for i, group in enumerate(["group-1", "group-2", "group-1"]):
+            matcher.match_document(f"doc-{i}", group, f"Story {i}", tickers=["TSM"])
+
+        assert [m.document_guid for m in matcher.get_matches("holder")] == ["doc-2", "doc-1"]
+        assert [m.document_guid for m in matcher.get_matches("holder", group_guids=["group-1"])] == ["doc-2"]
+        assert [m.document_guid for m in matcher.get_matches("holder", limit=1)] == ["doc-2"]
+        assert matcher.stats()["matches_recorded"] == 3
+
+    def test_max_clients_per_document_keeps_best(self, mandate_store, clock):
+        graph_index = make_graph([
+            client_row("watcher", watchlist=["TSM"]),
+            client_row("holder", holdings=["TSM"]),
+        ])
+        matcher = ClientMatcher(graph_index, mandate_store, max_clients_per_document=1, clock=clock)
+
+        recorded = matcher.match_document("doc-1", "group-1", "Story", tickers=["TSM"])
+
+        assert [client for client, _ in recorded] == ["holder"]
+        assert matcher.get_matches("watcher") == []
+
+    def test_unmigrated_mandate_read_from_graph(self, tmp_path, clock):
+        graph_index = make_graph(
+            [client_row("legacy", profile_guid="profile-legacy")],
+            graph_vectors=[{"profile_guid": "profile-legacy", "mandate_embedding": [0.0, 0.0, 2.0]}],
+        )
+        matcher = ClientMatcher(graph_index, MandateEmbeddingStore(tmp_path), clock=clock)
+
+        recorded = matcher.match_document("doc-1", "group-1", "Story", embeddings=[[0.0, 0.0, 1.0]])
+
+        assert [client for client, _ in recorded] == ["legacy"]
+        assert recorded[0][1].similarity == pytest.approx(1.0)
+
+    def test_only_store_misses_are_read_from_graph(self, mandate_store, clock):
+        graph_index = make_graph([
+            client_row("semis", profile_guid="profile-semis"),
+            client_row("legacy", profile_guid="profile-legacy"),
+        ])
+        matcher = ClientMatcher(graph_index, mandate_store, clock=clock)
+
+        matcher.match_document("doc-1", "group-1", "Story", embeddings=[[1.0, 0.0, 0.0]])
+
+        session = graph_index._get_session.return_value.__enter__.return_value
+        unmigrated = [c.kwargs for c in session.run.call_args_list if "UNWIND $profile_guids" in c.args[0]]
+        assert unmigrated == [{"profile_guids": ["profile-legacy"]}]
+
+    def test_reloads_when_invalidated_or_expired(self, mandate_store, clock):
+        rows = [client_row("holder", holdings=["TSM"])]
+        graph_index = make_graph(rows)
+        matcher = ClientMatcher(graph_index, mandate_store, refresh_interval_seconds=60, clock=clock)
+
+        matcher.match_document("doc-1", "group-1", "Story", tickers=["SONY"])
+        rows.append(client_row("sony-holder", holdings=["SONY"]))
+        # Still the cached universe
+        assert matcher.match_document("doc-2", "group-1", "Story", tickers=["SONY"]) == []
+
+        matcher.invalidate()
+        assert [c for c, _ in matcher.match_document("doc-3", "group-1", "Story", tickers=["SONY"])] == ["sony-holder"]
+
+        rows.append(client_row("late-holder", holdings=["SONY"]))
+        clock.now += 61
+        assert len(matcher.match_document("doc-4", "group-1", "Story", tickers=["SONY"])) == 2
+        assert matcher.stats()["refreshes"] == 3
+
+    def test_create_client_matcher_from_env(self, monkeypatch):
+        monkeypatch.delenv("GOFR_IQ_CLIENT_MATCHER", raising=False)
+        assert create_client_matcher(MagicMock()) is None
+
+        monkeypatch.setenv("GOFR_IQ_CLIENT_MATCHER", "1")
+        monkeypatch.setenv("GOFR_IQ_CLIENT_INBOX_SIZE", "50")
+        matcher = create_client_matcher(MagicMock())
+        assert isinstance(matcher, ClientMatcher)
+        assert matcher.inbox_size == 50
+        assert create_client_matcher(None) is None
+
+
+class TestIngestMatchesClients:
+    @pytest.fixture
+    def source_registry(self, tmp_path: Path) -> SourceRegistry:
+        return SourceRegistry(base_path=tmp_path / "sources")
+
+    @pytest.fixture
+    def source(self, source_registry: SourceRegistry) -> Source:
+        return source_registry.create(
+            name="Test Source",
+            source_type=SourceType.NEWS_AGENCY,
+            region="APAC",
+            languages=["en"],
+            trust_level=TrustLevel.HIGH,
+        )
+
+    def test_successful_ingest_is_matched_once(self, tmp_path, source_registry, source):
+        matcher = MagicMock()
+        service = IngestService(
+            document_store=DocumentStore(base_path=tmp_path / "documents"),
+            source_registry=source_registry,
+            client_matcher=matcher,
+        )
+        group_guid = str(uuid.uuid4())
+        content = "The central bank held rates steady on Tuesday while signalling two cuts later in the year."
+
+        result = service.ingest("Rates on hold", content, source.source_guid, group_guid)
+        duplicate = service.ingest("Rates on hold", content, source.source_guid, group_guid)
+
+        assert duplicate.is_duplicate
+        matcher.match_document.assert_called_once()
+        kwargs = matcher.match_document.call_args.kwargs
+        assert kwargs["document_guid"] == result.guid
+        assert kwargs["group_guid"] == group_guid
+        assert kwargs["title"] == "Rates on hold"
+
+    def test_matcher_failure_does_not_fail_ingest(self, tmp_path, source_registry, source):
+        matcher = MagicMock()
+        matcher.match_document.side_effect = RuntimeError("neo4j down")
+        service = IngestService(
+            document_store=DocumentStore(base_path=tmp_path / "documents"),
+            source_registry=source_registry,
+            client_matcher=matcher,
+        )
+
+        result = service.ingest(
+            "Rates on hold",
+            "The central bank held rates steady on Tuesday while signalling two cuts later in the year.",
+            source.source_guid,
+            str(uuid.uuid4()),
+        )
+
+        assert result.is_success
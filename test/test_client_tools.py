@@ -13,9 +13,11 @@ Group Access Control:
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import json
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from mcp.server.fastmcp import FastMCP
@@ -118,6 +120,7 @@ class TestToolRegistration:
         assert "create_client" in registered_tools
         assert "get_client_feed" in registered_tools
         assert "get_top_client_news" in registered_tools
+        assert "get_top_client_news_batch" in registered_tools
         assert "why_it_matters_to_client" in registered_tools
         assert "add_to_portfolio" in registered_tools
         assert "add_to_watchlist" in registered_tools
@@ -781,6 +784,119 @@ class TestGetTopClientNews:
         assert "PEER" in second_article["reasons"]
 
 
+class TestGetTopClientNewsBatch:
+    """Tests for get_top_client_news_batch tool"""
+
+    @patch('app.tools.client_tools.get_group_uuids_by_names')
+    @patch('app.tools.client_tools.resolve_permitted_groups')
+    def test_batch_skips_unknown_and_defunct(
+        self,
+        mock_permitted_groups: MagicMock,
+        mock_get_group_uuids: MagicMock,
+        mcp_server: FastMCP,
+        mock_graph_index: MagicMock,
+        mock_query_service: MagicMock,
+    ) -> None:
+        """Only active clients are fed to the shared-pool batch"""
+        mock_permitted_groups.return_value = [TEST_PUBLIC_GROUP, TEST_GROUP]
+        mock_get_group_uuids.return_value = ["group-uuid"]
+        register_client_tools(mcp_server, mock_graph_index, query_service=mock_query_service)
+
+        mock_session = MagicMock()
+        mock_session.run.return_value = [
+            {"guid": "client-1", "status": "active"},
+            {"guid": "client-2", "status": "defunct"},
+            {"guid": "client-3", "status": None},
+        ]
+        mock_session.__enter__ = MagicMock(return_value=mock_session)
+        mock_session.__exit__ = MagicMock(return_value=None)
+        mock_graph_index._get_session.return_value = mock_session
+
+        article = {
+            "document_guid": "doc-1",
+            "title": "Client-Relevant News",
+            "impact_score": 85,
+            "relevance_score": 0.9,
+            "reasons": ["DIRECT_HOLDING"],
+        }
+        mock_query_service.iter_top_client_news_batch.return_value = iter([
+            ("client-1", [article]),
+            ("client-3", []),
+        ])
+
+        tool_fn = get_tool_fn(mcp_server, "get_top_client_news_batch")
+        response = tool_fn(client_guids=["client-1", "client-2", "client-3", "client-4"], limit=3)
+        result = parse_response(response)
+
+        assert result["status"] == "success"
+        assert result["data"]["client_count"] == 2
+        assert result["data"]["unknown_clients"] == ["client-4"]
+        assert result["data"]["defunct_clients"] == ["client-2"]
+        feeds = {f["client_guid"]: f for f in result["data"]["feeds"]}
+        assert feeds["client-1"]["articles"][0]["document_guid"] == "doc-1"
+        assert feeds["client-3"]["total_count"] == 0
+
+        call_kwargs = mock_query_service.iter_top_client_news_batch.call_args[1]
+        assert call_kwargs["client_guids"] == ["client-1", "client-3"]
+        assert call_kwargs["group_guids"] == ["group-uuid"]
+
+    @patch('app.tools.client_tools.get_group_uuids_by_names')
+    @patch('app.tools.client_tools.resolve_permitted_groups')
+    def test_batch_backfills_missing_impact_score(
+        self,
+        mock_permitted_groups: MagicMock,
+        mock_get_group_uuids: MagicMock,
+        mcp_server: FastMCP,
+        mock_graph_index: MagicMock,
+        mock_query_service: MagicMock,
+    ) -> None:
+        """Articles without impact_score are backfilled like get_top_client_news, in one query"""
+        mock_permitted_groups.return_value = [TEST_PUBLIC_GROUP, TEST_GROUP]
+        mock_get_group_uuids.return_value = ["group-uuid"]
+        register_client_tools(mcp_server, mock_graph_index, query_service=mock_query_service)
+
+        mock_session = MagicMock()
+        mock_session.run.side_effect = [
+            [{"guid": "client-1", "status": "active"}, {"guid": "client-2", "status": "active"}],
+            [{"guid": "doc-1", "impact_score": 72}, {"guid": "doc-2", "impact_score": 10}],
+        ]
+        mock_session.__enter__ = MagicMock(return_value=mock_session)
+        mock_session.__exit__ = MagicMock(return_value=None)
+        mock_graph_index._get_session.return_value = mock_session
+
+        mock_query_service.iter_top_client_news_batch.return_value = iter([
+            ("client-1", [{"document_guid": "doc-1", "impact_score": None}]),
+            ("client-2", [{"document_guid": "doc-2", "impact_score": None}]),
+        ])
+
+        tool_fn = get_tool_fn(mcp_server, "get_top_client_news_batch")
+        result = parse_response(tool_fn(client_guids=["client-1", "client-2"], min_impact_score=50))
+
+        assert result["status"] == "success"
+        feeds = {f["client_guid"]: f for f in result["data"]["feeds"]}
+        assert feeds["client-1"]["articles"] == [{"document_guid": "doc-1", "impact_score": 72}]
+        assert feeds["client-2"]["articles"] == []
+        assert mock_session.run.call_count == 2
+        assert mock_session.run.call_args.kwargs["guids"] == ["doc-1", "doc-2"]
+
+    @patch('app.tools.client_tools.resolve_permitted_groups')
+    def test_batch_without_query_service(
+        self,
+        mock_permitted_groups: MagicMock,
+        mcp_server: FastMCP,
+        mock_graph_index: MagicMock,
+    ) -> None:
+        """Test error when QueryService is not configured"""
+        mock_permitted_groups.return_value = [TEST_PUBLIC_GROUP, TEST_GROUP]
+        register_client_tools(mcp_server, mock_graph_index)
+
+        tool_fn = get_tool_fn(mcp_server, "get_top_client_news_batch")
+        result = parse_response(tool_fn(client_guids=["client-1"]))
+
+        assert result["status"] == "error"
+        assert result["error_code"] == "QUERY_SERVICE_UNAVAILABLE"
+
+
 class TestWhyItMattersToClient:
     """Tests for why_it_matters_to_client tool"""
 
@@ -828,6 +944,45 @@ class TestWhyItMattersToClient:
 
         mock_query_service.why_it_matters_to_client.assert_called_once()
 
+    @patch('app.tools.client_tools.resolve_permitted_groups')
+    def test_async_llm_service_registers_native_async_tool(
+        self,
+        mock_permitted_groups: MagicMock,
+        mcp_server: FastMCP,
+        mock_graph_index: MagicMock,
+        mock_query_service: MagicMock,
+    ) -> None:
+        mock_permitted_groups.return_value = [TEST_PUBLIC_GROUP, TEST_GROUP]
+        mock_graph_index.get_node.return_value = GraphNode(
+            label=NodeLabel.CLIENT,
+            guid="client-123",
+            properties={"name": "Test Fund"},
+        )
+        mock_query_service.awhy_it_matters_to_client = AsyncMock(return_value={
+            "why_it_matters": "Client exposed via holdings.",
+            "story_summary": "Company beat earnings.",
+        })
+        async_llm = MagicMock()
+
+        register_client_tools(
+            mcp_server,
+            mock_graph_index,
+            query_service=mock_query_service,
+            llm_service=MagicMock(),
+            async_llm_service=async_llm,
+        )
+
+        tool_fn = get_tool_fn(mcp_server, "why_it_matters_to_client")
+        assert inspect.iscoroutinefunction(tool_fn)
+        assert list(inspect.signature(tool_fn).parameters) == ["client_guid", "document_guid", "auth_tokens"]
+
+        result = parse_response(asyncio.run(tool_fn(client_guid="client-123", document_guid="doc-123")))
+
+        assert result["status"] == "success"
+        assert result["data"]["why_it_matters"] == "Client exposed via holdings."
+        assert mock_query_service.awhy_it_matters_to_client.await_args.kwargs["llm_service"] is async_llm
+        mock_query_service.why_it_matters_to_client.assert_not_called()
+
 
 # ============================================================================
 # Add to Portfolio Tests
@@ -21,6 +21,10 @@ import pytest
 
 from app.models import Document, DocumentCreate
 from app.services import DocumentNotFoundError, DocumentStore
+from app.services.document_store import DocumentAccessDeniedError
+
+GROUP_A = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+GROUP_B = "b2c3d4e5-f6a7-8901-bcde-f12345678901"
 
 
 class TestDocumentStoreSaveLoad:
@@ -514,3 +518,86 @@ class TestDocumentStoreEdgeCases:
 
         assert "DocumentStore" in repr_str
         assert str(tmp_path) in repr_str
+
+
+class TestDocumentPathIndex:
+    """Tests for the GUID -> (group, date) index"""
+
+    def _doc(self, group_guid: str, days_ago: int = 0) -> Document:
+        return Document(
+            source_guid="7c9e6679-7425-40de-944b-e07fc1f90ae7",
+            group_guid=group_guid,
+            title="Indexed Document",
+            content="Indexed content.",
+            created_at=datetime.now(UTC) - timedelta(days=days_ago),
+        )
+
+    def test_load_uses_index_not_directory_scan(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Indexed loads go straight to the file."""
+        store = DocumentStore(tmp_path)
+        for days_ago in range(3):
+            store.save(self._doc(GROUP_A, days_ago=days_ago))
+        target = self._doc(GROUP_A, days_ago=5)
+        store.save(target)
+
+        def no_scan(self: Path) -> None:
+            raise AssertionError("directory scanned")
+
+        monkeypatch.setattr(Path, "iterdir", no_scan)
+        assert store.load(target.guid, GROUP_A).guid == target.guid
+        assert store.load_with_access_check(target.guid, [GROUP_B, GROUP_A]).guid == target.guid
+        with pytest.raises(DocumentAccessDeniedError):
+            store.load_with_access_check(target.guid, [GROUP_B])
+        with pytest.raises(DocumentNotFoundError):
+            store.load(target.guid, GROUP_B)
+
+    def test_index_follows_delete_and_versions(self, tmp_path: Path) -> None:
+        """delete and save_version keep the index current."""
+        store = DocumentStore(tmp_path)
+        doc = self._doc(GROUP_A)
+        store.save(doc)
+        v2 = store.save_version(doc, {"title": "Updated"})
+
+        assert store.index is not None
+        assert store.index.get(v2.guid) == (GROUP_A, v2.created_at.strftime("%Y-%m-%d"))
+        assert [d.guid for d in store.get_version_chain(v2.guid, GROUP_A)] == [doc.guid, v2.guid]
+
+        assert store.delete(doc.guid, GROUP_A) is True
+        assert store.index.get(doc.guid) is None
+        with pytest.raises(DocumentNotFoundError):
+            store.load_with_access_check(doc.guid, [GROUP_A])
+
+    def test_index_shared_between_stores_and_rebuilt(self, tmp_path: Path) -> None:
+        """A second store sees the first one's writes; rebuild picks up unindexed files."""
+        first = DocumentStore(tmp_path)
+        second = DocumentStore(tmp_path)
+        doc = self._doc(GROUP_A)
+        first.save(doc)
+        assert second.load(doc.guid, GROUP_A).guid == doc.guid
+
+        # A file written without the index is still found, then indexed
+        unindexed = DocumentStore(tmp_path, use_index=False)
+        stray = self._doc(GROUP_B, days_ago=2)
+        unindexed.save(stray)
+        assert first.load(stray.guid, GROUP_B).guid == stray.guid
+        assert first.index is not None and first.index.get(stray.guid) is not None
+
+        first.delete(doc.guid, GROUP_A)
+        assert first.index.stats()["dead_lines"] == 2
+        assert second.rebuild_index() == 1
+        assert first.index.stats() == {
+            "documents": 1,
+            "dead_lines": 0,
+            "bytes": (tmp_path / "guid_index.tsv").stat().st_size,
+        }
+
+    def test_existing_store_is_indexed_on_open(self, tmp_path: Path) -> None:
+        """Opening a store that predates the index builds it from the tree."""
+        unindexed = DocumentStore(tmp_path, use_index=False)
+        doc = self._doc(GROUP_A, days_ago=1)
+        unindexed.save(doc)
+        assert not (tmp_path / "guid_index.tsv").exists()
+
+        store = DocumentStore(tmp_path)
+        assert store.index is not None
+        assert store.index.get(doc.guid) == (GROUP_A, doc.created_at.strftime("%Y-%m-%d"))
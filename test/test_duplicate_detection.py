@@ -5,9 +5,12 @@ Tests for detecting exact and near-duplicate documents at ingestion time.
 
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
+
 from app.services import (
     DuplicateDetector,
     DuplicateResult,
+    MinHashLSHIndex,
     check_duplicate,
     compute_content_hash,
     cosine_similarity,
@@ -345,6 +348,19 @@ class TestDuplicateDetectorManagement:
 
         assert detector.document_count == 0
 
+    def test_unregister_drops_story_fingerprint(self) -> None:
+        """Registered story fingerprints are removed with the document."""
+        detector = DuplicateDetector()
+
+        detector.register("doc-001", "Title 1", "Content 1", group="g1", story_fingerprint="fp-1")
+        detector.register("doc-002", "Title 2", "Content 2", group="g1", story_fingerprint="fp-1")
+        detector.unregister("doc-001")
+        assert detector._fingerprint_index == {"fp-1": {"doc-002"}}
+
+        detector.unregister("doc-002")
+        assert detector._fingerprint_index == {}
+        assert detector._fingerprints == {}
+
     def test_check_and_register(self) -> None:
         """Test check_and_register convenience method."""
         detector = DuplicateDetector()
@@ -466,6 +482,87 @@ class TestEdgeCases:
         assert result.is_duplicate is True
 
 
+# =============================================================================
+# INDEXED SIMILARITY TESTS
+# =============================================================================
+
+
+class TestIndexedSimilarity:
+    """Tests for the MinHash/LSH candidate index behind similarity matching."""
+
+    BASE = (
+        "Acme Corp reported quarterly revenue of 4.2 billion dollars, beating analyst "
+        "expectations as cloud sales grew 31 percent and operating margins widened"
+    )
+
+    def test_lsh_banding_for_threshold(self) -> None:
+        """Higher thresholds use more rows per band (fewer false candidates)."""
+        strict = MinHashLSHIndex.for_threshold(0.85)
+        loose = MinHashLSHIndex.for_threshold(0.5)
+        assert strict.rows > loose.rows
+        assert strict.bands * strict.rows <= 128
+
+    def test_lsh_candidates_and_remove(self) -> None:
+        """Identical hashes collide in every band; removed docs are not returned."""
+        index = MinHashLSHIndex(bands=8, rows=4)
+        hashes = [hash(t) & ((1 << 64) - 1) for t in self.BASE.split()]
+        index.add("doc-001", hashes)
+        assert index.candidates(hashes) == {"doc-001"}
+        assert index.remove("doc-001") is True
+        assert index.candidates(hashes) == set()
+        assert len(index) == 0
+
+    def test_paraphrase_matches_linear_cosine(self) -> None:
+        """Indexed check reports the same score as cosine over token lists."""
+        detector = DuplicateDetector(use_hash_detection=False, similarity_threshold=0.85)
+        paraphrase = self.BASE.replace("widened", "expanded")
+        detector.register("doc-001", "Acme beats", self.BASE)
+        detector.register("doc-002", "Unrelated", "Central bank holds rates steady amid sticky inflation")
+
+        result = detector.check("Acme beats", paraphrase)
+        expected = cosine_similarity(tokenize(f"Acme beats {self.BASE}"), tokenize(f"Acme beats {paraphrase}"))
+        assert result.is_duplicate is True
+        assert result.duplicate_of == "doc-001"
+        assert result.score == expected
+
+    def test_time_window_pruning(self) -> None:
+        """Documents outside time_window_hours are not near-duplicate candidates."""
+        detector = DuplicateDetector(use_hash_detection=False, time_window_hours=48)
+        now = datetime.now(UTC)
+        detector.register("old", "Acme beats", self.BASE, created_at=now - timedelta(hours=72))
+        assert detector.check("Acme beats", self.BASE, created_at=now).is_duplicate is False
+
+        detector.register("recent", "Acme beats", self.BASE, created_at=now - timedelta(hours=1))
+        result = detector.check("Acme beats", self.BASE, created_at=now)
+        assert result.duplicate_of == "recent"
+
+        assert detector.prune(now - timedelta(hours=48)) == 1
+        assert detector.document_count == 1
+
+    def test_unregister_removes_from_index(self) -> None:
+        """Unregistered documents are no longer similarity candidates."""
+        detector = DuplicateDetector(use_hash_detection=False)
+        detector.register("doc-001", "Acme beats", self.BASE)
+        detector.unregister("doc-001")
+        assert detector.check("Acme beats", self.BASE).is_duplicate is False
+
+    def test_reregister_replaces_entry(self) -> None:
+        """Registering an existing GUID replaces its content in the index."""
+        detector = DuplicateDetector(use_hash_detection=False)
+        detector.register("doc-001", "Acme beats", self.BASE)
+        detector.register("doc-001", "Rates", "Central bank holds rates steady amid sticky inflation")
+        assert detector.document_count == 1
+        assert detector.check("Acme beats", self.BASE).is_duplicate is False
+
+    def test_threshold_change_rebuilds_index(self) -> None:
+        """Lowering the threshold after registration still finds weaker matches."""
+        detector = DuplicateDetector(use_hash_detection=False, similarity_threshold=0.99)
+        detector.register("doc-001", "Title", "Hello world test content")
+        assert detector.check("Title", "Hello world test different").is_duplicate is False
+        detector.similarity_threshold = 0.5
+        assert detector.check("Title", "Hello world test different").is_duplicate is True
+
+
 # =============================================================================
 # CONVENIENCE FUNCTION TESTS
 # =============================================================================
@@ -0,0 +1,114 @@
+"""Tests for the concurrent embedding batch dispatcher."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from app.services.embedding_dispatcher import (
+    EmbeddingDispatcher,
+    TokenBucket,
+    create_embedding_dispatcher,
+    estimate_tokens,
+)
+from app.services.llm_service import EmbeddingResult, LLMAPIError, LLMRateLimitError
+
+
+class FakeEmbeddingService:
+    """Embeds text as [len(text)]; optionally throttles the first calls."""
+
+    def __init__(self, rate_limited_calls: int = 0, retry_after: float | None = 0.01) -> None:
+        self.rate_limited_calls = rate_limited_calls
+        self.retry_after = retry_after
+        self.batches: list[list[str]] = []
+        self.retries_seen: list[int | None] = []
+        self._lock = threading.Lock()
+
+    def generate_embeddings(self, texts, model=None, retries=None):  # type: ignore[no-untyped-def]
+        with self._lock:
+            self.retries_seen.append(retries)
+            if self.rate_limited_calls > 0:
+                self.rate_limited_calls -= 1
+                raise LLMRateLimitError(self.retry_after)
+            self.batches.append(list(texts))
+        # Later batches finish first to exercise reordering
+        time.sleep(0.01 / (len(self.batches) + 1))
+        return EmbeddingResult(embeddings=[[float(len(t))] for t in texts], model=model or "fake")
+
+
+def test_plan_batches_by_text_and_token_count():
+    dispatcher = EmbeddingDispatcher(FakeEmbeddingService(), max_batch_texts=3, max_batch_tokens=10)
+    texts = ["aaaa"] * 5 + ["x" * 100, "bbbb"]
+    assert estimate_tokens("x" * 100) == 25
+    assert dispatcher.plan_batches(texts) == [[0, 1, 2], [3, 4], [5], [6]]
+
+
+def test_embed_returns_results_in_input_order():
+    service = FakeEmbeddingService()
+    dispatcher = EmbeddingDispatcher(service, max_concurrency=4, max_batch_texts=2)
+    texts = ["a" * n for n in range(1, 12)]
+
+    assert dispatcher.embed(texts) == [[float(n)] for n in range(1, 12)]
+    assert len(service.batches) == 6
+    # LLMService must not sleep on 429s itself
+    assert set(service.retries_seen) == {0}
+
+
+def test_rate_limit_pauses_and_retries():
+    service = FakeEmbeddingService(rate_limited_calls=2)
+    dispatcher = EmbeddingDispatcher(service, max_concurrency=2, max_batch_texts=1)
+
+    assert dispatcher.embed(["a", "bb", "ccc"]) == [[1.0], [2.0], [3.0]]
+    stats = dispatcher.stats()
+    assert stats["rate_limited"] == 2
+    assert stats["retries"] == 2
+    assert stats["requests"] == 5
+
+
+def test_rate_limit_gives_up_after_max_retries():
+    dispatcher = EmbeddingDispatcher(FakeEmbeddingService(rate_limited_calls=10), max_retries=1)
+    with pytest.raises(LLMRateLimitError):
+        dispatcher.embed(["a"])
+
+
+def test_count_mismatch_is_an_error():
+    class ShortService(FakeEmbeddingService):
+        def generate_embeddings(self, texts, model=None, retries=None):  # type: ignore[no-untyped-def]
+            return EmbeddingResult(embeddings=[[1.0]], model="fake")
+
+    with pytest.raises(LLMAPIError):
+        EmbeddingDispatcher(ShortService()).embed(["a", "b"])
+
+
+def test_token_bucket_rate_and_shared_pause(clock):
+    bucket = TokenBucket(rate=2.0, capacity=2.0, clock=clock, sleep=clock.sleep)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(0.5)
+
+    bucket.pause_for(3.0)
+    start = clock.now
+    bucket.acquire()
+    # Waits out the pause, then refills one token from an empty bucket
+    assert clock.now - start == pytest.approx(3.5)
+
+    unlimited = TokenBucket(clock=clock, sleep=clock.sleep)
+    unlimited.pause_for(1.0)
+    assert unlimited.acquire() == pytest.approx(1.0)
+    assert unlimited.acquire() == 0.0
+
+
+def test_create_embedding_dispatcher_from_env(monkeypatch):
+    monkeypatch.delenv("GOFR_IQ_EMBEDDING_CONCURRENCY", raising=False)
+    assert create_embedding_dispatcher(FakeEmbeddingService()) is None
+
+    monkeypatch.setenv("GOFR_IQ_EMBEDDING_CONCURRENCY", "8")
+    monkeypatch.setenv("GOFR_IQ_EMBEDDING_RPS", "20")
+    monkeypatch.setenv("GOFR_IQ_EMBEDDING_BATCH_TOKENS", "4000")
+    dispatcher = create_embedding_dispatcher(FakeEmbeddingService())
+    assert dispatcher is not None
+    assert dispatcher.max_concurrency == 8
+    assert dispatcher.bucket.rate == 20
+    assert dispatcher.max_batch_tokens == 4000
@@ -4,15 +4,35 @@ Tests ChromaDB-based embedding storage and similarity search.
 """
 
 import pytest
+import uuid
+from datetime import datetime, timezone
 from pathlib import Path
 
 from app.services.embedding_index import (
     Chunk,
     ChunkConfig,
+    DeterministicEmbeddingFunction,
     EmbeddingIndex,
+    PreparedEmbedding,
     SimilarityResult,
+    build_where_clause,
     create_embedding_index,
+    filterable_metadata,
 )
+from app.services.chunk_embedding_store import ChunkEmbeddingStore
+from app.services.query_embedding_cache import QueryEmbeddingCache
+
+
+class CountingEmbeddingFunction(DeterministicEmbeddingFunction):
+    """Deterministic embeddings that record the batch size of each call"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[int] = []
+
+    def __call__(self, input):  # type: ignore[no-untyped-def]
+        self.calls.append(len(input))
+        return super().__call__(input)
 
 
 class TestChunkConfig:
@@ -291,6 +311,135 @@ class TestDocumentEmbedding:
         assert index.count() == count_after_first
 
 
+class TestPreparedEmbedding:
+    """Tests for embedding a document once and reusing the vectors"""
+
+    def test_probe_embedding_is_normalized_mean(self) -> None:
+        """Multi-chunk probe is the unit-length mean of the chunk vectors"""
+        prepared = PreparedEmbedding(chunks=[], embeddings=[[1.0, 0.0], [0.0, 1.0]])
+        probe = prepared.probe_embedding
+        assert probe == pytest.approx([2**-0.5, 2**-0.5])
+        assert PreparedEmbedding(chunks=[], embeddings=[[0.3, 0.4]]).probe_embedding == [0.3, 0.4]
+        assert PreparedEmbedding(chunks=[], embeddings=[]).probe_embedding == []
+
+    def test_embed_document_reuses_prepared_vectors(self) -> None:
+        """embed_document(prepared=...) does not call the embedding function again"""
+        calls: list[int] = []
+        base = DeterministicEmbeddingFunction()
+
+        def counting(texts):  # type: ignore[no-untyped-def]
+            calls.append(len(texts))
+            return base(texts)
+
+        index = EmbeddingIndex()
+        index._embedding_function = counting  # type: ignore[assignment]
+        content = "Chip maker raises guidance on strong data center demand."
+        prepared = index.prepare_document("doc123", content)
+        assert calls == [1]
+
+        index.embed_document(
+            document_guid="doc123",
+            content=content,
+            group_guid="group1",
+            source_guid="source1",
+            language="en",
+            prepared=prepared,
+        )
+        assert calls == [1]
+
+        results = index.search_by_embedding(prepared.probe_embedding, n_results=1)
+        assert results[0].document_guid == "doc123"
+        assert results[0].score == pytest.approx(1.0, abs=1e-4)
+
+    def test_duplicate_probe_is_content_only(self) -> None:
+        """A republished story with a rewritten headline still matches on embedding"""
+        from app.services.duplicate_detector import DuplicateDetector
+
+        index = EmbeddingIndex()
+        content = "Chip maker raises guidance on strong data center demand."
+        index.embed_document(
+            document_guid="doc123",
+            content=content,
+            group_guid="group1",
+            source_guid="source1",
+            language="en",
+            prepared=index.prepare_document("doc123", content),
+        )
+
+        result = DuplicateDetector(use_hash_detection=False).check(
+            "Completely different headline",
+            content,
+            embedding_index=index,
+            query_embedding=index.prepare_document("doc456", content).probe_embedding,
+        )
+
+        assert result.is_duplicate
+        assert result.duplicate_of == "doc123"
+        assert result.method == "embedding"
+
+
+class TestChunkEmbeddingStore:
+    """Tests for reusing stored chunk embeddings on re-embedding"""
+
+    def test_reembedding_unchanged_chunks_is_free(self, tmp_path: Path) -> None:
+        """Re-indexing unchanged content after clear() makes no embedding calls"""
+        embedder = CountingEmbeddingFunction()
+        calls = embedder.calls
+
+        content = "Chip maker raises guidance on strong data center demand. " * 40
+        index = EmbeddingIndex(
+            chunk_config=ChunkConfig(chunk_size=500, chunk_overlap=50),
+            embedding_function=embedder,
+            chunk_store=ChunkEmbeddingStore(tmp_path / "embeddings"),
+        )
+
+        index.embed_document("doc1", content, "group1", "source1", "en")
+        assert sum(calls) > 1
+
+        calls.clear()
+        index.clear()
+        index.embed_document("doc1", content, "group1", "source1", "en")
+        index.prepare_document("doc1-v2", content)
+        assert calls == []
+        assert index.count() > 1
+
+        # Only chunks whose text changed are embedded for an edited version
+        index.embed_document("doc1", content + " Updated outlook.", "group1", "source1", "en")
+        assert len(calls) == 1
+        assert calls[0] < index.count()
+
+
+class TestQueryEmbeddingCache:
+    """Tests for caching query embeddings on the search path"""
+
+    def test_repeated_search_embeds_query_once(self) -> None:
+        """A repeated query is served from the cache instead of the embedding function"""
+        calls: list[list[str]] = []
+        base = DeterministicEmbeddingFunction()
+
+        def counting(texts):  # type: ignore[no-untyped-def]
+            calls.append(list(texts))
+            return base(texts)
+
+        cache = QueryEmbeddingCache()
+        index = EmbeddingIndex(query_cache=cache)
+        index.embed_document(
+            document_guid="doc1",
+            content="Apple Inc. reported strong quarterly earnings driven by iPhone sales.",
+            group_guid="group1",
+            source_guid="source1",
+            language="en",
+        )
+        index._embedding_function = counting  # type: ignore[assignment]
+
+        first = index.search("iPhone earnings", n_results=1)
+        second = index.search("iPhone  earnings", n_results=1)
+
+        assert calls == [["iPhone earnings"]]
+        assert [r.document_guid for r in first] == [r.document_guid for r in second] == ["doc1"]
+        assert cache.stats()["hits"] == 1
+
+
 class TestSimilaritySearch:
     """Tests for similarity search functionality"""
 
@@ -377,6 +526,149 @@ class TestSimilaritySearch:
 
         assert results == []
 
+    def test_search_by_embeddings_matches_single_searches(self, index: EmbeddingIndex) -> None:
+        """One batched query returns the same hits as one search_by_embedding per vector"""
+        queries = index.embed_queries(["iPhone earnings", "interest rates"])
+
+        batched = index.search_by_embeddings(queries, n_results=2, group_guids=["group1", "group2"])
+
+        assert len(batched) == 2
+        for query, hits in zip(queries, batched):
+            single = index.search_by_embedding(query, n_results=2, group_guids=["group1", "group2"])
+            assert [(r.chunk_id, r.score) for r in hits] == [(r.chunk_id, r.score) for r in single]
+        assert batched[0][0].document_guid == "doc1"
+        assert index.search_by_embeddings([]) == []
+
+
+class TestFilterPushdown:
+    """Tests for date/impact/tier/sector filters evaluated by Chroma"""
+
+    @pytest.fixture
+    def index(self) -> EmbeddingIndex:
+        """Create index with documents carrying filterable metadata"""
+        idx = EmbeddingIndex()
+        docs = [
+            ("doc1", datetime(2026, 1, 5, tzinfo=timezone.utc), 80.0, "gold", ["Technology"]),
+            ("doc2", datetime(2026, 1, 10, tzinfo=timezone.utc), 40.0, "BRONZE", ["Energy"]),
+            ("doc3", datetime(2026, 1, 15, tzinfo=timezone.utc), 95.0, "PLATINUM", ["Technology", "Energy"]),
+        ]
+        for guid, created_at, score, tier, sectors in docs:
+            idx.embed_document(
+                document_guid=guid,
+                content=f"Market update {guid} on earnings and guidance.",
+                group_guid="group1",
+                source_guid="source1",
+                language="en",
+                metadata={
+                    "created_at": created_at.isoformat(),
+                    "impact_score": score,
+                    "impact_tier": tier,
+                    "sectors": sectors,
+                },
+            )
+        return idx
+
+    def test_filterable_metadata(self) -> None:
+        """List fields become boolean keys, tiers are upper-cased, dates become epoch seconds"""
+        derived = filterable_metadata(
+            {
+                "created_at": "2026-01-01T00:00:00",
+                "impact_score": 72,
+                "impact_tier": "silver",
+                "region": "EMEA",
+                "sectors": ["Consumer Discretionary"],
+                "companies": "ACME Corp",
+            }
+        )
+        assert derived == {
+            "created_at_ts": datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp(),
+            "impact_score": 72.0,
+            "impact_tier": "SILVER",
+            "region": "EMEA",
+            "region_emea": True,
+            "sector_consumer_discretionary": True,
+            "company_acme_corp": True,
+        }
+        assert filterable_metadata({"impact_score": True}) == {}
+
+    def test_build_where_clause(self) -> None:
+        """Single filter is returned bare, several are combined with $and"""
+        assert build_where_clause() is None
+        assert build_where_clause(group_guids=["g1"]) == {"group_guid": {"$in": ["g1"]}}
+        where = build_where_clause(
+            group_guids=["g1"],
+            created_from=datetime(2026, 1, 1),
+            min_impact_score=50,
+            impact_tiers=["gold"],
+            sectors=["Energy", "Technology"],
+        )
+        assert where == {
+            "$and": [
+                {"group_guid": {"$in": ["g1"]}},
+                {"created_at_ts": {"$gte": datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()}},
+                {"impact_score": {"$gte": 50.0}},
+                {"impact_tier": {"$in": ["GOLD"]}},
+                {"$or": [{"sector_energy": True}, {"sector_technology": True}]},
+            ]
+        }
+
+    def test_search_with_date_range(self, index: EmbeddingIndex) -> None:
+        """Date bounds are applied inside the vector query"""
+        results = index.search(
+            "earnings",
+            n_results=10,
+            created_from=datetime(2026, 1, 8),
+            created_to=datetime(2026, 1, 12, tzinfo=timezone.utc),
+        )
+        assert {r.document_guid for r in results} == {"doc2"}
+
+    def test_search_with_impact_filters(self, index: EmbeddingIndex) -> None:
+        """Minimum score and tier filters are applied inside the vector query"""
+        results = index.search("earnings", n_results=10, min_impact_score=75)
+        assert {r.document_guid for r in results} == {"doc1", "doc3"}
+
+        results = index.search("earnings", n_results=10, impact_tiers=["gold", "bronze"])
+        assert {r.document_guid for r in results} == {"doc1", "doc2"}
+
+    def test_search_with_sector_filter(self, index: EmbeddingIndex) -> None:
+        """Sector membership matches any of the requested sectors"""
+        results = index.search("earnings", n_results=10, sectors=["energy"])
+        assert {r.document_guid for r in results} == {"doc2", "doc3"}
+
+    def test_search_matches_any_document_region(self) -> None:
+        """Every extracted region is filterable, not only the primary one"""
+        idx = EmbeddingIndex(collection_name=f"regions_{uuid.uuid4().hex}")
+        idx.embed_document(
+            document_guid="doc1",
+            content="Chipmaker expands fabs in Taiwan and Germany.",
+            group_guid="group1",
+            source_guid="source1",
+            language="en",
+            metadata={"region": "APAC", "regions": ["APAC", "EMEA"]},
+        )
+        assert build_where_clause(regions=["emea", "Americas"]) == {
+            "$or": [{"region_americas": True}, {"region_emea": True}]
+        }
+        assert [r.document_guid for r in idx.search("chipmaker", n_results=5, regions=["EMEA"])] == ["doc1"]
+        assert idx.search("chipmaker", n_results=5, regions=["Americas"]) == []
+
+    def test_backfill_filter_metadata(self) -> None:
+        """Chunks indexed without filterable keys are updated once"""
+        # Own collection: ephemeral clients share chunks indexed by other tests
+        idx = EmbeddingIndex(collection_name=f"backfill_{uuid.uuid4().hex}")
+        # Chunk written before filterable metadata existed
+        idx._collection.upsert(
+            ids=["doc1_0"],
+            documents=["Legacy chunk without filter keys."],
+            metadatas=[{"document_guid": "doc1", "impact_score": 60, "impact_tier": "silver"}],
+        )
+        assert idx.search("legacy", n_results=5, impact_tiers=["SILVER"]) == []
+
+        assert idx.backfill_filter_metadata(dry_run=True) == {"scanned": 1, "updated": 1}
+        assert idx.backfill_filter_metadata() == {"scanned": 1, "updated": 1}
+        assert idx.backfill_filter_metadata() == {"scanned": 1, "updated": 0}
+        assert [r.document_guid for r in idx.search("legacy", n_results=5, impact_tiers=["SILVER"])] == ["doc1"]
+
 
 class TestCrossLanguageSearch:
     """Tests for cross-language similarity search"""
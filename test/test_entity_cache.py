@@ -0,0 +1,98 @@
+"""Tests for the shared entity resolution cache."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from app.services.entity_cache import (
+    COMPANY,
+    INSTRUMENT,
+    EntityResolutionCache,
+    create_entity_resolution_cache,
+)
+
+
+def test_lookup_put_and_case_rules():
+    cache = EntityResolutionCache()
+    assert cache.lookup(INSTRUMENT, "AAPL") == (False, None)
+
+    cache.put(INSTRUMENT, "AAPL", "inst-AAPL")
+    cache.put(COMPANY, "Apple Inc", "comp-apple-inc")
+
+    assert cache.lookup(INSTRUMENT, "AAPL") == (True, "inst-AAPL")
+    # Tickers are exact, company names are case-folded
+    assert cache.lookup(INSTRUMENT, "aapl") == (False, None)
+    assert cache.lookup(COMPANY, " apple inc ") == (True, "comp-apple-inc")
+    assert cache.lookup(COMPANY, "AAPL") == (False, None)
+
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 3
+
+
+def test_negative_entries_expire_and_are_replaced_on_create(clock):
+    cache = EntityResolutionCache(negative_ttl_seconds=60, clock=clock)
+
+    cache.put(INSTRUMENT, "NEWX", None)
+    assert cache.lookup(INSTRUMENT, "NEWX") == (True, None)
+    assert cache.stats()["negative_hits"] == 1
+
+    clock.now += 61
+    assert cache.lookup(INSTRUMENT, "NEWX") == (False, None)
+
+    cache.put(INSTRUMENT, "NEWX", None)
+    cache.put(INSTRUMENT, "NEWX", "inst-NEWX")
+    clock.now += 3600
+    # Positive entries do not expire
+    assert cache.lookup(INSTRUMENT, "NEWX") == (True, "inst-NEWX")
+
+    assert cache.invalidate(INSTRUMENT, "NEWX") is True
+    assert cache.lookup(INSTRUMENT, "NEWX") == (False, None)
+
+    no_negatives = EntityResolutionCache(negative_ttl_seconds=0)
+    no_negatives.put(INSTRUMENT, "NEWX", None)
+    assert len(no_negatives) == 0
+
+
+def test_get_many_and_lru_bound():
+    cache = EntityResolutionCache(max_entries=2)
+    cache.put_many(INSTRUMENT, {"AAPL": "inst-AAPL", "MSFT": "inst-MSFT"})
+    cache.lookup(INSTRUMENT, "AAPL")
+    cache.put(INSTRUMENT, "NVDA", "inst-NVDA")
+
+    cached, missing = cache.get_many(INSTRUMENT, ["AAPL", "MSFT", "NVDA"])
+    assert cached == {"AAPL": "inst-AAPL", "NVDA": "inst-NVDA"}
+    assert missing == ["MSFT"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_warm_prefers_canonical_instrument_guid():
+    session = MagicMock()
+    session.run.side_effect = [
+        # Ordered as the warm-up query returns them: preferred guid last
+        [
+            {"ticker": "AAPL", "guid": "AAPL:UNKNOWN"},
+            {"ticker": "MSFT", "guid": "inst-MSFT"},
+            {"ticker": "AAPL", "guid": "inst-AAPL"},
+        ],
+        [{"name": "Apple Inc", "guid": "comp-apple-inc"}],
+    ]
+    graph_index = MagicMock()
+    graph_index._get_session.return_value.__enter__.return_value = session
+
+    cache = EntityResolutionCache()
+    assert cache.warm(graph_index) == 3
+    assert cache.lookup(INSTRUMENT, "AAPL") == (True, "inst-AAPL")
+    assert cache.lookup(COMPANY, "apple inc") == (True, "comp-apple-inc")
+
+
+def test_create_entity_resolution_cache_from_env(monkeypatch):
+    monkeypatch.delenv("GOFR_IQ_ENTITY_CACHE_MAX_ENTRIES", raising=False)
+    monkeypatch.setenv("GOFR_IQ_ENTITY_CACHE_NEGATIVE_TTL_SECONDS", "30")
+    cache = create_entity_resolution_cache()
+    assert cache is not None
+    assert cache.max_entries == 50_000
+    assert cache.negative_ttl_seconds == 30
+
+    monkeypatch.setenv("GOFR_IQ_ENTITY_CACHE_MAX_ENTRIES", "0")
+    assert create_entity_resolution_cache() is None
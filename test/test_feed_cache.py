@@ -0,0 +1,115 @@
+"""Tests for the per-client feed cache."""
+
+from __future__ import annotations
+
+from app.services.feed_cache import FeedCache, FeedDependencies, create_feed_cache
+
+
+def _deps(tickers=(), themes=()) -> FeedDependencies:
+    deps = FeedDependencies()
+    deps.add_tickers(tickers)
+    deps.add_themes(themes)
+    return deps
+
+
+def test_make_key_normalizes_groups_and_lists():
+    a = FeedCache.make_key("top", "c1", ["g2", "g1"], impact_tiers=["GOLD"], limit=3)
+    b = FeedCache.make_key("top", "c1", ["g1", "g2"], limit=3, impact_tiers=["GOLD"])
+    assert a == b
+    assert a != FeedCache.make_key("top", "c1", ["g1", "g2"], limit=3, impact_tiers=["GOLD"], opportunity_bias=0.5)
+
+
+def test_hit_returns_copy_and_counts():
+    cache = FeedCache()
+    key = FeedCache.make_key("top", "c1", ["g1"], limit=3)
+    assert cache.get(key) is None
+    cache.put(key, [{"document_guid": "d1", "impact_score": None}], "c1")
+
+    hit = cache.get(key)
+    assert hit == [{"document_guid": "d1", "impact_score": None}]
+    hit[0]["impact_score"] = 90
+    assert cache.get(key)[0]["impact_score"] is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+
+def test_ttl_expiry(clock):
+    cache = FeedCache(ttl_seconds=60, clock=clock)
+    key = FeedCache.make_key("top", "c1", ["g1"])
+    cache.put(key, [], "c1")
+    clock.now += 59
+    assert cache.get(key) == []
+    clock.now += 2
+    assert cache.get(key) is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    cache = FeedCache(max_entries=2)
+    k1, k2, k3 = (FeedCache.make_key("top", c, ["g1"]) for c in ("c1", "c2", "c3"))
+    cache.put(k1, 1, "c1")
+    cache.put(k2, 2, "c2")
+    assert cache.get(k1) == 1  # k2 is now least recently used
+    cache.put(k3, 3, "c3")
+    assert cache.get(k2) is None
+    assert cache.get(k1) == 1
+    assert cache.get(k3) == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_client():
+    cache = FeedCache()
+    top = FeedCache.make_key("top", "c1", ["g1"])
+    avatar = FeedCache.make_key("avatar", "c1", ["g1"])
+    other = FeedCache.make_key("top", "c2", ["g1"])
+    cache.put(top, 1, "c1")
+    cache.put(avatar, 2, "c1")
+    cache.put(other, 3, "c2")
+
+    assert cache.invalidate_client("c1") == 2
+    assert cache.get(top) is None
+    assert cache.get(avatar) is None
+    assert cache.get(other) == 3
+
+
+def test_invalidate_for_document_by_ticker_and_theme():
+    cache = FeedCache()
+    k1 = FeedCache.make_key("top", "c1", ["g1"])
+    k2 = FeedCache.make_key("top", "c2", ["g1"])
+    k3 = FeedCache.make_key("top", "c3", ["g1"])
+    cache.put(k1, 1, "c1", _deps(tickers=["AAPL", "MSFT"]))
+    cache.put(k2, 2, "c2", _deps(themes=["ai"]))
+    cache.put(k3, 3, "c3", _deps(tickers=["TSM"], themes=["semiconductor"]))
+
+    assert cache.invalidate_for_document(tickers=["MSFT"], themes=["ai"]) == 2
+    assert cache.get(k1) is None
+    assert cache.get(k2) is None
+    assert cache.get(k3) == 3
+    assert cache.stats()["invalidations"] == 2
+    # Reverse indexes are cleaned up with the entries
+    assert cache.invalidate_for_document(tickers=["AAPL"]) == 0
+
+
+def test_put_skipped_when_invalidated_during_compute():
+    cache = FeedCache()
+    key = FeedCache.make_key("top", "c1", ["g1"])
+    generation = cache.generation()
+    cache.invalidate_for_document(tickers=["AAPL"])
+    assert cache.put(key, 1, "c1", _deps(tickers=["AAPL"]), generation) is False
+    assert cache.get(key) is None
+
+
+def test_create_feed_cache_from_env(monkeypatch):
+    monkeypatch.setenv("GOFR_IQ_FEED_CACHE_TTL_SECONDS", "30")
+    monkeypatch.setenv("GOFR_IQ_FEED_CACHE_MAX_ENTRIES", "16")
+    cache = create_feed_cache()
+    assert cache is not None
+    assert cache.ttl_seconds == 30
+    assert cache.max_entries == 16
+
+    monkeypatch.setenv("GOFR_IQ_FEED_CACHE_TTL_SECONDS", "0")
+    assert create_feed_cache() is None
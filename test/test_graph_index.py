@@ -13,6 +13,7 @@ from typing import Generator
 neo4j = pytest.importorskip("neo4j")
 
 from app.services.graph_index import (  # noqa: E402
+    DocumentGraphWrite,
     GraphIndex,
     GraphNode,
     GraphRelationship,
@@ -998,6 +999,59 @@ class TestClientFeedQuery:
         
         assert len(feed) == 0
 
+    def test_get_client_feed_only_position_documents(self, graph_index: GraphIndex) -> None:
+        """Documents about instruments the client neither holds nor watches are excluded"""
+        feed = graph_index.get_client_feed(
+            client_guid="client-001",
+            permitted_groups=["grp-1"],
+            limit=10,
+        )
+
+        assert [f["document_guid"] for f in feed] == ["doc-001"]
+        assert feed[0]["relevance_score"] == pytest.approx(80.0 + 0.20 * 100)
+
+    def test_get_client_feed_watchlist(self, graph_index: GraphIndex) -> None:
+        """Watched instruments anchor the feed too, and can be switched off"""
+        graph_index.create_watchlist("watchlist-001", "client-001", "Ideas")
+        graph_index.add_to_watchlist("watchlist-001", "MSFT:NASDAQ")
+
+        feed = graph_index.get_client_feed(
+            client_guid="client-001",
+            permitted_groups=["grp-1"],
+            limit=10,
+        )
+        by_guid = {f["document_guid"]: f for f in feed}
+        assert by_guid["doc-002"]["relevance_score"] == pytest.approx(60.0 + 50)
+        assert by_guid["doc-002"]["affected_instruments"] == ["MSFT"]
+
+        portfolio_only = graph_index.get_client_feed(
+            client_guid="client-001",
+            permitted_groups=["grp-1"],
+            include_watchlist=False,
+            limit=10,
+        )
+        assert [f["document_guid"] for f in portfolio_only] == ["doc-001"]
+
+    def test_get_client_feed_min_impact_score(self, graph_index: GraphIndex) -> None:
+        """Impact score filter is applied as a query parameter"""
+        graph_index.create_watchlist("watchlist-001", "client-001", "Ideas")
+        graph_index.add_to_watchlist("watchlist-001", "MSFT:NASDAQ")
+
+        feed = graph_index.get_client_feed(
+            client_guid="client-001",
+            permitted_groups=["grp-1"],
+            min_impact_score=70.0,
+            limit=10,
+        )
+        assert [f["document_guid"] for f in feed] == ["doc-001"]
+
+        assert graph_index.get_client_feed(
+            client_guid="client-001",
+            permitted_groups=["grp-1"],
+            min_impact_score=90.0,
+            limit=10,
+        ) == []
+
 
 class TestDocumentThemes:
     """Tests for set_document_themes — Step 2 of the Avatar plan."""
@@ -1061,3 +1115,88 @@ class TestDocumentThemes:
         assert doc.properties["impact_score"] == 80.0
         assert doc.properties["impact_tier"] == "GOLD"
         assert doc.properties["themes"] == ["rates", "fx"]
+
+
+class TestBulkDocumentWrites:
+    """Tests for write_documents and batched entity resolution"""
+
+    @pytest.fixture
+    def graph_index(self) -> Generator[GraphIndex, None, None]:
+        """Graph with a group, an event type and one known instrument and company"""
+        index = GraphIndex(uri=NEO4J_URI, password=NEO4J_PASSWORD)
+        index.clear()
+        index.init_schema()
+
+        index.create_node(NodeLabel.GROUP, "grp-1", {"name": "Test Group"})
+        index.create_event_type("EARNINGS", "Earnings", "CORPORATE")
+        index.create_node(NodeLabel.INSTRUMENT, "inst-AAPL", {"ticker": "AAPL", "name": "Apple"})
+        index.create_node(NodeLabel.COMPANY, "comp-apple", {"name": "Apple Inc", "aliases": []})
+
+        yield index
+        index.clear()
+        index.close()
+
+    def _write(self, guid: str, **kwargs: object) -> DocumentGraphWrite:
+        props = GraphIndex.document_properties("src-1", "grp-1", f"Title {guid}", "en")
+        return DocumentGraphWrite(
+            document_guid=guid,
+            source_guid="src-1",
+            group_guid="grp-1",
+            properties={**props, "impact_score": 70.0, "impact_tier": "GOLD", "themes": ["ai"]},
+            source={"name": "Wire", "type": "news_feed"},
+            **kwargs,  # type: ignore[arg-type]
+        )
+
+    def test_resolve_guids_in_one_call(self, graph_index: GraphIndex) -> None:
+        """Known tickers and company names resolve; unknown ones are absent"""
+        assert graph_index.resolve_instrument_guids(["AAPL", "ZZZZ", "AAPL"]) == {"AAPL": "inst-AAPL"}
+        assert graph_index.resolve_company_guids(["Apple", "Unknown Co"]) == {"Apple": "comp-apple"}
+
+    def test_write_documents_full_extraction(self, graph_index: GraphIndex) -> None:
+        """Documents, source, edges and new entities land in one call"""
+        written = graph_index.write_documents(
+            [
+                self._write(
+                    "doc-1",
+                    event_type_code="EARNINGS",
+                    affects=[
+                        {"instrument_guid": "inst-AAPL", "props": {"direction": "positive", "magnitude": 0.02}},
+                        {"instrument_guid": "inst-NEWX", "props": {"direction": "neutral"}},
+                    ],
+                    mentions=[{"company_guid": "comp-apple", "name": "Apple Inc"}],
+                ),
+                self._write("doc-2", mentions=[{"company_guid": "comp-new-co", "name": "New Co"}]),
+            ],
+            instruments=[{"guid": "inst-NEWX", "ticker": "NEWX", "name": "New X"}],
+            companies=[{"guid": "comp-new-co", "name": "New Co", "ticker": "NEW-CO"}],
+        )
+
+        assert written == 2
+        with graph_index._get_session() as session:
+            record = session.run(
+                """
+                MATCH (d:Document {guid: 'doc-1'})-[:PRODUCED_BY]->(:Source {guid: 'src-1'})
+                MATCH (d)-[:IN_GROUP]->(:Group {guid: 'grp-1'})
+                MATCH (d)-[:TRIGGERED_BY]->(:EventType {code: 'EARNINGS'})
+                OPTIONAL MATCH (d)-[a:AFFECTS]->(i:Instrument)
+                WITH d, collect(i.guid) AS instruments, collect(a.direction) AS directions
+                OPTIONAL MATCH (d)-[:MENTIONS]->(c:Company)
+                RETURN d.impact_tier AS tier, d.themes AS themes, instruments, directions,
+                       collect(c.guid) AS companies
+                """
+            ).single()
+            assert record is not None
+            assert record["tier"] == "GOLD"
+            assert record["themes"] == ["ai"]
+            assert sorted(record["instruments"]) == ["inst-AAPL", "inst-NEWX"]
+            assert "positive" in record["directions"]
+            assert record["companies"] == ["comp-apple"]
+
+            count = session.run(
+                "MATCH (:Document {guid: 'doc-2'})-[:MENTIONS]->(c:Company {guid: 'comp-new-co'}) RETURN count(c) AS n"
+            ).single()
+            assert count is not None and count["n"] == 1
+
+    def test_write_documents_empty(self, graph_index: GraphIndex) -> None:
+        """No documents, no transaction"""
+        assert graph_index.write_documents([]) == 0
@@ -18,6 +18,7 @@ from app.services import (
     GraphIndex,
     IngestService,
     LanguageDetector,
+    PreparedEmbedding,
     SourceRegistry,
 )
 from app.services.graph_index import NodeLabel
@@ -135,6 +136,26 @@ def test_ingest_calls_indexes(ingest_context, mock_embedding_index, mock_graph_i
     assert call_args.kwargs["title"] == "Test Document"
 
 
+def test_ingest_embeds_once_for_duplicate_check_and_indexing(ingest_context, mock_embedding_index):
+    """The duplicate probe reuses the chunk embeddings that are indexed."""
+    prepared = PreparedEmbedding(chunks=[], embeddings=[[0.6, 0.8]])
+    mock_embedding_index.prepare_document.return_value = prepared
+    mock_embedding_index.search_by_embedding.return_value = []
+
+    result = ingest_context.service.ingest(
+        title="Test Document",
+        content="This is a test document.",
+        source_guid=ingest_context.source.source_guid,
+        group_guid=ingest_context.group_guid,
+    )
+
+    assert result.is_success
+    mock_embedding_index.prepare_document.assert_called_once_with(result.guid, "This is a test document.")
+    mock_embedding_index.search.assert_not_called()
+    assert mock_embedding_index.search_by_embedding.call_args.kwargs["query_embedding"] == [0.6, 0.8]
+    assert mock_embedding_index.embed_document.call_args.kwargs["prepared"] is prepared
+
+
 def test_ingest_fails_and_rolls_back_on_embedding_error(ingest_context, mock_embedding_index, mock_graph_index):
     """Test that ingest fails and rolls back if embedding fails."""
     
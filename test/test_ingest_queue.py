@@ -0,0 +1,207 @@
+"""Tests for the asynchronous ingest job queue."""
+
+from __future__ import annotations
+
+import time
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models import Source, SourceType, TrustLevel
+from app.services import (
+    DocumentStore,
+    IngestJobQueue,
+    IngestJobStatus,
+    IngestResult,
+    IngestService,
+    IngestStatus,
+    SourceRegistry,
+)
+
+CONTENT = "The central bank held rates steady on Tuesday while signalling two cuts later in the year."
+
+
+@pytest.fixture
+def source_registry(tmp_path: Path) -> SourceRegistry:
+    return SourceRegistry(base_path=tmp_path / "sources")
+
+
+@pytest.fixture
+def source(source_registry: SourceRegistry) -> Source:
+    return source_registry.create(
+        name="Test Source",
+        source_type=SourceType.NEWS_AGENCY,
+        region="APAC",
+        languages=["en"],
+        trust_level=TrustLevel.HIGH,
+    )
+
+
+@pytest.fixture
+def ingest_service(tmp_path: Path, source_registry: SourceRegistry) -> IngestService:
+    return IngestService(
+        document_store=DocumentStore(base_path=tmp_path / "documents"),
+        source_registry=source_registry,
+    )
+
+
+@pytest.fixture
+def group_guid() -> str:
+    return str(uuid.uuid4())
+
+
+def make_queue(tmp_path: Path, ingest_service, clock, **kwargs) -> IngestJobQueue:
+    return IngestJobQueue(tmp_path / "ingest_queue.db", ingest_service, clock=clock, **kwargs)
+
+
+class TestIngestJobQueue:
+    def test_enqueue_then_process_ingests_document(self, tmp_path, ingest_service, source, group_guid, clock):
+        queue = make_queue(tmp_path, ingest_service, clock)
+
+        job, created = queue.enqueue("Rates on hold", CONTENT, source.source_guid, group_guid)
+
+        assert created
+        assert job.status == IngestJobStatus.QUEUED
+        assert ingest_service.get_document(job.document_guid, group_guid) is None
+
+        assert queue.run_pending() == 1
+
+        done = queue.get(job.job_id)
+        assert done.status == IngestJobStatus.SUCCEEDED
+        assert done.attempts == 1
+        assert done.result["guid"] == job.document_guid
+        assert done.result["status"] == "success"
+        assert ingest_service.get_document(job.document_guid, group_guid).title == "Rates on hold"
+
+    def test_jobs_survive_restart(self, tmp_path, ingest_service, source, group_guid, clock):
+        queue = make_queue(tmp_path, ingest_service, clock)
+        queued, _ = queue.enqueue("Queued", CONTENT, source.source_guid, group_guid)
+        interrupted, _ = queue.enqueue("Interrupted", CONTENT + " Markets rallied.", source.source_guid, group_guid)
+        # Simulate a crash while the second job was running
+        queue._conn.execute("UPDATE ingest_jobs SET status = 'running', attempts = 1 WHERE job_id = ?", (interrupted.job_id,))
+        queue._conn.close()
+
+        reopened = make_queue(tmp_path, ingest_service, clock)
+        assert reopened._requeue_interrupted() == 1
+        assert reopened.run_pending() == 2
+
+        assert reopened.get(queued.job_id).status == IngestJobStatus.SUCCEEDED
+        retried = reopened.get(interrupted.job_id)
+        assert retried.status == IngestJobStatus.SUCCEEDED
+        assert retried.attempts == 2
+
+    def test_retry_replaces_partial_first_attempt(self, tmp_path, ingest_service, source, group_guid, clock):
+        queue = make_queue(tmp_path, ingest_service, clock)
+        job, _ = queue.enqueue("Rates on hold", CONTENT, source.source_guid, group_guid)
+        # First attempt stored the document, then the process died before recording it
+        ingest_service.ingest("Rates on hold", CONTENT, source.source_guid, group_guid, document_guid=job.document_guid)
+        queue._conn.execute("UPDATE ingest_jobs SET status = 'running', attempts = 1 WHERE job_id = ?", (job.job_id,))
+        queue._requeue_interrupted()
+
+        queue.run_pending()
+
+        done = queue.get(job.job_id)
+        # Not flagged as a duplicate of its own first attempt, and stored once
+        assert done.result["status"] == "success"
+        assert [d.guid for d in ingest_service.document_store.list_by_group(group_guid)] == [job.document_guid]
+
+    def test_failed_attempt_retried_with_backoff(self, tmp_path, source, group_guid, clock):
+        service = MagicMock()
+        service.ingest.side_effect = [
+            IngestResult(guid="g", status=IngestStatus.FAILED, error="Indexing failed: neo4j down"),
+            IngestResult(guid="g", status=IngestStatus.SUCCESS),
+        ]
+        queue = make_queue(tmp_path, service, clock, retry_backoff_seconds=30)
+        job, _ = queue.enqueue("Rates on hold", CONTENT, source.source_guid, group_guid)
+
+        assert queue.run_pending() == 1
+        waiting = queue.get(job.job_id)
+        assert waiting.status == IngestJobStatus.QUEUED
+        assert waiting.error == "Indexing failed: neo4j down"
+        # Not due yet
+        assert queue.run_pending() == 0
+
+        clock.now += 30
+        assert queue.run_pending() == 1
+        assert queue.get(job.job_id).status == IngestJobStatus.SUCCEEDED
+        service.discard_document.assert_called_once_with(job.document_guid, group_guid)
+        assert queue.stats()["retried"] == 1
+
+    def test_gives_up_after_max_attempts(self, tmp_path, source, group_guid, clock):
+        service = MagicMock()
+        service.ingest.side_effect = RuntimeError("boom")
+        queue = make_queue(tmp_path, service, clock, max_attempts=2, retry_backoff_seconds=0)
+        job, _ = queue.enqueue("Rates on hold", CONTENT, source.source_guid, group_guid)
+
+        assert queue.run_pending() == 2
+
+        failed = queue.get(job.job_id)
+        assert failed.status == IngestJobStatus.FAILED
+        assert failed.attempts == 2
+        assert "boom" in failed.error
+
+    def test_error_after_attempt_marks_job_failed(self, tmp_path, source, group_guid, clock):
+        service = MagicMock()
+        result = service.ingest.return_value
+        result.is_failed = False
+        result.to_dict.side_effect = TypeError("not serializable")
+        queue = make_queue(tmp_path, service, clock)
+        job, _ = queue.enqueue("Rates on hold", CONTENT, source.source_guid, group_guid)
+
+        assert queue.run_pending() == 1
+
+        failed = queue.get(job.job_id)
+        assert failed.status == IngestJobStatus.FAILED
+        assert "not serializable" in failed.error
+        assert queue.run_pending() == 0
+
+    def test_invalid_input_fails_without_retry(self, tmp_path, ingest_service, group_guid, clock):
+        queue = make_queue(tmp_path, ingest_service, clock)
+        job, _ = queue.enqueue("Rates on hold", CONTENT, str(uuid.uuid4()), group_guid)
+
+        queue.run_pending()
+
+        failed = queue.get(job.job_id)
+        assert failed.status == IngestJobStatus.FAILED
+        assert failed.attempts == 1
+
+    def test_idempotency_key_returns_existing_job(self, tmp_path, ingest_service, source, group_guid, clock):
+        queue = make_queue(tmp_path, ingest_service, clock)
+        first, created = queue.enqueue("Rates", CONTENT, source.source_guid, group_guid, idempotency_key="feed-1")
+        again, created_again = queue.enqueue("Rates", CONTENT, source.source_guid, group_guid, idempotency_key="feed-1")
+        other_group, _ = queue.enqueue("Rates", CONTENT, source.source_guid, str(uuid.uuid4()), idempotency_key="feed-1")
+
+        assert created and not created_again
+        assert again.job_id == first.job_id
+        assert other_group.job_id != first.job_id
+
+    def test_list_jobs_filters_by_group_and_status(self, tmp_path, ingest_service, source, group_guid, clock):
+        queue = make_queue(tmp_path, ingest_service, clock)
+        mine, _ = queue.enqueue("Mine", CONTENT, source.source_guid, group_guid)
+        clock.now += 1
+        queue.enqueue("Theirs", CONTENT, source.source_guid, str(uuid.uuid4()))
+
+        assert [j.job_id for j in queue.list_jobs(group_guids=[group_guid])] == [mine.job_id]
+        assert queue.list_jobs(group_guids=[]) == []
+        assert len(queue.list_jobs()) == 2
+        assert queue.list_jobs(status=IngestJobStatus.SUCCEEDED) == []
+        assert queue.stats()["jobs"]["queued"] == 2
+
+    def test_workers_process_in_background(self, tmp_path, ingest_service, source, group_guid):
+        queue = IngestJobQueue(tmp_path / "ingest_queue.db", ingest_service, workers=2, poll_interval_seconds=0.05)
+        queue.start()
+        try:
+            jobs = [
+                queue.enqueue(f"Story {i}", f"{CONTENT} Story number {i} mentions sector {i}.", source.source_guid, group_guid)[0]
+                for i in range(4)
+            ]
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline and not all(queue.get(j.job_id).is_finished for j in jobs):
+                time.sleep(0.05)
+            statuses = [queue.get(j.job_id).status for j in jobs]
+        finally:
+            queue.close()
+
+        assert statuses == [IngestJobStatus.SUCCEEDED] * 4
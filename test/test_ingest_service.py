@@ -5,9 +5,11 @@ Tests for document ingestion orchestration without external indexes.
 
 from __future__ import annotations
 
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -15,6 +17,7 @@ from app.models import DocumentCreate, Source, SourceType, TrustLevel
 from app.services import (
     DocumentStore,
     DuplicateDetector,
+    EntityResolutionCache,
     IngestResult,
     IngestService,
     IngestStatus,
@@ -672,6 +675,305 @@ class TestIngestBatch:
         assert results[2].status == IngestStatus.SUCCESS
 
 
+class TestPipelinedIngestBatch:
+    """Tests for ingest_batch with concurrent front stages."""
+
+    def _inputs(self, source: Source, group_guid: str, contents: list[str]) -> list[DocumentCreate]:
+        return [
+            DocumentCreate(
+                title=f"Doc {i}",
+                content=content,
+                source_guid=source.source_guid,
+                group_guid=group_guid,
+            )
+            for i, content in enumerate(contents)
+        ]
+
+    def test_extraction_runs_concurrently(
+        self,
+        ingest_service: IngestService,
+        source: Source,
+        group_guid: str,
+    ) -> None:
+        """Extraction for several documents is in flight at once."""
+        # Each extraction waits until three are running together
+        barrier = threading.Barrier(3, timeout=5)
+
+        def extract(doc, require_extraction=False):  # type: ignore[no-untyped-def]
+            barrier.wait()
+            return None
+
+        ingest_service._extract_graph_entities = extract  # type: ignore[method-assign]
+        inputs = self._inputs(source, group_guid, [f"Distinct content number {i}." for i in range(6)])
+
+        results = ingest_service.ingest_batch(inputs, max_workers=3)
+
+        assert [r.status for r in results] == [IngestStatus.SUCCESS] * 6
+        stored = [ingest_service.get_document(r.guid, group_guid) for r in results]
+        assert [d.title for d in stored if d] == [f"Doc {i}" for i in range(6)]
+
+    def test_detects_duplicates_within_batch(
+        self,
+        ingest_service: IngestService,
+        source: Source,
+        group_guid: str,
+    ) -> None:
+        """A later copy in the same batch is flagged against the earlier one."""
+        content = "Acme Corp reported record quarterly revenue driven by strong demand."
+        inputs = self._inputs(source, group_guid, [content, "Unrelated market wrap.", content])
+        inputs[2].title = inputs[0].title
+
+        results = ingest_service.ingest_batch(inputs, max_workers=4)
+
+        assert [r.status for r in results] == [
+            IngestStatus.SUCCESS,
+            IngestStatus.SUCCESS,
+            IngestStatus.DUPLICATE,
+        ]
+        assert results[2].duplicate_of == results[0].guid
+
+    def test_stop_on_error_and_rollback(
+        self,
+        ingest_service: IngestService,
+        source: Source,
+        group_guid: str,
+    ) -> None:
+        """Rejected inputs fail in place; failed indexing is rolled back."""
+        inputs = self._inputs(source, group_guid, ["First document.", "Second.", "Third document.", "Fourth."])
+        inputs[1].source_guid = str(uuid.uuid4())
+
+        results = ingest_service.ingest_batch(inputs, stop_on_error=True, max_workers=2)
+        assert [r.status for r in results] == [IngestStatus.SUCCESS, IngestStatus.FAILED]
+
+        graph_index = MagicMock()
+        # Graph duplicate lookups find nothing
+        graph_index._get_session.return_value.__enter__.return_value.run.return_value.single.return_value = None
+        graph_index.create_document_node.side_effect = [None, RuntimeError("neo4j down")]
+        ingest_service.graph_index = graph_index
+        ingest_service.llm_service = MagicMock()
+        ingest_service._extract_graph_entities = lambda doc, require_extraction=False: None  # type: ignore[method-assign]
+
+        results = ingest_service.ingest_batch(
+            self._inputs(source, group_guid, ["Fifth document.", "Sixth document."]), max_workers=2
+        )
+
+        assert [r.status for r in results] == [IngestStatus.SUCCESS, IngestStatus.FAILED]
+        assert ingest_service.get_document(results[1].guid, group_guid) is None
+        graph_index.delete_node.assert_called_once()
+
+
+class TestBulkGraphWrites:
+    """Tests for bulk_graph_writes (one UNWIND transaction per document or batch group)."""
+
+    def _service(
+        self,
+        ingest_service: IngestService,
+        batch_size: int = 50,
+    ) -> MagicMock:
+        from app.prompts.graph_extraction import (
+            EventDetection,
+            GraphExtractionResult,
+            InstrumentMention,
+        )
+
+        graph_index = MagicMock()
+        # Graph duplicate lookups find nothing; AAPL and Apple are already known
+        graph_index._get_session.return_value.__enter__.return_value.run.return_value.single.return_value = None
+        graph_index.resolve_instrument_guids.return_value = {"AAPL": "inst-AAPL"}
+        graph_index.resolve_company_guids.return_value = {"Apple": "comp-apple"}
+        ingest_service.graph_index = graph_index
+        ingest_service.bulk_graph_writes = True
+        ingest_service.graph_write_batch_size = batch_size
+        ingest_service.llm_service = MagicMock()
+
+        def extract(doc, require_extraction=False):  # type: ignore[no-untyped-def]
+            ticker = doc.title.split()[-1]
+            return GraphExtractionResult(
+                impact_score=70,
+                impact_tier="GOLD",
+                events=[EventDetection(event_type="EARNINGS_BEAT", confidence=0.9)],
+                instruments=[InstrumentMention(ticker=ticker, name=ticker, direction="UP")],
+                companies=["Apple"],
+            )
+
+        ingest_service._extract_graph_entities = extract  # type: ignore[method-assign]
+        return graph_index
+
+    def _inputs(self, source: Source, group_guid: str, tickers: list[str]) -> list[DocumentCreate]:
+        return [
+            DocumentCreate(
+                title=f"Results for {ticker}",
+                content=f"Quarterly results story number {i} with strong demand.",
+                source_guid=source.source_guid,
+                group_guid=group_guid,
+            )
+            for i, ticker in enumerate(tickers)
+        ]
+
+    def test_single_ingest_writes_once(
+        self,
+        ingest_service: IngestService,
+        source: Source,
+        group_guid: str,
+    ) -> None:
+        """One ingest makes one write_documents call instead of per-entity calls."""
+        graph_index = self._service(ingest_service)
+        doc = self._inputs(source, group_guid, ["AAPL"])[0]
+
+        result = ingest_service.ingest(
+            title=doc.title, content=doc.content, source_guid=doc.source_guid, group_guid=group_guid
+        )
+
+        assert result.status == IngestStatus.SUCCESS
+        graph_index.create_document_node.assert_not_called()
+        graph_index.create_relationship.assert_not_called()
+        graph_index.write_documents.assert_called_once()
+        (writes,), kwargs = graph_index.write_documents.call_args
+        assert writes[0].document_guid == result.guid
+        assert writes[0].event_type_code == "EARNINGS"
+        assert writes[0].properties["impact_tier"] == "GOLD"
+        assert writes[0].affects == [
+            {"instrument_guid": "inst-AAPL", "props": {"confidence": 1.0, "direction": "positive", "magnitude": 0.01}}
+        ]
+        assert writes[0].mentions == [{"company_guid": "comp-apple", "name": "Apple"}]
+        assert kwargs == {"instruments": [], "companies": []}
+
+    def test_batch_groups_documents_per_transaction(
+        self,
+        ingest_service: IngestService,
+        source: Source,
+        group_guid: str,
+    ) -> None:
+        """ingest_batch writes graph_write_batch_size documents per call, resolving entities once."""
+        graph_index = self._service(ingest_service, batch_size=3)
+        # The flushed list is reused for the next group, so record it at call time
+        calls: list[tuple[list[str], list[str]]] = []
+        graph_index.write_documents.side_effect = lambda writes, instruments, companies: calls.append(
+            ([w.document_guid for w in writes], sorted(row["ticker"] for row in instruments))
+        )
+        inputs = self._inputs(source, group_guid, ["AAPL", "NEWX", "MSFT", "NVDA", "TSLA"])
+
+        results = ingest_service.ingest_batch(inputs, max_workers=2)
+
+        assert [r.status for r in results] == [IngestStatus.SUCCESS] * 5
+        assert calls == [
+            ([r.guid for r in results[:3]], ["MSFT", "NEWX"]),
+            ([r.guid for r in results[3:]], ["NVDA", "TSLA"]),
+        ]
+        assert graph_index.resolve_instrument_guids.call_count == 2
+
+    def test_failed_flush_rolls_back_its_documents(
+        self,
+        ingest_service: IngestService,
+        source: Source,
+        group_guid: str,
+    ) -> None:
+        """A failed bulk transaction fails and rolls back every document in it."""
+        graph_index = self._service(ingest_service, batch_size=2)
+        graph_index.write_documents.side_effect = [2, RuntimeError("neo4j down")]
+        inputs = self._inputs(source, group_guid, ["AAPL", "MSFT", "NVDA", "AMZN"])
+
+        results = ingest_service.ingest_batch(inputs, max_workers=2)
+
+        assert [r.status for r in results] == [
+            IngestStatus.SUCCESS,
+            IngestStatus.SUCCESS,
+            IngestStatus.FAILED,
+            IngestStatus.FAILED,
+        ]
+        assert "neo4j down" in (results[2].error or "")
+        assert ingest_service.get_document(results[1].guid, group_guid) is not None
+        assert ingest_service.get_document(results[3].guid, group_guid) is None
+        assert results[3].guid not in ingest_service.duplicate_detector._similarity_index
+
+    def test_feeds_invalidated_after_flush(
+        self,
+        ingest_service: IngestService,
+        source: Source,
+        group_guid: str,
+    ) -> None:
+        """Deferred documents drop cached feeds only once their graph write committed."""
+        graph_index = self._service(ingest_service, batch_size=2)
+        events: list[str] = []
+
+        def write_documents(writes, instruments, companies):  # type: ignore[no-untyped-def]
+            events.append("write")
+            if len(events) > 3:
+                raise RuntimeError("neo4j down")
+            return len(writes)
+
+        graph_index.write_documents.side_effect = write_documents
+        ingest_service.feed_cache = MagicMock()
+        ingest_service.feed_cache.invalidate_for_document.side_effect = lambda tickers, themes: events.append(
+            tickers[0]
+        )
+        inputs = self._inputs(source, group_guid, ["AAPL", "MSFT", "NVDA", "AMZN"])
+
+        results = ingest_service.ingest_batch(inputs, max_workers=2)
+
+        assert [r.status for r in results][2:] == [IngestStatus.FAILED] * 2
+        # No invalidation for the rolled-back group
+        assert events == ["write", "AAPL", "MSFT", "write"]
+
+    def test_fingerprint_duplicate_within_batch(
+        self,
+        ingest_service: IngestService,
+        source: Source,
+        group_guid: str,
+    ) -> None:
+        """Same story from a different wire is caught before its graph write is flushed."""
+        graph_index = self._service(ingest_service)
+        inputs = self._inputs(source, group_guid, ["AAPL", "MSFT", "AAPL"])
+
+        results = ingest_service.ingest_batch(inputs, max_workers=2)
+
+        assert [r.status for r in results] == [
+            IngestStatus.SUCCESS,
+            IngestStatus.SUCCESS,
+            IngestStatus.DUPLICATE,
+        ]
+        assert results[2].duplicate_of == results[0].guid
+        graph_index.write_documents.assert_called_once()
+
+    def test_entity_cache_skips_known_lookups(
+        self,
+        ingest_service: IngestService,
+        source: Source,
+        group_guid: str,
+    ) -> None:
+        """Only tickers and names missing from entity_cache are resolved in Neo4j."""
+        graph_index = self._service(ingest_service, batch_size=2)
+        graph_index.resolve_instrument_guids.return_value = {}
+        ingest_service.entity_cache = EntityResolutionCache()
+        ingest_service.entity_cache.put("instrument", "AAPL", "inst-AAPL")
+        ingest_service.entity_cache.put("company", "Apple", "comp-apple")
+
+        ingest_service.ingest_batch(self._inputs(source, group_guid, ["AAPL", "NEWX"]), max_workers=2)
+        ingest_service.ingest_batch(self._inputs(source, group_guid, ["NEWX", "MSFT"]), max_workers=2)
+
+        assert [c.args[0] for c in graph_index.resolve_instrument_guids.call_args_list] == [["NEWX"], ["MSFT"]]
+        graph_index.resolve_company_guids.assert_not_called()
+        # Instruments created by the first batch are cached for the second
+        assert ingest_service.entity_cache.lookup("instrument", "NEWX") == (True, "inst-NEWX")
+
+    def test_company_cached_miss_is_fuzzy_matched_again(
+        self,
+        ingest_service: IngestService,
+        source: Source,
+        group_guid: str,
+    ) -> None:
+        """A negative company entry does not skip the fuzzy match before creating a node."""
+        graph_index = self._service(ingest_service, batch_size=2)
+        graph_index.resolve_instrument_guids.return_value = {}
+        graph_index.resolve_company_guids.return_value = {}
+        ingest_service.entity_cache = EntityResolutionCache()
+        ingest_service.entity_cache.put("company", "Apple", None)
+
+        ingest_service.ingest_batch(self._inputs(source, group_guid, ["AAPL"]), max_workers=2)
+
+        assert graph_index.resolve_company_guids.call_args.args[0] == ["Apple"]
+
+
 # =============================================================================
 # FACTORY FUNCTION TESTS
 # =============================================================================
@@ -695,6 +997,28 @@ class TestCreateIngestService:
 
         assert service.max_word_count == 10_000
 
+    def test_create_ingest_service_batch_workers_from_env(
+        self, storage_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """GOFR_IQ_INGEST_BATCH_WORKERS is parsed, and a malformed value falls back to 1."""
+        monkeypatch.setenv("GOFR_IQ_INGEST_BATCH_WORKERS", "4")
+        assert create_ingest_service(storage_path).batch_workers == 4
+
+        monkeypatch.setenv("GOFR_IQ_INGEST_BATCH_WORKERS", "four")
+        assert create_ingest_service(storage_path).batch_workers == 1
+
+    def test_create_ingest_service_shares_stores(self, storage_path: Path) -> None:
+        """Stores passed in (as the MCP server does) are used instead of new ones."""
+        document_store = DocumentStore(base_path=storage_path / "shared")
+        source_registry = SourceRegistry(base_path=storage_path / "shared_sources")
+
+        service = create_ingest_service(
+            storage_path, document_store=document_store, source_registry=source_registry
+        )
+
+        assert service.document_store is document_store
+        assert service.source_registry is source_registry
+
 
 # =============================================================================
 # SERVICE REPR TEST
@@ -806,6 +1130,68 @@ class TestStrictTickerValidation:
         # Two calls: MATCH lookup + MERGE create
         assert mock_session.run.call_count == 2
 
+    def test_resolve_instrument_guid_uses_entity_cache(
+        self,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+        language_detector: LanguageDetector,
+        duplicate_detector: DuplicateDetector,
+    ) -> None:
+        """Cached tickers skip Neo4j; a cached miss skips the lookup but still creates."""
+        from unittest.mock import MagicMock
+
+        service = IngestService(
+            document_store=document_store,
+            source_registry=source_registry,
+            language_detector=language_detector,
+            duplicate_detector=duplicate_detector,
+            entity_cache=EntityResolutionCache(),
+        )
+        mock_session = MagicMock()
+        mock_session.run.return_value.single.return_value = None
+
+        # First call: lookup + MERGE; the created guid is cached
+        assert service._resolve_instrument_guid(session=mock_session, ticker="NEWTKR", name="New") == "inst-NEWTKR"
+        assert mock_session.run.call_count == 2
+        assert service._resolve_instrument_guid(session=mock_session, ticker="NEWTKR", name="New") == "inst-NEWTKR"
+        assert mock_session.run.call_count == 2
+
+        # A cached miss goes straight to creation
+        assert service.entity_cache is not None
+        service.entity_cache.put("instrument", "OTHER", None)
+        assert service._resolve_instrument_guid(session=mock_session, ticker="OTHER", name="Other") == "inst-OTHER"
+        assert mock_session.run.call_count == 3
+        assert "MERGE" in mock_session.run.call_args[0][0]
+
+    def test_resolve_company_guid_ignores_cached_miss(
+        self,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+        language_detector: LanguageDetector,
+        duplicate_detector: DuplicateDetector,
+    ) -> None:
+        """Company resolution is fuzzy, so a cached miss still runs the match."""
+        from unittest.mock import MagicMock
+
+        service = IngestService(
+            document_store=document_store,
+            source_registry=source_registry,
+            language_detector=language_detector,
+            duplicate_detector=duplicate_detector,
+            entity_cache=EntityResolutionCache(),
+        )
+        assert service.entity_cache is not None
+        service.entity_cache.put("company", "Apple", None)
+        mock_session = MagicMock()
+        mock_session.run.return_value.single.return_value = {"guid": "comp-apple-inc", "name": "Apple Inc"}
+
+        assert service._resolve_company_guid(mock_session, "Apple") == "comp-apple-inc"
+        assert mock_session.run.call_count == 1
+        assert "CONTAINS" in mock_session.run.call_args[0][0]
+        # The match is cached, so the next lookup skips Neo4j
+        assert service._resolve_company_guid(mock_session, "Apple") == "comp-apple-inc"
+        assert mock_session.run.call_count == 1
+
     def test_resolve_instrument_guid_known_ticker_both_modes(
         self,
         document_store: DocumentStore,
@@ -948,6 +1334,34 @@ class TestRegexTickerFallback:
 
         assert added == 0
 
+    def test_universe_reloads_after_instrument_created(
+        self, document_store, source_registry, language_detector, duplicate_detector
+    ) -> None:
+        """Creating an Instrument via GraphIndex refreshes the compiled matcher."""
+        from unittest.mock import MagicMock
+
+        graph_index = MagicMock()
+        graph_index.instrument_version = 0
+        session = graph_index.driver.session.return_value.__enter__.return_value
+        session.run.return_value = [{"t": "NXS"}]
+        service = IngestService(
+            document_store=document_store,
+            source_registry=source_registry,
+            language_detector=language_detector,
+            duplicate_detector=duplicate_detector,
+            graph_index=graph_index,
+        )
+
+        assert service._augment_extraction_with_regex_tickers("NXS and ECO", self._make_extraction([])) == 1
+        assert session.run.call_count == 1
+        service._augment_extraction_with_regex_tickers("NXS and ECO", self._make_extraction([]))
+        assert session.run.call_count == 1  # cached
+
+        session.run.return_value = [{"t": "NXS"}, {"t": "ECO"}]
+        graph_index.instrument_version = 1
+        assert service._augment_extraction_with_regex_tickers("NXS and ECO", self._make_extraction([])) == 2
+        assert session.run.call_count == 2
+
     def test_no_graph_index_returns_zero(
         self, document_store, source_registry, language_detector, duplicate_detector
     ) -> None:
@@ -964,3 +1378,71 @@ class TestRegexTickerFallback:
         added = service._augment_extraction_with_regex_tickers("NXS mentioned", extraction)
 
         assert added == 0
+
+
+# =============================================================================
+# OVERLAPPED LLM I/O
+# =============================================================================
+
+
+class TestOverlapLLMIO:
+    """Chunk embedding runs while the extraction request is in flight."""
+
+    def _make_service(
+        self,
+        ingest_service: IngestService,
+        overlap: bool,
+        events: list[str],
+    ) -> IngestService:
+        embedding_started = threading.Event()
+
+        def prepare_document(guid: str, content: str) -> None:
+            events.append(f"embed:{threading.current_thread().name.split('_')[0]}")
+            embedding_started.set()
+            return None
+
+        def extract(doc, require_extraction=False):  # type: ignore[no-untyped-def]
+            if overlap:
+                # Only returns once the embedding has started on another thread
+                assert embedding_started.wait(timeout=5)
+            events.append("extract")
+            return None
+
+        embedding_index = MagicMock()
+        embedding_index.prepare_document.side_effect = prepare_document
+        ingest_service.embedding_index = embedding_index
+        ingest_service.llm_service = MagicMock()
+        ingest_service.overlap_llm_io = overlap
+        ingest_service.duplicate_detector = MagicMock()
+        ingest_service.duplicate_detector.check.return_value = MagicMock(
+            is_duplicate=False, duplicate_of=None, score=0.0
+        )
+        ingest_service._extract_graph_entities = extract  # type: ignore[method-assign]
+        return ingest_service
+
+    def test_overlap_embeds_on_worker_thread(
+        self, ingest_service: IngestService, source: Source, group_guid: str
+    ) -> None:
+        events: list[str] = []
+        service = self._make_service(ingest_service, overlap=True, events=events)
+
+        result = service.ingest(
+            title="Overlap", content="Some content to embed.", source_guid=source.source_guid, group_guid=group_guid
+        )
+
+        assert result.is_success
+        assert events == ["embed:gofr-iq-ingest-io", "extract"]
+        service.embedding_index.embed_document.assert_called_once()
+
+    def test_default_embeds_after_extraction(
+        self, ingest_service: IngestService, source: Source, group_guid: str
+    ) -> None:
+        events: list[str] = []
+        service = self._make_service(ingest_service, overlap=False, events=events)
+
+        result = service.ingest(
+            title="Sequential", content="Some content to embed.", source_guid=source.source_guid, group_guid=group_guid
+        )
+
+        assert result.is_success
+        assert events == ["extract", "embed:MainThread"]
@@ -5,12 +5,16 @@ Unit tests for the LLM service using mocked HTTP responses.
 
 from __future__ import annotations
 
+import asyncio
+import json
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from app.services.llm_service import (
+    AsyncLLMService,
     LLMSettings,
     ChatCompletionResult,
     ChatMessage,
@@ -20,6 +24,7 @@ from app.services.llm_service import (
     LLMRateLimitError,
     LLMService,
     LLMServiceError,
+    create_async_llm_service,
     create_llm_service,
     llm_available,
 )
@@ -492,3 +497,139 @@ class TestFactoryFunctions:
             # This will check environment, result depends on actual env
             result = llm_available()
             assert isinstance(result, bool)
+
+
+# ============================================================================
+# Async Service Tests
+# ============================================================================
+
+
+class TestAsyncLLMService:
+    """Tests for AsyncLLMService over a mock transport"""
+
+    @staticmethod
+    def _service(
+        llm_settings: LLMSettings,
+        handler: Any,
+    ) -> AsyncLLMService:
+        return AsyncLLMService(settings=llm_settings, transport=httpx.MockTransport(handler))
+
+    async def test_chat_completion(
+        self,
+        llm_settings: LLMSettings,
+        mock_chat_response: dict[str, Any],
+    ) -> None:
+        """Test async chat completion shares request building and parsing"""
+        seen: list[dict[str, Any]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path.endswith("/chat/completions")
+            assert request.headers["Authorization"] == "Bearer test-api-key-12345"
+            seen.append(json.loads(request.content))
+            return httpx.Response(200, json=mock_chat_response)
+
+        async with self._service(llm_settings, handler) as service:
+            result = await service.chat_completion(
+                messages=[ChatMessage("user", "Hello!")], json_mode=True
+            )
+
+        assert result.content == "Hello! How can I help you today?"
+        assert result.finish_reason == "stop"
+        assert seen[0]["response_format"] == {"type": "json_object"}
+
+    async def test_concurrent_requests_overlap(
+        self,
+        llm_settings: LLMSettings,
+        mock_chat_response: dict[str, Any],
+        mock_embedding_response: dict[str, Any],
+    ) -> None:
+        """Test chat and embedding requests are in flight at the same time"""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            if request.url.path.endswith("/embeddings"):
+                return httpx.Response(200, json=mock_embedding_response)
+            return httpx.Response(200, json=mock_chat_response)
+
+        async with self._service(llm_settings, handler) as service:
+            chat, embeddings = await asyncio.gather(
+                service.chat_completion([ChatMessage("user", "Hello!")]),
+                service.generate_embeddings(["Hello", "World"]),
+            )
+
+        assert chat.content == "Hello! How can I help you today?"
+        assert len(embeddings.embeddings) == 2
+        assert peak == 2
+
+    async def test_rate_limit_backoff_does_not_block(
+        self,
+        llm_settings: LLMSettings,
+        mock_embedding_response: dict[str, Any],
+    ) -> None:
+        """Test a 429 is retried after an awaited Retry-After wait"""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return httpx.Response(429, headers={"Retry-After": "0.01"})
+            return httpx.Response(200, json=mock_embedding_response)
+
+        async with self._service(llm_settings, handler) as service:
+            with patch("app.services.llm_service.time.sleep") as blocking_sleep:
+                embedding = await service.generate_embedding("Hello")
+
+        assert calls == 2
+        assert len(embedding) == 5
+        blocking_sleep.assert_not_called()
+
+    async def test_rate_limit_error_without_retries(
+        self,
+        llm_settings: LLMSettings,
+    ) -> None:
+        """Test retries=0 surfaces LLMRateLimitError"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(429, headers={"Retry-After": "5"})
+
+        async with self._service(llm_settings, handler) as service:
+            with pytest.raises(LLMRateLimitError) as exc_info:
+                await service.generate_embeddings(["Hello"], retries=0)
+
+        assert exc_info.value.retry_after == 5.0
+
+    async def test_api_error(
+        self,
+        llm_settings: LLMSettings,
+    ) -> None:
+        """Test API error mapping matches the sync service"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, json={"error": {"message": "Invalid model specified"}})
+
+        async with self._service(llm_settings, handler) as service:
+            with pytest.raises(LLMAPIError, match="Invalid model specified"):
+                await service.chat_completion([ChatMessage("user", "Hello!")])
+
+    async def test_not_configured(self) -> None:
+        """Test async service without API key raises configuration error"""
+        service = AsyncLLMService(settings=LLMSettings(api_key=None))
+        with pytest.raises(LLMConfigurationError):
+            await service.generate_embeddings(["Hello"])
+
+    def test_pool_limits_and_http2_from_env(self) -> None:
+        """Test factory reads connection pool size and HTTP/2 switch"""
+        env = {"GOFR_IQ_LLM_MAX_CONNECTIONS": "8", "GOFR_IQ_LLM_HTTP2": "false"}
+        with patch.dict("os.environ", env, clear=False):
+            service = create_async_llm_service(LLMSettings(api_key="test-key"))
+
+        assert service.limits.max_connections == 8
+        assert service.limits.max_keepalive_connections == 4
+        assert service.http2 is False
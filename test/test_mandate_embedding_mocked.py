@@ -61,3 +61,50 @@ def test_update_client_profile_sets_mandate_embedding(graph_index: GraphIndex, t
         ).single()
         assert record is not None
         assert record.get("emb") == [0.1, 0.2, 0.3]
+
+
+@pytest.mark.integration
+def test_update_client_profile_writes_mandate_store(
+    mcp_server: FastMCP, graph_index: GraphIndex, tmp_path
+) -> None:
+    from app.services.mandate_embedding_store import MandateEmbeddingStore
+
+    mandate_store = MandateEmbeddingStore(tmp_path / "mandate_embeddings")
+    register_client_tools(mcp_server, graph_index, query_service=MagicMock(), mandate_store=mandate_store)
+    tools = {tool.name: tool for tool in mcp_server._tool_manager._tools.values()}
+
+    graph_index.create_node(NodeLabel.GROUP, "public", {"name": "public"})
+    graph_index.create_node(NodeLabel.CLIENT_TYPE, "HEDGE_FUND", {"code": "HEDGE_FUND"})
+
+    client_guid = str(uuid.uuid4())
+    profile_guid = str(uuid.uuid4())
+    graph_index.create_client(guid=client_guid, name="Test", client_type_code="HEDGE_FUND", group_guid="public")
+    # Not yet migrated: the old vector still lives on the node
+    graph_index.create_client_profile(
+        guid=profile_guid, client_guid=client_guid, properties={"mandate_embedding": [0.9, 0.9, 0.9]}
+    )
+
+    fake_llm = MagicMock()
+    fake_llm.is_available = True
+    fake_llm.generate_embedding.return_value = [0.1, 0.2, 0.3]
+    fake_llm.__enter__.return_value = fake_llm
+    fake_llm.__exit__.return_value = False
+
+    with patch("app.tools.client_tools.resolve_permitted_groups", return_value=["public"]), \
+         patch("app.tools.client_tools.get_group_uuids_by_names", return_value=["public"]), \
+         patch("app.services.llm_service.create_llm_service", return_value=fake_llm), \
+         patch("app.services.mandate_enrichment.extract_themes_from_mandate") as mock_extract:
+        mock_extract.return_value.success = True
+        mock_extract.return_value.themes = ["ai"]
+
+        tools["update_client_profile"].fn(client_guid=client_guid, mandate_text="We invest in AI")
+
+    assert mandate_store.get(profile_guid) == pytest.approx([0.1, 0.2, 0.3])
+    with graph_index._get_session() as session:
+        record = session.run(
+            "MATCH (cp:ClientProfile {guid: $guid}) "
+            "RETURN cp.mandate_embedding AS emb, cp.mandate_embedding_dim AS dim",
+            guid=profile_guid,
+        ).single()
+        assert record.get("emb") is None
+        assert record.get("dim") == 3
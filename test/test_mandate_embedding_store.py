@@ -0,0 +1,186 @@
+"""Tests for the mandate embedding store and lazy mandate vector loading."""
+
+from __future__ import annotations
+
+import multiprocessing
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models.client_profile import ClientProfile
+from app.services.embedding_index import SimilarityResult
+from app.services.mandate_embedding_store import MandateEmbeddingStore, create_mandate_embedding_store
+from app.services.query_service import QueryService
+
+
+def test_put_get_replace_and_delete(tmp_path):
+    store = MandateEmbeddingStore(tmp_path / "mandate_embeddings")
+    assert store.get("profile-1") is None
+
+    assert store.put("profile-1", [0.5, 0.25, -1.0]) == 3
+    store.put("profile-2", [1.0])
+    assert store.get("profile-1") == [0.5, 0.25, -1.0]
+
+    # Latest write wins
+    store.put("profile-1", [0.125, 0.75])
+    assert store.get("profile-1") == [0.125, 0.75]
+
+    assert store.delete("profile-1")
+    assert not store.delete("profile-1")
+    assert store.get("profile-1") is None
+    assert "profile-2" in store and "profile-1" not in store
+
+    stats = store.stats()
+    assert stats["profiles"] == 1
+    assert stats["dead_vectors"] == 2
+    assert stats["bytes"] == 24
+
+    with pytest.raises(ValueError):
+        store.put("profile-3", [])
+
+
+def test_get_many_returns_stored_profiles_only(tmp_path):
+    store = MandateEmbeddingStore(tmp_path)
+    store.put("profile-1", [0.5, 0.25])
+    store.put("profile-2", [1.0])
+    store.delete("profile-2")
+
+    assert store.get_many(["profile-1", "profile-2", "profile-3"]) == {"profile-1": [0.5, 0.25]}
+    assert store.stats()["hits"] == 1
+    assert store.stats()["misses"] == 2
+
+
+def test_survives_restart_and_sees_other_writers(tmp_path):
+    first = MandateEmbeddingStore(tmp_path)
+    first.put("profile-1", [0.125, 0.5])
+    first.put("profile-2", [0.25])
+    first.delete("profile-2")
+
+    second = MandateEmbeddingStore(tmp_path)
+    assert second.get("profile-1") == [0.125, 0.5]
+    assert second.get("profile-2") is None
+
+    # Writes by one instance are picked up by the other on lookup
+    second.put("profile-1", [0.75, 0.5])
+    assert first.get("profile-1") == [0.75, 0.5]
+
+
+def _put_from_process(base_path, worker: int, count: int) -> None:
+    store = MandateEmbeddingStore(base_path)
+    for i in range(count):
+        store.put(f"w{worker}-p{i}", [float(worker), float(i)])
+
+
+def test_concurrent_processes_keep_offsets_consistent(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    workers, count = 4, 200
+    procs = [ctx.Process(target=_put_from_process, args=(tmp_path, w, count)) for w in range(workers)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(timeout=120)
+        assert proc.exitcode == 0
+
+    store = MandateEmbeddingStore(tmp_path)
+    assert len(store) == workers * count
+    for w in range(workers):
+        for i in range(count):
+            assert store.get(f"w{w}-p{i}") == [float(w), float(i)]
+
+
+def test_create_mandate_embedding_store_from_env(monkeypatch, tmp_path):
+    monkeypatch.delenv("GOFR_IQ_MANDATE_EMBEDDING_STORE", raising=False)
+    assert isinstance(create_mandate_embedding_store(tmp_path), MandateEmbeddingStore)
+
+    monkeypatch.setenv("GOFR_IQ_MANDATE_EMBEDDING_STORE", "0")
+    assert create_mandate_embedding_store(tmp_path) is None
+
+
+class TestLoadMandateEmbedding:
+    @staticmethod
+    def _service(graph_index=None, mandate_store=None) -> QueryService:
+        return QueryService(
+            embedding_index=MagicMock(),
+            document_store=MagicMock(),
+            source_registry=MagicMock(),
+            graph_index=graph_index,
+            mandate_store=mandate_store,
+        )
+
+    @staticmethod
+    def _profile(**fields) -> dict:
+        return ClientProfile.model_validate({"client_guid": "client-1", **fields}).model_dump()
+
+    def test_reads_store_without_touching_neo4j(self, tmp_path):
+        store = MandateEmbeddingStore(tmp_path)
+        store.put("profile-1", [0.5, 0.25])
+        graph_index = MagicMock()
+        service = self._service(graph_index, store)
+
+        profile = self._profile(profile_guid="profile-1", mandate_embedding_in_graph=False)
+
+        assert profile["mandate_embedding"] == []
+        assert service._load_mandate_embedding(profile) == [0.5, 0.25]
+        graph_index._get_session.assert_not_called()
+
+    def test_unmigrated_profile_falls_back_to_node_property(self, tmp_path):
+        graph_index = MagicMock()
+        session = graph_index._get_session.return_value.__enter__.return_value
+        session.run.return_value.single.return_value = {"mandate_embedding": [0.1, 0.2]}
+        service = self._service(graph_index, MandateEmbeddingStore(tmp_path))
+
+        profile = self._profile(profile_guid="profile-1", mandate_embedding_in_graph=True)
+
+        assert service._load_mandate_embedding(profile) == [0.1, 0.2]
+        assert session.run.call_args.kwargs["profile_guid"] == "profile-1"
+
+    def test_no_vector_anywhere_skips_lookup(self, tmp_path):
+        graph_index = MagicMock()
+        service = self._service(graph_index, MandateEmbeddingStore(tmp_path))
+
+        assert service._load_mandate_embedding(self._profile(profile_guid="profile-1")) == []
+        assert service._load_mandate_embedding(self._profile()) == []
+        graph_index._get_session.assert_not_called()
+
+    def test_vector_search_uses_loaded_embedding(self, tmp_path):
+        store = MandateEmbeddingStore(tmp_path)
+        store.put("profile-1", [0.5, 0.25])
+        service = self._service(MagicMock(), store)
+        service.embedding_index.search_by_embedding.return_value = []
+
+        service._search_mandate_vectors(
+            self._profile(profile_guid="profile-1", mandate_text="Asian semiconductors"),
+            ["group-1"],
+            MagicMock(vector_similarity_threshold=0.5),
+        )
+
+        kwargs = service.embedding_index.search_by_embedding.call_args.kwargs
+        assert kwargs["query_embedding"] == [0.5, 0.25]
+        service.embedding_index.search.assert_not_called()
+
+    def test_batch_vector_search_is_one_chroma_query(self, tmp_path):
+        store = MandateEmbeddingStore(tmp_path)
+        store.put("profile-1", [0.5, 0.25])
+        graph_index = MagicMock()
+        service = self._service(graph_index, store)
+        service.embedding_index.embed_queries.return_value = [[0.0, 1.0]]
+        service.embedding_index.search_by_embeddings.return_value = [
+            [SimilarityResult("doc-1", "doc-1_0", "", 0.8, {}), SimilarityResult("doc-2", "doc-2_0", "", 0.3, {})],
+            [SimilarityResult("doc-3", "doc-3_0", "", 0.6, {})],
+        ]
+
+        best_sims = service._search_mandate_vectors_batch(
+            [
+                self._profile(profile_guid="profile-1"),
+                self._profile(profile_guid="profile-2", mandate_text="European utilities"),
+                self._profile(profile_guid="profile-3"),
+            ],
+            ["group-1"],
+            MagicMock(vector_similarity_threshold=0.5),
+        )
+
+        assert best_sims == [{"doc-1": 0.8}, {"doc-3": 0.6}, {}]
+        service.embedding_index.embed_queries.assert_called_once_with(["European utilities"])
+        service.embedding_index.search_by_embeddings.assert_called_once()
+        assert service.embedding_index.search_by_embeddings.call_args.args[0] == [[0.5, 0.25], [0.0, 1.0]]
+        graph_index._get_session.assert_not_called()
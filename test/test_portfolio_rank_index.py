@@ -0,0 +1,45 @@
+"""Tests for PortfolioRankIndex position boosts used in get_top_client_news."""
+
+from __future__ import annotations
+
+import math
+
+from app.services.query_service import PortfolioRankIndex
+
+
+def test_rank_index_empty_holdings() -> None:
+    idx = PortfolioRankIndex.from_holdings([])
+    assert idx.size == 0
+    assert idx.boost_for(["AAPL"]) == 0.0
+    assert idx.boost_for(None) == 0.0
+
+
+def test_rank_index_single_holding_gets_full_boost() -> None:
+    idx = PortfolioRankIndex.from_holdings([{"ticker": "AAPL", "weight": 0.1}])
+    assert idx.size == 1
+    assert abs(idx.boost_for(["AAPL"]) - 0.3) < 1e-9
+
+
+def test_rank_index_percentile_log_boost() -> None:
+    holdings = [
+        {"ticker": "SMALL", "weight": 0.05},
+        {"ticker": "BIG", "weight": 0.50},
+        {"ticker": "MID", "weight": 0.20},
+        {"ticker": None, "weight": 0.90},
+    ]
+    idx = PortfolioRankIndex.from_holdings(holdings)
+
+    assert idx.size == 3
+    assert abs(idx.boosts["BIG"] - 0.3) < 1e-9
+    assert abs(idx.boosts["MID"] - 0.3 * math.log2(1.5)) < 1e-9
+    assert idx.boosts["SMALL"] == 0.0
+
+
+def test_rank_index_takes_best_affected_instrument() -> None:
+    idx = PortfolioRankIndex.from_holdings([
+        {"ticker": "A", "weight": 0.3},
+        {"ticker": "B", "weight": 0.2},
+        {"ticker": "C", "weight": 0.1},
+    ])
+    assert idx.boost_for(["C", "UNKNOWN", "B"]) == idx.boosts["B"]
+    assert idx.boost_for(["UNKNOWN"]) == 0.0
@@ -0,0 +1,127 @@
+"""Tests for the query embedding cache."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.services.query_embedding_cache import QueryEmbeddingCache, create_query_embedding_cache
+
+
+def test_key_normalizes_whitespace_and_includes_model():
+    assert QueryEmbeddingCache.make_key("m1", "  chip   export\ncontrols ") == QueryEmbeddingCache.make_key(
+        "m1", "chip export controls"
+    )
+    assert QueryEmbeddingCache.make_key("m1", "rates") != QueryEmbeddingCache.make_key("m2", "rates")
+
+
+def test_hit_miss_and_float32_storage():
+    cache = QueryEmbeddingCache()
+    assert cache.get("m1", "rates") is None
+    assert cache.put("m1", "rates", [0.1, -0.5, 2.0])
+
+    hit = cache.get("m1", " rates ")
+    assert hit == pytest.approx([0.1, -0.5, 2.0], abs=1e-7)
+    assert cache.get("m2", "rates") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["size"] == 1
+    assert stats["bytes"] > 12
+
+
+def test_ttl_expiry(clock):
+    cache = QueryEmbeddingCache(ttl_seconds=60, clock=clock)
+    cache.put("m1", "rates", [1.0])
+    clock.now += 59
+    assert cache.get("m1", "rates") == [1.0]
+    clock.now += 2
+    assert cache.get("m1", "rates") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_byte_limit_evicts_least_recently_used():
+    probe = QueryEmbeddingCache()
+    probe.put("m", "q", [0.0] * 8)
+    cache = QueryEmbeddingCache(max_bytes=2 * probe.stats()["bytes"])
+    cache.put("m", "a", [1.0] * 8)
+    cache.put("m", "b", [2.0] * 8)
+    assert cache.get("m", "a") is not None  # "b" is now least recently used
+    cache.put("m", "c", [3.0] * 8)
+
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "a") is not None
+    assert cache.get("m", "c") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] <= cache.max_bytes
+    # A vector larger than the whole cache is not stored
+    assert cache.put("m", "huge", [0.0] * 1000) is False
+
+
+def test_persistence_round_trip(tmp_path, clock):
+    path = tmp_path / "cache" / "query_embeddings"
+    cache = QueryEmbeddingCache(persist_path=path, ttl_seconds=60, clock=clock)
+    cache.put("m1", "rates", [0.25, 0.5])
+    cache.put("m1", "stale", [1.0])
+    clock.now += 30
+    cache.put("m1", "fresh", [0.75])
+    assert cache.save() == 3
+
+    clock.now += 40  # "rates" and "stale" have expired, "fresh" has not
+    reloaded = QueryEmbeddingCache(persist_path=path, ttl_seconds=60, clock=clock)
+    assert len(reloaded) == 1
+    assert reloaded.get("m1", "fresh") == [0.75]
+    assert reloaded.get("m1", "rates") is None
+
+    # Saving over the mapped file keeps served vectors intact
+    reloaded.put("m1", "new", [0.5])
+    assert reloaded.save() == 2
+    assert reloaded.get("m1", "fresh") == [0.75]
+
+
+def test_periodic_save(tmp_path):
+    path = tmp_path / "query_embeddings"
+    cache = QueryEmbeddingCache(persist_path=path, persist_every=2)
+    cache.put("m1", "a", [1.0])
+    assert not (tmp_path / "query_embeddings.json").exists()
+    cache.put("m1", "b", [2.0])
+    cache.flush()
+    assert (tmp_path / "query_embeddings.json").exists()
+    assert QueryEmbeddingCache(persist_path=path).get("m1", "b") == [2.0]
+
+
+def test_periodic_save_does_not_block_put(tmp_path, monkeypatch):
+    cache = QueryEmbeddingCache(persist_path=tmp_path / "query_embeddings", persist_every=1)
+    release = threading.Event()
+    saves: list[int] = []
+
+    def slow_save() -> int:
+        release.wait(5)
+        saves.append(len(cache))
+        return 0
+
+    monkeypatch.setattr(cache, "save", slow_save)
+    cache.put("m1", "a", [1.0])
+    # A second threshold crossing while the first save runs does not start another
+    cache.put("m1", "b", [2.0])
+    assert saves == []
+    release.set()
+    cache.flush()
+    assert saves == [2]
+
+
+def test_create_query_embedding_cache_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("GOFR_IQ_QUERY_EMBEDDING_CACHE_MAX_MB", "2")
+    monkeypatch.setenv("GOFR_IQ_QUERY_EMBEDDING_CACHE_TTL_SECONDS", "30")
+    monkeypatch.delenv("GOFR_IQ_QUERY_EMBEDDING_CACHE_PATH", raising=False)
+    cache = create_query_embedding_cache()
+    assert cache is not None
+    assert cache.max_bytes == 2 * 1024 * 1024
+    assert cache.ttl_seconds == 30
+    assert cache.persist_path is None
+
+    monkeypatch.setenv("GOFR_IQ_QUERY_EMBEDDING_CACHE_MAX_MB", "0")
+    assert create_query_embedding_cache() is None
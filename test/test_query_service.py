@@ -5,14 +5,15 @@ enrichment, metadata filtering, and group-based access control.
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Generator, Optional
+from unittest.mock import MagicMock
 
 from app.models.document import Document
 from app.models.group import Group
 from app.models.source import Source, SourceType, TrustLevel
 from app.services.document_store import DocumentStore
-from app.services.embedding_index import EmbeddingIndex
+from app.services.embedding_index import EmbeddingIndex, SimilarityResult
 from app.services.graph_index import GraphIndex
 from app.services.query_service import (
     QueryFilters,
@@ -572,6 +573,158 @@ class TestQueryFilters:
             assert "Technology" in result.metadata.get("sectors", [])
             assert result.language == "en"
 
+    def test_metadata_filters_impact_and_aware_dates(self, query_service: QueryService) -> None:
+        """Impact filters are enforced and naive bounds compare against aware timestamps"""
+
+        def result(guid: str, **metadata: object) -> SimilarityResult:
+            return SimilarityResult(document_guid=guid, chunk_id=f"{guid}_0", content="", score=0.9, metadata=metadata)
+
+        results = [
+            result("old", created_at="2023-12-01T00:00:00+00:00", impact_score=90, impact_tier="GOLD"),
+            result("low", created_at="2024-01-10T00:00:00+00:00", impact_score=20, impact_tier="BRONZE"),
+            result("hit", created_at="2024-01-10T00:00:00+00:00", impact_score=80, impact_tier="gold"),
+            result("unscored", created_at="2024-01-10T00:00:00+00:00"),
+        ]
+        filters = QueryFilters(date_from=datetime(2024, 1, 1), min_impact_score=50, impact_tiers=["GOLD"])
+
+        filtered = query_service._apply_metadata_filters(results, filters)
+        assert [r.document_guid for r in filtered] == ["hit"]
+
+    def test_metadata_filters_match_any_region(self, query_service: QueryService) -> None:
+        """Region filters match secondary regions as well as the primary one"""
+        results = [
+            SimilarityResult("multi", "multi_0", "", 0.9, {"region": "APAC", "regions": '["APAC", "EMEA"]'}),
+            SimilarityResult("legacy", "legacy_0", "", 0.9, {"region": "EMEA"}),
+            SimilarityResult("other", "other_0", "", 0.9, {"region": "APAC", "regions": '["APAC"]'}),
+        ]
+
+        filtered = query_service._apply_metadata_filters(results, QueryFilters(regions=["emea"]))
+        assert [r.document_guid for r in filtered] == ["multi", "legacy"]
+
+    def test_filter_pushdown_passes_filters_to_search(self) -> None:
+        """With filter_pushdown, metadata filters are sent to the embedding index"""
+        embedding_index = MagicMock()
+        embedding_index.search.return_value = []
+        service = QueryService(
+            embedding_index=embedding_index, document_store=MagicMock(), source_registry=MagicMock(), filter_pushdown=True
+        )
+        date_from = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        filters = QueryFilters(date_from=date_from, min_impact_score=50, impact_tiers=["GOLD"], sectors=["Energy"])
+
+        service._execute_similarity_search("oil", ["g1"], 10, filters)
+
+        kwargs = embedding_index.search.call_args.kwargs
+        assert kwargs["created_from"] == date_from
+        assert kwargs["min_impact_score"] == 50
+        assert kwargs["impact_tiers"] == ["GOLD"]
+        assert kwargs["sectors"] == ["Energy"]
+
+        # A precomputed query embedding gets the same filters
+        embedding_index.search_by_embedding.return_value = []
+        service._execute_similarity_search("oil", ["g1"], 10, filters, query_embedding=[0.6, 0.8])
+        kwargs = embedding_index.search_by_embedding.call_args.kwargs
+        assert kwargs["query_embedding"] == [0.6, 0.8]
+        assert kwargs["created_from"] == date_from
+        assert kwargs["sectors"] == ["Energy"]
+
+        service.filter_pushdown = False
+        service._execute_similarity_search("oil", ["g1"], 10, filters)
+        assert "created_from" not in embedding_index.search.call_args.kwargs
+
+
+class TestAdaptiveOverfetch:
+    """Tests for iterative deepening of the similarity candidate page"""
+
+    @staticmethod
+    def _service(num_docs: int, chunks_per_doc: int, **kwargs: object) -> tuple[QueryService, MagicMock]:
+        """Service over a fake index; even-numbered documents are APAC"""
+        chunks = [
+            SimilarityResult(
+                document_guid=f"doc{d}",
+                chunk_id=f"doc{d}_{c}",
+                content="",
+                score=1.0 - (d * chunks_per_doc + c) / 10_000,
+                metadata={"region": "APAC" if d % 2 == 0 else "EMEA"},
+            )
+            for d in range(num_docs)
+            for c in range(chunks_per_doc)
+        ]
+        embedding_index = MagicMock()
+        embedding_index.embed_query.return_value = [0.6, 0.8]
+        embedding_index.search.side_effect = lambda **kw: chunks[: kw["n_results"]]
+        embedding_index.search_by_embedding.side_effect = lambda **kw: chunks[: kw["n_results"]]
+        service = QueryService(
+            embedding_index=embedding_index,
+            document_store=MagicMock(),
+            source_registry=MagicMock(),
+            adaptive_overfetch=True,
+            **kwargs,  # type: ignore[arg-type]
+        )
+        return service, embedding_index
+
+    def test_unfiltered_query_uses_small_single_page(self) -> None:
+        """Unfiltered single-chunk documents are satisfied by the first page"""
+        service, embedding_index = self._service(num_docs=100, chunks_per_doc=1)
+
+        response = service.query("rates", group_guids=["g1"], n_results=10, enable_graph_expansion=False)
+
+        assert len(response.results) == 10
+        assert response.retrieval_rounds == 1
+        assert response.candidates_scanned == 15
+        assert embedding_index.search_by_embedding.call_args.kwargs["n_results"] == 15
+
+    def test_selective_filter_deepens_until_enough_documents(self) -> None:
+        """Multi-chunk documents plus a post-filter trigger further rounds"""
+        service, embedding_index = self._service(num_docs=200, chunks_per_doc=4)
+
+        response = service.query(
+            "rates",
+            group_guids=["g1"],
+            n_results=10,
+            filters=QueryFilters(regions=["APAC"]),
+            enable_graph_expansion=False,
+        )
+
+        assert len(response.results) == 10
+        assert all(r.metadata["region"] == "APAC" for r in response.results)
+        assert response.retrieval_rounds > 1
+        pages = [c.kwargs["n_results"] for c in embedding_index.search_by_embedding.call_args_list]
+        assert pages == sorted(pages)
+        assert response.candidates_scanned == sum(pages)
+        # The query is embedded once, not once per round
+        embedding_index.embed_query.assert_called_once_with("rates")
+        embedding_index.search.assert_not_called()
+        assert all(c.kwargs["query_embedding"] == [0.6, 0.8] for c in embedding_index.search_by_embedding.call_args_list)
+
+    def test_stops_when_index_exhausted_or_capped(self) -> None:
+        """A short page from ChromaDB or the candidate cap ends the loop"""
+        service, _ = self._service(num_docs=3, chunks_per_doc=2)
+        response = service.query("rates", group_guids=["g1"], n_results=10, enable_graph_expansion=False)
+        assert response.retrieval_rounds == 1
+        assert len(response.results) == 3
+
+        service, embedding_index = self._service(num_docs=500, chunks_per_doc=4, max_overfetch_candidates=40)
+        response = service.query(
+            "rates",
+            group_guids=["g1"],
+            n_results=10,
+            filters=QueryFilters(regions=["APAC"]),
+            enable_graph_expansion=False,
+        )
+        assert embedding_index.search_by_embedding.call_args.kwargs["n_results"] == 40
+        assert len(response.results) == 5
+
+    def test_fixed_overfetch_when_disabled(self) -> None:
+        """Without adaptive_overfetch a single n_results * 3 page is fetched"""
+        service, embedding_index = self._service(num_docs=100, chunks_per_doc=1)
+        service.adaptive_overfetch = False
+
+        response = service.query("rates", group_guids=["g1"], n_results=10, enable_graph_expansion=False)
+
+        assert response.retrieval_rounds == 1
+        assert response.candidates_scanned == 30
+        assert embedding_index.search.call_args.kwargs["n_results"] == 30
+
 
 # =============================================================================
 # Phase 12.4: Group-Based Access Control
@@ -2018,3 +2171,953 @@ class TestAvatarFeed:
         # But it should appear exactly once in combined
         combined_guids = [item.document_guid for item in feed.combined]
         assert combined_guids.count("doc-overlap-001") == 1
+
+
+# =============================================================================
+# Batched graph expansion
+# =============================================================================
+
+
+class TestBatchedGraphExpansion:
+    """Tests for single round-trip graph expansion in _expand_via_graph"""
+
+    @pytest.fixture
+    def mock_graph_index(self) -> Generator:
+        """Mock GraphIndex whose session.run returns canned expansion rows."""
+        from unittest.mock import MagicMock
+
+        mock = MagicMock()
+        mock_session = MagicMock()
+        mock._get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
+        mock._get_session.return_value.__exit__ = MagicMock(return_value=None)
+        yield mock, mock_session
+
+    @staticmethod
+    def _row(seed_rank: int, seed_guid: str, ticker: str, hop: int,
+             peer_ticker: Optional[str], guid: str) -> dict:
+        return {
+            "seed_rank": seed_rank,
+            "seed_guid": seed_guid,
+            "ticker": ticker,
+            "hop": hop,
+            "peer_ticker": peer_ticker,
+            "guid": guid,
+            "title": f"Title {guid}",
+            "created_at": datetime.now().isoformat(),
+            "language": "en",
+            "impact_score": 50.0,
+            "impact_tier": "SILVER",
+            "event_type": None,
+            "source_guid": "",
+            "source_name": "",
+        }
+
+    @staticmethod
+    def _seed(guid: str) -> QueryResult:
+        return QueryResult(
+            document_guid=guid,
+            title=guid,
+            content_snippet="",
+            score=1.0,
+            similarity_score=1.0,
+            trust_score=0.5,
+            recency_score=1.0,
+            graph_score=0.0,
+            source_guid="",
+            source_name="",
+            language="en",
+            created_at=None,
+        )
+
+    def test_batched_expansion_single_round_trip(
+        self,
+        embedding_index_test: EmbeddingIndex,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+        mock_graph_index,
+    ) -> None:
+        """All seeds are expanded with one session.run and keep provenance."""
+        mock, mock_session = mock_graph_index
+        mock_session.run.return_value = [
+            self._row(0, "seed-1", "AAPL", 0, None, "doc-a"),
+            self._row(0, "seed-1", "AAPL", 1, "MSFT", "doc-b"),
+            self._row(1, "seed-2", "TSM", 0, None, "doc-a"),  # already seen
+            self._row(1, "seed-2", "TSM", 0, None, "seed-1"),  # excluded
+            self._row(1, "seed-2", "TSM", 0, None, "doc-c"),
+        ]
+        service = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=mock,
+        )
+
+        results = service._expand_via_graph(
+            semantic_results=[self._seed("seed-1"), self._seed("seed-2")],
+            group_guids=[TEST_GROUP_GUID],
+            weights=ScoringWeights(),
+            exclude_guids={"seed-1", "seed-2"},
+        )
+
+        assert mock_session.run.call_count == 1
+        assert mock_session.run.call_args.kwargs["seed_guids"] == ["seed-1", "seed-2"]
+        assert [r.document_guid for r in results] == ["doc-a", "doc-b", "doc-c"]
+        by_guid = {r.document_guid: r.graph_context for r in results}
+        assert by_guid["doc-a"] == {"via": "instrument:AAPL", "via_doc": "seed-1"}
+        assert by_guid["doc-b"]["via"] == QueryService._peer_via("AAPL", "MSFT")
+        assert by_guid["doc-c"] == {"via": "instrument:TSM", "via_doc": "seed-2"}
+        assert all(r.discovered_via == "graph" for r in results)
+
+    def test_batched_expansion_falls_back_to_per_hit(
+        self,
+        embedding_index_test: EmbeddingIndex,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+        mock_graph_index,
+    ) -> None:
+        """A failing batched query falls back to per-hit traversal."""
+        from unittest.mock import patch
+
+        mock, mock_session = mock_graph_index
+        mock_session.run.side_effect = RuntimeError("CALL subqueries unsupported")
+        service = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=mock,
+        )
+
+        with (
+            patch.object(service, "_get_document_instruments", return_value=["AAPL"]),
+            patch.object(service, "_get_documents_affecting_instrument", return_value={
+                "doc-a": {"guid": "doc-a", "title": "A"},
+            }),
+            patch.object(service, "_get_peer_instruments", return_value=[]),
+        ):
+            results = service._expand_via_graph(
+                semantic_results=[self._seed("seed-1")],
+                group_guids=[TEST_GROUP_GUID],
+                weights=ScoringWeights(),
+                exclude_guids={"seed-1"},
+            )
+
+        assert [r.document_guid for r in results] == ["doc-a"]
+        assert results[0].graph_context == {"via": "instrument:AAPL", "via_doc": "seed-1"}
+
+
+# =============================================================================
+# Consolidated candidate retrieval for get_top_client_news
+# =============================================================================
+
+
+class TestConsolidatedFeedRetrieval:
+    """The two-query retrieval path must rank exactly like the per-helper path."""
+
+    @pytest.fixture
+    def mock_graph(self):
+        """Minimal mock GraphIndex that makes _get_session() a context-manager."""
+        from unittest.mock import MagicMock
+        mock = MagicMock()
+        mock_session = MagicMock()
+        mock._get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
+        mock._get_session.return_value.__exit__ = MagicMock(return_value=None)
+        return mock
+
+    def test_consolidated_matches_legacy_ranking(
+        self,
+        embedding_index_test: EmbeddingIndex,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+        mock_graph,
+    ) -> None:
+        from unittest.mock import patch
+        from datetime import datetime as real_datetime
+
+        now = datetime(2026, 2, 6, 12, 0, 0)
+
+        class FrozenDateTime(real_datetime):
+            @classmethod
+            def utcnow(cls):
+                return now
+
+        def doc(guid: str, hours: int, score: int, tickers: list[str], themes=None) -> dict:
+            d = {
+                "document_guid": guid,
+                "title": f"Story {guid}",
+                "created_at": (now - timedelta(hours=hours)).isoformat(),
+                "impact_score": score,
+                "impact_tier": "GOLD",
+                "affected_instruments": tickers,
+            }
+            if themes is not None:
+                d["themes"] = themes
+            return d
+
+        profile = {
+            "client_guid": "client-consolidated-001",
+            "client_type": "HEDGE_FUND",
+            "mandate_text": None,
+            "mandate_themes": ["ai"],
+            "esg_constrained": False,
+            "impact_threshold": 30,
+            "benchmark": None,
+        }
+        holdings = [{"ticker": "TSM", "weight": 0.15}, {"ticker": "NVDA", "weight": 0.05}]
+        holdings_docs = [doc("h1", 1, 70, ["TSM"]), doc("h2", 3, 90, ["NVDA"])]
+        watch_docs = [doc("w1", 2, 60, ["AMD"]), doc("h1", 1, 70, ["AMD"])]
+        peer_docs = [doc("p1", 4, 50, ["INTC"])]
+        theme_docs = [doc("t1", 6, 40, ["ASML"], themes=["ai"]), doc("h2", 3, 90, ["NVDA"], themes=["ai"])]
+        lateral = {"competitors": [], "suppliers": [], "peers": ["INTC"]}
+
+        legacy = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=mock_graph,
+        )
+        with (
+            patch("app.services.query_service.datetime", FrozenDateTime),
+            patch.object(legacy, "_get_client_profile_context", return_value=profile),
+            patch.object(legacy, "_get_client_holdings", return_value=holdings),
+            patch.object(legacy, "_get_client_watchlist", return_value=["AMD"]),
+            patch.object(legacy, "_get_documents_for_tickers", side_effect=[
+                holdings_docs, watch_docs, peer_docs,
+            ]),
+            patch.object(legacy, "_expand_lateral_tickers", return_value=lateral),
+            patch.object(legacy, "_get_documents_by_themes", return_value=theme_docs),
+        ):
+            expected = legacy.get_top_client_news(
+                client_guid="client-consolidated-001",
+                group_guids=[TEST_GROUP_GUID],
+                limit=10,
+            )
+
+        consolidated = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=mock_graph,
+            consolidated_feed_retrieval=True,
+        )
+        feed_context = {
+            "profile": profile,
+            "holdings": holdings,
+            "watchlist": ["AMD"],
+            "exclusions": {"companies": [], "sectors": []},
+            "lateral": lateral,
+        }
+        by_reason = {
+            "DIRECT_HOLDING": holdings_docs,
+            "WATCHLIST": watch_docs,
+            "PEER": peer_docs,
+            "THEMATIC": theme_docs,
+        }
+        with (
+            patch("app.services.query_service.datetime", FrozenDateTime),
+            patch.object(consolidated, "_get_client_feed_context", return_value=feed_context),
+            patch.object(consolidated, "_get_client_feed_candidates", return_value=(by_reason, None)) as fetch,
+            patch.object(consolidated, "_get_client_profile_context") as legacy_profile,
+            patch.object(consolidated, "_get_documents_for_tickers") as legacy_tickers,
+        ):
+            actual = consolidated.get_top_client_news(
+                client_guid="client-consolidated-001",
+                group_guids=[TEST_GROUP_GUID],
+                limit=10,
+            )
+
+        assert fetch.call_count == 1
+        channels = dict(fetch.call_args.kwargs["channel_tickers"])
+        assert channels["DIRECT_HOLDING"] == ["TSM", "NVDA"]
+        assert channels["PEER"] == ["INTC"]
+        legacy_profile.assert_not_called()
+        legacy_tickers.assert_not_called()
+        assert actual == expected
+
+    def test_consolidated_falls_back_to_mandate_themes_lookup(
+        self,
+        embedding_index_test: EmbeddingIndex,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+        mock_graph,
+    ) -> None:
+        from unittest.mock import patch
+
+        service = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=mock_graph,
+            consolidated_feed_retrieval=True,
+        )
+        feed_context = {
+            "profile": {"client_guid": "client-themeless-001", "mandate_themes": []},
+            "holdings": [],
+            "watchlist": [],
+            "exclusions": {"companies": [], "sectors": []},
+            "lateral": {},
+        }
+        with (
+            patch.object(service, "_get_client_feed_context", return_value=feed_context),
+            patch.object(service, "_get_client_mandate_themes", return_value=["ai"]) as themes,
+            patch.object(service, "_get_client_feed_candidates", return_value=({}, None)) as fetch,
+        ):
+            service.get_top_client_news(
+                client_guid="client-themeless-001",
+                group_guids=[TEST_GROUP_GUID],
+                limit=10,
+            )
+
+        themes.assert_called_once_with("client-themeless-001")
+        assert fetch.call_args.kwargs["themes"] == ["ai"]
+
+
+# =============================================================================
+# Time-window push-down for client feed candidate queries
+# =============================================================================
+
+
+class TestCreatedAfterPushdown:
+    """created_after is evaluated in Cypher, not only in Python."""
+
+    @pytest.fixture
+    def service_and_session(
+        self,
+        embedding_index_test: EmbeddingIndex,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+    ):
+        from unittest.mock import MagicMock
+        mock = MagicMock()
+        mock_session = MagicMock()
+        mock_session.run.return_value = []
+        mock._get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
+        mock._get_session.return_value.__exit__ = MagicMock(return_value=None)
+        service = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=mock,
+        )
+        return service, mock_session
+
+    def test_tickers_query_includes_created_after(self, service_and_session) -> None:
+        service, session = service_and_session
+        service._get_documents_for_tickers(
+            tickers=["AAPL"],
+            group_guids=[TEST_GROUP_GUID],
+            created_after=datetime(2026, 2, 6, 11, 30, 15, 999),
+        )
+        query = session.run.call_args.args[0]
+        assert "d.created_at >= $created_after" in query
+        assert session.run.call_args.kwargs["created_after"] == "2026-02-06T11:30:15"
+
+    def test_themes_query_without_cutoff_is_unchanged(self, service_and_session) -> None:
+        service, session = service_and_session
+        service._get_documents_by_themes(
+            themes=["ai"],
+            group_guids=[TEST_GROUP_GUID],
+            exclude_tickers=[],
+        )
+        query = session.run.call_args.args[0]
+        assert "$created_after" not in query
+        assert session.run.call_args.kwargs["created_after"] is None
+
+    def test_created_after_param_normalizes_to_utc(self) -> None:
+        from datetime import timezone
+
+        aware = datetime(2026, 2, 6, 20, 0, 0, tzinfo=timezone(timedelta(hours=8)))
+        assert QueryService._created_after_param(aware) == "2026-02-06T12:00:00"
+        assert QueryService._created_after_param(None) is None
+
+    def test_avatar_feed_passes_time_cutoff(self, service_and_session) -> None:
+        from unittest.mock import patch
+        from datetime import datetime as real_datetime
+
+        service, _ = service_and_session
+        now = datetime(2026, 2, 6, 12, 0, 0)
+
+        class FrozenDateTime(real_datetime):
+            @classmethod
+            def utcnow(cls):
+                return now
+
+        with (
+            patch("app.services.query_service.datetime", FrozenDateTime),
+            patch.object(service, "_get_client_profile_context", return_value={"impact_threshold": None}),
+            patch.object(service, "_get_client_holdings", return_value=[{"ticker": "TSM", "weight": 0.1}]),
+            patch.object(service, "_get_client_watchlist", return_value=[]),
+            patch.object(service, "_get_client_mandate_themes", return_value=["ai"]),
+            patch.object(service, "_get_documents_for_tickers", return_value=[]) as tickers,
+            patch.object(service, "_get_documents_by_themes", return_value=[]) as themes,
+        ):
+            service.get_client_avatar_feed(
+                client_guid="client-avatar-001",
+                group_guids=[TEST_GROUP_GUID],
+                time_window_hours=6,
+            )
+
+        expected = now - timedelta(hours=6)
+        assert tickers.call_args.kwargs["created_after"] == expected
+        assert themes.call_args.kwargs["created_after"] == expected
+
+
+# =============================================================================
+# Concurrent fan-out of independent feed retrievals
+# =============================================================================
+
+
+class TestConcurrentFeedFanout:
+    """Independent feed branches run on the shared pool when enabled."""
+
+    @pytest.fixture
+    def mock_graph(self):
+        from unittest.mock import MagicMock
+        mock = MagicMock()
+        mock_session = MagicMock()
+        mock._get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
+        mock._get_session.return_value.__exit__ = MagicMock(return_value=None)
+        return mock
+
+    def test_run_feed_branches_records_timings(
+        self,
+        embedding_index_test: EmbeddingIndex,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+        mock_graph,
+    ) -> None:
+        service = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=mock_graph,
+            concurrent_feed_fanout=True,
+            feed_fanout_workers=2,
+        )
+        results, timings = service._run_feed_branches({"a": lambda: 1, "b": lambda: [2]})
+        assert results == {"a": 1, "b": [2]}
+        assert set(timings) == {"a", "b"}
+        assert all(ms >= 0.0 for ms in timings.values())
+
+    def test_avatar_feed_channels_run_concurrently(
+        self,
+        embedding_index_test: EmbeddingIndex,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+        mock_graph,
+    ) -> None:
+        """Both channel fetches must be in flight at the same time."""
+        import threading
+        from unittest.mock import patch
+
+        from datetime import datetime as real_datetime
+
+        barrier = threading.Barrier(2, timeout=5)
+        now = datetime(2026, 2, 6, 12, 0, 0)
+
+        class FrozenDateTime(real_datetime):
+            @classmethod
+            def utcnow(cls):
+                return now
+
+        position_doc = {
+            "document_guid": "doc-pos-001",
+            "title": "TSMC capex raised",
+            "created_at": (now - timedelta(hours=1)).isoformat(),
+            "impact_score": 80,
+            "impact_tier": "GOLD",
+            "affected_instruments": ["TSM"],
+        }
+        theme_doc = {
+            "document_guid": "doc-theme-001",
+            "title": "AI datacenter build-out accelerates",
+            "created_at": (now - timedelta(hours=2)).isoformat(),
+            "impact_score": 70,
+            "impact_tier": "GOLD",
+            "affected_instruments": ["ASML"],
+            "themes": ["ai"],
+        }
+
+        def tickers(**_kwargs):
+            barrier.wait()
+            return [position_doc]
+
+        def themes(**_kwargs):
+            barrier.wait()
+            return [theme_doc]
+
+        service = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=mock_graph,
+            concurrent_feed_fanout=True,
+        )
+        with (
+            patch("app.services.query_service.datetime", FrozenDateTime),
+            patch.object(service, "_get_client_profile_context", return_value={"impact_threshold": None}),
+            patch.object(service, "_get_client_holdings", return_value=[{"ticker": "TSM", "weight": 0.1}]),
+            patch.object(service, "_get_client_watchlist", return_value=[]),
+            patch.object(service, "_get_client_mandate_themes", return_value=["ai"]),
+            patch.object(service, "_get_documents_for_tickers", side_effect=tickers),
+            patch.object(service, "_get_documents_by_themes", side_effect=themes),
+        ):
+            feed = service.get_client_avatar_feed(
+                client_guid="client-avatar-001",
+                group_guids=[TEST_GROUP_GUID],
+                limit=10,
+            )
+
+        assert [i.document_guid for i in feed.maintenance] == ["doc-pos-001"]
+        assert [i.document_guid for i in feed.opportunity] == ["doc-theme-001"]
+
+
+# =============================================================================
+# Per-client feed cache
+# =============================================================================
+
+
+class TestFeedCacheIntegration:
+    """get_top_client_news / get_client_avatar_feed are served from FeedCache."""
+
+    @pytest.fixture
+    def mock_graph(self):
+        from unittest.mock import MagicMock
+        mock = MagicMock()
+        mock_session = MagicMock()
+        mock._get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
+        mock._get_session.return_value.__exit__ = MagicMock(return_value=None)
+        return mock
+
+    def test_top_client_news_hit_and_ticker_invalidation(
+        self,
+        embedding_index_test: EmbeddingIndex,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+        mock_graph,
+    ) -> None:
+        from unittest.mock import patch
+        from datetime import datetime as real_datetime
+
+        from app.services.feed_cache import FeedCache
+
+        now = datetime(2026, 2, 6, 12, 0, 0)
+
+        class FrozenDateTime(real_datetime):
+            @classmethod
+            def utcnow(cls):
+                return now
+
+        holding_doc = {
+            "document_guid": "doc-cache-001",
+            "title": "TSMC capex raised",
+            "created_at": (now - timedelta(hours=1)).isoformat(),
+            "impact_score": 80,
+            "impact_tier": "GOLD",
+            "affected_instruments": ["TSM"],
+        }
+        profile = {"client_type": "HEDGE_FUND", "mandate_themes": ["ai"], "impact_threshold": None}
+        cache = FeedCache()
+        service = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=mock_graph,
+            feed_cache=cache,
+        )
+
+        with (
+            patch("app.services.query_service.datetime", FrozenDateTime),
+            patch.object(service, "_get_client_profile_context", return_value=profile),
+            patch.object(service, "_get_client_holdings", return_value=[{"ticker": "TSM", "weight": 0.1}]),
+            patch.object(service, "_get_client_watchlist", return_value=[]),
+            patch.object(service, "_expand_lateral_tickers", return_value={"peers": ["INTC"]}),
+            patch.object(service, "_get_documents_for_tickers", return_value=[holding_doc]) as tickers,
+            patch.object(service, "_get_documents_by_themes", return_value=[]),
+        ):
+            kwargs = {"client_guid": "client-cache-001", "group_guids": [TEST_GROUP_GUID], "limit": 3}
+            first = service.get_top_client_news(**kwargs)
+            calls_after_first = tickers.call_count
+            second = service.get_top_client_news(**kwargs)
+            assert tickers.call_count == calls_after_first
+            assert second == first
+
+            # Different opportunity_bias is a different key
+            service.get_top_client_news(**kwargs, opportunity_bias=0.5)
+            assert tickers.call_count > calls_after_first
+
+            # A document touching a lateral peer or a mandate theme invalidates
+            assert cache.invalidate_for_document(tickers=["INTC"]) == 2
+            service.get_top_client_news(**kwargs)
+            assert cache.invalidate_for_document(themes=["ai"]) == 1
+
+        assert cache.stats()["hits"] == 1
+
+    def test_avatar_feed_client_invalidation(
+        self,
+        embedding_index_test: EmbeddingIndex,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+        mock_graph,
+    ) -> None:
+        from unittest.mock import patch
+
+        from app.services.feed_cache import FeedCache
+
+        cache = FeedCache()
+        service = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=mock_graph,
+            feed_cache=cache,
+        )
+        with (
+            patch.object(service, "_get_client_profile_context", return_value={"impact_threshold": None}) as profile,
+            patch.object(service, "_get_client_holdings", return_value=[]),
+            patch.object(service, "_get_client_watchlist", return_value=[]),
+            patch.object(service, "_get_client_mandate_themes", return_value=[]),
+        ):
+            service.get_client_avatar_feed(client_guid="client-cache-002", group_guids=[TEST_GROUP_GUID])
+            service.get_client_avatar_feed(client_guid="client-cache-002", group_guids=[TEST_GROUP_GUID])
+            assert profile.call_count == 1
+
+            cache.invalidate_client("client-cache-002")
+            service.get_client_avatar_feed(client_guid="client-cache-002", group_guids=[TEST_GROUP_GUID])
+            assert profile.call_count == 2
+
+    @pytest.mark.parametrize("concurrent", [False, True])
+    def test_failed_read_is_not_cached(
+        self,
+        embedding_index_test: EmbeddingIndex,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+        mock_graph,
+        concurrent: bool,
+    ) -> None:
+        from unittest.mock import patch
+
+        from app.services.feed_cache import FeedCache
+
+        cache = FeedCache()
+        service = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=mock_graph,
+            feed_cache=cache,
+            concurrent_feed_fanout=concurrent,
+        )
+        session = mock_graph._get_session.return_value.__enter__.return_value
+        failures = [RuntimeError("neo4j unavailable")]
+
+        def run(*args, **kwargs):
+            # First read fails (the helper returns its empty default), later reads succeed
+            if failures:
+                raise failures.pop()
+            return []
+
+        session.run.side_effect = run
+        with (
+            patch.object(service, "_get_client_profile_context", return_value={"impact_threshold": None}),
+            patch.object(service, "_get_client_watchlist", return_value=[]),
+            patch.object(service, "_get_client_exclusions", return_value={"companies": [], "sectors": []}),
+            patch.object(service, "_expand_lateral_tickers", return_value={}),
+            patch.object(service, "_get_documents_for_tickers", return_value=[]),
+            patch.object(service, "_get_documents_by_themes", return_value=[]),
+            patch.object(service, "_get_client_mandate_themes", return_value=[]),
+        ):
+            kwargs = {"client_guid": "client-cache-003", "group_guids": [TEST_GROUP_GUID]}
+            assert service.get_top_client_news(**kwargs) == []
+            assert len(cache) == 0
+
+            service.get_top_client_news(**kwargs)
+            assert len(cache) == 1
+            service.get_top_client_news(**kwargs)
+            assert cache.stats()["hits"] == 1
+
+
+# =============================================================================
+# Batch top client news (shared candidate pool)
+# =============================================================================
+
+
+class TestTopClientNewsBatch:
+    """get_top_client_news_batch ranks like the per-client path with O(1) pool queries."""
+
+    @pytest.fixture
+    def mock_graph(self):
+        from unittest.mock import MagicMock
+        mock = MagicMock()
+        mock_session = MagicMock()
+        mock._get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
+        mock._get_session.return_value.__exit__ = MagicMock(return_value=None)
+        return mock
+
+    def test_batch_matches_per_client_ranking(
+        self,
+        embedding_index_test: EmbeddingIndex,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+        mock_graph,
+    ) -> None:
+        from unittest.mock import patch
+        from datetime import datetime as real_datetime
+
+        now = datetime(2026, 2, 6, 12, 0, 0)
+
+        class FrozenDateTime(real_datetime):
+            @classmethod
+            def utcnow(cls):
+                return now
+
+        def doc(guid: str, hours: int, score: int, tickers: list[str], themes=None) -> dict:
+            return {
+                "document_guid": guid,
+                "title": f"Story {guid}",
+                "created_at": (now - timedelta(hours=hours)).isoformat(),
+                "impact_score": score,
+                "impact_tier": "GOLD",
+                "themes": themes,
+                "event_type": None,
+                "affected_instruments": tickers,
+            }
+
+        def context(profile: dict, holdings: list, watchlist: list, lateral: dict) -> dict:
+            return {
+                "profile": {"esg_constrained": False, "benchmark": None, "mandate_themes": [], **profile},
+                "holdings": holdings,
+                "watchlist": watchlist,
+                "exclusions": {"companies": [], "sectors": []},
+                "lateral": {"competitors": [], "suppliers": [], "peers": [], **lateral},
+            }
+
+        contexts = {
+            "client-a": context(
+                {"client_type": "HEDGE_FUND", "mandate_themes": ["ai"], "impact_threshold": 30},
+                [{"ticker": "TSM", "weight": 0.15}, {"ticker": "NVDA", "weight": 0.05}],
+                ["AMD"],
+                {"peers": ["INTC"]},
+            ),
+            "client-b": context(
+                {"client_type": "LONG_ONLY", "impact_threshold": 65},
+                [{"ticker": "AMD", "weight": 0.2}],
+                [],
+                {},
+            ),
+        }
+        # What the per-client consolidated query returns for each client
+        per_client = {
+            "client-a": {
+                "DIRECT_HOLDING": [doc("h1", 1, 70, ["TSM"]), doc("h2", 3, 90, ["NVDA"])],
+                "WATCHLIST": [doc("h1", 1, 70, ["AMD"]), doc("w1", 2, 60, ["AMD"])],
+                "PEER": [doc("p1", 4, 50, ["INTC"])],
+                "THEMATIC": [doc("t1", 6, 40, ["ASML"], ["ai"]), doc("h2", 3, 90, ["NVDA"], ["ai"])],
+            },
+            "client-b": {
+                "DIRECT_HOLDING": [doc("h1", 1, 70, ["AMD"])],
+            },
+        }
+        # The shared pool covers the union of both clients' channels
+        pool = {
+            "POOL": [
+                doc("h1", 1, 70, ["TSM", "AMD"]),
+                doc("w1", 2, 60, ["AMD"]),
+                doc("h2", 3, 90, ["NVDA"]),
+                doc("p1", 4, 50, ["INTC"]),
+            ],
+            "THEMATIC": [doc("t1", 6, 40, ["ASML"], ["ai"]), doc("h2", 3, 90, ["NVDA"], ["ai"])],
+        }
+
+        service = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=mock_graph,
+            consolidated_feed_retrieval=True,
+        )
+
+        expected = {}
+        for client_guid in ("client-a", "client-b"):
+            with (
+                patch("app.services.query_service.datetime", FrozenDateTime),
+                patch.object(service, "_get_client_feed_context", return_value=contexts[client_guid]),
+                patch.object(service, "_get_client_feed_candidates", return_value=(per_client[client_guid], None)),
+            ):
+                expected[client_guid] = service.get_top_client_news(
+                    client_guid=client_guid,
+                    group_guids=[TEST_GROUP_GUID],
+                    limit=10,
+                )
+
+        with (
+            patch("app.services.query_service.datetime", FrozenDateTime),
+            patch.object(service, "_get_client_feed_contexts", return_value=contexts) as load_contexts,
+            patch.object(service, "_get_client_feed_candidates", return_value=(pool, None)) as load_pool,
+        ):
+            actual = service.get_top_client_news_batch(
+                client_guids=["client-a", "client-b", "client-missing"],
+                group_guids=[TEST_GROUP_GUID],
+                limit=10,
+            )
+
+        assert load_contexts.call_count == 1
+        assert load_pool.call_count == 1
+        pool_kwargs = load_pool.call_args.kwargs
+        assert sorted(pool_kwargs["channel_tickers"][0][1]) == ["AMD", "INTC", "NVDA", "TSM"]
+        assert pool_kwargs["themes"] == ["ai"]
+        assert pool_kwargs["min_impact_score"] == 30
+
+        assert actual["client-missing"] == []
+        assert [a["document_guid"] for a in actual["client-b"]] == ["h1"]
+        assert actual["client-a"] == expected["client-a"]
+        assert actual["client-b"] == expected["client-b"]
+
+    def test_contexts_loaded_in_chunks(
+        self,
+        embedding_index_test: EmbeddingIndex,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+        mock_graph,
+    ) -> None:
+        from unittest.mock import patch
+
+        service = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=mock_graph,
+        )
+        guids = [f"client-{i}" for i in range(25)]
+        with (
+            patch.object(service, "_get_client_feed_contexts", return_value={}) as load_contexts,
+            patch.object(service, "_get_client_feed_candidates") as load_pool,
+        ):
+            results = list(service.iter_top_client_news_batch(
+                client_guids=guids,
+                group_guids=[TEST_GROUP_GUID],
+                context_chunk_size=10,
+            ))
+
+        assert [guid for guid, _ in results] == guids
+        assert load_contexts.call_count == 3
+        load_pool.assert_not_called()
+
+    def test_truncated_pool_requeries_short_clients(
+        self,
+        embedding_index_test: EmbeddingIndex,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+        mock_graph,
+    ) -> None:
+        """A client whose channel was cut short by a truncated pool gets its own query."""
+        from unittest.mock import patch
+        from datetime import datetime as real_datetime
+
+        now = datetime(2026, 2, 6, 12, 0, 0)
+
+        class FrozenDateTime(real_datetime):
+            @classmethod
+            def utcnow(cls):
+                return now
+
+        def doc(guid: str, hours: int, tickers: list[str]) -> dict:
+            return {
+                "document_guid": guid,
+                "title": f"Story {guid}",
+                "created_at": (now - timedelta(hours=hours)).isoformat(),
+                "impact_score": 70,
+                "impact_tier": "GOLD",
+                "themes": None,
+                "event_type": None,
+                "affected_instruments": tickers,
+            }
+
+        contexts = {
+            "client-a": {
+                "profile": {"client_type": "HEDGE_FUND", "esg_constrained": False, "benchmark": None,
+                            "mandate_themes": [], "impact_threshold": None},
+                "holdings": [{"ticker": "TSM", "weight": 0.1}],
+                "watchlist": [],
+                "exclusions": {"companies": [], "sectors": []},
+                "lateral": {"competitors": [], "suppliers": [], "peers": []},
+            },
+        }
+        # The pool hit its limit on other clients' tickers, hiding an older TSM story
+        pool = {"POOL": [doc("n1", 1, ["NVDA"]), doc("t1", 2, ["TSM"])]}
+        own = {"DIRECT_HOLDING": [doc("t1", 2, ["TSM"]), doc("t0", 5, ["TSM"])]}
+
+        service = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=mock_graph,
+        )
+        with (
+            patch("app.services.query_service.datetime", FrozenDateTime),
+            patch.object(service, "_get_client_feed_contexts", return_value=contexts),
+            patch.object(service, "_get_client_feed_candidates", side_effect=[(pool, None), (own, None)]) as fetch,
+        ):
+            actual = dict(service.iter_top_client_news_batch(
+                client_guids=["client-a"],
+                group_guids=[TEST_GROUP_GUID],
+                limit=10,
+                pool_limit=2,
+            ))
+
+        assert fetch.call_count == 2
+        assert dict(fetch.call_args.kwargs["channel_tickers"])["DIRECT_HOLDING"] == ["TSM"]
+        assert sorted(a["document_guid"] for a in actual["client-a"]) == ["t0", "t1"]
+
+
+# =============================================================================
+# why_it_matters_to_client (sync and async LLM services)
+# =============================================================================
+
+
+class TestWhyItMattersToClient:
+    """The sync and async variants share prompt building and output parsing."""
+
+    def test_async_matches_sync(
+        self,
+        embedding_index_test: EmbeddingIndex,
+        document_store: DocumentStore,
+        source_registry: SourceRegistry,
+    ) -> None:
+        import asyncio
+        import json
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from app.services.llm_service import ChatCompletionResult
+
+        long_why = " ".join(["word"] * 40)
+        completion = ChatCompletionResult(
+            content=json.dumps({"why_it_matters": long_why, "story_summary": "Beat and raise."}),
+            model="test-model",
+        )
+        sync_llm = MagicMock()
+        sync_llm.chat_completion.return_value = completion
+        async_llm = MagicMock()
+        async_llm.chat_completion = AsyncMock(return_value=completion)
+
+        service = QueryService(
+            embedding_index=embedding_index_test,
+            document_store=document_store,
+            source_registry=source_registry,
+            graph_index=MagicMock(),
+        )
+        kwargs = {"client_guid": "client-1", "document_guid": "doc-1", "group_guids": [TEST_GROUP_GUID]}
+        with patch.object(service, "_why_it_matters_prompt", return_value="prompt") as prompt:
+            expected = service.why_it_matters_to_client(**kwargs, llm_service=sync_llm)
+            actual = asyncio.run(service.awhy_it_matters_to_client(**kwargs, llm_service=async_llm))
+
+        assert actual == expected
+        assert len(actual["why_it_matters"].split()) == 30
+        assert prompt.call_count == 2
+        assert async_llm.chat_completion.await_args.kwargs == sync_llm.chat_completion.call_args.kwargs
+
+        async_llm.chat_completion = AsyncMock(
+            return_value=ChatCompletionResult(content="[]", model="test-model")
+        )
+        with patch.object(service, "_why_it_matters_prompt", return_value="prompt"):
+            with pytest.raises(RuntimeError, match="LLM augmentation failed"):
+                asyncio.run(service.awhy_it_matters_to_client(**kwargs, llm_service=async_llm))
@@ -0,0 +1,47 @@
+"""Tests for the single-pass ticker matcher."""
+
+from __future__ import annotations
+
+import random
+import re
+
+from app.services.ticker_matcher import TickerMatcher
+
+
+def _legacy(tickers: set[str], text: str) -> set[str]:
+    return {t for t in tickers if re.search(rf"\b{re.escape(t)}\b", text)}
+
+
+def test_word_boundaries_and_case():
+    matcher = TickerMatcher({"NXS", "AI", "ECO"})
+    text = "Nexus (NXS) SAID the FAIR price suits ecological AI plans; nxs lower."
+    assert matcher.find(text) == ["NXS", "AI"]
+
+
+def test_prefix_and_overlapping_tickers():
+    matcher = TickerMatcher({"BRK", "BRK.B", "B"})
+    assert set(matcher.find("Holders of BRK.B gained")) == {"BRK", "BRK.B", "B"}
+    assert matcher.find("BRKX") == []
+
+
+def test_matches_per_ticker_regex_scan():
+    rng = random.Random(7)
+    alphabet = "AB.-1_"
+    for _ in range(500):
+        tickers = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(10)}
+        text = "".join(rng.choice(alphabet + " x") for _ in range(40))
+        assert set(TickerMatcher(tickers).find(text)) == _legacy(tickers, text)
+
+
+def test_add_recompiles_only_on_new_tickers():
+    matcher = TickerMatcher({"NXS"})
+    version = matcher.version
+    assert matcher.add(["NXS"]) is False
+    assert matcher.version == version
+    assert matcher.add(["ECO"]) is True
+    assert matcher.find("ECO up") == ["ECO"]
+    assert "ECO" in matcher and len(matcher) == 2
+
+
+def test_empty_matcher():
+    assert TickerMatcher().find("NXS") == []
@@ -0,0 +1,145 @@
+"""Tests for running MCP tools on worker pools."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import time
+from typing import Annotated, Any
+
+import pytest
+from pydantic import Field
+
+from app.tools.tool_executor import DB_POOL, LLM_POOL, ToolExecutor, create_tool_executor
+
+
+class FakeMCP:
+    """Records functions registered through tool()."""
+
+    def __init__(self) -> None:
+        self.tools: dict[str, Any] = {}
+        self.name = "fake"
+
+    def tool(self, name: str | None = None, **kwargs: Any):  # type: ignore[no-untyped-def]
+        def decorator(fn):  # type: ignore[no-untyped-def]
+            self.tools[name or fn.__name__] = fn
+            return fn
+
+        return decorator
+
+
+def lookup(ticker: Annotated[str, Field(description="Ticker")], limit: int = 5) -> dict[str, Any]:
+    """Look something up."""
+    return {"ticker": ticker, "limit": limit, "thread": threading.current_thread().name}
+
+
+def test_bind_registers_async_wrapper_with_original_signature():
+    executor = ToolExecutor(llm_workers=1, db_workers=1)
+    mcp = FakeMCP()
+    bound = executor.bind(mcp)
+
+    returned = bound.tool(name="lookup", description="x")(lookup)
+
+    # The register_* functions keep the plain function; FastMCP gets the wrapper
+    assert returned is lookup
+    wrapper = mcp.tools["lookup"]
+    assert inspect.iscoroutinefunction(wrapper)
+    assert wrapper.__name__ == "lookup"
+    # FastMCP evaluates the (string) annotations against the tool's own module
+    assert str(inspect.signature(wrapper, eval_str=True)) == str(inspect.signature(lookup, eval_str=True))
+    # Other attributes pass through to the server
+    assert bound.name == "fake"
+    executor.shutdown()
+
+
+async def test_runs_on_pool_threads():
+    executor = ToolExecutor(llm_workers=1, db_workers=1)
+    assert executor.pool_for("ingest_document") == LLM_POOL
+    assert executor.pool_for("get_document") == DB_POOL
+
+    result = await executor.wrap("get_document", lookup)("AAPL", limit=2)
+
+    assert result["ticker"] == "AAPL"
+    assert result["limit"] == 2
+    assert result["thread"].startswith("gofr-iq-tool-db")
+    executor.shutdown()
+
+
+async def test_slow_llm_tool_does_not_block_reads():
+    executor = ToolExecutor(llm_workers=1, db_workers=2)
+    slow = executor.wrap("ingest_document", lambda: time.sleep(0.5) or "ingested")
+    fast = executor.wrap("get_document", lambda: "doc")
+
+    started = time.perf_counter()
+    slow_task = asyncio.ensure_future(slow())
+    await asyncio.sleep(0.05)
+    assert await fast() == "doc"
+    assert time.perf_counter() - started < 0.3
+    assert executor.stats()["pools"][LLM_POOL]["running"] == 1
+
+    assert await slow_task == "ingested"
+    executor.shutdown()
+
+
+async def test_per_tool_limit_and_queue_depth():
+    executor = ToolExecutor(llm_workers=4, db_workers=4, tool_limits={"ingest_document": 1})
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def ingest() -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+
+    wrapped = executor.wrap("ingest_document", ingest)
+    await asyncio.gather(*(wrapped() for _ in range(3)))
+
+    assert peak == 1
+    stats = executor.stats()["tools"]["ingest_document"]
+    assert stats["calls"] == 3
+    assert stats["limit"] == 1
+    assert stats["max_queued"] >= 2
+    assert stats["queued"] == 0 and stats["running"] == 0
+    assert stats["avg_wait_ms"] > 0
+    executor.shutdown()
+
+
+async def test_errors_and_async_tools():
+    executor = ToolExecutor(llm_workers=1, db_workers=1)
+
+    def broken() -> None:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await executor.wrap("get_source", broken)()
+
+    async def native() -> str:
+        return threading.current_thread().name
+
+    # Native async tools stay on the event loop thread
+    assert await executor.wrap("health_check", native)() == threading.current_thread().name
+
+    tools = executor.stats()["tools"]
+    assert tools["get_source"]["errors"] == 1
+    assert tools["health_check"]["calls"] == 1
+    executor.shutdown()
+
+
+def test_create_tool_executor_from_env(monkeypatch):
+    monkeypatch.delenv("GOFR_IQ_TOOL_EXECUTOR", raising=False)
+    monkeypatch.setenv("GOFR_IQ_TOOL_LLM_WORKERS", "3")
+    monkeypatch.setenv("GOFR_IQ_TOOL_CONCURRENCY", "query_documents=8, ingest_document=0,bad")
+    executor = create_tool_executor()
+    assert executor is not None
+    assert executor.pool_sizes == {LLM_POOL: 3, DB_POOL: 16}
+    assert executor.tool_limits == {"query_documents": 8}
+    executor.shutdown()
+
+    monkeypatch.setenv("GOFR_IQ_TOOL_EXECUTOR", "false")
+    assert create_tool_executor() is None
@@ -0,0 +1,45 @@
+"""Tests for the append-only float32 vector log shared by the embedding stores."""
+
+from __future__ import annotations
+
+from app.services.vector_log import VectorLog
+
+
+def test_append_and_read_back(tmp_path):
+    log = VectorLog(tmp_path / "vectors")
+    assert log.read(0, 1) is None
+
+    with log.writer_lock():
+        locations = log.append_vectors([[0.5, 0.25], [1.0]])
+        log.append_index([("a", *locations[0]), ("b", *locations[1])])
+
+    assert locations == [(0, 2), (2, 1)]
+    assert log.read_index() == [["a", "0", "2"], ["b", "2", "1"]]
+    assert log.read_index() == []
+    assert log.read(0, 2) == [0.5, 0.25]
+    assert log.read(2, 1) == [1.0]
+    assert log.read(2, 2) is None
+    assert log.size_bytes == 12
+
+
+def test_partial_index_line_is_left_for_later(tmp_path):
+    log = VectorLog(tmp_path)
+    with open(tmp_path / "index.tsv", "a", encoding="utf-8") as index:
+        index.write("a\t0\t2\nb\t2")
+    assert log.read_index() == [["a", "0", "2"]]
+
+    with open(tmp_path / "index.tsv", "a", encoding="utf-8") as index:
+        index.write("\t1\n")
+    assert log.read_index() == [["b", "2", "1"]]
+
+
+def test_reader_remaps_after_another_writer_grows_the_file(tmp_path):
+    reader = VectorLog(tmp_path)
+    writer = VectorLog(tmp_path)
+    with writer.writer_lock():
+        writer.append_vectors([[0.125]])
+    assert reader.read(0, 1) == [0.125]
+
+    with writer.writer_lock():
+        writer.append_vectors([[0.75, 0.5]])
+    assert reader.read(1, 2) == [0.75, 0.5]